@@ -2,6 +2,8 @@
 ASGI config for cets project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Served this way, long-lived async views (the explorer's scan stream,
+``explore.scanfeed``) hold a connection without pinning a worker thread.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -77,11 +77,17 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Outermost of ours: times every HWDB call the request makes (hwdb.calls).
+    "hwdb.middleware.HwdbCallsMiddleware",
+    "hwdb.middleware.ViewMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.auth.middleware.LoginRequiredMiddleware",
+    # Query counts/shapes per view when asked (QUERY_PROFILE or the
+    # X-Query-Profile header); after auth for the staff check.
+    "hwdb.middleware.QueryProfileMiddleware",
     # Two-zone guard: keep FNAL-provisioned explore users out of the CETS zone
     # (ADR-0011). After auth/login so it only judges authenticated users.
     "explore.middleware.CetsZoneMiddleware",
@@ -118,6 +124,11 @@ HWDB_PROFILES = {
         "coldata_part_type": "D08100300001",  # coldata_e4prep
     },
 }
+# Point every profile's API at another server — the offline load-test rig
+# (``manage.py fake_hwdb``). Never set in a real deployment.
+if HWDB_API_OVERRIDE := config("HWDB_API_OVERRIDE", default="").rstrip("/"):
+    for _profile in HWDB_PROFILES.values():
+        _profile["api"] = HWDB_API_OVERRIDE
 if HWDB_INSTANCE not in HWDB_PROFILES:
     raise ImproperlyConfigured(
         f"HWDB_INSTANCE must be one of {sorted(HWDB_PROFILES)}; got {HWDB_INSTANCE!r}"
@@ -131,6 +142,36 @@ HWDB_WRITE_INSTANCES = ["dev", "prod"]
 HWDB_API_BASE_URL = HWDB_PROFILES[HWDB_INSTANCE]["api"]
 HWDB_UI_BASE_URL = HWDB_PROFILES[HWDB_INSTANCE]["ui"]
 HWDB_LARASIC_PART_TYPE = HWDB_PROFILES[HWDB_INSTANCE]["larasic_part_type"]
+# HWDB call timing (hwdb.calls): calls at least this slow are logged and kept
+# in the rolling slow-call log; the footer lists each page's calls.
+HWDB_SLOW_CALL_MS = config("HWDB_SLOW_CALL_MS", default=1000, cast=int)
+HWDB_CALL_FOOTER = config("HWDB_CALL_FOOTER", default=DEBUG, cast=bool)
+# Prometheus /metrics (hwdb.metrics): each worker writes its values under
+# METRICS_DIR ("" = this process only), merged on scrape. Scrapers send
+# METRICS_TOKEN as a bearer; with no token set, only staff may read it.
+METRICS_DIR = config("METRICS_DIR", default=str(BASE_DIR / "var" / "metrics"))
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+# Query profiling (hwdb.profiler): QUERY_PROFILE profiles every request, else
+# only those sending X-Query-Profile (staff, or anyone under DEBUG). Each
+# worker writes its worst views to QUERY_PROFILE_DIR/<pid>.txt this often.
+QUERY_PROFILE = config("QUERY_PROFILE", default=False, cast=bool)
+QUERY_PROFILE_DIR = config("QUERY_PROFILE_DIR", default=str(BASE_DIR / "var" / "query-profile"))
+QUERY_PROFILE_REPORT_SECONDS = config("QUERY_PROFILE_REPORT_SECONDS", default=300, cast=int)
+# On-disk cache behind the explorer's HWDB image proxy (explore.imagecache).
+# HWDB attachments are immutable per image id, so entries never go stale;
+# the cap only bounds disk use (least-recently-served evicted first).
+HWDB_IMAGE_CACHE_DIR = Path(config("HWDB_IMAGE_CACHE_DIR",
+                                   default=str(BASE_DIR / "var" / "image-cache")))
+HWDB_IMAGE_CACHE_MAX_MB = config("HWDB_IMAGE_CACHE_MAX_MB", default=1024, cast=int)
+# Executive-summary PDFs render off the request (explore.esrender), keyed by
+# a hash of everything that goes into them, in a process pool shared with the
+# plots below (this many slots; 0 renders inline).
+ES_PDF_CACHE_DIR = Path(config("ES_PDF_CACHE_DIR",
+                              default=str(BASE_DIR / "var" / "es-pdf")))
+ES_PDF_WORKERS = config("ES_PDF_WORKERS", default=2, cast=int)
+# Numeric ES plots: PNGs cached under ES_PDF_CACHE_DIR/plots, misses drawn
+# in this many more slots of that pool (0 = in the request thread).
+ES_PLOT_WORKERS = config("ES_PLOT_WORKERS", default=2, cast=int)
 
 # Per-component-type defaults for HWDB upload (Phase-3). Manufacturers and
 # institutions are per-part-type; LArASIC is BNL/TSMC. Add new entries as we
@@ -2,13 +2,20 @@ from django.contrib import admin
 from django.http import HttpResponsePermanentRedirect
 from django.urls import path, include, re_path, reverse
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
-from core import views
+from core import api, views
+from hwdb.views import metrics_view
 from django.views.generic.base import RedirectView
 from django.templatetags.static import static
 from rest_framework.routers import DefaultRouter
 
 router = DefaultRouter()
-router.register(r"api/femb", views.FEMBViewSet, basename="femb")
+router.register(r"api/femb", api.FEMBViewSet, basename="femb")
+router.register(r"api/larasic", api.LArASICViewSet, basename="larasic")
+router.register(r"api/coldadc", api.ColdADCViewSet, basename="coldadc")
+router.register(r"api/coldata", api.COLDATAViewSet, basename="coldata")
+router.register(r"api/cable", api.CABLEViewSet, basename="cable")
+router.register(r"api/femb-tests", api.FembTestViewSet, basename="femb-test")
+router.register(r"api/cable-tests", api.CableTestViewSet, basename="cable-test")
 
 
 def _legacy_redirect(name):
@@ -23,6 +30,8 @@ def _legacy_redirect(name):
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api-auth/", include("rest_framework.urls")),
+    # Prometheus scrape target (hwdb.metrics).
+    path("metrics", metrics_view, name="metrics"),
     path("", views.home, name="home"),
     path("reference/", views.reference, name="reference"),
     path("search/typeahead/", views.search_typeahead, name="search_typeahead"),
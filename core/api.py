@@ -0,0 +1,154 @@
+"""The REST API (``/api/…``): FEMBs, LArASIC / ColdADC / COLDATA chips,
+cables, and the FEMB and cable test records.
+
+Built for scripts that pull whole tables, so every list endpoint:
+
+- pages by keyset (``KeysetPagination`` — a cursor on ``id``): each page is
+  one indexed range read however deep it is, and rows added while a client
+  walks the table don't shift its pages;
+- prefetches nested tests in one query per page, skipped when ``?fields=``
+  leaves them out;
+- answers conditional GETs: ``ETag`` and ``Last-Modified`` come from the
+  rows' ``last_update`` (tests count through their board's or cable's), so
+  an unchanged table costs one aggregate query and a 304.
+
+``?fields=serial_number,status`` trims the rows; ``?last_update__gte=…``
+fetches only what changed since a previous pull.
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import viewsets
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import AllowAny, IsAdminUser
+
+from .models import CABLE, COLDATA, FEMB, CableTest, ColdADC, FembTest, LArASIC
+from .serializers import (CABLESerializer, CableTestSerializer, COLDATASerializer,
+                          ColdADCSerializer, FEMBSerializer, FembTestSerializer,
+                          LArASICSerializer, requested_fields)
+
+
+class KeysetPagination(CursorPagination):
+    ordering = "id"
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+
+class ConditionalMixin:
+    """ETag / Last-Modified validators for ``list`` and ``retrieve``, from
+    one aggregate over the rows the request would return."""
+
+    modified_field = "last_update"
+
+    def _validators(self, queryset):
+        agg = queryset.order_by().aggregate(n=Count("pk"), top=Max("pk"),
+                                            last=Max(self.modified_field))
+        # The query string picks the page, fields and filters — part of the
+        # representation, so part of the tag.
+        key = f"{self.request.get_full_path()}|{agg['n']}|{agg['top']}|{agg['last']}"
+        etag = '"%s"' % hashlib.md5(key.encode()).hexdigest()
+        # Whole seconds, as HTTP dates carry them.
+        last = int(agg["last"].timestamp()) if agg["last"] else None
+        return etag, last
+
+    def _conditional(self, queryset, respond):
+        etag, last = self._validators(queryset)
+        response = get_conditional_response(self.request, etag=etag, last_modified=last)
+        if response is None:
+            response = respond()
+        response["ETag"] = etag
+        if last is not None:
+            response["Last-Modified"] = http_date(last)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self._conditional(queryset, lambda: super(ConditionalMixin, self).list(
+            request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: kwargs[lookup]})
+        return self._conditional(queryset, lambda: super(ConditionalMixin, self).retrieve(
+            request, *args, **kwargs))
+
+
+class APIViewSetMixin(ConditionalMixin):
+    """Keyset pages, filters, and ``prefetch`` (nested test sets) applied
+    only when the response includes them."""
+
+    pagination_class = KeysetPagination
+    filter_backends = [DjangoFilterBackend]
+    permission_classes = [AllowAny]
+    prefetch = ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        wanted = requested_fields(self.request)
+        lookups = [f for f in self.prefetch if wanted is None or f in wanted]
+        return queryset.prefetch_related(*lookups) if lookups else queryset
+
+
+_SERIAL = {"serial_number": ["exact"], "status": ["exact"], "last_update": ["gte", "lte"]}
+_CHIP = {**_SERIAL, "tray_id": ["exact"], "femb": ["exact"]}
+_TEST = {"test_type": ["exact"], "test_env": ["exact"], "site": ["exact"],
+         "status": ["exact"], "timestamp": ["gte", "lte"]}
+
+
+class FEMBViewSet(APIViewSetMixin, viewsets.ModelViewSet):
+    queryset = FEMB.objects.all()
+    serializer_class = FEMBSerializer
+    filterset_fields = {**_SERIAL, "version": ["exact"]}
+    prefetch = ("fembtest_set",)
+
+    def get_permissions(self):
+        if self.action in ["create", "update", "partial_update", "destroy"]:
+            self.permission_classes = [IsAdminUser]
+        else:
+            self.permission_classes = [AllowAny]
+        return super().get_permissions()
+
+
+class LArASICViewSet(APIViewSetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = LArASIC.objects.all()
+    serializer_class = LArASICSerializer
+    filterset_fields = _CHIP
+
+
+class ColdADCViewSet(APIViewSetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = ColdADC.objects.all()
+    serializer_class = ColdADCSerializer
+    filterset_fields = _CHIP
+
+
+class COLDATAViewSet(APIViewSetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = COLDATA.objects.all()
+    serializer_class = COLDATASerializer
+    filterset_fields = _CHIP
+
+
+class CABLEViewSet(APIViewSetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = CABLE.objects.all()
+    serializer_class = CABLESerializer
+    filterset_fields = {**_SERIAL, "batch_number": ["exact"]}
+    prefetch = ("cabletest_set",)
+
+
+class FembTestViewSet(APIViewSetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = FembTest.objects.all()
+    serializer_class = FembTestSerializer
+    filterset_fields = {**_TEST, "femb": ["exact"]}
+    modified_field = "femb__last_update"
+
+
+class CableTestViewSet(APIViewSetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = CableTest.objects.all()
+    serializer_class = CableTestSerializer
+    filterset_fields = {**_TEST, "cable": ["exact"]}
+    modified_field = "cable__last_update"
@@ -0,0 +1,20 @@
+"""Rebuild the search index (``core.search``) from its source tables.
+
+Writes only the difference, so it's cheap to re-run. Needed once after
+migration 0016 (the index starts empty) and after any out-of-band bulk edit;
+the syncs and ingest commands keep it current otherwise.
+
+    python manage.py rebuild_search_index
+"""
+from django.core.management.base import BaseCommand
+
+from core import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search index behind the typeahead and the explorer search."
+
+    def handle(self, *args, **options):
+        for line in search.rebuild_all():
+            self.stdout.write(line, ending="")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
@@ -141,6 +141,10 @@ class Command(BaseCommand):
 
         with transaction.atomic():
             CableTest.objects.bulk_create(new_tests)
+            # New tests are a change to their cable: the API's
+            # Last-Modified/ETag follow the cable's last_update.
+            CABLE.objects.filter(pk__in={t.cable_id for t in new_tests}).update(
+                last_update=timezone.now())
 
         self.stdout.write(
             self.style.SUCCESS(
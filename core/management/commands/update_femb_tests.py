@@ -180,6 +180,11 @@ class Command(BaseCommand):
         with transaction.atomic():
             FembTest.objects.bulk_create(new_tests)
             FembTest.objects.bulk_update(updated_tests, ["status"])
+            # New or changed tests are a change to their board: the API's
+            # Last-Modified/ETag follow the FEMB's last_update.
+            FEMB.objects.filter(
+                pk__in={t.femb_id for t in new_tests + updated_tests}
+            ).update(last_update=timezone.now())
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -2,6 +2,7 @@ import os
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from decouple import config
+from core import search
 from core.models import LArASIC
 
 
@@ -145,6 +146,9 @@ class Command(BaseCommand):
                     if chips_to_update_objects:
                         LArASIC.objects.bulk_update(chips_to_update_objects, ["tray_id"])
 
+                    if chips_to_create_data:
+                        search.sync_ce("larasic")  # bulk_create skips the index signal
+
                 self.stdout.write(
                     self.style.SUCCESS(f"\nSuccessfully updated the database.")
                 )
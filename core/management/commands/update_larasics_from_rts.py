@@ -27,6 +27,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.db.models import Max
 
+from core import search
 from core.models import LArASIC
 
 BATCH_RE = re.compile(r"^B\d{3,4}T\d{3,4}$")
@@ -368,6 +369,8 @@ class Command(BaseCommand):
             deleted = 0
             if to_delete_count:
                 deleted, _ = to_delete_qs.delete()
+            if to_create:
+                search.sync_ce("larasic")  # bulk_create skips the index signal
         self.stdout.write(self.style.SUCCESS(
             f"Wrote {new_count} new and {updated_count} updated LArASIC rows; "
             f"deleted {deleted} pre-cutoff rows."
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:31
+#
+# The search index (core.search): the SearchDoc table plus a backend-specific
+# matcher over its ``text`` — an external-content FTS5 table with the trigram
+# tokenizer on SQLite (kept in step by triggers), a pg_trgm GIN index on
+# PostgreSQL. Other backends get neither and search falls back to LIKE.
+# Existing rows are indexed by ``manage.py rebuild_search_index``.
+
+from django.db import migrations, models
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE core_searchdoc_fts USING fts5("
+    "text, content='core_searchdoc', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER core_searchdoc_ai AFTER INSERT ON core_searchdoc BEGIN "
+    "INSERT INTO core_searchdoc_fts(rowid, text) VALUES (new.id, new.text); END",
+    "CREATE TRIGGER core_searchdoc_ad AFTER DELETE ON core_searchdoc BEGIN "
+    "INSERT INTO core_searchdoc_fts(core_searchdoc_fts, rowid, text) "
+    "VALUES ('delete', old.id, old.text); END",
+    "CREATE TRIGGER core_searchdoc_au AFTER UPDATE ON core_searchdoc BEGIN "
+    "INSERT INTO core_searchdoc_fts(core_searchdoc_fts, rowid, text) "
+    "VALUES ('delete', old.id, old.text); "
+    "INSERT INTO core_searchdoc_fts(rowid, text) VALUES (new.id, new.text); END",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS core_searchdoc_ai",
+    "DROP TRIGGER IF EXISTS core_searchdoc_ad",
+    "DROP TRIGGER IF EXISTS core_searchdoc_au",
+    "DROP TABLE IF EXISTS core_searchdoc_fts",
+]
+# Django's icontains compiles to UPPER(col) LIKE UPPER(%s) on PostgreSQL, so
+# the trigram index is over UPPER(text) for the planner to pick it up.
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX core_searchdoc_text_trgm ON core_searchdoc "
+    "USING gin (UPPER(text) gin_trgm_ops)",
+]
+POSTGRES_REVERSE = ["DROP INDEX IF EXISTS core_searchdoc_text_trgm"]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_femb_io_1865_1k_00020_note'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDoc',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=8)),
+                ('kind', models.CharField(max_length=12)),
+                ('key', models.CharField(max_length=120)),
+                ('ref', models.CharField(blank=True, default='', max_length=20)),
+                ('note', models.CharField(blank=True, default='', max_length=200)),
+                ('text', models.CharField(max_length=600)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['scope', 'kind', 'ref'], name='core_search_scope_866e23_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scope', 'kind', 'key'), name='uniq_search_doc')],
+            },
+        ),
+        migrations.RunPython(
+            _run({"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD}),
+            _run({"sqlite": SQLITE_REVERSE, "postgresql": POSTGRES_REVERSE}),
+        ),
+    ]
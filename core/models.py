@@ -190,3 +190,33 @@ class CableTest(models.Model):
 
     def __str__(self):
         return f"Test for {self.cable} @ {self.timestamp} ({self.test_type}, {self.test_env})"
+
+
+class SearchDoc(models.Model):
+    """One searchable record in the search index (``core.search``).
+
+    A denormalized copy of what the search boxes match — serials, part ids,
+    type names — kept beside the source rows so a keystroke is one indexed
+    lookup instead of an ``icontains`` scan per table. ``scope`` separates the
+    CETS tables (``"ce"``) from each HWDB mirror instance (``"prod"``/``"dev"``);
+    ``kind`` is the record family and ``key`` its identity within it. ``ref``
+    groups a slice the syncs rewrite together (a part's component type);
+    ``note`` carries a display extra (a part's serial). ``text`` is what's
+    matched: an FTS5 trigram table on SQLite, a ``pg_trgm`` GIN index on
+    PostgreSQL (migration 0016).
+    """
+
+    scope = models.CharField(max_length=8)
+    kind = models.CharField(max_length=12)
+    key = models.CharField(max_length=120)
+    ref = models.CharField(max_length=20, blank=True, default="")
+    note = models.CharField(max_length=200, blank=True, default="")
+    text = models.CharField(max_length=600)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(
+            fields=["scope", "kind", "key"], name="uniq_search_doc")]
+        indexes = [models.Index(fields=["scope", "kind", "ref"])]
+
+    def __str__(self):
+        return f"SearchDoc({self.scope}, {self.kind}, {self.key})"
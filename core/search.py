@@ -0,0 +1,176 @@
+"""The search index behind the typeahead and the explorer's search box.
+
+Search boxes used to ``icontains`` each source table per keystroke — a full
+scan per table. Instead every searchable record gets one ``SearchDoc`` row
+(``core.models``) and a query is one indexed lookup over that table, picked
+by backend:
+
+- **SQLite** — an FTS5 external-content table with the ``trigram``
+  tokenizer (migration 0016), kept in step with ``core_searchdoc`` by
+  triggers. A quoted FTS5 phrase is a case-insensitive substring match, so
+  results equal the old ``icontains``; queries under 3 characters (no
+  trigram to look up) fall back to a LIKE over the doc table.
+- **PostgreSQL** — a ``pg_trgm`` GIN index over ``UPPER(text)``, which the
+  planner uses for the ``icontains`` Django emits; similarity breaks ties.
+- anything else — LIKE over the doc table (still one table, not five).
+
+Docs are kept current incrementally: ``post_save`` receivers for
+row-at-a-time writes, and ``sync_slice`` after the bulk writers (the HWDB
+syncs, the RTS ingest commands), which bypass signals. ``manage.py
+rebuild_search_index`` rebuilds everything from the registered builders —
+run it once after migrating.
+"""
+
+from __future__ import annotations
+
+from django.db import connection, transaction
+from django.db.models import Case, FloatField, Func, IntegerField, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+from .models import SearchDoc, FEMB, LArASIC, ColdADC, COLDATA, CABLE
+
+CE = "ce"  # scope of the CETS tables; HWDB mirror docs use the instance name
+
+_REBUILDERS: list = []
+
+
+def register_rebuilder(fn):
+    """Register ``fn()`` → ``[(scope, kind, ref_or_None, docs), ...]``, a
+    full rebuild of the docs an app owns (see ``rebuild_all``)."""
+    _REBUILDERS.append(fn)
+    return fn
+
+
+def _fts_phrase(q: str) -> str:
+    return '"' + q.replace('"', '""') + '"'
+
+
+def _match(q: str) -> Q:
+    if connection.vendor == "sqlite" and len(q) >= 3:
+        return Q(id__in=RawSQL(
+            "SELECT rowid FROM core_searchdoc_fts WHERE core_searchdoc_fts MATCH %s",
+            [_fts_phrase(q)]))
+    return Q(text__icontains=q)
+
+
+def query(scope: str, kind: str, q: str, limit: int = 25):
+    """Docs of ``kind`` in ``scope`` whose text contains ``q``
+    (case-insensitive), best first: an exact key/note, then a key prefix,
+    then any other hit; ties by key."""
+    rank = Case(
+        When(Q(key__iexact=q) | Q(note__iexact=q), then=Value(0)),
+        When(key__istartswith=q, then=Value(1)),
+        default=Value(2), output_field=IntegerField(),
+    )
+    order = ["rank"]
+    qs = SearchDoc.objects.filter(_match(q), scope=scope, kind=kind).annotate(rank=rank)
+    if connection.vendor == "postgresql":
+        qs = qs.annotate(sim=Func("text", Value(q), function="SIMILARITY",
+                                  output_field=FloatField()))
+        order.append("-sim")
+    return qs.order_by(*order, "key")[:limit]
+
+
+def put(scope: str, kind: str, key: str, text: str, ref: str = "", note: str = ""):
+    """Index one doc; a save that leaves it as stored writes nothing."""
+    doc = {"text": text[:600], "ref": ref, "note": note[:200]}
+    if SearchDoc.objects.filter(scope=scope, kind=kind, key=key).values(*doc).first() == doc:
+        return
+    SearchDoc.objects.update_or_create(scope=scope, kind=kind, key=key, defaults=doc)
+
+
+def drop(scope: str, kind: str, key: str):
+    SearchDoc.objects.filter(scope=scope, kind=kind, key=key).delete()
+
+
+def sync_slice(scope: str, kind: str, docs: dict[str, tuple[str, str]],
+               ref: str | None = None) -> int:
+    """Make the ``(scope, kind)`` docs — only those with ``ref`` when given —
+    exactly ``docs`` (``{key: (text, note)}``), writing just the difference.
+    Returns the number of rows written or removed."""
+    current = {
+        k: (t, n) for k, t, n in SearchDoc.objects
+        .filter(scope=scope, kind=kind, **({"ref": ref} if ref is not None else {}))
+        .values_list("key", "text", "note")
+    }
+    gone = [k for k in current if k not in docs]
+    changed = {k: v for k, v in docs.items() if current.get(k) != (v[0][:600], v[1][:200])}
+    with transaction.atomic():
+        for i in range(0, len(gone), 500):
+            SearchDoc.objects.filter(scope=scope, kind=kind, key__in=gone[i:i + 500]).delete()
+        keys = list(changed)
+        for i in range(0, len(keys), 500):
+            # A key can move between refs (a part re-typed); clear it first.
+            SearchDoc.objects.filter(scope=scope, kind=kind, key__in=keys[i:i + 500]).delete()
+        SearchDoc.objects.bulk_create(
+            [SearchDoc(scope=scope, kind=kind, key=k, ref=ref or "",
+                       text=t[:600], note=n[:200]) for k, (t, n) in changed.items()],
+            batch_size=1000)
+    return len(gone) + len(changed)
+
+
+def rebuild_all():
+    """Rebuild every registered slice; yields a progress line per slice."""
+    for fn in _REBUILDERS:
+        for scope, kind, ref, docs in fn():
+            n = sync_slice(scope, kind, docs, ref)
+            yield f"{scope}/{kind}: {len(docs)} docs ({n} written/removed)\n"
+
+
+# --- CETS component families ---
+
+# kind → (model, URL name); FEMBs are keyed "version/serial".
+CE_FAMILIES = {
+    "femb": (FEMB, "femb_detail"),
+    "larasic": (LArASIC, "larasic_detail"),
+    "coldadc": (ColdADC, "coldadc_detail"),
+    "coldata": (COLDATA, "coldata_detail"),
+    "cable": (CABLE, "cable_detail"),
+}
+_KIND_OF = {model: kind for kind, (model, _) in CE_FAMILIES.items()}
+
+
+def _ce_doc(kind: str, obj) -> tuple[str, str, str]:
+    if kind == "femb":
+        key = f"{obj.version}/{obj.serial_number}"
+        return key, f"{key} {obj.serial_number}", obj.serial_number
+    return obj.serial_number, obj.serial_number, ""
+
+
+def ce_docs(kind: str) -> dict[str, tuple[str, str]]:
+    model = CE_FAMILIES[kind][0]
+    fields = ["version", "serial_number"] if kind == "femb" else ["serial_number"]
+    out = {}
+    for obj in model.objects.only(*fields).iterator(chunk_size=2000):
+        key, text, note = _ce_doc(kind, obj)
+        out[key] = (text, note)
+    return out
+
+
+def sync_ce(kind: str) -> int:
+    """Re-sync one CE family's docs after a bulk write (ingest commands)."""
+    return sync_slice(CE, kind, ce_docs(kind))
+
+
+@register_rebuilder
+def _ce_rebuild():
+    return [(CE, kind, None, ce_docs(kind)) for kind in CE_FAMILIES]
+
+
+def _ce_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not {"serial_number", "version"} & set(update_fields):
+        return
+    kind = _KIND_OF[sender]
+    key, text, note = _ce_doc(kind, instance)
+    put(CE, kind, key, text, note=note)
+
+
+def _ce_deleted(sender, instance, **kwargs):
+    drop(CE, _KIND_OF[sender], _ce_doc(_KIND_OF[sender], instance)[0])
+
+
+def connect_signals():
+    from django.db.models.signals import post_delete, post_save
+    for model in _KIND_OF:
+        post_save.connect(_ce_saved, sender=model, dispatch_uid=f"search-{model.__name__}")
+        post_delete.connect(_ce_deleted, sender=model, dispatch_uid=f"search-del-{model.__name__}")
@@ -1,16 +1,73 @@
 from rest_framework import serializers
-from .models import FEMB, FembTest
+from .models import CABLE, COLDATA, FEMB, CableTest, ColdADC, FembTest, LArASIC
 
 
-class FembTestSerializer(serializers.ModelSerializer):
+def requested_fields(request):
+    """The ``?fields=a,b`` selection as a set, or None for every field."""
+    raw = request.query_params.get("fields", "") if request is not None else ""
+    wanted = {f.strip() for f in raw.split(",") if f.strip()}
+    return wanted or None
+
+
+class SparseFieldsMixin:
+    """Honors ``?fields=`` on the top-level serializer (unknown names are
+    ignored; nested serializers keep all their fields)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        wanted = requested_fields(self.context.get("request"))
+        if wanted:
+            for name in set(self.fields) - wanted:
+                self.fields.pop(name)
+
+
+class FembTestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = FembTest
         fields = "__all__"
 
 
-class FEMBSerializer(serializers.ModelSerializer):
+class FEMBSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     fembtest_set = FembTestSerializer(many=True, read_only=True)
 
     class Meta:
         model = FEMB
-        fields = ["id", "version", "serial_number", "status", "fembtest_set"]
+        fields = ["id", "version", "serial_number", "status", "last_update", "fembtest_set"]
+
+
+class CableTestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = CableTest
+        fields = "__all__"
+
+
+class CABLESerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    cabletest_set = CableTestSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = CABLE
+        fields = ["id", "serial_number", "status", "batch_number", "last_update",
+                  "cabletest_set"]
+
+
+class LArASICSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    # A chip's tests are its RTS warm/cold runs, stamped on the row.
+    class Meta:
+        model = LArASIC
+        fields = ["id", "serial_number", "status", "tray_id", "warm_tested_at",
+                  "cold_tested_at", "femb", "femb_pos", "is_in_hwdb",
+                  "qc_tests_uploaded", "last_update"]
+
+
+class ColdADCSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = ColdADC
+        fields = ["id", "serial_number", "status", "tray_id", "femb", "femb_pos",
+                  "last_update"]
+
+
+class COLDATASerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = COLDATA
+        fields = ["id", "serial_number", "status", "tray_id", "femb", "femb_pos",
+                  "last_update"]
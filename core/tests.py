@@ -5,10 +5,13 @@ from io import StringIO
 from pathlib import Path
 
 from django.core.management import call_command
+from django.db import connection
 from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
 from cets.testutils import make_cets_user
 
+from core import search
 from core.management.commands.update_fembs_from_ocr import (
     components_to_state,
     compute_repair_diff,
@@ -20,7 +23,8 @@ from core.management.commands.update_larasics_from_rts import (
     parse_time_folder,
     scan_batch,
 )
-from core.models import CABLE, COLDATA, FEMB, ColdADC, LArASIC
+from core.models import CABLE, COLDATA, FEMB, CableTest, ColdADC, FembTest, LArASIC
+from hwdb.testing import QueryBudgetMixin
 
 
 class ComponentsToStateTests(SimpleTestCase):
@@ -228,6 +232,175 @@ class ViewSmokeTests(TestCase):
         self.assertTrue(r["Location"].endswith(f"/coldadc/{self.coldadc.serial_number}/"))
 
 
+
+
+class APITests(QueryBudgetMixin, TestCase):
+    """The REST API (core.api): keyset pages, nested tests prefetched,
+    ?fields=, conditional GETs."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_cets_user(username="api")
+        fembs = FEMB.objects.bulk_create(
+            [FEMB(serial_number=f"{i:05d}") for i in range(1, 8)])
+        at = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        FembTest.objects.bulk_create([
+            FembTest(femb=f, timestamp=at, test_type="QC", test_env=env,
+                     report_filename=f"{f.serial_number}-{env}.md")
+            for f in fembs for env in ("RT", "LN")])
+        cable = CABLE.objects.create(serial_number="CBL-00001")
+        CableTest.objects.create(cable=cable, timestamp=at, test_type="QC",
+                                 test_env="RT", report_filename="c.html")
+        LArASIC.objects.create(serial_number="009-00001", femb=fembs[0], femb_pos="F1")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def _walk(self, url):
+        rows = []
+        while url:
+            body = self.client.get(url).json()
+            rows += body["results"]
+            url = body["next"]
+        return rows
+
+    def test_keyset_pages_cover_the_table_once(self):
+        rows = self._walk("/api/femb/?page_size=3")
+        self.assertEqual([r["serial_number"] for r in rows],
+                         [f"{i:05d}" for i in range(1, 8)])
+        self.assertIn("cursor=", self.client.get("/api/femb/?page_size=3").json()["next"])
+
+    def test_nested_tests_are_prefetched(self):
+        # One page: the cursor read + one test read, whatever the number of
+        # boards (plus session, user, zone check and the validator aggregate).
+        with self.assertQueryBudget(6):
+            rows = self.client.get("/api/femb/").json()["results"]
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(len(rows[0]["fembtest_set"]), 2)
+
+    def test_sparse_fields_skip_unrequested_nesting(self):
+        with CaptureQueriesContext(connection) as ctx:
+            rows = self.client.get("/api/femb/?fields=serial_number,status").json()["results"]
+        self.assertEqual(set(rows[0]), {"serial_number", "status"})
+        self.assertFalse([q for q in ctx.captured_queries if "core_fembtest" in q["sql"]])
+
+    def test_conditional_get(self):
+        resp = self.client.get("/api/femb/")
+        etag, modified = resp["ETag"], resp["Last-Modified"]
+        self.assertEqual(self.client.get(
+            "/api/femb/", headers={"If-None-Match": etag}).status_code, 304)
+        self.assertEqual(self.client.get(
+            "/api/femb/", headers={"If-Modified-Since": modified}).status_code, 304)
+        self.assertNotEqual(self.client.get("/api/femb/?fields=id")["ETag"], etag)
+        FEMB.objects.filter(serial_number="00003").update(
+            last_update=datetime(2099, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(self.client.get(
+            "/api/femb/", headers={"If-None-Match": etag}).status_code, 200)
+
+    def test_read_only_endpoints(self):
+        for url, n in [("/api/larasic/", 1), ("/api/coldadc/", 0), ("/api/coldata/", 0),
+                       ("/api/cable/", 1), ("/api/femb-tests/", 14), ("/api/cable-tests/", 1)]:
+            with self.subTest(url=url):
+                resp = self.client.get(url)
+                self.assertEqual(len(resp.json()["results"]), n)
+                self.assertEqual(self.client.post(url, {}).status_code, 405)
+        cable = self.client.get("/api/cable/").json()["results"][0]
+        self.assertEqual(cable["cabletest_set"][0]["test_env"], "RT")
+        rows = self.client.get("/api/femb-tests/", {"test_env": "LN"}).json()["results"]
+        self.assertEqual(len(rows), 7)
+
+    def test_retrieve_is_conditional(self):
+        femb = FEMB.objects.get(serial_number="00001")
+        resp = self.client.get(f"/api/femb/{femb.pk}/")
+        self.assertEqual(resp.json()["serial_number"], "00001")
+        self.assertEqual(self.client.get(
+            f"/api/femb/{femb.pk}/", headers={"If-None-Match": resp["ETag"]}).status_code, 304)
+
+
+class ChipFamilyListTests(TestCase):
+    """The grouped chip-family pages (/larasic/ trays, /coldadc/ FEMBs) are
+    grouped, sorted and paged in the DB."""
+
+    def setUp(self):
+        self.client.force_login(make_cets_user(username="lister"))
+
+    def _trays(self, start, n):
+        t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for i in range(start, start + n):
+            LArASIC.objects.create(serial_number=f"001-{i:05d}", tray_id=f"B001T{i:04d}",
+                                   warm_tested_at=t0.replace(day=1 + i % 28))
+
+    def test_tray_rows_sorted_and_filtered(self):
+        self._trays(1, 3)
+        LArASIC.objects.create(serial_number="001-09999", tray_id="B001T0002",
+                               cold_tested_at=datetime(2025, 6, 1, tzinfo=timezone.utc))
+        page = self.client.get("/larasic/").context["page_obj"]
+        self.assertEqual([r["tray_id"] for r in page], ["B001T0002", "B001T0003", "B001T0001"])
+        self.assertEqual(page[0]["chip_count"], 2)
+        self.assertEqual(page[0]["last_activity"], datetime(2025, 6, 1, tzinfo=timezone.utc))
+        page = self.client.get("/larasic/", {"q": "t0003"}).context["page_obj"]
+        self.assertEqual([r["tray_id"] for r in page], ["B001T0003"])
+
+    def test_query_count_independent_of_group_count(self):
+        self._trays(1, 3)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get("/larasic/")
+        self._trays(4, 30)
+        with CaptureQueriesContext(connection) as many:
+            self.client.get("/larasic/")
+        self.assertEqual(len(many), len(few))
+
+    def test_femb_rows_carry_counts_and_sort_by_femb(self):
+        for sn in ("00002", "00001"):
+            f = FEMB.objects.create(serial_number=sn)
+            ColdADC.objects.create(serial_number=f"2502-{sn}", femb=f, femb_pos="F1")
+        FEMB.objects.create(serial_number="00003")  # no chips → not listed
+        page = self.client.get("/coldadc/", {"sort": "femb", "dir": "asc"}).context["page_obj"]
+        self.assertEqual([r["femb"].serial_number for r in page], ["00001", "00002"])
+        self.assertEqual((page[0]["chip_count"], page[0]["qc"], page[0]["latest_test"]), (1, 0, None))
+
+
+class SearchIndexTests(TestCase):
+    """The typeahead reads the search index (core.search), which row saves
+    and the bulk ingest commands keep current."""
+
+    def setUp(self):
+        self.client.force_login(make_cets_user(username="searcher"))
+        FEMB.objects.create(version="IO-1865-1K", serial_number="00123")
+        LArASIC.objects.create(serial_number="009-00123")
+        LArASIC.objects.create(serial_number="009-01230")
+        ColdADC.objects.create(serial_number="2502-00123")
+
+    def _typeahead(self, q):
+        return self.client.get("/search/typeahead/", {"q": q}).content.decode()
+
+    def test_substring_matches_across_families(self):
+        html = self._typeahead("0123")
+        self.assertIn("IO-1865-1K/00123", html)
+        self.assertIn("/femb/IO-1865-1K/00123/", html)
+        self.assertIn("009-00123", html)
+        self.assertIn("2502-00123", html)
+
+    def test_exact_and_prefix_hits_rank_first(self):
+        keys = [d.key for d in search.query(search.CE, "larasic", "009-01230")]
+        self.assertEqual(keys, ["009-01230"])
+        keys = [d.key for d in search.query(search.CE, "larasic", "0123")]
+        self.assertEqual(keys, ["009-00123", "009-01230"])
+        self.assertEqual([d.key for d in search.query(search.CE, "femb", "00123")],
+                         ["IO-1865-1K/00123"])  # exact serial ranks as exact
+
+    def test_delete_follows_the_row(self):
+        LArASIC.objects.get(serial_number="009-00123").delete()
+        self.assertEqual([d.key for d in search.query(search.CE, "larasic", "009-")],
+                         ["009-01230"])
+
+    def test_rebuild_command_indexes_bulk_rows(self):
+        LArASIC.objects.bulk_create([LArASIC(serial_number="011-00042")])
+        self.assertFalse(search.query(search.CE, "larasic", "011-00042"))
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertIn("/larasic/011-00042/", self._typeahead("011-00042"))
+
+
 def _mkrts(tmp: Path, tree: dict) -> Path:
     """Materialize an RTS fixture tree from a nested dict of folder names.
 
@@ -406,6 +579,9 @@ class UpdateLArasicsFromRtsCommandTests(TestCase):
         self.assertEqual(c.tray_id, "B002T0001")
         self.assertIsNotNone(c.warm_tested_at)
         self.assertIsNotNone(c.cold_tested_at)
+        # bulk_create bypasses signals; the command re-syncs the index.
+        self.assertEqual([d.key for d in search.query(search.CE, "larasic", "002-0460")],
+                         ["002-04605", "002-04606"])
 
     def test_dry_run_makes_no_writes(self):
         with tempfile.TemporaryDirectory() as td:
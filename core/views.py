@@ -10,14 +10,10 @@ from django.utils import timezone
 from django.utils.html import escape
 from django.views.decorators.http import require_POST
 from .models import LArASIC, ColdADC, COLDATA, FEMB, FembRepair, FembTest, CABLE, CableTest
-from . import queries
+from . import queries, search
 from decouple import config
-from django.db.models import Subquery, OuterRef, Q, Count, Max, IntegerField
-from django.db.models.functions import Coalesce
-from rest_framework.permissions import IsAdminUser, AllowAny
-from django_filters.rest_framework import DjangoFilterBackend
-from .serializers import FEMBSerializer
-from rest_framework import viewsets
+from django.db.models import Exists, F, Subquery, OuterRef, Q, Count, Max, IntegerField
+from django.db.models.functions import Coalesce, Greatest
 
 RTS_FILENAME_RE = re.compile(r"^[A-Za-z0-9_.-]+\.csv$")
 
@@ -134,60 +130,25 @@ def search_typeahead(request):
     """HTMX live-search across all component families.
 
     Empty `q` returns an empty fragment so the dropdown stays hidden.
-    Otherwise: substring-match `serial_number` on FEMB, LArASIC, ColdADC,
-    COLDATA, CABLE — up to ~6 per family. The dropdown groups results by
-    family and each row links to that detail page.
+    Otherwise: substring-match serials (and FEMB versions) on FEMB, LArASIC,
+    ColdADC, COLDATA, CABLE through the search index (``core.search``) — up
+    to ~6 per family, exact and prefix hits first. The dropdown groups
+    results by family and each row links to that detail page.
     """
     q = (request.GET.get("q") or "").strip()
     if not q:
         return render(request, "core/_search_typeahead.html", {"groups": [], "q": q})
 
-    n = _TYPEAHEAD_PER_FAMILY
-    groups = [
-        {
-            "family": "FEMB",
-            "items": [
-                {"serial": f"{f.version}/{f.serial_number}",
-                 "url": reverse("femb_detail", args=[f.version, f.serial_number])}
-                for f in FEMB.objects.filter(
-                    Q(serial_number__icontains=q) | Q(version__icontains=q)
-                ).order_by("version", "serial_number")[:n]
-            ],
-        },
-        {
-            "family": "LArASIC",
-            "items": [
-                {"serial": c.serial_number,
-                 "url": reverse("larasic_detail", args=[c.serial_number])}
-                for c in LArASIC.objects.filter(serial_number__icontains=q).order_by("serial_number")[:n]
-            ],
-        },
-        {
-            "family": "ColdADC",
-            "items": [
-                {"serial": c.serial_number,
-                 "url": reverse("coldadc_detail", args=[c.serial_number])}
-                for c in ColdADC.objects.filter(serial_number__icontains=q).order_by("serial_number")[:n]
-            ],
-        },
-        {
-            "family": "COLDATA",
-            "items": [
-                {"serial": c.serial_number,
-                 "url": reverse("coldata_detail", args=[c.serial_number])}
-                for c in COLDATA.objects.filter(serial_number__icontains=q).order_by("serial_number")[:n]
-            ],
-        },
-        {
-            "family": "Cable",
-            "items": [
-                {"serial": c.serial_number,
-                 "url": reverse("cable_detail", args=[c.serial_number])}
-                for c in CABLE.objects.filter(serial_number__icontains=q).order_by("serial_number")[:n]
-            ],
-        },
-    ]
-    groups = [g for g in groups if g["items"]]
+    groups = []
+    for family, kind in (("FEMB", "femb"), ("LArASIC", "larasic"), ("ColdADC", "coldadc"),
+                         ("COLDATA", "coldata"), ("Cable", "cable")):
+        url_name = search.CE_FAMILIES[kind][1]
+        items = []
+        for doc in search.query(search.CE, kind, q, _TYPEAHEAD_PER_FAMILY):
+            args = doc.key.rsplit("/", 1) if kind == "femb" else [doc.key]
+            items.append({"serial": doc.key, "url": reverse(url_name, args=args)})
+        if items:
+            groups.append({"family": family, "items": items})
     return render(request, "core/_search_typeahead.html", {"groups": groups, "q": q})
 
 
@@ -221,6 +182,7 @@ def _tray_options(model):
 
 def _annotate_to_upload(rows):
     """Inject ``to_upload_count`` into each tray row using local-only signals.
+    Called with one page of rows, so it reads only those trays' chips.
 
     A chip needs work if any of:
       - qc_tests_uploaded is False (never uploaded), OR
@@ -306,79 +268,70 @@ def _grouped_chip_response(
     if sort not in sort_keys:
         sort = default_sort
 
-    rows = []
+    # Grouped, filtered, sorted and paged in the DB; only the page's rows are
+    # materialized. Nulls sort last ascending and first descending, as the
+    # page always has.
+    def _order(field):
+        f = F(field)
+        return f.desc(nulls_first=True) if direction == "desc" else f.asc(nulls_last=True)
+
     if view == "tray":
-        tray_annotations = dict(
-            chip_count=Count("id"),
-            rt_tested=Count("id", filter=Q(warm_tested_at__isnull=False)),
-            ln_tested=Count("id", filter=Q(cold_tested_at__isnull=False)),
-            latest_warm=Max("warm_tested_at"),
-            latest_cold=Max("cold_tested_at"),
-        )
-        rows = list(
-            model.objects
-            .exclude(tray_id__isnull=True).exclude(tray_id="")
-            .values("tray_id").annotate(**tray_annotations)
-        )
-        if include_to_upload:
-            _annotate_to_upload(rows)
-        # Flag trays with offline analysis CSVs — sourced from the persistent
-        # TrayCsvCache the upload page maintains. One DB query, no SMB stats.
-        from hwdb.upload import larasic as upload_lib
-        with_csvs = upload_lib.trays_with_analysis([r["tray_id"] for r in rows])
-        for r in rows:
-            w, c = r["latest_warm"], r["latest_cold"]
-            r["last_activity"] = max(w, c) if w and c else (w or c)
-            r["has_csv"] = r["tray_id"] in with_csvs
-        total_groups = len(rows)
+        trays = model.objects.exclude(tray_id__isnull=True).exclude(tray_id="")
+        total_groups = trays.values("tray_id").distinct().count()
         if q:
-            ql = q.lower()
-            rows = [r for r in rows if ql in (r["tray_id"] or "").lower()]
-        rows.sort(
-            key=lambda r: (r.get(sort) is None, r.get(sort) or ""),
-            reverse=(direction == "desc"),
+            trays = trays.filter(tray_id__icontains=q)
+        latest_warm, latest_cold = Max("warm_tested_at"), Max("cold_tested_at")
+        rows = (
+            trays.values("tray_id")
+            .annotate(
+                chip_count=Count("id"),
+                rt_tested=Count("id", filter=Q(warm_tested_at__isnull=False)),
+                ln_tested=Count("id", filter=Q(cold_tested_at__isnull=False)),
+                # max(warm, cold), ignoring whichever side is NULL.
+                last_activity=Greatest(Coalesce(latest_warm, latest_cold),
+                                       Coalesce(latest_cold, latest_warm)),
+            )
+            .order_by(_order(sort), "tray_id")
         )
     else:
-        chip_counts = dict(
-            model.objects.filter(removed_at_repair__isnull=True, femb__isnull=False)
-            .values("femb").annotate(n=Count("id")).values_list("femb", "n")
-        )
-        qc_counts = dict(
-            FembTest.objects.filter(test_type="QC").values("femb")
-            .annotate(n=Count("id")).values_list("femb", "n")
-        )
-        chk_counts = dict(
-            FembTest.objects.filter(test_type="CHK").values("femb")
-            .annotate(n=Count("id")).values_list("femb", "n")
-        )
-        latest_test = dict(
-            FembTest.objects.values("femb").annotate(t=Max("timestamp"))
-            .values_list("femb", "t")
-        )
-        fembs = FEMB.objects.filter(pk__in=chip_counts.keys())
+        installed = model.objects.filter(femb=OuterRef("pk"), removed_at_repair__isnull=True)
+        fembs = FEMB.objects.filter(Exists(installed))
         total_groups = fembs.count()
         if q:
             fembs = fembs.filter(serial_number__icontains=q)
-        for f in fembs:
-            rows.append({
-                "femb": f,
-                "chip_count": chip_counts.get(f.pk, 0),
-                "latest_test": latest_test.get(f.pk),
-                "qc": qc_counts.get(f.pk, 0),
-                "chk": chk_counts.get(f.pk, 0),
-            })
-
-        def _key(r):
-            if sort == "femb":
-                f = r["femb"]
-                return (False, (f.version, f.serial_number))
-            v = r.get(sort)
-            return (v is None, v or 0)
-        rows.sort(key=_key, reverse=(direction == "desc"))
+        fembs = fembs.annotate(
+            chip_count=_installed_chip_count_sq(model),
+            qc=Count("fembtest", filter=Q(fembtest__test_type="QC")),
+            chk=Count("fembtest", filter=Q(fembtest__test_type="CHK")),
+            latest_test=Max("fembtest__timestamp"),
+        )
+        if sort == "femb":
+            prefix = "-" if direction == "desc" else ""
+            rows = fembs.order_by(f"{prefix}version", f"{prefix}serial_number")
+        else:
+            rows = fembs.order_by(_order(sort), "version", "serial_number")
 
     page_size = FAMILY_PAGE_SIZE
     page_obj = Paginator(rows, page_size).get_page(request.GET.get("page"))
 
+    if view == "tray":
+        page_rows = list(page_obj.object_list)
+        if include_to_upload:
+            _annotate_to_upload(page_rows)
+        # Flag trays with offline analysis CSVs — sourced from the persistent
+        # TrayCsvCache the upload page maintains. One DB query, no SMB stats.
+        from hwdb.upload import larasic as upload_lib
+        with_csvs = upload_lib.trays_with_analysis([r["tray_id"] for r in page_rows])
+        for r in page_rows:
+            r["has_csv"] = r["tray_id"] in with_csvs
+    else:
+        page_rows = [
+            {"femb": f, "chip_count": f.chip_count, "qc": f.qc, "chk": f.chk,
+             "latest_test": f.latest_test}
+            for f in page_obj.object_list
+        ]
+    page_obj.object_list = page_rows
+
     context = {
         "view": view,
         "q": q,
@@ -783,16 +736,3 @@ def rts_file_content(request, serial_number, filename):
         return HttpResponseNotFound("<h1>File not found</h1>")
     return HttpResponse(f"<pre>{escape(content)}</pre>")
 
-
-class FEMBViewSet(viewsets.ModelViewSet):
-    queryset = FEMB.objects.all()
-    serializer_class = FEMBSerializer
-    filter_backends = [DjangoFilterBackend]
-    filterset_fields = ["version", "serial_number"]
-
-    def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy"]:
-            self.permission_classes = [IsAdminUser]
-        else:
-            self.permission_classes = [AllowAny]
-        return super().get_permissions()
@@ -5,9 +5,11 @@ an in-app write — so the feed itself never talks to HWDB (keep the mirror
 light). Sync callers log ONE summary row per run, and only when something new
 was mirrored; per-item events from a sync are deliberately impossible here.
 
-The table is a rolling window: ``log()`` prunes rows older than
-``RETENTION_DAYS`` on every write, and the feed view prunes on read so the
-cap holds even on a quiet instance.
+The table is a rolling window: ``prune()`` drops rows older than
+``RETENTION_DAYS``, run periodically by ``manage.py prune_activity`` rather
+than on every write and feed read; it recounts the watchers' unread
+counters it may have left too high. ``log()`` also counts each new row as
+unread for its watchers (``watches.notify``).
 """
 
 from __future__ import annotations
@@ -19,6 +21,7 @@ from django.utils import timezone
 
 from hwdb.fnal.session import LINK_KEY
 
+from . import watches
 from .auth import FNAL_USERNAME_PREFIX
 from .models import ActivityEvent
 
@@ -41,10 +44,14 @@ def actor_of(request) -> str:
     return request.user.get_username().removeprefix(FNAL_USERNAME_PREFIX)
 
 
-def prune() -> None:
-    """Drop feed rows older than the retention window (all instances)."""
+def prune() -> int:
+    """Drop feed rows older than the retention window (all instances), and
+    recount the unread badges that counted them. Returns how many went."""
     cutoff = timezone.now() - timedelta(days=RETENTION_DAYS)
-    ActivityEvent.objects.filter(created_at__lt=cutoff).delete()
+    n = ActivityEvent.objects.filter(created_at__lt=cutoff).delete()[0]
+    if n:
+        watches.recount_unread()
+    return n
 
 
 def log(instance: str, kind: str, summary: str, *,
@@ -52,9 +59,9 @@ def log(instance: str, kind: str, summary: str, *,
     """Record one feed row. Never raises — the feed must not sink the write
     or sync it rides on."""
     try:
-        ActivityEvent.objects.create(
+        event = ActivityEvent.objects.create(
             instance=instance, kind=kind, summary=summary,
             part_id=part_id, part_type_id=part_type_id, actor=actor)
-        prune()
+        watches.notify(event)
     except Exception:
         logger.exception("activity log failed (%s: %s)", kind, summary)
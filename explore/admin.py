@@ -16,4 +16,15 @@ class HierarchyNodeAdmin(admin.ModelAdmin):
     search_fields = ("part_type_id", "name", "full_name")
 
 
-admin.site.register([HwdbTestEvent, HwdbComponentEvent, HierarchySyncState])
+@admin.register(HwdbTestEvent)
+class HwdbTestEventAdmin(admin.ModelAdmin):
+    list_display = ("part_type_id", "part_key", "test_type", "created")
+    raw_id_fields = ("part_key", "test_type")
+
+    def get_queryset(self, request):
+        # Every admin page that names events (list, change, delete
+        # confirmation, action log) reads both lookups in the same query.
+        return super().get_queryset(request).select_related("part_key", "test_type")
+
+
+admin.site.register([HwdbComponentEvent, HierarchySyncState])
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ExploreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'explore'
+
+    def ready(self):
+        from . import navigation, search
+        navigation.connect_signals()
+        search.connect_signals()
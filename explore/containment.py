@@ -0,0 +1,148 @@
+"""The mirrored containment graph as a closure table (``ContainmentPath``).
+
+Containment lives in HWDB as per-item live calls (``get_container``,
+``get_subcomponents``); the mirror keeps one edge per item
+(``HwdbComponentEvent.parent_part_id``, fresh from the tests sync, the
+parent sweep and box refreshes). This module keeps the transitive closure
+of those edges beside them, so subtree and ancestor questions are one
+indexed query instead of a walk:
+
+- ``descendants`` / ``n_inside`` — everything inside an item, any depth;
+- ``ancestors`` — the chain of boxes/assemblies holding it, nearest first;
+- ``children_map`` — a subtree's parent → children edges (the ES subtree
+  walk's read-ahead).
+
+Writers report the edges they just learned through ``set_parents`` (a
+moved item carries its whole subtree along); ``rebuild`` recomputes one
+instance from the mirror. The graph is a guess, like the mirror under it —
+callers that act on containment still verify live.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from django.db import transaction
+
+from .models import ContainmentPath, HwdbComponentEvent
+
+logger = logging.getLogger(__name__)
+
+
+def closure(edges: dict[str, str]) -> list[tuple[str, str, int]]:
+    """``[(ancestor, descendant, depth)]`` for ``child → parent`` edges. A
+    cycle (HWDB shouldn't have one; a half-synced mirror might) is cut where
+    the chain first revisits a node."""
+    out = []
+    for child in edges:
+        seen, node, depth = {child}, child, 0
+        while (parent := edges.get(node)) and parent not in seen:
+            depth += 1
+            out.append((parent, child, depth))
+            seen.add(parent)
+            node = parent
+    return out
+
+
+def rebuild(instance: str) -> int:
+    """Recompute the instance's closure from the mirrored parent edges;
+    returns the number of paths."""
+    edges = dict(HwdbComponentEvent.for_instance(instance)
+                 .exclude(parent_part_id="")
+                 .values_list("part_id", "parent_part_id"))
+    rows = [ContainmentPath(instance=instance, ancestor=a, descendant=d, depth=n)
+            for a, d, n in closure(edges)]
+    with transaction.atomic():
+        ContainmentPath.for_instance(instance).delete()
+        ContainmentPath.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def _subtree(instance: str, pid: str) -> list[tuple[str, int]]:
+    """``pid`` and its descendants, with their depth below it."""
+    return [(pid, 0)] + list(ContainmentPath.for_instance(instance)
+                             .filter(ancestor=pid).values_list("descendant", "depth"))
+
+
+def _chain(instance: str, pid: str) -> list[tuple[str, int]]:
+    """``pid`` and its ancestors, with their height above it."""
+    return [(pid, 0)] + list(ContainmentPath.for_instance(instance)
+                             .filter(descendant=pid).values_list("ancestor", "depth"))
+
+
+def set_parents(instance: str, parents: dict[str, str]) -> int:
+    """Apply ``child → parent`` edges ("" = free) to the closure, moving each
+    changed child's subtree along with it. Unchanged edges cost nothing past
+    one lookup; an edge that would close a cycle is refused with a warning.
+    Returns how many edges changed."""
+    if not parents:
+        return 0
+    current = dict(ContainmentPath.for_instance(instance)
+                   .filter(descendant__in=list(parents), depth=1)
+                   .values_list("descendant", "ancestor"))
+    moved = 0
+    with transaction.atomic():
+        for child, parent in parents.items():
+            parent = parent or ""
+            if current.get(child, "") == parent:
+                continue
+            sub = _subtree(instance, child)
+            below = [d for d, _n in sub]
+            if parent in below:
+                logger.warning("containment: %s inside %s would be a cycle; skipped",
+                               parent, child)
+                continue
+            above = [a for a, _n in _chain(instance, child)[1:]]
+            if above:
+                (ContainmentPath.for_instance(instance)
+                 .filter(ancestor__in=above, descendant__in=below).delete())
+            if parent:
+                ContainmentPath.objects.bulk_create(
+                    [ContainmentPath(instance=instance, ancestor=a, descendant=d,
+                                     depth=na + 1 + nd)
+                     for a, na in _chain(instance, parent) for d, nd in sub],
+                    batch_size=1000)
+            moved += 1
+    return moved
+
+
+def set_contents(instance: str, box_pid: str, members) -> int:
+    """A box's live manifest → edges: ``members`` sit in ``box_pid``, and
+    whatever the graph still had there has left."""
+    members = set(members)
+    gone = (ContainmentPath.for_instance(instance)
+            .filter(ancestor=box_pid, depth=1).exclude(descendant__in=members)
+            .values_list("descendant", flat=True))
+    return set_parents(instance, {**{pid: "" for pid in gone},
+                                  **{pid: box_pid for pid in members}})
+
+
+def descendants(instance: str, pid: str) -> list[tuple[str, int]]:
+    """Everything inside ``pid`` as ``(part_id, depth)``, nearest first."""
+    return list(ContainmentPath.for_instance(instance).filter(ancestor=pid)
+                .order_by("depth", "descendant").values_list("descendant", "depth"))
+
+
+def n_inside(instance: str, pid: str) -> int:
+    return ContainmentPath.for_instance(instance).filter(ancestor=pid).count()
+
+
+def ancestors(instance: str, pid: str) -> list[str]:
+    """The boxes/assemblies holding ``pid``, nearest first (the last one is
+    the top-level holder)."""
+    return list(ContainmentPath.for_instance(instance).filter(descendant=pid)
+                .order_by("depth").values_list("ancestor", flat=True))
+
+
+def children_map(instance: str, root_pid: str, limit: int | None = None) -> dict:
+    """parent → child pids for the subtree under ``root_pid``, in one query
+    (the direct-parent rows of every descendant)."""
+    inside = (ContainmentPath.for_instance(instance).filter(ancestor=root_pid)
+              .values("descendant"))
+    edges = (ContainmentPath.for_instance(instance)
+             .filter(depth=1, descendant__in=inside)
+             .order_by("ancestor", "descendant").values_list("ancestor", "descendant"))
+    out: dict[str, list[str]] = {}
+    for parent, child in (edges[:limit] if limit else edges):
+        out.setdefault(parent, []).append(child)
+    return out
@@ -1,7 +1,7 @@
 """Template context for the URL-carried HWDB instance (#47): the banner flag
 and the prod⇄dev switch targets rendered in explore/base.html. Plus the
 watched-activity badge (#90), computed lazily so only templates that render
-it (explore/base.html) pay its two small mirror queries."""
+it (explore/base.html) pay its one-row cursor read."""
 
 from django.urls import reverse
 from django.utils.functional import SimpleLazyObject
@@ -70,6 +70,23 @@ def project_label(instance: str, project_id: str) -> str:
     return f"Project {project_id}"
 
 
+# instance → (regions, block, fingerprint) of the parse it was taken from.
+_FINGERPRINTS: dict[str, tuple] = {}
+
+
+def fingerprint(instance: str) -> str:
+    """A cheap identity for an instance's curation — the key half that
+    invalidates trees built from it (``navigation``'s per-version cache).
+    Memoized per parse, like ``load_curation``: the repr is only rebuilt
+    when the blocks it read are different objects (a new parse, or a test
+    patching them)."""
+    regs, block = regions(instance), _block(instance)
+    memo = _FINGERPRINTS.get(instance)
+    if memo is None or memo[0] is not regs or memo[1] is not block:
+        memo = _FINGERPRINTS[instance] = (regs, block, repr((regs, block)))
+    return memo[2]
+
+
 def _family_is_browsable(fam: dict) -> bool:
     return fam.get("curated", True) is not False and bool(fam.get("systems"))
 
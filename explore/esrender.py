@@ -0,0 +1,349 @@
+"""Executive-summary renders off the request, content-addressed: the summary
+PDFs and the numeric plots on the signing page.
+
+``execsummary.render_detail_pdf`` / ``build_default_pdf`` take seconds on
+a plot-heavy summary (reportlab + embedded images + a merged supplemental
+PDF), so the signing page hands the render to the module's process pool
+(``settings.ES_PDF_WORKERS`` slots; 0 renders inline) and polls for it —
+reportlab, like matplotlib below, is CPU-bound Python and would serialize
+the web worker's threads on the GIL. A render is keyed by a hash of
+everything that goes into it — the form dict, every plot's bytes, the
+supplemental PDF and ``RENDER_VERSION`` — so an identical re-render is a
+file lookup. Layout under ``settings.ES_PDF_CACHE_DIR``:
+
+- ``<key>.pdf`` — a finished render;
+- ``<key>.json`` — a render in flight or failed:
+  ``{"state": …, "started": …, "error": …, "host": …, "pid": …}``;
+- ``posted/<ticket>.claim`` — a delivery of a finished render that has been
+  taken (``claim``), so overlapping polls post it once.
+
+State lives on disk rather than in the worker, so a poll answered by
+another gunicorn worker sees the same job. A "rendering" record names the
+process rendering it (host + pid; the pool process rewrites it when it
+starts); once that process is gone — a recycled or killed worker — the job
+counts as missing and the next Generate renders it again. A pool process
+that dies mid-render fails its job. PDFs unused for ``KEEP_DAYS`` are
+pruned after each render.
+
+Numeric plot PNGs (``execsummary.render_numeric_plot``) are cached under
+``plots/<key>.png``, keyed by the test record they draw, the plot's config
+and its label (``plot_key``). Misses render in the same process pool
+(``settings.ES_PLOT_WORKERS`` more slots; 0 renders in the calling thread).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+
+from hwdb import metrics
+
+logger = logging.getLogger(__name__)
+
+# Bump when the PDF layout changes, so renders cached under the old layout
+# stop matching.
+RENDER_VERSION = 2
+KEEP_DAYS = 30
+_KEY = re.compile(r"[0-9a-f]{64}")
+_TICKET = re.compile(r"[0-9a-f]{32}")
+
+RENDERING, DONE, FAILED, MISSING = "rendering", "done", "failed", "missing"
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+_futures: dict[str, Future] = {}
+
+
+@dataclass(frozen=True)
+class Job:
+    key: str
+    state: str
+    started: float | None = None
+    error: str = ""
+
+    @property
+    def elapsed(self) -> int:
+        return int(time.time() - self.started) if self.started else 0
+
+
+def _root() -> Path:
+    return Path(settings.ES_PDF_CACHE_DIR)
+
+
+def _canon(value):
+    """``value`` as plain JSON, bytes replaced by their hash."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"sha256": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, dict):
+        return {str(k): _canon(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canon(v) for v in value]
+    return value
+
+
+def render_key(kind: str, part_id: str, inputs: dict,
+               attachment: bytes | None = None) -> str:
+    """The cache key of one render: ``kind`` ("detail"/"default"), the part,
+    the builder's inputs and an optional appended PDF."""
+    doc = {"v": RENDER_VERSION, "kind": kind, "part_id": part_id,
+           "inputs": _canon(inputs), "attachment": _canon(attachment)}
+    blob = json.dumps(doc, sort_keys=True, default=str).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _write_atomic(dest: Path, data: bytes) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, dest)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _set_state(root: Path, key: str, state: str, error: str = "",
+               started: float | None = None) -> None:
+    """Write ``key``'s job record, owned by this process."""
+    _write_atomic(root / f"{key}.json", json.dumps(
+        {"state": state, "started": started or time.time(), "error": error,
+         "host": socket.gethostname(), "pid": os.getpid()}).encode())
+
+
+def _owner_alive(meta: dict) -> bool:
+    """Whether the process named by a job record still runs. A record from
+    another host can't be checked here and is taken at its word."""
+    if meta.get("host") != socket.gethostname():
+        return True
+    try:
+        os.kill(int(meta.get("pid") or 0), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, ValueError):
+        pass
+    return True
+
+
+def lookup(key: str) -> Path | None:
+    """The finished PDF for ``key``, or None."""
+    if not _KEY.fullmatch(key):
+        return None
+    path = _root() / f"{key}.pdf"
+    hit = path.is_file()
+    metrics.cache_lookup("es_pdf", hit)
+    if not hit:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return path
+
+
+def status(key: str) -> Job:
+    if lookup(key) is not None:
+        return Job(key, DONE)
+    if not _KEY.fullmatch(key):
+        return Job(key, MISSING)
+    try:
+        meta = json.loads((_root() / f"{key}.json").read_text())
+    except (OSError, ValueError):
+        return Job(key, MISSING)
+    job = Job(key, meta.get("state") or MISSING, meta.get("started"),
+              meta.get("error") or "")
+    if job.state == RENDERING and not _owner_alive(meta):
+        return Job(key, MISSING)
+    return job
+
+
+def claim(key: str, ticket: str) -> bool:
+    """Take the one delivery ``ticket`` names of the finished render ``key``
+    — True for exactly one caller, in any worker: the claim is an exclusive
+    create on disk. False when the render isn't done or the ticket is taken."""
+    if not _TICKET.fullmatch(ticket) or status(key).state != DONE:
+        return False
+    d = _root() / "posted"
+    d.mkdir(parents=True, exist_ok=True)
+    try:
+        os.close(os.open(d / f"{ticket}.claim", os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    return True
+
+
+def _run(root: Path, key: str, started: float, render, args: tuple) -> None:
+    """One PDF render: ``render(*args)`` → ``<key>.pdf``. Runs in a pool
+    process (or inline), so it takes the cache root rather than reading
+    settings, and first claims the job record as its own."""
+    _set_state(root, key, RENDERING, started=started)
+    try:
+        pdf = render(*args)
+    except ValueError as e:   # bad input, e.g. an unreadable supplement
+        logger.info("es render %s refused: %s", key[:12], e)
+        _set_state(root, key, FAILED, str(e))
+        return
+    except Exception as e:
+        logger.exception("es render %s failed", key[:12])
+        _set_state(root, key, FAILED, str(e))
+        return
+    _write_atomic(root / f"{key}.pdf", pdf)
+    (root / f"{key}.json").unlink(missing_ok=True)
+    prune(root=root)
+
+
+def _executor() -> ProcessPoolExecutor:
+    """The process pool shared by PDF and plot renders."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the parent is a threaded web worker.
+            _pool = ProcessPoolExecutor(
+                max_workers=max(1, settings.ES_PDF_WORKERS + settings.ES_PLOT_WORKERS),
+                mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _reset_pool() -> None:
+    """Drop the pool (broken, or torn down by a test); the next render
+    starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _settled(root: Path, key: str, fut: Future) -> None:
+    """A render's future finished. ``_run`` records its own outcome; an
+    exception here means the pool process died under it."""
+    _futures.pop(key, None)
+    if fut.cancelled() or fut.exception() is None:
+        return
+    e = fut.exception()
+    logger.warning("es render %s lost its process: %s", key[:12], e)
+    if isinstance(e, BrokenProcessPool):
+        _reset_pool()
+    _set_state(root, key, FAILED, "the render process died; generate again")
+
+
+def submit(key: str, render, *args) -> Job:
+    """Start rendering ``key`` with ``render(*args)`` (→ PDF bytes) unless
+    it is already cached or in flight; returns the job as it stands.
+    ``render`` and ``args`` cross into a pool process, so they must pickle
+    (a module-level function, plain data). A failed job is retried. With
+    no workers configured the render runs here and the returned job is
+    already finished."""
+    job = status(key)
+    if job.state in (DONE, RENDERING):
+        return job
+    root, started = _root(), time.time()
+    _set_state(root, key, RENDERING, started=started)
+    if settings.ES_PDF_WORKERS <= 0:
+        _run(root, key, started, render, args)
+    else:
+        fut = _executor().submit(_run, root, key, started, render, args)
+        _futures[key] = fut
+        fut.add_done_callback(lambda f: _settled(root, key, f))
+    return status(key)
+
+
+def wait(key: str, timeout: float | None = None) -> Job:
+    """Block until this process's render of ``key`` finishes (tests, CLI)."""
+    fut = _futures.get(key)
+    if fut is not None:
+        try:
+            fut.exception(timeout)
+        except TimeoutError:
+            return status(key)
+        _settled(_root(), key, fut)   # don't race the done-callback
+    return status(key)
+
+
+def prune(max_age_days: int = KEEP_DAYS, root: Path | None = None) -> int:
+    """Drop renders (job records, plot PNGs, delivery claims) untouched for
+    ``max_age_days``."""
+    root = root or _root()
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for d in (root, root / "plots", root / "posted"):
+        if not d.is_dir():
+            continue
+        for p in d.iterdir():
+            if p.name.startswith(".tmp-") or p.suffix not in (".pdf", ".json", ".png", ".claim"):
+                continue
+            try:
+                if p.stat().st_mtime < cutoff:
+                    p.unlink(missing_ok=True)
+                    removed += 1
+            except OSError:
+                continue
+    return removed
+
+
+# ---- numeric plot PNGs ------------------------------------------------------
+
+def plot_key(record_ref: str, plot: dict, label: str) -> str:
+    """The cache key of one plot PNG: the record it draws (an HWDB test
+    record id, or a digest of the data when there is none), the plot's
+    config and the label in its title."""
+    doc = {"v": RENDER_VERSION, "record": record_ref, "plot": _canon(plot),
+           "label": label}
+    blob = json.dumps(doc, sort_keys=True, default=str).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def render_plots(jobs) -> list[tuple[bytes | None, str | None]]:
+    """``[(png | None, note | None)]`` for ``jobs`` — ``(key, render, args)``
+    triples, ``render(*args)`` returning the same pair. Cached PNGs come
+    from disk; the misses render side by side in the process pool and the
+    PNGs are cached (notes aren't — a miss without a plot is cheap). A
+    renderer that raises costs its own slot a note, not the page."""
+    plots = _root() / "plots"
+    out: list = [None] * len(jobs)
+    misses = []
+    for i, (key, _render, _args) in enumerate(jobs):
+        path = plots / f"{key}.png"
+        try:
+            out[i] = (path.read_bytes(), None)
+            os.utime(path)
+        except OSError:
+            misses.append(i)
+    metrics.cache_lookup("es_plot", True, len(jobs) - len(misses))
+    metrics.cache_lookup("es_plot", False, len(misses))
+    if not misses:
+        return out
+    futs = {}
+    if settings.ES_PLOT_WORKERS > 0:
+        pool = _executor()
+        futs = {i: pool.submit(jobs[i][1], *jobs[i][2]) for i in misses}
+    for i in misses:
+        key, render, args = jobs[i]
+        try:
+            try:
+                out[i] = futs[i].result() if i in futs else render(*args)
+            except BrokenProcessPool:
+                logger.warning("es plot pool broke; rendering in-thread")
+                _reset_pool()
+                out[i] = render(*args)
+        except Exception as e:
+            logger.exception("es plot %s failed", key[:12])
+            out[i] = (None, f"the plot could not be drawn ({e}).")
+            continue
+        if out[i][0]:
+            _write_atomic(plots / f"{jobs[i][0]}.png", out[i][0])
+    return out
@@ -23,10 +23,13 @@ from typing import Iterator
 from django.conf import settings
 from django.utils import timezone
 
+from hwdb import metrics
 from hwdb.api_client import FnalDbApiClient
 
-from . import activity, parts
-from .models import ActivityEvent, HierarchyNode, HwdbComponentEvent, HwdbTestEvent
+from . import activity, containment, parts, search, testvalues
+from .models import (
+    ActivityEvent, HierarchyNode, HwdbComponentEvent, HwdbTestEvent, HwdbTestValue, PartKey,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -220,6 +223,7 @@ def sweep_parents(api, instance: str, part_type_id: str) -> int | None:
     if changed:
         HwdbComponentEvent.objects.bulk_update(
             changed, ["parent_part_id", "status", "status_id"], batch_size=500)
+        containment.set_parents(instance, {r.part_id: r.parent_part_id for r in changed})
     return len(changed)
 
 
@@ -257,7 +261,8 @@ def _ref_name(v) -> str:
 
 def _fetch_component(api, part_id: str, date_spec: dict | None,
                      test_type_ids: dict[str, int], *,
-                     need_detail: bool, need_tests: bool) -> dict:
+                     need_detail: bool, need_tests: bool,
+                     value_spec: dict | None = None) -> dict:
     """Per-component fetch; the caller decides which halves to pull.
 
     - ``need_detail`` → one ``components/{pid}`` call for ``created``/``updated``
@@ -266,6 +271,9 @@ def _fetch_component(api, part_id: str, date_spec: dict | None,
       default) that's one summary call; with it set (a registry type) it's one
       *detailed* call per defined test type, reading the physics date out of
       ``test_data`` per the spec, with a ``created`` fallback.
+    - ``value_spec`` (a type with "sum" ES plots, ``testvalues.value_spec``)
+      → the opted-in numeric values too: one history call per listed test
+      type alongside the tests, item_paths out of the detail record.
     """
     tests = []
     if need_tests:
@@ -287,6 +295,7 @@ def _fetch_component(api, part_id: str, date_spec: dict | None,
     created = updated = None
     serial = created_by = status = manufacturer = institution = parent = ""
     installed = uploaded = certified = status_id = None
+    detail = None
     if need_detail:
         detail = api._make_request("GET", f"components/{part_id}")
         d = detail.get("data") if isinstance(detail.get("data"), dict) else {}
@@ -307,6 +316,11 @@ def _fetch_component(api, part_id: str, date_spec: dict | None,
         # The box/assembly currently holding this item (#63); "" when free.
         parent = d.get("parent_part_id") or ""
 
+    test_values, item_values = (
+        testvalues.extract_values(api, part_id, value_spec, tests=need_tests,
+                                  detail=detail)
+        if value_spec else ([], []))
+
     return {
         "part_id": part_id, "created": created, "updated": updated,
         "serial_number": serial, "created_by": created_by, "status": status,
@@ -315,9 +329,11 @@ def _fetch_component(api, part_id: str, date_spec: dict | None,
         "is_installed": installed, "qaqc_uploaded": uploaded,
         "certified_qaqc": certified, "parent_part_id": parent,
         "tests": tests, "has_detail": need_detail, "has_tests": need_tests,
+        "test_values": test_values, "item_values": item_values,
     }
 
 
+@metrics.sync_job("sync_test_events")
 def sync_test_events(
     api_base_url: str,
     bearer: str,
@@ -362,6 +378,12 @@ def sync_test_events(
                 f"sync tests: using physics date '{date_spec['label']}' from "
                 f"{len(test_type_ids)} test type(s)\n"
             )
+        value_spec = testvalues.spec_for(bootstrap, part_type_id)
+        if value_spec:
+            yield (
+                f"sync tests: mirroring {sum(map(len, value_spec.values()))} "
+                f"numeric path(s) for type-wide ES plots\n"
+            )
 
         yield f"sync tests ({mode}): listing components for {part_type_id}\n"
         part_ids = list(_list_part_ids(bootstrap, part_type_id))
@@ -400,7 +422,8 @@ def sync_test_events(
                             lambda p=pid: _fetch_component(
                                 tls.client, p, date_spec, test_type_ids,
                                 need_detail=p in detail_set,
-                                need_tests=p in tests_set)): pid
+                                need_tests=p in tests_set,
+                                value_spec=value_spec)): pid
                         for pid in process}
                 for fut in as_completed(futs):
                     try:
@@ -419,16 +442,16 @@ def sync_test_events(
         else:
             # append for the (new) components we fetched tests for; clear any
             # stale rows for exactly those first so a retry can't double-insert.
-            fetched_test_pids = [r["part_id"] for r in results if r["has_tests"]]
+            fetched_test_keys = PartKey.intern(
+                instance, [r["part_id"] for r in results if r["has_tests"]])
             HwdbTestEvent.for_instance(instance).filter(
-                part_type_id=part_type_id, part_id__in=fetched_test_pids
+                part_type_id=part_type_id, part_key_id__in=fetched_test_keys.values()
             ).delete()
-        new_test_rows = [
-            HwdbTestEvent(instance=instance, part_type_id=part_type_id,
-                          part_id=r["part_id"], test_type_name=name, created=dt)
+        new_test_rows = HwdbTestEvent.build(instance, part_type_id, (
+            (r["part_id"], name, dt)
             for r in results if r["has_tests"]
             for name, dt in r["tests"]
-        ]
+        ))
         if new_test_rows:
             HwdbTestEvent.objects.bulk_create(new_test_rows, batch_size=1000)
 
@@ -458,6 +481,39 @@ def sync_test_events(
             ],
             batch_size=1000,
         )
+        search.index_parts(instance, part_type_id)
+        # The detail records carry each item's current parent. A rewrite
+        # drops the rows of items it didn't bring back (gone from HWDB, or
+        # their fetch failed); their edge goes with them, as ``rebuild``
+        # would have it.
+        parents = {r["part_id"]: r["parent_part_id"] for r in results if r["has_detail"]}
+        if mode in ("full", "components"):
+            parents.update(dict.fromkeys(known - parents.keys(), ""))
+        containment.set_parents(instance, parents)
+
+        # --- Numeric test values (type-wide "sum" plots) ---
+        # Same rewrite rule as the events: full clears the type (a plot that
+        # dropped "sum" drops its rows); otherwise each fetched component's
+        # rows are replaced — test values where tests were fetched, item
+        # values where the detail was.
+        values = HwdbTestValue.for_instance(instance).filter(part_type_id=part_type_id)
+        if mode == "full":
+            values.delete()
+        elif value_spec:
+            values.filter(part_id__in=[r["part_id"] for r in results if r["has_tests"]]
+                          ).exclude(test_type_name=testvalues.ITEM_SPECS).delete()
+            values.filter(part_id__in=[r["part_id"] for r in results if r["has_detail"]],
+                          test_type_name=testvalues.ITEM_SPECS).delete()
+        HwdbTestValue.objects.bulk_create(
+            [
+                HwdbTestValue(instance=instance, part_type_id=part_type_id,
+                              part_id=r["part_id"], test_type_name=name,
+                              test_id=test_id, path=path, idx=idx, value=value)
+                for r in results
+                for name, test_id, path, idx, value in r["test_values"] + r["item_values"]
+            ],
+            batch_size=1000,
+        )
 
         # --- Availability sweep (issue #63) ---
         # The detail record doesn't carry HWDB's approval flag, but the
@@ -473,6 +529,7 @@ def sync_test_events(
         node.n_tests = n_tests
         node.n_components = len(part_ids) or node.n_components
         node.save(update_fields=["tests_synced_at", "n_tests", "n_components"])
+        metrics.sync_items(len(part_ids))
 
         # Activities feed (#88): one summary row per run, only when the run
         # mirrored something new. ``new_test_rows`` counts ALL rewritten rows
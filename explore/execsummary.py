@@ -14,17 +14,18 @@ Dashboard's behavior (mechanics mapped on #53/#54):
   role-gated against the caller's ``whoami`` roles.
 - **PDF** — reportlab platypus (the Dashboard's stack), DETAIL layout incl.
   config plots; filename ``ExecutiveSummary_{pid}_{YYYYmmdd_HHMMSS}.pdf`` —
-  the pre-shipping gate's convention.
+  the pre-shipping gate's convention. The "Generated" time is stamped on
+  at delivery (``stamp_pdf``), outside the cached render.
 """
 
 from __future__ import annotations
 
 import base64
+import hashlib
 import io
 import json
 import logging
 import re
-from datetime import datetime
 
 from xml.sax.saxutils import escape
 
@@ -36,6 +37,8 @@ from reportlab.platypus import (
     Table, TableStyle,
 )
 
+from . import esrender
+
 logger = logging.getLogger(__name__)
 
 # The Dashboard's status vocabulary. Ids 1-3 are the obsolete pre-change set
@@ -171,9 +174,10 @@ def _normalize(cfg: dict) -> dict:
             refs.append({"url": str(r["url"]), "comments": str(r.get("comments") or "")})
     # Plots: every entry becomes a slot the page can fill. image_path entries
     # resolve from a test record (the Dashboard convention); numeric
-    # data_paths entries render from the item's latest test record (single
-    # item only — no type-wide "sum"); either kind can instead carry a
-    # manually-uploaded image (see plot_upload_prefix).
+    # data_paths entries render from the item's latest test record, plus the
+    # type-wide population when "sum" is set (drawn from the mirrored values,
+    # see testvalues); either kind can instead carry a manually-uploaded
+    # image (see plot_upload_prefix).
     plots = []
     for i, p in enumerate(cfg.get("plots") or []):
         if not isinstance(p, dict):
@@ -222,7 +226,8 @@ def _normalize(cfg: dict) -> dict:
             dps = [str(x) for x in p.get("data_paths") or []]
             ips = [] if dps else [str(x) for x in p.get("item_paths") or []]
             plots.append({**base, "kind": "numeric", "bins": bins,
-                          "data_paths": dps, "item_paths": ips})
+                          "data_paths": dps, "item_paths": ips,
+                          "population": bool(p.get("sum"))})
     # Arbitrary top-level keys (#86, Hajime 2026-08-04): the editor's "Extra
     # fields" card writes them; they are ES-level facts, shown on the page
     # and in the PDF header — not silently carried.
@@ -343,11 +348,12 @@ def todos_payload(cfg, checked: list[int]) -> dict:
 # ---- Config plots -----------------------------------------------------------
 # The Dashboard's image plots: each image_path entry points at an image
 # already attached to a test record in HWDB. Numeric data_paths plots (Plotly
-# histograms, optional type-wide "sum") are NOT rendered: the sum variant
-# means a live fetch across every item of the type, which the Explorer's
-# keep-the-mirror-light rule forbids. Instead, ANY slot accepts a manually
-# uploaded image (rendered elsewhere, e.g. by the Dashboard), posted onto the
-# item under a deterministic ESPlot_* name; the newest upload wins the slot.
+# histograms) render here with matplotlib; their type-wide "sum" variant
+# draws from the values the tests sync mirrors for opted-in types
+# (``testvalues``) — a live fetch across every item of the type would break
+# the keep-the-mirror-light rule. ANY slot also accepts a manually uploaded
+# image (rendered elsewhere, e.g. by the Dashboard), posted onto the item
+# under a deterministic ESPlot_* name; the newest upload wins the slot.
 
 def _plot_slug(index: int, title) -> str:
     """Filename-safe identity of one config plot slot, e.g. ``p02-Gain-hist``.
@@ -423,6 +429,59 @@ def _test_record_at(api, pid: str, test_type_name: str, history_order: int):
     return (rec if isinstance(rec, dict) else None), None
 
 
+def _shared_read(cli, key):
+    """One ``_SharedReads`` call; the error is returned, not raised, so a
+    parallel prefetch keeps it for the slot that needs it."""
+    method, *args = key
+    try:
+        if method == "get_tests":
+            pid, test_type_name, history = args
+            return cli.get_tests(pid, test_type_id=test_type_name, history=history)
+        return cli.get_component(*args)
+    except Exception as e:
+        return e
+
+
+class _SharedReads:
+    """The reads plot slots share — a pid's test history per test type and
+    its item record — made once per ``resolve_plots`` call, in one parallel
+    wave up front (``prefetch``). Stands in for the client in
+    ``_test_record_at`` / ``_item_spec_at``; a failed read re-raises its
+    error at every use, so each slot still reports it."""
+
+    def __init__(self, api):
+        self._api = api
+        self._got = {}
+
+    def _call(self, key):
+        if key not in self._got:
+            self._got[key] = _shared_read(self._api, key)
+        got = self._got[key]
+        if isinstance(got, Exception):
+            raise got
+        return got
+
+    def get_tests(self, pid, test_type_id=None, history=False):
+        return self._call(("get_tests", pid, test_type_id, history))
+
+    def get_component(self, pid):
+        return self._call(("get_component", pid))
+
+    def prefetch(self, keys) -> None:
+        from .parts import fetch_map
+        self._got.update(fetch_map(
+            self._api, _shared_read, [k for k in keys if k not in self._got]))
+
+
+def _record_ref(rec, root) -> str:
+    """What a numeric plot draws, for its cache key: the test record's id
+    (when there is one) and a digest of the addressed data — ids are only
+    unique per HWDB instance."""
+    digest = hashlib.sha256(
+        json.dumps(root, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{(rec or {}).get('id') or ''}:{digest}"
+
+
 def _item_spec_at(api, pid: str):
     """``(latest Item Specifications entry, error)`` — the item_path root
     (#94, APA): the same latest-entry rule as the part page (an FNAL-UI edit
@@ -519,9 +578,8 @@ def render_numeric_plot(test_data: dict, plot: dict, label: str):
     histogram (numeric when >80% of values parse, else categorical bar);
     2 paths → scatter. ``test_data`` is whatever dict the paths address —
     a test record's test_data (data_paths) or the latest Item Specifications
-    entry (item_paths, #94). Type-wide "sum" populations are NOT rendered
-    (that's a fan-out over every item of the type — see the mirror-light
-    rule)."""
+    entry (item_paths, #94), or a type-wide population synthesized from the
+    mirror (``testvalues.population_data``) for "sum" plots."""
     try:
         from matplotlib.figure import Figure
     except ImportError:
@@ -633,41 +691,69 @@ def resolve_plot_fields(api, plot, pid: str, saved: dict) -> list[dict]:
 
 
 def resolve_plots(api, cfg, part_id: str, children_of, item_images,
-                  plot_fields=None) -> list[dict]:
+                  plot_fields=None, instance: str | None = None) -> list[dict]:
     """Resolve every config plot slot. Image slots resolve to an HWDB
     image_id (the page streams the bytes through the existing image proxy);
     the newest manual ESPlot_* upload on the item wins any slot; image_path
     slots without one fall back to their test record (``children_of(pid)``
     returns manifest rows for sub_part_id addressing); numeric data_paths
-    slots render from the resolved pid's latest test record (``png_b64``,
-    single-item only — no type-wide "sum" fan-out). An uploaded numeric slot
-    still renders (page toggle between the two) but the upload keeps the PDF
-    (``bytes`` stays unset so download_plot_images fetches it). Failures land
-    in ``error``, shown verbatim. ``plot_fields`` (#85) is the ES record's
-    saved manual field values; each block gets its field group resolved
-    under the same pid addressing as the plot."""
-    blocks = []
+    slots render from the resolved pid's latest test record (``png_b64``);
+    given the ``instance``, a "sum" slot also gets the type-wide population
+    from the mirror (``pop_png_b64`` / ``pop_bytes``, or ``pop_note``). An
+    uploaded numeric slot still renders (page toggle between the two) but
+    the upload keeps the PDF (``bytes`` stays unset so download_plot_images
+    fetches it). Failures land in ``error``, shown verbatim. ``plot_fields``
+    (#85) is the ES record's saved manual field values; each block gets its
+    field group resolved under the same pid addressing as the plot."""
+    # First pass: each slot's pid (the sub_part_id walk memoized — slots
+    # usually share their layers) and the reads it will make, so those go
+    # out as one parallel wave instead of slot by slot.
+    kids = {}
+
+    def children(pid):
+        if pid not in kids:
+            kids[pid] = children_of(pid)
+        return kids[pid]
+
+    reads = _SharedReads(api)
+    slots, wanted = [], []
     for p in cfg["plots"]:
-        blk = {**p, "pid": part_id, "image_id": None, "error": None,
-               "uploaded": False, "upload_name": None, "is_pdf": False}
         # single_pid addressing (both kinds, the Dashboard's rule): explicit
-        # part_id or sub_part_id in the config, else the item itself. First,
-        # so the field group resolves under it even when an upload covers
-        # the slot.
+        # part_id or sub_part_id in the config, else the item itself —
+        # resolved even when an upload covers the slot, for its field group.
+        pid = part_id
         if p["sub_part_id"]:
-            resolved = _resolve_sub_part_id(
-                children_of, part_id,
-                p["sub_part_id"].get("layer"), p["sub_part_id"].get("pos_name"))
-            blk["pid"] = resolved or part_id
+            pid = _resolve_sub_part_id(
+                children, part_id,
+                p["sub_part_id"].get("layer"), p["sub_part_id"].get("pos_name")) or part_id
         elif p["part_id"]:
-            blk["pid"] = p["part_id"]
+            pid = p["part_id"]
+        up = (_newest_upload(item_images, plot_upload_prefix(part_id, p))
+              if p["kind"] != "fields" else None)
+        slots.append((p, pid, up))
+        tests = any(f["data_path"] for f in p["fields"])
+        spec = any(f["item_path"] for f in p["fields"])
+        if p["kind"] == "image":
+            tests = tests or not up
+        elif p["kind"] != "fields":
+            spec = spec or bool(p.get("item_paths"))
+            tests = tests or not p.get("item_paths")
+        if tests and pid and p["test_type_name"]:
+            wanted.append(("get_tests", pid, p["test_type_name"], True))
+        if spec and pid:
+            wanted.append(("get_component", pid))
+    reads.prefetch(dict.fromkeys(wanted))
+
+    blocks, renders = [], []
+    for p, pid, up in slots:
+        blk = {**p, "pid": pid, "image_id": None, "error": None,
+               "uploaded": False, "upload_name": None, "is_pdf": False}
         if p["fields"]:
             blk["fields"] = resolve_plot_fields(
-                api, p, blk["pid"], (plot_fields or {}).get(p["slug"]) or {})
+                reads, p, blk["pid"], (plot_fields or {}).get(p["slug"]) or {})
         if p["kind"] == "fields":   # values only — no image to resolve
             blocks.append(blk)
             continue
-        up = _newest_upload(item_images, plot_upload_prefix(part_id, p))
         if up:
             blk.update(image_id=str(up["image_id"]), uploaded=True,
                        upload_name=up.get("image_name"))
@@ -676,7 +762,7 @@ def resolve_plots(api, cfg, part_id: str, children_of, item_images,
                 continue
         if p["kind"] == "image":
             blk["is_pdf"] = p["image_name"].lower().endswith(".pdf")
-            rec, err = _test_record_at(api, blk["pid"], p["test_type_name"],
+            rec, err = _test_record_at(reads, blk["pid"], p["test_type_name"],
                                        p["history_order"])
             if err:
                 blk["error"] = err
@@ -689,29 +775,62 @@ def resolve_plots(api, cfg, part_id: str, children_of, item_images,
                         f"history_order={p['history_order']}).")
         else:  # numeric — draw from the resolved pid's latest test record,
             # or its latest Item Specifications entry (item_paths, #94)
+            rec = None
             if p.get("item_paths"):
-                root, err = _item_spec_at(api, blk["pid"])
+                root, err = _item_spec_at(reads, blk["pid"])
             else:
-                rec, err = _test_record_at(api, blk["pid"], p["test_type_name"], 0)
+                rec, err = _test_record_at(reads, blk["pid"], p["test_type_name"], 0)
                 root = (rec or {}).get("test_data") or {}
-            png, note = (None, err) if err else render_numeric_plot(
-                root, p, blk["pid"])
-            if png:
-                blk["png_b64"] = base64.b64encode(png).decode()
-                blk["render_bytes"] = png   # kept for a "plot from data" PDF choice
+            if err:
                 if not blk["uploaded"]:
-                    blk["bytes"] = png
-            elif not blk["uploaded"]:
-                # only a real problem when the upload isn't covering the slot
-                blk["error"] = note
+                    blk["error"] = err
+            else:
+                renders.append((blk, (
+                    esrender.plot_key(_record_ref(rec, root), p, blk["pid"]),
+                    render_numeric_plot, (root, p, blk["pid"]))))
         blocks.append(blk)
+
+    # The numeric plots render together — cached PNGs straight from disk,
+    # the rest side by side in the plot pool.
+    drawn = esrender.render_plots([job for _blk, job in renders])
+    for (blk, _job), (png, note) in zip(renders, drawn):
+        if png:
+            blk["png_b64"] = base64.b64encode(png).decode()
+            blk["render_bytes"] = png   # kept for a "plot from data" PDF choice
+            if not blk["uploaded"]:
+                blk["bytes"] = png
+        elif not blk["uploaded"]:
+            # only a real problem when the upload isn't covering the slot
+            blk["error"] = note
+    if instance:
+        from .testvalues import population_plot
+        ptid = part_id.rsplit("-", 1)[0]
+        for blk in blocks:
+            if blk["kind"] != "numeric" or not blk.get("population"):
+                continue
+            png, note, n = population_plot(instance, ptid, blk)
+            blk["pop_n"] = n
+            if png:
+                blk["pop_png_b64"] = base64.b64encode(png).decode()
+                blk["pop_bytes"] = png
+            else:
+                blk["pop_note"] = note
     return blocks
 
 
+def _image_bytes(cli, image_id):
+    try:
+        return cli.get_image_response(image_id).content
+    except Exception as e:
+        return e
+
+
 def download_plot_images(api, blocks) -> None:
-    """Fill ``bytes`` on resolved blocks for PDF embedding. PDF attachments
-    are linked on the page but not rasterized into the summary (that needs
-    pymupdf, which we don't carry)."""
+    """Fill ``bytes`` on resolved blocks for PDF embedding, fetched in
+    parallel. PDF attachments are linked on the page but not rasterized into
+    the summary (that needs pymupdf, which we don't carry)."""
+    from .parts import fetch_map
+    todo = []
     for b in blocks:
         if b.get("bytes"):  # numeric slot, already rendered from test data
             continue
@@ -723,10 +842,15 @@ def download_plot_images(api, blocks) -> None:
             b["error"] = (f"PDF attachment {b['image_name']} is not embedded "
                           "in the summary (view it on the ES page).")
             continue
-        try:
-            b["bytes"] = api.get_image_response(str(b["image_id"])).content
-        except Exception as e:
-            b["error"] = f"Failed to download image (image_id={b['image_id']}): {e}"
+        todo.append(b)
+    # All downloads at once — a dozen plots was a dozen round-trips in a row.
+    got = fetch_map(api, _image_bytes, [str(b["image_id"]) for b in todo])
+    for b in todo:
+        data = got.get(str(b["image_id"]))
+        if isinstance(data, (bytes, bytearray)):
+            b["bytes"] = data
+        else:
+            b["error"] = f"Failed to download image (image_id={b['image_id']}): {data}"
 
 
 # ---- Signing order / gating -----------------------------------------------
@@ -827,14 +951,17 @@ def _summary_header(part_id: str, facts: list[tuple[str, str]],
     val = _ds("hd-v", fontSize=8.5, leading=11.5)
     rows = [[Paragraph(f"<b>{escape(k)}</b>", key), Paragraph(v, val)]
             for k, v in facts]
-    facts_t = Table(rows, colWidths=[88, 282])
-    facts_t.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "TOP"),
-                                 ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                                 ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-                                 ("TOPPADDING", (0, 0), (-1, -1), 0.5),
-                                 ("BOTTOMPADDING", (0, 0), (-1, -1), 1.5)]))
+    left = [title]
+    if rows:
+        facts_t = Table(rows, colWidths=[88, 282])
+        facts_t.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "TOP"),
+                                     ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                                     ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+                                     ("TOPPADDING", (0, 0), (-1, -1), 0.5),
+                                     ("BOTTOMPADDING", (0, 0), (-1, -1), 1.5)]))
+        left.append(facts_t)
     right = _qr_drawing(qr_url) if qr_url else ""
-    outer = Table([[[title, facts_t], right]], colWidths=[382, 86])
+    outer = Table([[left, right]], colWidths=[382, 86])
     outer.setStyle(TableStyle([("LINEBELOW", (0, 0), (-1, -1), 1.8, _INK),
                                ("VALIGN", (0, 0), (-1, -1), "TOP"),
                                ("ALIGN", (-1, 0), (-1, -1), "RIGHT"),
@@ -1008,7 +1135,6 @@ def build_detail_pdf(part_id: str, form: dict) -> bytes:
         facts.append(("HWDB", f'<b>{escape(form["instance"])}</b>'))
     if form.get("consortium"):
         facts.append(("Consortium", escape(form["consortium"])))
-    facts.append(("Generated", f"{datetime.now():{TIMESTAMP_FMT}}"))
     if form.get("description"):
         facts.append(("Description", escape(form["description"])))
     # Arbitrary top-level config fields (#86) — ES-level facts, after the
@@ -1039,7 +1165,7 @@ def build_detail_pdf(part_id: str, form: dict) -> bytes:
     subtree = form.get("subtree") or ([], False)
     n_sub = len(subtree[0])
     story += _section("Sub-components",
-                      f"{n_sub} direct sub-component{'s' if n_sub != 1 else ''}")
+                      f"{n_sub} sub-component{'s' if n_sub != 1 else ''}")
     story += subtree_flowables(*subtree)
 
     refs = form.get("references") or []
@@ -1114,37 +1240,81 @@ def build_detail_pdf(part_id: str, form: dict) -> bytes:
                                            src_style))
             elif pb.get("error"):
                 story.append(Paragraph(f"⚠ {escape(pb['error'])}", src_style))
+            if pb.get("pop_bytes"):
+                try:
+                    img = Image(io.BytesIO(pb["pop_bytes"]))
+                    iw, ih = img.imageWidth, img.imageHeight
+                    scale = min(460 / iw, 400 / ih, 1.0) if iw and ih else 1.0
+                    img.drawWidth, img.drawHeight = iw * scale, ih * scale
+                    story += [Spacer(1, 6),
+                              Paragraph(f"Type-wide population · {pb.get('pop_n') or 0} "
+                                        "items (mirrored test data)", src_style),
+                              img]
+                except Exception as e:
+                    story.append(Paragraph(f"(population plot could not be embedded: {e})",
+                                           src_style))
 
     SimpleDocTemplate(buf, pagesize=letter,
                       title=f"Executive Summary: {part_id}").build(story)
     return buf.getvalue()
 
 
+def render_detail_pdf(part_id: str, form: dict, supplement: bytes | None = None) -> bytes:
+    """The DETAIL summary with the supplemental-material PDF, if any,
+    appended — the whole render ``esrender`` runs off the request. A
+    ValueError on an unreadable supplement fails the render, so the summary
+    is never posted half-merged."""
+    pdf = build_detail_pdf(part_id, form)
+    return append_pdf(pdf, supplement) if supplement else pdf
+
+
+def stamp_pdf(pdf: bytes, stamp: str) -> bytes:
+    """``pdf`` with ``stamp`` in the bottom margin of its first page. What
+    changes with every delivery (the "Generated" time) goes on here, after
+    the render cache, so a cached render is never posted with a stale
+    time (ADR-0021)."""
+    from pypdf import PdfReader, PdfWriter
+    from reportlab.pdfgen import canvas
+    writer = PdfWriter(clone_from=PdfReader(io.BytesIO(pdf)))
+    first = writer.pages[0]
+    width, height = float(first.mediabox.width), float(first.mediabox.height)
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=(width, height))
+    c.setFont("Helvetica", 7.5)
+    c.setFillColor(colors.HexColor(_GREY))
+    c.drawRightString(width - 72, 36, stamp)
+    c.save()
+    first.merge_page(PdfReader(buf).pages[0])
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
 def build_default_pdf(part_id: str, signinfo: dict,
                       subtree: tuple[list[dict], bool], log=None) -> bytes:
     """The configless DEFAULT summary in the same datasheet layout: header
     block, the status/QA-QC row, the single whoami sign-off row, and the
     sub-components table — no checklist, no references. ``log`` (#86) adds
-    the comments-log page, same as the DETAIL layout."""
+    the comments-log page, same as the DETAIL layout. The sign-off is
+    signed as it is generated, so it is dated by the "Generated" stamp
+    (``stamp_pdf``) rather than a column of its own."""
     buf = io.BytesIO()
     facts = []
     if signinfo.get("instance"):
         facts.append(("HWDB", f'<b>{escape(signinfo["instance"])}</b>'))
-    facts.append(("Generated", f"{datetime.now():{TIMESTAMP_FMT}}"))
     story = [_summary_header(part_id, facts, kind=" (default)",
                              qr_url=signinfo.get("part_url") or "")]
     story += _section("Status & QA/QC")
     story.append(_gate_grid(signinfo.get("status_label"),
                             signinfo.get("certified_flag"),
                             signinfo.get("uploaded_flag")))
-    story += _section("Sign-off")
+    story += _section("Sign-off", "signed when generated")
     cell = _ds("dso-c", fontSize=8.5, leading=11)
     table = Table(
-        [[_col_head("SIGNATURE"), _col_head("DATE"), _col_head("COMMENT")],
+        [[_col_head("SIGNATURE"), _col_head("COMMENT")],
          [Paragraph(escape(signinfo.get("signature") or "—"), cell),
-          Paragraph(escape(signinfo.get("timestamp") or "—"), cell),
           Paragraph(escape(signinfo.get("comments") or "—"), cell)]],
-        colWidths=[130, 100, 238])
+        colWidths=[130, 338])
     table.setStyle(TableStyle([
         ("LINEBELOW", (0, 0), (-1, 0), 0.9, _INK),
         ("LINEBELOW", (0, 1), (-1, -1), 0.4, _HAIRLINE),
@@ -1152,7 +1322,7 @@ def build_default_pdf(part_id: str, signinfo: dict,
     story.append(table)
     n_sub = len(subtree[0])
     story += _section("Sub-components",
-                      f"{n_sub} direct sub-component{'s' if n_sub != 1 else ''}")
+                      f"{n_sub} sub-component{'s' if n_sub != 1 else ''}")
     story += subtree_flowables(*subtree)
     log = [e for e in log or [] if isinstance(e, dict)]
     if log:
@@ -1165,9 +1335,9 @@ def build_default_pdf(part_id: str, signinfo: dict,
 
 
 def subtree_flowables(rows: list[dict], truncated: bool) -> list:
-    """The Sub-components page: the direct sub-components (one level only —
-    Hajime 2026-07-30), one row each with the three QC statuses and, for
-    children that already have a generated executive summary, an "Exe.Sum."
+    """The Sub-components page: the full sub-component tree, indented by
+    depth, one row each with the three QC statuses and, for items that
+    already have a generated executive summary, an "Exe.Sum."
     link straight to that PDF (``es_url``, added by the view; the column
     stays empty otherwise). ``rows`` come from ``parts.subtree_rows``."""
     styles = getSampleStyleSheet()
@@ -23,9 +23,10 @@ from typing import Iterator
 
 from django.utils import timezone
 
+from hwdb import metrics
 from hwdb.api_client import FnalDbApiClient
 
-from . import curation, parts
+from . import curation, parts, search
 from .models import HierarchyNode, HierarchySyncState
 
 logger = logging.getLogger(__name__)
@@ -158,6 +159,7 @@ def _upsert_system_tree(api, instance, project, sys_node, subs, cts_for, counts,
     return leaves, lines
 
 
+@metrics.sync_job("sync_hierarchy")
 def sync_hierarchy(api, instance: str = "prod", project: str = "D") -> Iterator[str]:
     """Walk one instance's curated systems into the ``HierarchyNode`` mirror.
     The caller's ``api`` client must point at the same instance (#47).
@@ -329,11 +331,13 @@ def sync_hierarchy(api, instance: str = "prod", project: str = "D") -> Iterator[
                     .exclude(pk__in=seen))
             n_stale += gone.count()
             gone.delete()
+        search.index_types(instance)
 
         state.finished_at = timezone.now()
         state.systems_count = systems_done
         state.nodes_count = leaves
         state.save()
+        metrics.sync_items(leaves)
         yield (
             f"done: {leaves} component types across {systems_done} systems"
             f"{f' ({n_stale} stale removed)' if n_stale else ''}\n"
@@ -413,6 +417,7 @@ def sync_system(api, instance: str, system_id: int, project: str = "D") -> Itera
                  .exclude(pk__in=seen))
         n_stale = stale.count()
         stale.delete()
+        search.index_types(instance)
 
         sys_node.structure_synced_at = timezone.now()
         sys_node.save(update_fields=["structure_synced_at"])
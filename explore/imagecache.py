@@ -0,0 +1,216 @@
+"""On-disk cache behind the HWDB image proxy (``explore_shipment_image_view``).
+
+HWDB never changes the bytes behind an image id, so an attachment fetched
+once can be served from disk forever after — part pages, thumbnail grids,
+ES PDFs and shipping sheets stop re-downloading the same files. Layout under
+``settings.HWDB_IMAGE_CACHE_DIR``:
+
+- ``blobs/<sha256>`` — the bytes, content-addressed (one copy per content,
+  however many ids or instances point at it);
+- ``thumbs/<sha256>-<px>.jpg`` — downscaled previews for thumbnail grids;
+- ``refs/<instance>/<image id>.json`` — ``{"sha": …, "content_type": …}``.
+
+Disk use is capped at ``HWDB_IMAGE_CACHE_MAX_MB``: every hit touches its
+file's mtime, and a store past the cap evicts the least recently served
+blobs and thumbnails first (down to 90% of the cap, so it doesn't evict on
+every store). Each process keeps a running total — the size at its last
+scan plus what it has written since — and only walks the directory once
+that crosses the cap; with several workers the cap can be overshot by
+about that 10% headroom per worker. A ref whose blob was evicted is just a
+miss. Writes go through a temp file and ``os.replace``, so concurrent
+workers never see a torn file; a file another worker evicts between
+``lookup`` and the read raises ``FileNotFoundError``, which the caller
+treats as a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from PIL import Image  # via matplotlib / reportlab
+
+from hwdb import metrics
+
+logger = logging.getLogger(__name__)
+
+THUMB_PX = 176  # 2× the 88px grid tile
+_SAFE_ID = re.compile(r"[\w.-]{1,128}")
+# Per cache dir: bytes on disk at this process's last scan + written since.
+_usage: dict[Path, int] = {}
+_usage_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Entry:
+    path: Path
+    content_type: str
+    etag: str   # the content hash (+ thumbnail size) — stable per bytes
+
+
+def _root() -> Path:
+    return Path(settings.HWDB_IMAGE_CACHE_DIR)
+
+
+def _ref_path(instance: str, image_id: str) -> Path | None:
+    if not _SAFE_ID.fullmatch(image_id) or not _SAFE_ID.fullmatch(instance):
+        return None
+    return _root() / "refs" / instance / f"{image_id}.json"
+
+
+def _write_atomic(dest: Path, write) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, dest)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _touch(path: Path) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def lookup(instance: str, image_id: str) -> Entry | None:
+    """The cached attachment, or None on a miss (never cached, evicted, or
+    an id that can't be a file name)."""
+    ref = _ref_path(instance, image_id)
+    if ref is None:
+        return None
+    try:
+        meta = json.loads(ref.read_text())
+    except (OSError, ValueError):
+        metrics.cache_lookup("image", False)
+        return None
+    blob = _root() / "blobs" / meta.get("sha", "")
+    if not meta.get("sha") or not blob.is_file():
+        ref.unlink(missing_ok=True)
+        metrics.cache_lookup("image", False)
+        return None
+    metrics.cache_lookup("image", True)
+    _touch(blob)
+    return Entry(blob, meta.get("content_type") or "application/octet-stream", meta["sha"])
+
+
+def store(instance: str, image_id: str, chunks, content_type: str) -> Entry:
+    """Write ``chunks`` (the upstream body) into the cache and return its
+    entry. An id that can't be cached still lands as a blob, just unreffed,
+    so the caller always gets a file to serve."""
+    blobs = _root() / "blobs"
+    blobs.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp = tempfile.mkstemp(dir=blobs, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                if chunk:
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+        sha = digest.hexdigest()
+        blob = blobs / sha
+        if blob.exists():   # same bytes under another id: nothing new on disk
+            size = 0
+        os.replace(tmp, blob)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    ref = _ref_path(instance, image_id)
+    if ref is not None:
+        meta = json.dumps({"sha": sha, "content_type": content_type}).encode()
+        _write_atomic(ref, lambda f: f.write(meta))
+    _grew(size, keep=blob)
+    return Entry(blob, content_type, sha)
+
+
+def thumbnail(entry: Entry, px: int = THUMB_PX) -> Entry | None:
+    """A ``px``-bounded JPEG preview of ``entry``, made once and cached; None
+    when the bytes aren't a raster image Pillow can read (PDFs, CSVs …).
+    Raises ``FileNotFoundError`` if the blob was evicted meanwhile."""
+    dest = _root() / "thumbs" / f"{entry.etag}-{px}.jpg"
+    if dest.is_file():
+        _touch(dest)
+        return Entry(dest, "image/jpeg", f"{entry.etag}-{px}")
+    try:
+        with Image.open(entry.path) as im:
+            im.thumbnail((px, px))
+            small = im.convert("RGB")
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        logger.info("image cache: no thumbnail for %s: %s", entry.etag[:12], e)
+        return None
+    _write_atomic(dest, lambda f: small.save(f, "JPEG", quality=82, optimize=True))
+    _grew(dest.stat().st_size, keep=dest)
+    return Entry(dest, "image/jpeg", f"{entry.etag}-{px}")
+
+
+def _cap() -> int:
+    return settings.HWDB_IMAGE_CACHE_MAX_MB * 1024 * 1024
+
+
+def _grew(size: int, keep: Path) -> None:
+    """Count ``size`` new bytes; evict once the running total passes the
+    cap (or on this process's first write, to learn the total)."""
+    with _usage_lock:
+        total = _usage.get(_root())
+        if total is not None:
+            total = _usage[_root()] = total + size
+    if total is None or total > _cap():
+        evict(keep=keep)
+
+
+def evict(max_bytes: int | None = None, keep: Path | None = None) -> int:
+    """Trim blobs + thumbnails to 90% of the cap, least recently served
+    first, once they exceed it — never ``keep`` (the file about to be
+    served). Returns the number of files removed."""
+    if max_bytes is None:
+        max_bytes = _cap()
+    files = []
+    for sub in ("blobs", "thumbs"):
+        d = _root() / sub
+        if not d.is_dir():
+            continue
+        for p in d.iterdir():
+            if p.name.startswith(".tmp-") or p == keep:
+                continue
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+    total = sum(size for _, size, _ in files)
+    kept = keep.stat().st_size if keep is not None and keep.exists() else 0
+    if total <= max_bytes:
+        _set_usage(total + kept)
+        return 0
+    removed = 0
+    for _, size, p in sorted(files, key=lambda f: f[0]):
+        if total <= max_bytes * 0.9:
+            break
+        p.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    _set_usage(total + kept)
+    logger.info("image cache: evicted %d files", removed)
+    return removed
+
+
+def _set_usage(total: int) -> None:
+    with _usage_lock:
+        _usage[_root()] = total
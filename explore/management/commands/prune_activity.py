@@ -0,0 +1,21 @@
+"""Drop Activities-feed rows older than the retention window (#88,
+``activity.RETENTION_DAYS``), across instances. Run it periodically — a
+daily cron line or systemd timer is plenty:
+
+    python manage.py prune_activity
+
+Neither logging nor reading the feed prunes, so until it runs the feed may
+show rows a day or so past the window.
+"""
+from django.core.management.base import BaseCommand
+
+from explore import activity
+
+
+class Command(BaseCommand):
+    help = "Delete activity feed rows older than the retention window."
+
+    def handle(self, *args, **opts):
+        n = activity.prune()
+        self.stdout.write(f"pruned {n} activity row(s) older than "
+                          f"{activity.RETENTION_DAYS} days")
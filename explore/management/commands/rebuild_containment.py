@@ -0,0 +1,26 @@
+"""Recompute the containment closure (``explore.containment``) from the
+mirrored parent edges. The syncs keep it current; run this after an
+out-of-band edit of the mirror, or to repair a closure that has drifted:
+
+    python manage.py rebuild_containment
+    python manage.py rebuild_containment --instance dev
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from explore import containment
+
+
+class Command(BaseCommand):
+    help = "Rebuild the containment closure from the mirrored parent edges."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--instance", choices=list(settings.HWDB_PROFILES),
+            help="Rebuild one HWDB instance (default: all of them).",
+        )
+
+    def handle(self, *args, **opts):
+        for inst in [opts["instance"]] if opts["instance"] else settings.HWDB_PROFILES:
+            n = containment.rebuild(inst)
+            self.stdout.write(f"{inst}: {n} containment path(s)")
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:28
+
+import explore.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0021_watchsubscription'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shipmentitem',
+            name='status',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(location_id=0, then=models.Value('transit')), models.When(n_contents__gt=0, then=models.Value('packing')), default=models.Value('empty')), output_field=models.CharField(max_length=8)),
+        ),
+        migrations.AddIndex(
+            model_name='shipmentitem',
+            index=explore.models.NullsLastIndex(fields=['instance', 'status', '-last_arrived', 'part_id'], name='explore_shipmentitem_tab'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0022_shipmentitem_arrived_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HwdbTestValue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('instance', models.CharField(db_index=True, default='prod', max_length=8)),
+                ('part_type_id', models.CharField(max_length=20)),
+                ('part_id', models.CharField(max_length=50)),
+                ('test_type_name', models.CharField(blank=True, default='', max_length=100)),
+                ('test_id', models.BigIntegerField(blank=True, null=True)),
+                ('path', models.CharField(max_length=200)),
+                ('idx', models.PositiveIntegerField(default=0)),
+                ('value', models.FloatField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['instance', 'part_type_id', 'test_type_name', 'path'], name='explore_hwd_instanc_ef7b5b_idx')],
+            },
+        ),
+    ]
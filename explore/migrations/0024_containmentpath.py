@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0023_hwdbtestvalue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContainmentPath',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('instance', models.CharField(db_index=True, default='prod', max_length=8)),
+                ('ancestor', models.CharField(max_length=50)),
+                ('descendant', models.CharField(max_length=50)),
+                ('depth', models.PositiveSmallIntegerField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['instance', 'descendant', 'depth'], name='explore_con_instanc_0da1c2_idx')],
+                'constraints': [models.UniqueConstraint(fields=('instance', 'ancestor', 'descendant'), name='containment_path_unique')],
+            },
+        ),
+    ]
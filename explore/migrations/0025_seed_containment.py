@@ -0,0 +1,34 @@
+# Seed the containment closure (ContainmentPath) from the parent edges
+# already in the item mirror; from here on the syncs and box refreshes keep
+# it current (explore.containment). Same cycle cut as containment.closure.
+
+from django.db import migrations
+
+
+def seed(apps, schema_editor):
+    E = apps.get_model("explore", "HwdbComponentEvent")
+    P = apps.get_model("explore", "ContainmentPath")
+    for instance in E.objects.values_list("instance", flat=True).distinct():
+        edges = dict(E.objects.filter(instance=instance).exclude(parent_part_id="")
+                     .values_list("part_id", "parent_part_id"))
+        rows = []
+        for child in edges:
+            seen, node, depth = {child}, child, 0
+            while (parent := edges.get(node)) and parent not in seen:
+                depth += 1
+                rows.append(P(instance=instance, ancestor=parent,
+                              descendant=child, depth=depth))
+                seen.add(parent)
+                node = parent
+        P.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("explore", "0024_containmentpath"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed, migrations.RunPython.noop),
+    ]
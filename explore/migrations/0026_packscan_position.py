@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0025_seed_containment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='packscan',
+            name='position',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Narrow HwdbTestEvent (ADR-0024), step 1: the lookup tables (PartKey,
+# HwdbTestType) and nullable keys on the event rows.
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0026_packscan_position'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HwdbTestType',
+            fields=[
+                ('instance', models.CharField(db_index=True, default='prod', max_length=8)),
+                ('id', models.SmallAutoField(primary_key=True, serialize=False)),
+                ('part_type_id', models.CharField(max_length=20)),
+                ('name', models.CharField(max_length=100)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('instance', 'part_type_id', 'name'), name='hwdb_test_type_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PartKey',
+            fields=[
+                ('instance', models.CharField(db_index=True, default='prod', max_length=8)),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('part_id', models.CharField(max_length=50)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('instance', 'part_id'), name='part_key_unique')],
+            },
+        ),
+        migrations.AddField(
+            model_name='hwdbtestevent',
+            name='part_key',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='explore.partkey'),
+        ),
+        migrations.AddField(
+            model_name='hwdbtestevent',
+            name='test_type',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='explore.hwdbtesttype'),
+        ),
+    ]
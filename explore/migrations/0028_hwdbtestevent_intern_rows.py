@@ -0,0 +1,42 @@
+# Narrow HwdbTestEvent (ADR-0024), step 2: intern the existing rows' part ids
+# and test-type names. Separate from the schema steps so PostgreSQL's
+# deferred FK checks fire before the columns are altered.
+
+from django.db import migrations
+
+
+def intern(apps, schema_editor):
+    E = apps.get_model("explore", "HwdbTestEvent")
+    K = apps.get_model("explore", "PartKey")
+    T = apps.get_model("explore", "HwdbTestType")
+    K.objects.bulk_create(
+        [K(instance=i, part_id=p) for i, p in
+         E.objects.values_list("instance", "part_id").distinct()],
+        batch_size=1000)
+    T.objects.bulk_create(
+        [T(instance=i, part_type_id=t, name=n) for i, t, n in
+         E.objects.values_list("instance", "part_type_id", "test_type_name").distinct()],
+        batch_size=1000)
+    keys = {(k.instance, k.part_id): k.id for k in K.objects.all()}
+    types = {(t.instance, t.part_type_id, t.name): t.id for t in T.objects.all()}
+    batch = []
+    for e in E.objects.only("instance", "part_type_id", "part_id", "test_type_name").iterator(
+            chunk_size=2000):
+        e.part_key_id = keys[e.instance, e.part_id]
+        e.test_type_id = types[e.instance, e.part_type_id, e.test_type_name]
+        batch.append(e)
+        if len(batch) == 2000:
+            E.objects.bulk_update(batch, ["part_key", "test_type"])
+            batch = []
+    E.objects.bulk_update(batch, ["part_key", "test_type"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0027_hwdbtestevent_interned'),
+    ]
+
+    operations = [
+        migrations.RunPython(intern, migrations.RunPython.noop),
+    ]
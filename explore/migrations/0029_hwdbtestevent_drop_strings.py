@@ -0,0 +1,46 @@
+# Narrow HwdbTestEvent (ADR-0024), step 3: drop the string columns, make the
+# keys required, and index the chart predicate (instance, type, date).
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0028_hwdbtestevent_intern_rows'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='hwdbtestevent',
+            name='explore_hwd_part_ty_f6307c_idx',
+        ),
+        migrations.RemoveField(
+            model_name='hwdbtestevent',
+            name='part_id',
+        ),
+        migrations.RemoveField(
+            model_name='hwdbtestevent',
+            name='test_type_name',
+        ),
+        migrations.AlterField(
+            model_name='hwdbtestevent',
+            name='part_type_id',
+            field=models.CharField(max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='hwdbtestevent',
+            name='part_key',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='explore.partkey'),
+        ),
+        migrations.AlterField(
+            model_name='hwdbtestevent',
+            name='test_type',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='explore.hwdbtesttype'),
+        ),
+        migrations.AddIndex(
+            model_name='hwdbtestevent',
+            index=models.Index(fields=['instance', 'part_type_id', 'created'], name='explore_hwd_instanc_213280_idx'),
+        ),
+    ]
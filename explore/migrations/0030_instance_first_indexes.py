@@ -0,0 +1,73 @@
+# Generated by Django 5.2.5 on 2026-10-19 15:50
+#
+# Instance-first indexes across the mirror (ADR-0025), replacing the
+# single-column ones.
+
+import explore.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0029_hwdbtestevent_drop_strings'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='hierarchynode',
+            name='explore_hie_level_a3e24f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='hwdbcomponentevent',
+            name='explore_hwd_part_ty_8951fb_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='shipmentitem',
+            name='explore_shi_part_ty_52ad77_idx',
+        ),
+        migrations.AddIndex(
+            model_name='activityevent',
+            index=models.Index(fields=['instance', '-created_at'], name='explore_act_instanc_b8d09f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activityevent',
+            index=models.Index(fields=['instance', 'part_type_id', '-created_at'], name='explore_act_instanc_bb28b0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activityevent',
+            index=models.Index(fields=['instance', 'part_id', '-created_at'], name='explore_act_instanc_4dd913_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hierarchynode',
+            index=models.Index(fields=['instance', 'level', 'part_type_id'], name='explore_hie_instanc_f6ba78_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hierarchynode',
+            index=models.Index(fields=['instance', 'level', 'project', 'system_id', 'subsystem_id', 'name'], name='explore_hie_instanc_ad7b3a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hwdbcomponentevent',
+            index=models.Index(fields=['instance', 'part_id'], name='explore_hwd_instanc_979c8a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hwdbcomponentevent',
+            index=models.Index(fields=['instance', 'parent_part_id'], name='explore_hwd_instanc_680351_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='packscan',
+            index=models.Index(fields=['username', 'instance', 'id'], name='explore_pac_usernam_2e5362_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shipmentitem',
+            index=models.Index(fields=['instance', 'part_type_id', 'part_id'], name='explore_shi_instanc_969572_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shipmentitem',
+            index=models.Index(fields=['instance', 'part_id'], name='explore_shi_instanc_80e9b7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hwdbcomponentevent',
+            index=explore.models.NullsLastIndex(fields=['instance', 'part_type_id', '-updated', '-created', 'part_id'], name='explore_hwd_parts_order'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Per-user watch cursors (ADR-0026): one WatchCursor per watcher replaces the
+# per-watch seen_at, seeded with each user's latest seen_at and their unread
+# count as it stood.
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Max, Q
+
+
+def seed(apps, schema_editor):
+    S = apps.get_model("explore", "WatchSubscription")
+    C = apps.get_model("explore", "WatchCursor")
+    E = apps.get_model("explore", "ActivityEvent")
+    users = S.objects.values("instance", "username").annotate(seen=Max("seen_at"))
+    for u in users:
+        unread = Q(pk__in=[])
+        for s in S.objects.filter(instance=u["instance"], username=u["username"]):
+            match = (Q(part_id=s.part_id) if s.part_id
+                     else Q(part_type_id=s.part_type_id))
+            unread |= match & Q(created_at__gt=s.seen_at)
+        C.objects.create(instance=u["instance"], username=u["username"],
+                         seen_at=u["seen"],
+                         unread=E.objects.filter(instance=u["instance"]).filter(unread).count())
+
+
+def unseed(apps, schema_editor):
+    S = apps.get_model("explore", "WatchSubscription")
+    C = apps.get_model("explore", "WatchCursor")
+    for c in C.objects.all():
+        S.objects.filter(instance=c.instance, username=c.username).update(seen_at=c.seen_at)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0030_instance_first_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WatchCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('instance', models.CharField(default='prod', max_length=8)),
+                ('username', models.CharField(max_length=150)),
+                ('seen_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('unread', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='watchcursor',
+            constraint=models.UniqueConstraint(fields=('instance', 'username'), name='uniq_watch_cursor_per_user'),
+        ),
+        migrations.RunPython(seed, unseed),
+        migrations.RemoveField(
+            model_name='watchsubscription',
+            name='seen_at',
+        ),
+        migrations.AddIndex(
+            model_name='watchsubscription',
+            index=models.Index(fields=['instance', 'part_type_id', 'part_id'], name='explore_wat_instanc_99addc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='watchsubscription',
+            index=models.Index(fields=['instance', 'part_id'], name='explore_wat_instanc_5b3311_idx'),
+        ),
+    ]
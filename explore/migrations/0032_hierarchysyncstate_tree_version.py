@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0031_watch_cursor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hierarchysyncstate',
+            name='tree_version',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+    ]
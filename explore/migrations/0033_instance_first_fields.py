@@ -0,0 +1,122 @@
+# Generated by Django 5.2.5 on 2026-10-19 15:50
+#
+# The field side of ADR-0025: ``instance`` and the other single-column
+# indexes go (db_index off); the composite indexes that replace them are
+# in 0030.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explore', '0032_hierarchysyncstate_tree_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activityevent',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='boxchecklist',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='boxchecklist',
+            name='part_id',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='containmentpath',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='hierarchynode',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='hierarchynode',
+            name='level',
+            field=models.CharField(choices=[('system', 'System'), ('subsystem', 'Subsystem'), ('component_type', 'Component type')], max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='hierarchynode',
+            name='part_type_id',
+            field=models.CharField(blank=True, default='', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='hierarchynode',
+            name='system_id',
+            field=models.PositiveIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='hwdbcomponentevent',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='hwdbcomponentevent',
+            name='parent_part_id',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='hwdbcomponentevent',
+            name='part_type_id',
+            field=models.CharField(max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='hwdbtestevent',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='hwdbtesttype',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='hwdbtestvalue',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='packscan',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='packscan',
+            name='username',
+            field=models.CharField(max_length=150),
+        ),
+        migrations.AlterField(
+            model_name='partkey',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='shipmentitem',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='shipmentitem',
+            name='part_type_id',
+            field=models.CharField(max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='watchsubscription',
+            name='instance',
+            field=models.CharField(default='prod', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='watchsubscription',
+            name='username',
+            field=models.CharField(max_length=150),
+        ),
+    ]
@@ -1,13 +1,21 @@
+import copy
+import uuid
+
 from django.db import models
+from django.utils import timezone
 
 
 class InstanceScoped(models.Model):
     """Mirror rows are per HWDB instance (#47): prod and dev share tables,
     disambiguated by this column — part-type ids are NOT guaranteed disjoint
     across instances, so every mirror read must scope through
-    ``for_instance()`` rather than raw ``objects``."""
+    ``for_instance()`` rather than raw ``objects``.
+
+    With two instances the column alone selects half a table, so it isn't
+    indexed on its own: each model's indexes lead with it instead, shaped
+    by the reads ``hwdb.bench.PLANS`` keeps an eye on (ADR-0025)."""
 
-    instance = models.CharField(max_length=8, default="prod", db_index=True)
+    instance = models.CharField(max_length=8, default="prod")
 
     class Meta:
         abstract = True
@@ -17,6 +25,22 @@ class InstanceScoped(models.Model):
         return cls.objects.filter(instance=instance)
 
 
+class NullsLastIndex(models.Index):
+    """An index whose descending columns sort NULLs last, to match an
+    ``F(...).desc(nulls_last=True)`` ordering (ADR-0025). PostgreSQL sorts
+    NULLs first under ``DESC`` unless told otherwise; SQLite sorts them low
+    already and can't spell ``NULLS LAST`` in an index, so there it's a
+    plain ``DESC`` column."""
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        index = self
+        if schema_editor.connection.vendor == "postgresql":
+            index = copy.copy(self)
+            index.fields_orders = [(name, f"{order} NULLS LAST" if order else order)
+                                   for name, order in self.fields_orders]
+        return models.Index.create_sql(index, model, schema_editor, using, **kwargs)
+
+
 class HierarchyNode(InstanceScoped):
     """One node of the DUNE hardware structure, mirrored from one HWDB instance.
 
@@ -46,12 +70,12 @@ class HierarchyNode(InstanceScoped):
         (LEVEL_TYPE, "Component type"),
     ]
 
-    level = models.CharField(max_length=16, choices=LEVEL_CHOICES, db_index=True)
+    level = models.CharField(max_length=16, choices=LEVEL_CHOICES)
     parent = models.ForeignKey(
         "self", null=True, blank=True, on_delete=models.CASCADE, related_name="children"
     )
     project = models.CharField(max_length=4, default="D")
-    system_id = models.PositiveIntegerField(db_index=True)
+    system_id = models.PositiveIntegerField()
     system_name = models.CharField(max_length=100)
     subsystem_id = models.PositiveIntegerField(null=True, blank=True)
     subsystem_name = models.CharField(max_length=100, blank=True, default="")
@@ -59,7 +83,7 @@ class HierarchyNode(InstanceScoped):
     full_name = models.CharField(max_length=300, blank=True, default="")
 
     # Component-type leaves only (blank/zero on System & Subsystem rows):
-    part_type_id = models.CharField(max_length=20, blank=True, default="", db_index=True)
+    part_type_id = models.CharField(max_length=20, blank=True, default="")
     n_components = models.PositiveIntegerField(default=0)
     # HWDB type category ("cable"/"generic"/"box"…), free from the type list;
     # for cable types the walk also mirrors the ENDs/connector counts from the
@@ -89,12 +113,80 @@ class HierarchyNode(InstanceScoped):
 
     class Meta:
         ordering = ["system_id", "subsystem_id", "name"]
-        indexes = [models.Index(fields=["level", "system_id"])]
+        indexes = [
+            # A leaf by its type id (every leaf, part and box page).
+            models.Index(fields=["instance", "level", "part_type_id"]),
+            # The navigation levels, in the default order.
+            models.Index(fields=["instance", "level", "project", "system_id",
+                                 "subsystem_id", "name"]),
+        ]
 
     def __str__(self):
         return f"HierarchyNode({self.level}, {self.name})"
 
 
+def _intern(model, scope: dict, field: str, values) -> dict:
+    """``{value: id}`` for ``values`` in one lookup table, inserting the ones
+    it hasn't seen. Existing values are read first, so a sync that brings
+    nothing new writes nothing (and burns no sequence numbers)."""
+    values, ids = list(set(values)), {}
+    for i in range(0, len(values), 1000):
+        chunk = values[i:i + 1000]
+        rows = model.objects.filter(**scope, **{f"{field}__in": chunk})
+        ids.update(rows.values_list(field, "id"))
+        missing = [v for v in chunk if v not in ids]
+        if missing:
+            model.objects.bulk_create([model(**scope, **{field: v}) for v in missing],
+                                      ignore_conflicts=True)
+            ids.update(model.objects.filter(**scope, **{f"{field}__in": missing})
+                       .values_list(field, "id"))
+    return ids
+
+
+class PartKey(InstanceScoped):
+    """An integer surrogate for one HWDB part id, so mirror rows that repeat
+    a part id per event carry 4 bytes instead of the ~20-character string.
+    One key space per instance; keys are never reused or deleted. Only
+    ``HwdbTestEvent`` references it — ``HwdbComponentEvent`` keeps its
+    ``part_id`` string (ADR-0024). ``intern`` maps part ids to keys."""
+
+    id = models.AutoField(primary_key=True)
+    part_id = models.CharField(max_length=50)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(
+            fields=["instance", "part_id"], name="part_key_unique")]
+
+    def __str__(self):
+        return f"PartKey({self.part_id})"
+
+    @classmethod
+    def intern(cls, instance: str, part_ids) -> dict[str, int]:
+        return _intern(cls, {"instance": instance}, "part_id", part_ids)
+
+
+class HwdbTestType(InstanceScoped):
+    """One test-type name as recorded under one component type — the
+    interned ``test_type.name`` of ``HwdbTestEvent``. A type has a handful
+    of these, so a small int stands in for the name on every event row."""
+
+    id = models.SmallAutoField(primary_key=True)
+    part_type_id = models.CharField(max_length=20)
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(
+            fields=["instance", "part_type_id", "name"], name="hwdb_test_type_unique")]
+
+    def __str__(self):
+        return f"HwdbTestType({self.part_type_id}, {self.name})"
+
+    @classmethod
+    def intern(cls, instance: str, part_type_id: str, names) -> dict[str, int]:
+        return _intern(cls, {"instance": instance, "part_type_id": part_type_id},
+                       "name", names)
+
+
 class HwdbTestEvent(InstanceScoped):
     """One test record for one component, mirrored from production HWDB.
 
@@ -108,19 +200,70 @@ class HwdbTestEvent(InstanceScoped):
     ``created`` holds the date the plot bins on: the physics ``test_data``
     date for component types we've mapped (CE → "Test Date"), else the HWDB
     record timestamp. See ``events.physics_date_field`` and ADR-0010. Rows are
-    keyed by ``part_id`` so the incremental sync can append per component.
+    keyed by part (``part_key``) so the incremental sync can append per
+    component.
+
+    The largest mirror table, so rows are kept narrow (ADR-0024): the part
+    id and the test-type name are interned (``PartKey``, ``HwdbTestType``)
+    and ``build`` does the lookups when rows are written.
     """
 
-    part_type_id = models.CharField(max_length=20, db_index=True)
-    part_id = models.CharField(max_length=50)
-    test_type_name = models.CharField(max_length=100)
+    part_type_id = models.CharField(max_length=20)
+    part_key = models.ForeignKey(PartKey, on_delete=models.CASCADE, related_name="+")
+    test_type = models.ForeignKey(HwdbTestType, on_delete=models.CASCADE, related_name="+")
     created = models.DateTimeField()
 
     class Meta:
-        indexes = [models.Index(fields=["part_type_id", "created"])]
+        # The chart read and the per-type rewrite both filter on these.
+        indexes = [models.Index(fields=["instance", "part_type_id", "created"])]
+
+    def __str__(self):
+        # The name only when it's already loaded (select_related): a repr
+        # must not cost a query per row.
+        test_type = (self.test_type.name if HwdbTestEvent.test_type.is_cached(self)
+                     else f"type #{self.test_type_id}")
+        return f"HwdbTestEvent({self.part_type_id}, {test_type}, {self.created:%Y-%m-%d})"
+
+    @classmethod
+    def build(cls, instance: str, part_type_id: str, rows) -> list["HwdbTestEvent"]:
+        """Unsaved events from ``(part_id, test_type_name, created)`` rows,
+        with the part ids and names interned."""
+        rows = list(rows)
+        keys = PartKey.intern(instance, (pid for pid, _, _ in rows))
+        types = HwdbTestType.intern(instance, part_type_id, (name for _, name, _ in rows))
+        return [cls(instance=instance, part_type_id=part_type_id, part_key_id=keys[pid],
+                    test_type_id=types[name], created=created)
+                for pid, name, created in rows]
+
+
+class HwdbTestValue(InstanceScoped):
+    """One numeric value out of a mirrored test record — the population
+    behind type-wide ("sum") ES plots.
+
+    Opt-in per type: only types whose ES config has a ``"sum"`` numeric plot
+    are extracted, and only that plot's ``data_paths`` (from each item's
+    latest record of the plot's test type) or ``item_paths`` (from its
+    latest Item Specifications entry, ``test_type_name`` ""). A path that
+    holds a list lands as one row per element, ``idx`` keeping the position
+    so a two-path scatter pairs x and y. Written by the tests sync alongside
+    ``HwdbTestEvent`` and rewritten per component the same way; see
+    ``explore.testvalues``.
+    """
+
+    part_type_id = models.CharField(max_length=20)
+    part_id = models.CharField(max_length=50)
+    test_type_name = models.CharField(max_length=100, blank=True, default="")
+    test_id = models.BigIntegerField(null=True, blank=True)   # HWDB record id
+    path = models.CharField(max_length=200)
+    idx = models.PositiveIntegerField(default=0)
+    value = models.FloatField()
+
+    class Meta:
+        indexes = [models.Index(
+            fields=["instance", "part_type_id", "test_type_name", "path"])]
 
     def __str__(self):
-        return f"HwdbTestEvent({self.part_type_id}, {self.test_type_name}, {self.created:%Y-%m-%d})"
+        return f"HwdbTestValue({self.part_id}, {self.path}[{self.idx}]={self.value:g})"
 
 
 class HwdbComponentEvent(InstanceScoped):
@@ -135,7 +278,7 @@ class HwdbComponentEvent(InstanceScoped):
     rewrite all rows. See ADR-0010.
     """
 
-    part_type_id = models.CharField(max_length=20, db_index=True)
+    part_type_id = models.CharField(max_length=20)
     part_id = models.CharField(max_length=50)
     created = models.DateTimeField(null=True, blank=True)   # HWDB mint date
     updated = models.DateTimeField(null=True, blank=True)   # HWDB last-modified
@@ -164,17 +307,48 @@ class HwdbComponentEvent(InstanceScoped):
     # ``refresh_box``); "" = free or not yet captured. ``enabled`` mirrors
     # HWDB's approval flag (NOT the link gate — a disabled status-0 item
     # linked fine in the 2026-07-27 probe); NULL = not yet captured.
-    parent_part_id = models.CharField(max_length=50, blank=True, default="",
-                                      db_index=True)
+    parent_part_id = models.CharField(max_length=50, blank=True, default="")
     enabled = models.BooleanField(null=True, blank=True)
 
     class Meta:
-        indexes = [models.Index(fields=["part_type_id", "updated"])]
+        indexes = [
+            # The parts table's order; its prefix serves every per-type read
+            # (charts, sweeps, search).
+            NullsLastIndex(fields=["instance", "part_type_id", "-updated", "-created", "part_id"],
+                           name="explore_hwd_parts_order"),
+            models.Index(fields=["instance", "part_id"]),
+            models.Index(fields=["instance", "parent_part_id"]),
+        ]
 
     def __str__(self):
         return f"HwdbComponentEvent({self.part_type_id}, {self.updated:%Y-%m-%d})"
 
 
+class ContainmentPath(InstanceScoped):
+    """One ancestor → descendant pair of the mirrored containment graph — the
+    closure of ``HwdbComponentEvent.parent_part_id`` and the box manifests
+    the shipment sync reads, so "everything inside this box" and "which
+    top-level assembly holds this chip" are one indexed query each.
+
+    ``depth`` is 1 for a direct parent, 2 for a grandparent …; an item has
+    no row for itself. Maintained by ``explore.containment`` wherever an
+    edge changes (the tests sync, the parent sweep, box refreshes);
+    ``containment.rebuild`` recomputes an instance from the mirror.
+    """
+
+    ancestor = models.CharField(max_length=50)
+    descendant = models.CharField(max_length=50)
+    depth = models.PositiveSmallIntegerField()
+
+    class Meta:
+        constraints = [models.UniqueConstraint(
+            fields=["instance", "ancestor", "descendant"], name="containment_path_unique")]
+        indexes = [models.Index(fields=["instance", "descendant", "depth"])]
+
+    def __str__(self):
+        return f"ContainmentPath({self.ancestor} ⊃ {self.descendant}, {self.depth})"
+
+
 class ShipmentItem(InstanceScoped):
     """One shipping box (an item of a curated shipping-type leaf), mirrored from
     HWDB production (ADR-0013).
@@ -190,7 +364,7 @@ class ShipmentItem(InstanceScoped):
     mirror (ADR-0007).
     """
 
-    part_type_id = models.CharField(max_length=20, db_index=True)
+    part_type_id = models.CharField(max_length=20)
     part_id = models.CharField(max_length=50)  # the box's PID
     location_name = models.CharField(max_length=200, blank=True, default="")
     location_id = models.IntegerField(null=True, blank=True)  # 0 = "In Transit"
@@ -202,10 +376,25 @@ class ShipmentItem(InstanceScoped):
     shipped_date = models.DateTimeField(null=True, blank=True)
     received_date = models.DateTimeField(null=True, blank=True)
     synced_at = models.DateTimeField(auto_now=True)
+    # ship_status, computed by the database on every write (sync, refresh,
+    # plain .update()) so the Shipments tabs filter and index on it.
+    status = models.GeneratedField(
+        expression=models.Case(
+            models.When(location_id=0, then=models.Value("transit")),
+            models.When(n_contents__gt=0, then=models.Value("packing")),
+            default=models.Value("empty")),
+        output_field=models.CharField(max_length=8), db_persist=True)
 
     class Meta:
         ordering = ["part_id"]
-        indexes = [models.Index(fields=["part_type_id"])]
+        indexes = [
+            # A type's boxes in PID order (leaf box table, picker, sync).
+            models.Index(fields=["instance", "part_type_id", "part_id"]),
+            models.Index(fields=["instance", "part_id"]),
+            # One Shipments tab, most-recently-arrived first, PID tiebreak.
+            NullsLastIndex(fields=["instance", "status", "-last_arrived", "part_id"],
+                           name="explore_shipmentitem_tab"),
+        ]
 
     @property
     def is_in_transit(self) -> bool:
@@ -216,7 +405,8 @@ class ShipmentItem(InstanceScoped):
         """Status bucket for the Shipments dashboard (#87). In Transit wins;
         otherwise contents decide — ≥1 item is "in packing" (not fully
         unpacked, or being packed for the next trip), 0 is an empty box ready
-        to start packing. Whether a location is set doesn't matter."""
+        to start packing. Whether a location is set doesn't matter. The
+        ``status`` column is the same rule, computed in the database."""
         if self.location_id == 0:
             return "transit"
         return "packing" if self.n_contents else "empty"
@@ -249,7 +439,7 @@ class BoxChecklist(InstanceScoped):
               ("confirm_non_surf", "Shipping to non-SURF"),
               ("confirm_transshipping", "Transshipping to SURF")]
 
-    part_id = models.CharField(max_length=50, db_index=True)
+    part_id = models.CharField(max_length=50)
     workflow = models.CharField(max_length=20, choices=WORKFLOWS)
     route = models.CharField(max_length=24, choices=ROUTES, default="confirm_surf")
     current_scene = models.PositiveSmallIntegerField(default=1)
@@ -284,15 +474,26 @@ class PackScan(InstanceScoped):
     Scan-to-cart: when the scan page is opened from a box's pack page its
     URL carries the box PID, and the submit endpoint links the item into
     that box immediately — ``ok``/``result`` record the outcome for both
-    screens. ``ok`` NULL = legacy select-only scan (no box context)."""
+    screens. ``ok`` NULL = legacy select-only scan (no box context).
+
+    Packing sessions: a batch-mode scan is checked against the box state the
+    phone's session cached and only *queued* — ``position`` holds the slot it
+    was given, ``ok`` stays NULL — until the commit links the whole queue in
+    one PATCH and replaces the queued rows with outcome rows."""
 
-    username = models.CharField(max_length=150, db_index=True)
+    username = models.CharField(max_length=150)
     part_id = models.CharField(max_length=50)
     box_part_id = models.CharField(max_length=50, blank=True, default="")
+    position = models.CharField(max_length=100, blank=True, default="")
     ok = models.BooleanField(null=True, blank=True)
     result = models.CharField(max_length=300, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # The pack page's poll (this user's scans after an id), and the
+        # stale-scan sweep, which spans instances — hence username first.
+        indexes = [models.Index(fields=["username", "instance", "id"])]
+
     def __str__(self):
         return f"PackScan({self.username}, {self.part_id})"
 
@@ -304,8 +505,8 @@ class ActivityEvent(InstanceScoped):
     Two sources: sync runs log ONE summary row per run and only when they
     mirrored something new (10,000 known items re-synced = no row); in-app
     writes (mint, pack, location, ES, checklists) log one row each. A rolling
-    window — ``activity.prune()`` drops rows older than a month; the part
-    page stays the authoritative history."""
+    window — ``manage.py prune_activity`` drops rows older than a month; the
+    part page stays the authoritative history."""
 
     KIND_SYNC = "sync"
     KIND_MINTED = "minted"
@@ -327,10 +528,16 @@ class ActivityEvent(InstanceScoped):
     part_type_id = models.CharField(max_length=20, blank=True, default="")
     summary = models.TextField()
     actor = models.CharField(max_length=150, blank=True, default="")
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)  # pruning
 
     class Meta:
         ordering = ["-created_at"]
+        # The feed, and the watched feed per type / per part, newest first.
+        indexes = [
+            models.Index(fields=["instance", "-created_at"]),
+            models.Index(fields=["instance", "part_type_id", "-created_at"]),
+            models.Index(fields=["instance", "part_id", "-created_at"]),
+        ]
 
     @property
     def kind_label(self) -> str:
@@ -345,24 +552,27 @@ class WatchSubscription(InstanceScoped):
 
     ``part_id`` set = a part-level watch (box or item; ``part_type_id`` rides
     along for context); ``part_id`` empty = a type-level watch. Notifications
-    are DERIVED at read time from ``ActivityEvent`` rows matching the watch —
-    there is no notification fan-out table. ``seen_at`` marks the last time
-    the user looked at their watched feed; matching events newer than it are
-    the unread count. ``username`` is the FNAL credkey (``activity.actor_of``),
+    are DERIVED from ``ActivityEvent`` rows matching the watch — there is no
+    notification fan-out table; the user's ``WatchCursor`` holds what they
+    have seen. ``username`` is the FNAL credkey (``activity.actor_of``),
     never the Django session user."""
 
-    username = models.CharField(max_length=150, db_index=True)
+    username = models.CharField(max_length=150)
     part_id = models.CharField(max_length=50, blank=True, default="")
     part_type_id = models.CharField(max_length=20, blank=True, default="")
     label = models.CharField(max_length=200, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
-    seen_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["-created_at"]
         constraints = [models.UniqueConstraint(
             fields=["instance", "username", "part_id", "part_type_id"],
             name="uniq_watch_per_user_target")]
+        # Who watches this event's type / part (``watches.notify``).
+        indexes = [
+            models.Index(fields=["instance", "part_type_id", "part_id"]),
+            models.Index(fields=["instance", "part_id"]),
+        ]
 
     @property
     def display(self) -> str:
@@ -372,6 +582,25 @@ class WatchSubscription(InstanceScoped):
         return f"WatchSubscription({self.username}, {self.display})"
 
 
+class WatchCursor(InstanceScoped):
+    """One user's read position over their watched feed (#90, ADR-0026).
+
+    ``seen_at`` is the last "Mark all read"; ``unread`` counts matching
+    events logged since, bumped by ``activity.log`` as each event is
+    written — so the badge is one row, however many watches there are."""
+
+    username = models.CharField(max_length=150)
+    seen_at = models.DateTimeField(default=timezone.now)
+    unread = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(
+            fields=["instance", "username"], name="uniq_watch_cursor_per_user")]
+
+    def __str__(self):
+        return f"WatchCursor({self.username}, {self.unread} unread)"
+
+
 class HierarchySyncState(models.Model):
     """One row per HWDB instance recording that instance's last hierarchy
     (skeleton) sync run.
@@ -387,8 +616,20 @@ class HierarchySyncState(models.Model):
     systems_count = models.PositiveIntegerField(default=0)
     nodes_count = models.PositiveIntegerField(default=0)
     last_error = models.TextField(blank=True, default="")
+    # A fresh token on every write to the instance's HierarchyNode rows
+    # (``touch``): navigation's cached trees key on it.
+    tree_version = models.CharField(max_length=32, blank=True, default="")
 
     @classmethod
     def get(cls, instance: str):
         obj, _ = cls.objects.get_or_create(instance=instance)
         return obj
+
+    @classmethod
+    def touch(cls, instance: str) -> None:
+        """Move ``tree_version``, so trees built before this write rebuild.
+        A token rather than a counter: a rolled-back write can't hand a
+        later one the same version."""
+        token = uuid.uuid4().hex
+        if not cls.objects.filter(instance=instance).update(tree_version=token):
+            cls.objects.update_or_create(instance=instance, defaults={"tree_version": token})
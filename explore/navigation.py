@@ -12,13 +12,18 @@ the built URLs land on the instance's own prefix (/hw/ vs /hw/dev/).
 
 from __future__ import annotations
 
+import threading
+
 from django.db.models import Sum
 from django.http import Http404
-from django.urls import reverse
+from django.urls import get_script_prefix, reverse
+
+from hwdb import metrics
 
 from . import curation
 from .instances import namespace_of
 from .models import HierarchyNode as H
+from .models import HierarchySyncState
 
 HOME_LABEL = "All systems"
 
@@ -55,13 +60,17 @@ def project_regions(instance: str) -> list[dict]:
     ``project`` scopes every mirror read below it — system/subsystem ids are
     per-project. A project the refresh hasn't recorded yet renders nothing."""
     out = []
-    for prj in curation.extra_projects(instance):
-        systems = (H.for_instance(instance)
-                   .filter(level=H.LEVEL_SYSTEM, project=prj)
-                   .order_by("system_id"))
+    projects = curation.extra_projects(instance)
+    by_project = {prj: [] for prj in projects}
+    if projects:
+        for s in (H.for_instance(instance)
+                  .filter(level=H.LEVEL_SYSTEM, project__in=projects)
+                  .order_by("system_id")):
+            by_project[s.project].append(s)
+    for prj in projects:
         families = [{"name": s.system_name, "key": str(s.system_id),
                      "sub": f"system {s.system_id}", "systems": [s.system_id]}
-                    for s in systems]
+                    for s in by_project[prj]]
         if not families:
             continue
         out.append({"name": curation.project_label(instance, prj),
@@ -326,29 +335,84 @@ def resolve(instance: str, trail: str | None) -> dict:
                         project=prj)}
 
 
-def _component_totals(instance):
-    """({(project, system_id): components}, {(project, system_id, subsystem_id):
-    components}) in one grouped query — for the sidebar count badges. Keys
-    carry the project because system ids repeat across projects (#71)."""
-    by_sys, by_sub = {}, {}
-    rows = (H.for_instance(instance).filter(level=H.LEVEL_TYPE)
-            .values("project", "system_id", "subsystem_id")
-            .annotate(c=Sum("n_components")))
-    for r in rows:
-        c = r["c"] or 0
-        k = (r["project"], r["system_id"])
-        by_sys[k] = by_sys.get(k, 0) + c
-        by_sub[(r["project"], r["system_id"], r["subsystem_id"])] = c
-    return by_sys, by_sub
-
-
-def _tnode(label, url, count, current, open_, dim=False, children=None, is_leaf=False,
+# Per-process cache of the request-independent trees (the sidebar skeleton
+# and the curated tree), keyed by the instance's hierarchy version. The mirror
+# only moves under a sync, so a page pays one version query instead of a full
+# node scan plus a reverse() per node; ``sidebar_tree`` then applies just the
+# cheap current/open flags for its ctx.
+_TREE_CACHE: dict[tuple, object] = {}
+_TREE_CACHE_MAX = 16
+_TREE_LOCK = threading.Lock()
+
+
+def hierarchy_version(instance: str) -> str:
+    """The instance's ``HierarchySyncState.tree_version``: every write that
+    reshapes a tree moves it — node saves and deletes through the signals
+    below, the syncs' bulk ``update()``s by calling ``touch`` themselves."""
+    return (HierarchySyncState.objects.filter(instance=instance)
+            .values_list("tree_version", flat=True).first()) or ""
+
+
+def _node_written(sender, instance, **kwargs):
+    HierarchySyncState.touch(instance.instance)
+
+
+def connect_signals():
+    from django.db.models.signals import post_delete, post_save
+    post_save.connect(_node_written, sender=H, dispatch_uid="tree-node-saved")
+    post_delete.connect(_node_written, sender=H, dispatch_uid="tree-node-deleted")
+
+
+def _cached(kind: str, instance: str, build):
+    # The script prefix is baked into every built URL; the curation
+    # fingerprint covers yaml edits (and tests that patch it).
+    key = (kind, instance, get_script_prefix(), curation.fingerprint(instance),
+           hierarchy_version(instance))
+    with _TREE_LOCK:
+        hit = _TREE_CACHE.get(key)
+    metrics.cache_lookup("tree", hit is not None)
+    if hit is None:
+        hit = build(instance)
+        with _TREE_LOCK:
+            while len(_TREE_CACHE) >= _TREE_CACHE_MAX:
+                _TREE_CACHE.pop(next(iter(_TREE_CACHE)))
+            _TREE_CACHE[key] = hit
+    return hit
+
+
+def clear_tree_cache() -> None:
+    """Drop every cached tree (tests; a new version rebuilds on its own)."""
+    with _TREE_LOCK:
+        _TREE_CACHE.clear()
+
+
+def _mirror_index(instance):
+    """The instance's whole mirror in one scan, grouped for the tree builders:
+    ``({(project, system_id): system}, {(project, system_id): [subsystems]},
+    {(project, system_id, subsystem_id): [leaves]})``, each list in display
+    order. Keys carry the project because system ids repeat across projects
+    (#71)."""
+    sys_by_id, subs_by_sys, leaves_by_sub = {}, {}, {}
+    for n in H.for_instance(instance).order_by("system_id", "subsystem_id", "name"):
+        if n.level == H.LEVEL_SYSTEM:
+            sys_by_id[(n.project, n.system_id)] = n
+        elif n.level == H.LEVEL_SUBSYSTEM:
+            subs_by_sys.setdefault((n.project, n.system_id), []).append(n)
+        else:
+            leaves_by_sub.setdefault((n.project, n.system_id, n.subsystem_id), []).append(n)
+    return sys_by_id, subs_by_sys, leaves_by_sub
+
+
+def _tnode(label, url, count, at, dim=False, children=None, is_leaf=False,
            empty=False, synced=False, title=""):
     # ``title`` is the hover tooltip; systems/subsystems put their HWDB id
-    # there (#50) — the sidebar is too narrow to show it inline.
-    return {"label": label, "url": url, "count": count, "current": current,
-            "open": open_, "dim": dim, "children": children or [], "is_leaf": is_leaf,
-            "empty": empty, "synced": synced, "title": title or label}
+    # there (#50) — the sidebar is too narrow to show it inline. ``at`` is
+    # the node's place in the tree, matched against a page's ctx by
+    # ``_flags`` (the cached skeleton carries no per-request state).
+    return {"label": label, "url": url, "count": count, "current": False,
+            "open": False, "at": at, "dim": dim, "children": children or [],
+            "is_leaf": is_leaf, "empty": empty, "synced": synced,
+            "title": title or label}
 
 
 def _leaf_synced(leaf) -> bool:
@@ -365,25 +429,54 @@ def _state(n_with_comp: int, n_synced: int) -> tuple[bool, bool]:
     return False, n_synced == n_with_comp
 
 
-def sidebar_tree(instance: str, ctx: dict) -> list[dict]:
-    """The full curated tree as nested nodes for the sidebar. Every node is
-    rendered (so any folder's chevron can expand/collapse it client-side); the
-    branch to the current node (``ctx``) is flagged ``open`` so the tree opens to
-    your location, and the current node is flagged for highlighting. Each node
-    carries a component count."""
-    by_sys, by_sub = _component_totals(instance)
-    sys_by_id, subs_by_sys, leaves_by_sub = {}, {}, {}
-    for n in H.for_instance(instance).order_by("system_id", "subsystem_id", "name"):
-        if n.level == H.LEVEL_SYSTEM:
-            sys_by_id[(n.project, n.system_id)] = n
-        elif n.level == H.LEVEL_SUBSYSTEM:
-            subs_by_sys.setdefault((n.project, n.system_id), []).append(n)
-        else:
-            leaves_by_sub.setdefault((n.project, n.system_id, n.subsystem_id), []).append(n)
+def _flags(at: tuple, ctx: dict) -> tuple[bool, bool]:
+    """(current, open) for a sidebar node placed at ``at`` on the page
+    described by ``ctx``. The system/subsystem checks compare project too:
+    their ids repeat across projects (#71); the family checks are qualified
+    by region key, since synthetic families are keyed by system id."""
+    kind, here = at[0], ctx.get("project", "D")
+    if kind == "leaf":
+        return ctx.get("kind") == "leaf" and ctx.get("part_type_id") == at[1], False
+    if kind == "subsystem":
+        _, prj, sid, ssid = at
+        on = (here == prj and ctx.get("system_id") == sid
+              and ctx.get("subsystem_id") == ssid)
+        return ctx.get("kind") == "subsystem" and on, on
+    if kind == "system":
+        _, prj, sid = at
+        on = here == prj and ctx.get("system_id") == sid
+        return ctx.get("kind") == "system" and on, on
+    if kind == "family":
+        _, rk, fk = at
+        on = ctx.get("region_key") == rk and ctx.get("family_key") == fk
+        return ctx.get("kind") == "family" and on, on
+    if kind == "region":
+        on = ctx.get("region_key") == at[1]
+        return ctx.get("kind") == "region" and on, on
+    return False, here == at[1]   # project folder
+
+
+def _flagged(node: dict, ctx: dict) -> dict:
+    current, open_ = _flags(node["at"], ctx)
+    out = dict(node, current=current, open=open_)
+    if node["children"]:
+        out["children"] = [_flagged(c, ctx) for c in node["children"]]
+    return out
 
-    # Sync/empty stats per scope: (#leaves with components, #of those synced).
+
+def _sidebar_skeleton(instance: str) -> list[dict]:
+    """The sidebar tree with every ctx-dependent flag off — built once per
+    hierarchy version (see ``_cached``)."""
+    sys_by_id, subs_by_sys, leaves_by_sub = _mirror_index(instance)
+
+    # Component counts and sync/empty stats per scope: (#leaves with
+    # components, #of those synced).
+    by_sys, by_sub = {}, {}
     sub_stats, sys_stats = {}, {}
     for (prj, sid, ssid), leaves in leaves_by_sub.items():
+        c = sum(l.n_components for l in leaves)
+        by_sub[(prj, sid, ssid)] = c
+        by_sys[(prj, sid)] = by_sys.get((prj, sid), 0) + c
         w = sum(1 for l in leaves if l.n_components > 0)
         s = sum(1 for l in leaves if l.n_components > 0 and _leaf_synced(l))
         sub_stats[(prj, sid, ssid)] = (w, s)
@@ -397,12 +490,8 @@ def sidebar_tree(instance: str, ctx: dict) -> list[dict]:
 
     def subs_of(rk, fk, flat, sid, prj):
         out = []
-        # The current-node checks compare project too: system/subsystem ids
-        # repeat across projects (#71).
-        here = ctx.get("project", "D") == prj
         for sub in subs_by_sys.get((prj, sid), []):
             ssid = sub.subsystem_id
-            on = here and ctx.get("system_id") == sid and ctx.get("subsystem_id") == ssid
             leaves = []
             for l in leaves_by_sub.get((prj, sid, ssid), []):
                 lempty = l.n_components == 0
@@ -410,9 +499,7 @@ def sidebar_tree(instance: str, ctx: dict) -> list[dict]:
                     l.name,
                     node_path(instance, rk, fk, system_id=None if flat else sid,
                               subsystem_id=ssid, part_type_id=l.part_type_id),
-                    l.n_components,
-                    ctx.get("kind") == "leaf" and ctx.get("part_type_id") == l.part_type_id,
-                    False, is_leaf=True,
+                    l.n_components, ("leaf", l.part_type_id), is_leaf=True,
                     empty=lempty, synced=not lempty and _leaf_synced(l),
                     title=f"{l.name} ({l.part_type_id})"))
             sempty, ssynced = _state(*sub_stats.get((prj, sid, ssid), (0, 0)))
@@ -420,7 +507,7 @@ def sidebar_tree(instance: str, ctx: dict) -> list[dict]:
                               node_path(instance, rk, fk,
                                         system_id=None if flat else sid, subsystem_id=ssid),
                               by_sub.get((prj, sid, ssid), 0),
-                              ctx.get("kind") == "subsystem" and on, on, children=leaves,
+                              ("subsystem", prj, sid, ssid), children=leaves,
                               empty=sempty, synced=ssynced,
                               title=f"{sub.subsystem_name} ({sid}.{ssid})"))
         return out
@@ -433,7 +520,6 @@ def sidebar_tree(instance: str, ctx: dict) -> list[dict]:
         rbr = curation.region_is_browsable(region)
         rk = region["key"]
         prj = region_project(region)
-        here = ctx.get("project", "D") == prj
         fams, rcount = [], 0
         if rbr:
             for fam in region.get("families", []) or []:
@@ -458,23 +544,16 @@ def sidebar_tree(instance: str, ctx: dict) -> list[dict]:
                             children.append(_tnode(
                                 sn.system_name,
                                 node_path(instance, rk, fk, system_id=sid),
-                                by_sys.get((prj, sid), 0),
-                                here and ctx.get("kind") == "system"
-                                and ctx.get("system_id") == sid,
-                                here and ctx.get("system_id") == sid,
+                                by_sys.get((prj, sid), 0), ("system", prj, sid),
                                 children=subs_of(rk, fk, False, sid, prj),
                                 empty=sysempty, synced=syssynced,
                                 title=f"{sn.system_name} ({sid})"))
                     fempty, fsynced = _state(*_agg(prj, fam.get("systems") or []))
                 else:
                     fempty, fsynced = False, False
-                # Region key qualifies the family checks: synthetic families
-                # are keyed by system id, which repeats across regions (#71).
-                fam_here = ctx.get("region_key") == rk and ctx.get("family_key") == fk
                 fams.append(_tnode(
                     fam["name"], node_path(instance, rk, fk) if fbr else None, fcount,
-                    ctx.get("kind") == "family" and fam_here,
-                    fam_here, dim=not fbr, children=children,
+                    ("family", rk, fk), dim=not fbr, children=children,
                     empty=fbr and fempty, synced=fsynced))
         rempty, rsynced = (False, False)
         rw, rs = 0, 0
@@ -486,8 +565,7 @@ def sidebar_tree(instance: str, ctx: dict) -> list[dict]:
             rempty, rsynced = _state(rw, rs)
         node = _tnode(
             region["name"], node_path(instance, rk) if rbr else None, rcount if rbr else None,
-            ctx.get("kind") == "region" and ctx.get("region_key") == rk,
-            ctx.get("region_key") == rk, dim=not rbr, children=fams,
+            ("region", rk), dim=not rbr, children=fams,
             empty=rbr and rempty, synced=rsynced)
         if prj == "D":
             dune_children.append(node)
@@ -498,24 +576,32 @@ def sidebar_tree(instance: str, ctx: dict) -> list[dict]:
             extra_nodes.append(node)
     dempty, dsynced = _state(dune_w, dune_s)
     dune = _tnode(curation.project_label(instance, "D"), None, dune_count,
-                  False, ctx.get("project", "D") == "D",
-                  children=dune_children, empty=dempty, synced=dsynced)
+                  ("project", "D"), children=dune_children, empty=dempty, synced=dsynced)
     return [dune] + extra_nodes
 
 
-def _tree_subs(instance, region_key, family_key, sid, flat, project="D"):
+def sidebar_tree(instance: str, ctx: dict) -> list[dict]:
+    """The full curated tree as nested nodes for the sidebar. Every node is
+    rendered (so any folder's chevron can expand/collapse it client-side); the
+    branch to the current node (``ctx``) is flagged ``open`` so the tree opens to
+    your location, and the current node is flagged for highlighting. Each node
+    carries a component count.
+
+    The structure comes from the per-version cache; only the flags are
+    computed per call, onto fresh dicts (the cached skeleton is shared)."""
+    return [_flagged(n, ctx) for n in _cached("sidebar", instance, _sidebar_skeleton)]
+
+
+def _tree_subs(index, instance, region_key, family_key, sid, flat, project="D"):
     """Subsystem nodes (+ their component-type leaves) for one system. Returns
     ``(nodes, n_with_components, n_synced)`` — the leaf tallies roll up so each
     node can carry the sidebar's ``empty``/``synced`` state. Leaves carry a
-    ``url`` to their explorer page."""
+    ``url`` to their explorer page. ``index`` is ``_mirror_index``'s grouping."""
+    _, subs_by_sys, leaves_by_sub = index
     out, sys_w, sys_s = [], 0, 0
-    for sub in (H.for_instance(instance).filter(level=H.LEVEL_SUBSYSTEM, project=project,
-                                                system_id=sid)
-                .order_by("subsystem_id")):
+    for sub in subs_by_sys.get((project, sid), []):
         types, w, s = [], 0, 0
-        for leaf in (H.for_instance(instance)
-                     .filter(level=H.LEVEL_TYPE, project=project, system_id=sid,
-                             subsystem_id=sub.subsystem_id).order_by("name")):
+        for leaf in leaves_by_sub.get((project, sid, sub.subsystem_id), []):
             n = leaf.n_components or 0
             has, syn = n > 0, (leaf.n_components or 0) > 0 and _leaf_synced(leaf)
             w += 1 if has else 0
@@ -549,7 +635,36 @@ def curated_tree(instance: str) -> dict:
     leaf carries ``url`` (its explorer page); ``n`` is components in HWDB; each
     node carries ``empty`` (no component-bearing leaves) and ``synced`` (all of
     them synced) — the same grey/green convention as the sidebar.
+
+    Served from the per-version cache and shared by every caller, so it is
+    frozen (``_freeze``): a caller that needs a changed tree copies the part
+    it changes.
     """
+    return _cached("curated", instance, lambda inst: _freeze(_build_curated_tree(inst)))
+
+
+class _FrozenDict(dict):
+    """A dict that refuses writes; still a dict to templates and JSON."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("the cached tree is shared; copy the part you change")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+def _freeze(node):
+    """``node`` with every dict frozen and every list a tuple."""
+    if isinstance(node, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in node.items())
+    if isinstance(node, list):
+        return tuple(_freeze(v) for v in node)
+    return node
+
+
+def _build_curated_tree(instance: str) -> dict:
+    index = _mirror_index(instance)
+    sys_by_id = index[0]
     # D regions group under a "DUNE (D)" project node; extra-project regions
     # sit next to it — projects share the top tree level (#71).
     d_regions, extra_regions = [], []
@@ -585,15 +700,14 @@ def curated_tree(instance: str) -> dict:
                        "url": node_path(instance, r["key"], fkey)}
                 fw = fs = 0
                 if flat:
-                    fam["children"], fw, fs = _tree_subs(instance, r["key"], fkey,
+                    fam["children"], fw, fs = _tree_subs(index, instance, r["key"], fkey,
                                                          sysids[0], flat=True, project=prj)
                 else:
                     for sid in sysids:
-                        node = H.for_instance(instance).filter(
-                            level=H.LEVEL_SYSTEM, project=prj, system_id=sid).first()
+                        node = sys_by_id.get((prj, sid))
                         if not node:
                             continue
-                        subs, sw, ss = _tree_subs(instance, r["key"], fkey, sid,
+                        subs, sw, ss = _tree_subs(index, instance, r["key"], fkey, sid,
                                                   flat=False, project=prj)
                         s_empty, s_synced = _state(sw, ss)
                         fam["children"].append({
@@ -660,7 +774,13 @@ def leaf_path_for(instance: str, part_type_id: str) -> str | None:
         level=H.LEVEL_TYPE, part_type_id=part_type_id).first()
     if not leaf:
         return None
-    for region in all_regions(instance):
+    return leaf_path_of(instance, leaf)
+
+
+def leaf_path_of(instance: str, leaf, regions: list[dict] | None = None) -> str | None:
+    """``leaf_path_for`` for a leaf row already in hand. Callers resolving
+    many leaves pass ``all_regions`` once as ``regions``."""
+    for region in all_regions(instance) if regions is None else regions:
         if not curation.region_is_browsable(region):
             continue
         if region_project(region) != leaf.project:
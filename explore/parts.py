@@ -1,14 +1,20 @@
 """Generic per-part detail engine (ADR-0014).
 
-``part_detail(api, part_id, is_shipping)`` assembles everything the explorer
-shows about a single part — item facts, a latest-per-type test summary,
-subcomponents, specifications, attachments, and a location timeline — live from
-HWDB. Read-only; nothing is mirrored (FNAL-gated at the view).
+The part page loads its cards separately (ADR-0020): ``part_item``,
+``part_tests``, ``part_manifest``, ``part_timeline``, ``part_attachments`` and
+``part_documents`` each assemble one card — item facts, a latest-per-type
+test summary, subcomponents, specifications, attachments, a location
+timeline — live from HWDB, making just the reads that card needs. Read-only;
+nothing is mirrored (FNAL-gated at the view).
 
 A shipping box is just a part whose type is curated as a shipping type: the
 view passes ``is_shipping=True`` so the spec blob renders as the fixed
 Pre-shipping / Shipping / Info @ Warehouse lifecycle (``shipment_details``)
 instead of the generic per-key sections.
+
+Several cards need the same record, image list or manifest. ``page_read``
+lets the panes of one page view share those: the view hands each pane its
+page's ``load`` id, and the first pane's answer serves the rest.
 """
 
 from __future__ import annotations
@@ -18,6 +24,9 @@ import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from django.core.cache import cache
+
+from hwdb import calls
 from hwdb.api_client import FnalDbApiClient
 
 from .shipments import (
@@ -169,42 +178,25 @@ def assembly_children(api, parent_pid: str) -> list[dict]:
     (``_STATUS_FETCH_CAP``) — a child whose record fails or is skipped just
     renders with no status (``None``)."""
     kids = current_manifest(_safe_data("subcomponents", lambda: api.get_subcomponents(parent_pid)))
+    return _with_statuses(api, kids)
+
+
+def _with_statuses(api, kids: list[dict]) -> list[dict]:
+    """``assembly_children``'s status half: the first ``_STATUS_FETCH_CAP``
+    children's records, fetched in parallel (``fetch_map``)."""
+    capped = [k["part_id"] for k in kids[:_STATUS_FETCH_CAP] if k.get("part_id")]
+    comps = fetch_map(api, lambda cli, pid: cli.get_component(pid).get("data") or {}, capped)
     for i, k in enumerate(kids):
-        status = None
-        if k.get("part_id") and i < _STATUS_FETCH_CAP:
-            try:
-                status = normalize_status(
-                    (api.get_component(k["part_id"]).get("data") or {}).get("status"))
-            except Exception as e:
-                logger.warning("assembly: status for %s failed: %s", k["part_id"], e)
-        k["status"] = status
+        comp = comps.get(k.get("part_id")) if i < _STATUS_FETCH_CAP else None
+        k["status"] = normalize_status(comp.get("status")) if comp is not None else None
     return kids
 
 
-# Bound for the executive summary's contents list — one HTTP call per child;
+# Bound for the executive summary's contents list — two HTTP reads per node;
 # past this the listing stops and the cut is reported, not silent.
 _SUBTREE_NODE_CAP = 300
 
 
-def _manifest_children(api, pid: str, depth: int, seen: set) -> list[dict]:
-    """One node's unvisited mounted children as subtree rows-in-waiting.
-
-    Peer back-references are skipped (#72): a cable's manifest lists what its
-    ends plug into — its flange/board/tray peers, including its own parent —
-    which is connectivity, not contents. Keeping them would fold a cable's
-    whole neighborhood into the subtree. Forward cable-end mounts
-    (``END:connector``) stay: the cable is genuinely attached; recursing into
-    it then yields only peer rows, so the walk terminates there."""
-    kids = []
-    for m in current_manifest(_safe_data("subcomponents", lambda: api.get_subcomponents(pid))):
-        cid = m.get("part_id")
-        if not cid or cid in seen or m.get("peer"):
-            continue
-        seen.add(cid)
-        kids.append({**m, "depth": depth})
-    return kids
-
-
 _FETCH_WORKERS = 8
 
 
@@ -236,7 +228,8 @@ def fetch_map(api, fn, keys, *, workers: int = _FETCH_WORKERS) -> dict:
             cli = local.client = _thread_client(api)
         return fn(cli, key)
 
-    with ThreadPoolExecutor(max_workers=min(workers, len(uniq))) as pool:
+    with ThreadPoolExecutor(max_workers=min(workers, len(uniq)),
+                            initializer=calls.inherit()) as pool:
         futs = {pool.submit(_run, k): k for k in uniq}
         for fut in as_completed(futs):
             key = futs[fut]
@@ -248,35 +241,106 @@ def fetch_map(api, fn, keys, *, workers: int = _FETCH_WORKERS) -> dict:
     return out
 
 
-def subtree_rows(api, root_pid: str, *, max_nodes: int = _SUBTREE_NODE_CAP
+def _subtree_read(cli, key):
+    """One ``subtree_rows`` read: ``("sub", pid)`` → the current manifest,
+    ``("comp", pid)`` → the item record."""
+    kind, pid = key
+    if kind == "sub":
+        return current_manifest(cli.get_subcomponents(pid).get("data"))
+    return cli.get_component(pid).get("data") or {}
+
+
+def _predicted(guess: dict, pids, limit: int) -> list[str]:
+    """Every descendant of ``pids`` the ``guess`` edges predict, nearest
+    first, at most ``limit``."""
+    out, frontier, seen = [], list(pids), set(pids)
+    while frontier and len(out) < limit:
+        nxt = [c for p in frontier for c in guess.get(p) or () if c not in seen]
+        seen.update(nxt)
+        out += nxt
+        frontier = nxt
+    return out[:limit]
+
+
+def subtree_rows(api, root_pid: str, *, max_nodes: int = _SUBTREE_NODE_CAP,
+                 guess: dict | None = None, known: dict | None = None
                  ) -> tuple[list[dict], bool]:
-    """The DIRECT sub-components of ``root_pid``, each with the three QC
-    statuses — ``status`` name, ``uploaded``, ``certified`` (``None`` =
-    record fetch failed). Originally the full recursive tree (Hajime's ES
-    review); limited to one level on his 2026-07-30 call — a CRU's nested
-    tree runs deep and slow, and "if we hear complaints, we would consider
-    other ways". The root itself is excluded — its statuses already headline
-    the executive summary. Per-child records are fetched in parallel
-    (``fetch_map``). Returns ``(rows, truncated)``."""
+    """The full sub-component tree of ``root_pid``, pre-order with
+    ``depth`` (0 = direct child), each row with the three QC statuses —
+    ``status`` name, ``uploaded``, ``certified`` (``None`` = record fetch
+    failed) — and HWDB's ``component_id``. The root itself is excluded — its
+    statuses already headline the executive summary.
+
+    Walked level by level: each level's manifests and records go out as one
+    parallel wave (``fetch_map``), so a deep assembly costs about its depth
+    in round-trips, not its node count (the old node-by-node recursion is
+    why this was cut to one level on 2026-07-30). ``guess`` (pid → child
+    pids, the mirror's ``parent_part_id`` edges) lets a wave read ahead:
+    the predicted descendants' manifests and records ride along with the
+    current level, and a node is listed only once a live manifest confirms
+    it — a stale mirror costs a wasted read or an extra wave, never a wrong
+    row. ``known`` (pid → ``status``/``uploaded``/``certified``/
+    ``component_id``) skips those record reads. Returns ``(rows,
+    truncated)``; past ``max_nodes`` rows the walk stops."""
+    guess, known = guess or {}, known or {}
+    got: dict = {}
     seen = {root_pid}
-    kids = _manifest_children(api, root_pid, 0, seen)
-    truncated = len(kids) > max_nodes
-    if truncated:
-        logger.warning("subtree for %s truncated at %d nodes", root_pid, max_nodes)
-    kids = kids[:max_nodes]
-    comps = fetch_map(api, lambda cli, pid: cli.get_component(pid).get("data") or {},
-                      [row["part_id"] for row in kids])
+    children: dict[str, list[dict]] = {}
+    level, depth, n, truncated = [root_pid], 0, 0, False
+    while level:
+        ahead = _predicted(guess, level, max_nodes - n)
+        wave = [("sub", p) for p in level + ahead]
+        wave += [("comp", p) for p in level + ahead if p != root_pid and p not in known]
+        got.update(fetch_map(api, _subtree_read, [k for k in wave if k not in got]))
+        nxt = []
+        for pid in level:
+            kids = []
+            # Peer back-references are skipped (#72): a cable's manifest
+            # lists what its ends plug into — its flange/board/tray peers,
+            # its own parent among them — which is connectivity, not
+            # contents. Forward cable-end mounts (END:connector) stay; the
+            # cable's own manifest is then all peers, so the walk ends there.
+            for m in got.get(("sub", pid)) or []:
+                cid = m.get("part_id")
+                if not cid or cid in seen or m.get("peer"):
+                    continue
+                if n >= max_nodes:
+                    truncated = True
+                    break
+                seen.add(cid)
+                kids.append({**m, "depth": depth})
+                n += 1
+            children[pid] = kids
+            nxt += [k["part_id"] for k in kids]
+        if truncated:
+            logger.warning("subtree for %s truncated at %d nodes", root_pid, max_nodes)
+            break
+        level, depth = nxt, depth + 1
+    # The records for the last level's nodes came with its manifest wave; a
+    # truncated walk fetches the ones it still lacks.
+    missing = [("comp", pid) for kids in children.values() for pid in
+               (k["part_id"] for k in kids)
+               if pid not in known and ("comp", pid) not in got]
+    got.update(fetch_map(api, _subtree_read, missing))
+
     rows: list[dict] = []
-    for row in kids:
-        comp = comps.get(row["part_id"])   # None = record fetch failed
-        row.update(
-            status=normalize_status(comp.get("status")) if comp is not None else None,
-            uploaded=comp.get("qaqc_uploaded") if comp is not None else None,
-            certified=comp.get("certified_qaqc") if comp is not None else None,
-            # HWDB's internal numeric id — the web UI's images page is
-            # addressed by it, not by the part id
-            component_id=comp.get("component_id") if comp is not None else None)
+    stack = list(reversed(children.get(root_pid, [])))
+    while stack:
+        row = stack.pop()
+        pid = row["part_id"]
+        if pid in known:
+            row.update(known[pid])
+        else:
+            comp = got.get(("comp", pid))   # None = record fetch failed
+            row.update(
+                status=normalize_status(comp.get("status")) if comp is not None else None,
+                uploaded=comp.get("qaqc_uploaded") if comp is not None else None,
+                certified=comp.get("certified_qaqc") if comp is not None else None,
+                # HWDB's internal numeric id — the web UI's images page is
+                # addressed by it, not by the part id
+                component_id=comp.get("component_id") if comp is not None else None)
         rows.append(row)
+        stack += reversed(children.get(pid, []))
     return rows, truncated
 
 
@@ -317,31 +381,35 @@ def _test_has_images(rec: dict) -> bool:
     return any(isinstance(rec.get(k), list) and rec.get(k) for k in _TEST_IMAGE_KEYS)
 
 
-def _enrich_test_ids(api, part_id: str, tests: list[dict]) -> None:
+def _enrich_test_ids(api, part_id: str, tests: list[dict],
+                     test_types: list[dict] | None = None) -> None:
     """Fill each summarized test's ``test_id`` (component-test oid), real
     ``status`` and ``has_data`` from the per-type endpoint.
 
     The list endpoint (``components/{pid}/tests``) omits the oid, status and
     embedded files; the per-type endpoint (``…/tests/{test_type_id}``) carries
-    all three. Bounded to the test types that actually have results, so a part
-    with two test types costs two extra calls. Best-effort — a failure just
-    leaves the FNAL data link off.
+    all three. Bounded to the test types that actually have results, fetched
+    in parallel (``fetch_map``); ``test_types`` is the part type's test-type
+    list when the caller already has it. Best-effort — a failure just leaves
+    the FNAL data link off.
     """
     if not tests:
         return
-    ptid = part_id.rsplit("-", 1)[0]
-    type_ids = {tt.get("name"): tt.get("id")
-                for tt in _safe_data("test types", lambda: api.get_test_types(ptid))
+    if test_types is None:
+        ptid = part_id.rsplit("-", 1)[0]
+        test_types = _safe_data("test types", lambda: api.get_test_types(ptid))
+    type_ids = {tt.get("name"): tt.get("id") for tt in test_types
                 if tt.get("name") and tt.get("id") is not None}
     for t in tests:
-        ttid = type_ids.get(t["test_type"])
-        if ttid is None:
-            continue
-        t["test_type_id"] = ttid
-        recs = _safe_data(
-            f"test {t['test_type']}",
-            lambda ttid=ttid: api.get_tests(part_id, test_type_id=ttid, history=True),
-        )
+        t["test_type_id"] = type_ids.get(t["test_type"])
+    history = fetch_map(
+        api,
+        lambda cli, ttid: _safe_data(
+            f"test type {ttid}",
+            lambda: cli.get_tests(part_id, test_type_id=ttid, history=True)),
+        [t["test_type_id"] for t in tests if t["test_type_id"] is not None])
+    for t in tests:
+        recs = history.get(t["test_type_id"]) or []
         latest = max(recs, key=lambda r: r.get("created") or "", default=None)
         if latest:
             t["test_id"] = latest.get("id")
@@ -356,17 +424,20 @@ def _annotate_cable_connections(api, part_id: str, manifest: list[dict]) -> list
     A cable's reverse rows only carry the *peer's* position name — the
     ``END:connector`` on the cable side is recorded on the peer's manifest
     (``<cable PID>.<END>:<n>``). One ``/subcomponents`` call per distinct
-    peer (capped, best-effort) fills each peer row's ``via`` and returns the
-    sorted occupied slots for the diagram. An only-PID connection (no
-    ENDs/connectors, e.g. a cable tray) keeps ``via`` None and occupies
-    nothing."""
+    peer (capped, parallel, best-effort) fills each peer row's ``via`` and
+    returns the sorted occupied slots for the diagram. An only-PID
+    connection (no ENDs/connectors, e.g. a cable tray) keeps ``via`` None
+    and occupies nothing."""
     peers = [m for m in manifest if m.get("peer") and m.get("part_id")]
     via: dict[tuple, str] = {}
     used: set[str] = set()
-    for pid in sorted({m["part_id"] for m in peers})[:_STATUS_FETCH_CAP]:
-        rows = current_manifest(_safe_data(
-            f"peer {pid} manifest", lambda pid=pid: api.get_subcomponents(pid)))
-        for row in rows:
+    manifests = fetch_map(
+        api,
+        lambda cli, pid: current_manifest(_safe_data(
+            f"peer {pid} manifest", lambda: cli.get_subcomponents(pid))),
+        sorted({m["part_id"] for m in peers})[:_STATUS_FETCH_CAP])
+    for pid, rows in sorted(manifests.items()):
+        for row in rows or []:
             if row.get("part_id") == part_id and row.get("connection") and not row.get("peer"):
                 used.add(row["connection"])
                 via[(pid, row.get("functional_position"))] = row["connection"]
@@ -410,57 +481,58 @@ def current_container(rows) -> dict | None:
             "functional_position": top.get("functional_position")}
 
 
-def part_detail(api, part_id: str, is_shipping: bool) -> dict:
-    """Live detail bundle for one part. ``sections`` are the spec cards (the
-    shipping lifecycle when ``is_shipping``); attachments are enriched with the
-    real filename + an image flag for thumbnailing."""
-    comp_body = api.get_component(part_id)  # core record — a failure here 502s
-    comp = comp_body.get("data") or {}
-    spec_block = _spec_block(comp_body)
-    data_blob = (spec_block or {}).get("DATA")
+def _attempt(fn, cli):
+    """``fn(cli)``, or the exception it raised — for ``fetch_map`` tasks whose
+    failure the caller must see rather than have folded into ``None``."""
+    try:
+        return fn(cli)
+    except Exception as e:
+        return e
+
+
+def gather(api, calls: dict) -> dict:
+    """Run independent reads at once: ``{name: fn(client)}`` for ``calls``
+    (``{name: fn}``), each on its own thread client (``fetch_map``). A read
+    that raises yields its exception in place of a result."""
+    return fetch_map(api, lambda cli, name: _attempt(calls[name], cli), list(calls))
+
 
-    locs = _safe_data("locations", lambda: api.get_locations(part_id))
-    timeline = sorted(
+def _timeline(rows: list[dict]) -> list[dict]:
+    return sorted(
         ({"arrived": e.get("arrived"),
           "location": (e.get("location") or {}).get("name"),
           "location_id": (e.get("location") or {}).get("id"),
           "creator": e.get("creator"),
           "comments": e.get("comments")}
-         for e in locs),
+         for e in rows),
         key=lambda e: e["arrived"] or "", reverse=True,
     )
-    manifest = assembly_children(api, part_id)  # direct children + their QC flags
-    tests = test_summary(_safe_data("tests", lambda: api.get_tests(part_id)))
-    _enrich_test_ids(api, part_id, tests)
 
-    images = [i for i in _safe_data("images", lambda: api.get_images(part_id)) if i.get("image_id")]
-    name_by_id = {str(i["image_id"]): i.get("image_name") for i in images}
-    sections = shipment_details(data_blob) if is_shipping else spec_sections(spec_block)
+
+def _attachments(image_rows: list[dict]) -> list[dict]:
+    return [{"image_id": str(i["image_id"]), "image_name": i.get("image_name"),
+             "created": i.get("created"),
+             "is_image": _is_image(i.get("image_name"))}
+            for i in image_rows if i.get("image_id")]
+
+
+def _documents(comp_body: dict, image_rows: list[dict], is_shipping: bool) -> tuple:
+    """``(sections, attachments)``: the spec cards, their attachment chips
+    named from the image list, and every image on the item."""
+    attachments = _attachments(image_rows)
+    name_by_id = {a["image_id"]: a["image_name"] for a in attachments}
+    spec_block = _spec_block(comp_body)
+    sections = (shipment_details((spec_block or {}).get("DATA")) if is_shipping
+                else spec_sections(spec_block))
     for sec in sections:
         for a in sec["attachments"]:
             a["filename"] = name_by_id.get(a["image_id"]) or a["label"]
             a["is_image"] = _is_image(a["filename"])
-    attachments = [{"image_id": str(i["image_id"]), "image_name": i.get("image_name"),
-                    "created": i.get("created"),
-                    "is_image": _is_image(i.get("image_name"))}
-                   for i in images]
-
-    # The item record's category tells a cable from a generic part (#72); a
-    # cable's page draws its ENDs/connectors from the type definition, with
-    # this item's occupied connectors recovered from its peers' manifests.
-    is_cable = comp.get("category") == "cable"
-    ends, used = [], []
-    if is_cable:
-        try:
-            ends = cable_ends(
-                (api.get_component_type(part_id.rsplit("-", 1)[0]).get("data") or {})
-                .get("connectors"))
-        except Exception as e:
-            logger.warning("part detail: cable ends for %s failed: %s", part_id, e)
-        used = _annotate_cable_connections(api, part_id, manifest)
-
-    container = current_container(
-        _safe_data("container", lambda: api.get_container(part_id)))
+    return sections, attachments
+
+
+def _inside(container_rows, is_cable: bool, manifest: list[dict]) -> dict | None:
+    container = current_container(container_rows)
     # A cable's /container rows include its connections' back-references, so
     # the "newest" one is a single arbitrary connector out of many — not a
     # parent. Peers already render in the Connections pane; only a genuine
@@ -468,23 +540,169 @@ def part_detail(api, part_id: str, is_shipping: bool) -> dict:
     if is_cable and container and any(
             m.get("peer") and m.get("part_id") == container["part_id"]
             for m in manifest):
-        container = None
+        return None
+    return container
 
-    ct = comp.get("component_type") or {}
+
+def _cable_reads(part_id: str, manifest: list[dict]) -> dict:
+    ptid = part_id.rsplit("-", 1)[0]
+    return {"cable type": lambda cli: cli.get_component_type(ptid),
+            "connections": lambda cli: _annotate_cable_connections(cli, part_id, manifest)}
+
+
+def _cable_parts(part_id: str, got: dict) -> tuple[list, list]:
+    """``(ends, used connectors)`` from the ``_cable_reads`` answers."""
+    ends = []
+    if isinstance(got["cable type"], Exception):
+        logger.warning("part detail: cable ends for %s failed: %s",
+                       part_id, got["cable type"])
+    else:
+        ends = cable_ends((got["cable type"].get("data") or {}).get("connectors"))
+    used = [] if isinstance(got["connections"], Exception) else got["connections"]
+    return ends, used
+
+
+def _component(got: dict) -> tuple[dict, dict]:
+    """``(body, record)`` of a gathered ``component`` read — the core record,
+    so its failure is raised (the caller 502s / shows its error)."""
+    body = got["component"]
+    if isinstance(body, Exception):
+        raise body
+    return body, body.get("data") or {}
+
+
+# --- The part page's cards, one loader each (each pane's own endpoint) ---
+#
+# Each loader runs its HWDB reads as a dependency graph, not a sequence:
+# the reads keyed only by ``part_id`` go out at once (``gather``), then the
+# reads that need one of those answers — per-child statuses off the
+# manifest, per-type test history off the test list, a cable's type and
+# peer manifests — go out together, each fanned out in turn. A card's
+# latency is its longest chain (two or three round-trips), not the sum.
+
+# Reads more than one card makes, by name; ``page_read`` shares them.
+_PAGE_READS = {
+    "component": lambda cli, pid: cli.get_component(pid),
+    "images": lambda cli, pid: _safe_data("images", lambda: cli.get_images(pid)),
+    "subcomponents": lambda cli, pid: _safe_data(
+        "subcomponents", lambda: cli.get_subcomponents(pid)),
+}
+# Long enough to cover one page view's panes, short enough that nothing
+# outlives it; a new page view has a new ``load`` id anyway.
+PAGE_READ_TTL = 60
+_MISS = object()
+# key → [lock, panes holding or waiting on it]; the last one out drops it.
+_flights: dict[str, list] = {}
+_flights_lock = threading.Lock()
+
+
+def page_load(instance: str, user_id, load: str) -> str:
+    """The ``page_read`` scope of one page view: its ``load`` id (or "")
+    for one user on one instance, so a ``load`` replayed from another
+    session or against the other instance shares nothing."""
+    return f"{instance}:{user_id}:{load}" if load else ""
+
+
+def page_read(api, part_id: str, name: str, load: str = ""):
+    """One of ``_PAGE_READS`` for ``part_id``, shared by the panes of the
+    page view ``load`` (a ``page_load`` scope): the answer is kept in the
+    cache for ``PAGE_READ_TTL``, and a pane asking while another's fetch is
+    in flight in this process waits for it instead of asking HWDB again.
+    No ``load`` = a plain read. A read that raises is not kept."""
+    read = _PAGE_READS[name]
+    if not load:
+        return read(api, part_id)
+    key = f"part-read:{load}:{part_id}:{name}"
+    with _flights_lock:
+        flight = _flights.setdefault(key, [threading.Lock(), 0])
+        flight[1] += 1
+    try:
+        with flight[0]:
+            got = cache.get(key, _MISS)
+            if got is _MISS:
+                got = read(api, part_id)
+                cache.set(key, got, PAGE_READ_TTL)
+            return got
+    finally:
+        with _flights_lock:
+            flight[1] -= 1
+            if not flight[1]:
+                del _flights[key]
+
+
+def _shared(part_id: str, name: str, load: str):
+    """``page_read`` as a ``gather`` call."""
+    return lambda cli: page_read(cli, part_id, name, load)
+
+
+def part_item(api, part_id: str, load: str = "") -> dict:
+    """The Item card: the record's facts, status, type name and its
+    container. A cable also needs its manifest to tell a container from a
+    connection peer."""
+    got = gather(api, {
+        "component": _shared(part_id, "component", load),
+        "container": lambda cli: _safe_data("container", lambda: cli.get_container(part_id)),
+    })
+    _body, comp = _component(got)
+    is_cable = comp.get("category") == "cable"
+    manifest = (current_manifest(page_read(api, part_id, "subcomponents", load))
+                if is_cable else [])
     return {
-        "part_id": part_id,
-        "container": container,
-        "type_name": _named(ct) or comp.get("type_name"),
-        "is_cable": is_cable,
-        "cable_ends": ends,
-        "used_connectors": used,
+        "type_name": _named(comp.get("component_type") or {}) or comp.get("type_name"),
         "status": normalize_status(comp.get("status")),
         "facts": part_facts(comp),
-        "tests": tests,
-        "manifest": manifest,
-        "timeline": timeline,
-        "sections": sections,
-        "attachments": attachments,
-        "has_location": bool(timeline),
-        "in_transit": bool(timeline and timeline[0]["location_id"] == 0),
+        "container": _inside(got["container"], is_cable, manifest),
     }
+
+
+def part_tests(api, part_id: str) -> list[dict]:
+    """The Tests card: the latest-per-type summary with each test's oid."""
+    ptid = part_id.rsplit("-", 1)[0]
+    got = gather(api, {
+        "tests": lambda cli: _safe_data("tests", lambda: cli.get_tests(part_id)),
+        "test types": lambda cli: _safe_data("test types", lambda: cli.get_test_types(ptid)),
+    })
+    tests = test_summary(got["tests"])
+    _enrich_test_ids(api, part_id, tests, got["test types"])
+    return tests
+
+
+def part_manifest(api, part_id: str, load: str = "") -> dict:
+    """The Assembly/Connections table (with per-child statuses) and, for a
+    cable, its ENDs and occupied connectors."""
+    got = gather(api, {
+        "component": _shared(part_id, "component", load),
+        "subcomponents": _shared(part_id, "subcomponents", load),
+    })
+    _body, comp = _component(got)
+    manifest = current_manifest(got["subcomponents"])
+    is_cable = comp.get("category") == "cable"
+    # Each second-wave read fans out again from its own worker's client.
+    second = {"statuses": lambda cli: _with_statuses(cli, manifest)}
+    if is_cable:
+        second.update(_cable_reads(part_id, manifest))
+    second = gather(api, second)
+    ends, used = _cable_parts(part_id, second) if is_cable else ([], [])
+    return {"manifest": manifest, "is_cable": is_cable,
+            "cable_ends": ends, "used_connectors": used}
+
+
+def part_timeline(api, part_id: str) -> list[dict]:
+    """The Location timeline, newest first."""
+    return _timeline(_safe_data("locations", lambda: api.get_locations(part_id)))
+
+
+def part_attachments(api, part_id: str, load: str = "") -> list[dict]:
+    """Every image on the item (the Executive-summary card's source)."""
+    return _attachments(page_read(api, part_id, "images", load))
+
+
+def part_documents(api, part_id: str, is_shipping: bool, load: str = "") -> dict:
+    """The spec cards and the item's attachments."""
+    got = gather(api, {
+        "component": _shared(part_id, "component", load),
+        "images": _shared(part_id, "images", load),
+    })
+    comp_body, _comp = _component(got)
+    sections, attachments = _documents(comp_body, got["images"], is_shipping)
+    return {"sections": sections, "attachments": attachments}
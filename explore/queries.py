@@ -14,7 +14,7 @@ from core.queries import (
     COLD_COLOR, TEST_TYPE_PALETTE, _ranges_for_series, chart_config,
 )
 
-from .models import HwdbComponentEvent, HwdbTestEvent
+from .models import HwdbComponentEvent, HwdbTestEvent, HwdbTestType
 
 # Overlay series colors (#52) — distinct from the cold-blue baseline; cycled
 # across the filter list (statuses first, then the three QC flags).
@@ -35,17 +35,19 @@ QC_FLAGS = (("is_installed", "Installed"),
 def component_type_progress(instance, part_type_id):
     """Tests-recorded-per-month for one component type from ``HwdbTestEvent``.
 
-    One series per ``test_type_name`` (dynamic — read from the data, no
+    One series per test-type name (dynamic — read from the data, no
     hard-coded consortium knowledge), counted by HWDB ``created`` timestamp.
     Returns the month/3month/all ranges; no 1-year projection (the "recorded"
     timeline is often bulk-loaded, so a steady-rate projection would mislead).
     """
+    names = dict(HwdbTestType.for_instance(instance).filter(part_type_id=part_type_id)
+                 .values_list("id", "name"))
     rows = HwdbTestEvent.for_instance(instance).filter(part_type_id=part_type_id).values_list(
-        "test_type_name", "created"
+        "test_type_id", "created"
     )
     dates_by_type = {}
-    for name, created in rows:
-        dates_by_type.setdefault(name or "(unnamed)", []).append(created)
+    for type_id, created in rows:
+        dates_by_type.setdefault(names[type_id] or "(unnamed)", []).append(created)
     series = [
         (name, TEST_TYPE_PALETTE[i % len(TEST_TYPE_PALETTE)], dates_by_type[name])
         for i, name in enumerate(sorted(dates_by_type))
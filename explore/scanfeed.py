@@ -0,0 +1,97 @@
+"""Push delivery of the phone-scanner feed (``PackScan`` rows) to the desktop
+packing page, as server-sent events.
+
+The pack page used to poll ``scan/feed/`` every two seconds — a full request
+through the middleware stack plus a query, for as long as the page stays
+open. ``stream`` instead holds one connection per page and pushes rows as
+they land:
+
+- in-process: the submit/commit views call ``notify`` once their rows are
+  committed, which wakes every stream of that (instance, user) in this
+  worker at once;
+- across workers: a stream also re-reads the table every ``POLL_SECONDS``,
+  so a scan handled by another worker arrives within that bound.
+
+A stream ends after ``LIFETIME_SECONDS``; the browser's ``EventSource``
+reconnects on its own and resumes from the last event id. Streams are only
+served under ASGI (``cets.asgi``) — a WSGI worker would be pinned for the
+stream's lifetime, so there the view answers 204 and the page keeps polling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+
+from asgiref.sync import sync_to_async
+
+from .models import PackScan
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = 5
+LIFETIME_SECONDS = 300
+# How long the browser waits before reconnecting a closed stream.
+RETRY_MS = 2000
+
+_lock = threading.Lock()
+_listeners: dict[tuple[str, str], set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+
+def rows_after(instance: str, username: str, since: int, limit: int = 100) -> list[dict]:
+    """This user's scans newer than ``since``, oldest first, as feed dicts."""
+    rows = (PackScan.for_instance(instance)
+            .filter(username=username, id__gt=since).order_by("id")[:limit])
+    return [{"id": r.id, "pid": r.part_id, "ok": r.ok, "message": r.result,
+             "box": r.box_part_id, "queued": r.ok is None and bool(r.position)}
+            for r in rows]
+
+
+def notify(instance: str, username: str) -> None:
+    """Wake this worker's streams for the user. Safe from any thread."""
+    with _lock:
+        waiting = list(_listeners.get((instance, username), ()))
+    for loop, event in waiting:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:      # that stream's loop already closed
+            pass
+
+
+def _event(scans: list[dict]) -> bytes:
+    return (f"id: {scans[-1]['id']}\nevent: scans\n"
+            f"data: {json.dumps({'scans': scans})}\n\n").encode()
+
+
+async def stream(instance: str, username: str, since: int):
+    """The SSE body: a ``scans`` event per batch of new rows (its id is the
+    newest row's), a keep-alive comment on idle polls."""
+    key = (instance, username)
+    entry = (asyncio.get_running_loop(), asyncio.Event())
+    with _lock:
+        _listeners.setdefault(key, set()).add(entry)
+    fetch = sync_to_async(rows_after)
+    try:
+        yield f"retry: {RETRY_MS}\n\n".encode()
+        deadline = entry[0].time() + LIFETIME_SECONDS
+        while True:
+            entry[1].clear()
+            scans = await fetch(instance, username, since)
+            if scans:
+                since = scans[-1]["id"]
+                yield _event(scans)
+                continue
+            remaining = deadline - entry[0].time()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(entry[1].wait(), min(POLL_SECONDS, remaining))
+            except asyncio.TimeoutError:
+                yield b": idle\n\n"
+    finally:
+        with _lock:
+            _listeners.get(key, set()).discard(entry)
+            if not _listeners.get(key):
+                _listeners.pop(key, None)
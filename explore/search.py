@@ -0,0 +1,91 @@
+"""Mirror docs in the search index (``core.search``).
+
+Two kinds per HWDB instance (the doc ``scope``): ``type`` — a component-type
+leaf, keyed by part-type id, matched on name/id/full name — and ``part`` — a
+mirrored component, keyed by part id with its type as ``ref``, matched on
+part id/serial. Single-row saves index themselves; the syncs' bulk rewrites
+call ``index_parts``/``index_types`` afterwards.
+"""
+
+from __future__ import annotations
+
+from core import search
+from core.models import SearchDoc
+
+from .models import HierarchyNode, HwdbComponentEvent
+from .instances import NAMESPACE_BY_INSTANCE
+
+TYPE, PART = "type", "part"
+
+
+def _type_doc(name, ptid, full_name):
+    return " ".join(filter(None, [name, ptid, full_name])), name or ""
+
+
+def _part_doc(part_id, serial):
+    return " ".join(filter(None, [part_id, serial])), serial or ""
+
+
+def type_docs(instance: str) -> dict[str, tuple[str, str]]:
+    rows = (HierarchyNode.for_instance(instance)
+            .filter(level=HierarchyNode.LEVEL_TYPE)
+            .values_list("name", "part_type_id", "full_name"))
+    return {ptid: _type_doc(name, ptid, full) for name, ptid, full in rows if ptid}
+
+
+def part_docs(instance: str, part_type_id: str) -> dict[str, tuple[str, str]]:
+    rows = (HwdbComponentEvent.for_instance(instance)
+            .filter(part_type_id=part_type_id)
+            .values_list("part_id", "serial_number"))
+    return {pid: _part_doc(pid, serial) for pid, serial in rows}
+
+
+def index_types(instance: str) -> int:
+    """Re-sync an instance's type docs after a hierarchy refresh/prune."""
+    return search.sync_slice(instance, TYPE, type_docs(instance))
+
+
+def index_parts(instance: str, part_type_id: str) -> int:
+    """Re-sync one component type's part docs after a tests sync."""
+    return search.sync_slice(instance, PART, part_docs(instance, part_type_id),
+                             ref=part_type_id)
+
+
+@search.register_rebuilder
+def _rebuild():
+    for inst in NAMESPACE_BY_INSTANCE:
+        yield inst, TYPE, None, type_docs(inst)
+        ptids = set(HwdbComponentEvent.for_instance(inst)
+                    .values_list("part_type_id", flat=True).distinct())
+        # Slices of types no longer mirrored are emptied.
+        indexed = set(SearchDoc.objects.filter(scope=inst, kind=PART)
+                      .values_list("ref", flat=True).distinct())
+        for ptid in sorted(ptids | indexed):
+            yield inst, PART, ptid, part_docs(inst, ptid) if ptid in ptids else {}
+
+
+def _node_saved(sender, instance, update_fields=None, **kwargs):
+    if instance.level != HierarchyNode.LEVEL_TYPE or not instance.part_type_id:
+        return
+    if update_fields is not None and not {"name", "part_type_id", "full_name"} & set(update_fields):
+        return
+    text, note = _type_doc(instance.name, instance.part_type_id, instance.full_name)
+    search.put(instance.instance, TYPE, instance.part_type_id, text, note=note)
+
+
+def _component_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not {"part_id", "part_type_id",
+                                          "serial_number"} & set(update_fields):
+        return
+    text, note = _part_doc(instance.part_id, instance.serial_number)
+    search.put(instance.instance, PART, instance.part_id, text,
+               ref=instance.part_type_id, note=note)
+
+
+def connect_signals():
+    # post_save only: deletes here are bulk (the syncs' rewrites), which
+    # don't signal — those paths re-sync their slice instead.
+    from django.db.models.signals import post_save
+    post_save.connect(_node_saved, sender=HierarchyNode, dispatch_uid="search-node")
+    post_save.connect(_component_saved, sender=HwdbComponentEvent,
+                      dispatch_uid="search-component")
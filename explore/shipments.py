@@ -23,10 +23,12 @@ from typing import Iterator
 
 from django.utils import timezone
 
+from hwdb import metrics
 from hwdb.api_client import FnalDbApiClient
 
-from . import activity
-from .models import ActivityEvent, HierarchyNode, HwdbComponentEvent, ShipmentItem
+from . import activity, containment
+from .models import (ActivityEvent, HierarchyNode, HierarchySyncState, HwdbComponentEvent,
+                     ShipmentItem)
 
 logger = logging.getLogger(__name__)
 
@@ -244,6 +246,9 @@ def _mirror_box_parent(instance: str, box_pid: str, manifest: list[dict]) -> Non
     if members:
         (HwdbComponentEvent.for_instance(instance)
          .filter(part_id__in=members).update(parent_part_id=box_pid))
+    # The closure takes every member, mirrored row or not — the manifest is
+    # live truth either way.
+    containment.set_contents(instance, box_pid, members)
 
 
 def refresh_box(api, instance: str, part_type_id: str, part_id: str) -> None:
@@ -287,6 +292,7 @@ def _list_boxes(api, part_type_id: str) -> list[str]:
         page += 1
 
 
+@metrics.sync_job("sync_shipments")
 def sync_shipments(api_base_url: str, bearer: str, part_type_id: str,
                    instance: str = "prod", mode: str = "full") -> Iterator[str]:
     """Mirror boxes of one shipping type. Generator yielding progress.
@@ -365,6 +371,7 @@ def sync_shipments(api_base_url: str, bearer: str, part_type_id: str,
         ShipmentItem.for_instance(instance).filter(part_type_id=part_type_id).delete()
     if ship_rows:
         ShipmentItem.objects.bulk_create(ship_rows, batch_size=1000)
+    metrics.sync_items(len(ship_rows))
     # The same manifest fetch also keeps items' parent_part_id honest (#63).
     for pid, _locs, manifest, _shipped, _received in results:
         _mirror_box_parent(instance, pid, manifest)
@@ -374,6 +381,7 @@ def sync_shipments(api_base_url: str, bearer: str, part_type_id: str,
     HierarchyNode.for_instance(instance).filter(
         level=HierarchyNode.LEVEL_TYPE, part_type_id=part_type_id
     ).update(shipments_synced_at=timezone.now())
+    HierarchySyncState.touch(instance)
 
     # Activities feed (#88): one summary row per run, only when new boxes
     # appeared — never a row per box.
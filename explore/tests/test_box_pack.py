@@ -14,6 +14,7 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 
 from explore.models import HwdbComponentEvent, ShipmentItem
+from explore.tests.test_parts import _part_page
 
 BOX = "D00599800007-00128"          # dev-curated shipping type
 CHILD_TYPE = "D08100100004"         # dev LArASIC
@@ -82,7 +83,7 @@ class PackingCardRenderTest(TestCase):
         api = _api()
         m1, m2 = _mocked(api)
         with m1, m2:
-            html = self.client.get(PAGE).content.decode()
+            html = _part_page(self.client, PAGE)
         self.assertIn("Packing", html)
         self.assertIn('value="Slot 1"', html)             # unlink button
         self.assertIn(f">{IN_BOX}</a>", html)             # occupant link
@@ -98,7 +99,7 @@ class PackingCardRenderTest(TestCase):
         api = _api()
         m1, m2 = _mocked(api)
         with m1, m2:
-            html = self.client.get("/hw/part/D08120200001-00001/").content.decode()
+            html = _part_page(self.client, "/hw/part/D08120200001-00001/")
         self.assertNotIn("Packing", html)
         api.get_component_type.assert_not_called()
 
@@ -107,7 +108,7 @@ class PackingCardRenderTest(TestCase):
         api = _api()
         m1, m2 = _mocked(api)
         with m1, m2:
-            html = self.client.get(f"/hw/dev/part/{GOOD}/").content.decode()
+            html = _part_page(self.client, f"/hw/dev/part/{GOOD}/")
         self.assertIn("Inside", html)
         self.assertIn(f">{BOX}</a>", html)
 
@@ -120,7 +121,7 @@ class PackingCardRenderTest(TestCase):
                            "component_type": {"name": "Test Type 007"}}}]}
         m1, m2 = _mocked(api)
         with m1, m2:
-            html = self.client.get(f"/hw/dev/part/{GOOD}/").content.decode()
+            html = _part_page(self.client, f"/hw/dev/part/{GOOD}/")
         self.assertIn("Inside", html)
         self.assertIn(f">{BOX}</a>", html)
         self.assertIn("My Sub Comp 2", html)
@@ -129,7 +130,7 @@ class PackingCardRenderTest(TestCase):
         api = _api()
         m1, m2 = _mocked(api)
         with m1, m2:
-            html = self.client.get(f"/hw/dev/part/{GOOD}/").content.decode()
+            html = _part_page(self.client, f"/hw/dev/part/{GOOD}/")
         self.assertNotIn("In shipping box", html)
 
     def test_type_with_no_connectors_says_so(self):
@@ -138,7 +139,7 @@ class PackingCardRenderTest(TestCase):
         api.get_subcomponents.return_value = {"data": []}
         m1, m2 = _mocked(api)
         with m1, m2:
-            html = self.client.get(PAGE).content.decode()
+            html = _part_page(self.client, PAGE)
         self.assertIn("defines no functional positions", html)
 
 
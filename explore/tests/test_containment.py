@@ -0,0 +1,139 @@
+"""Tests for the containment closure (``explore.containment``): building it
+from mirrored parent edges, moving subtrees, the sync/box hooks that feed it,
+and the part page's "Inside …" line.
+
+    python manage.py test explore
+"""
+
+from __future__ import annotations
+
+import io
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from explore import containment, shipments
+from explore.models import ContainmentPath, HwdbComponentEvent
+
+
+def _paths(instance="prod"):
+    return sorted(ContainmentPath.for_instance(instance)
+                  .values_list("ancestor", "descendant", "depth"))
+
+
+class ClosureTest(TestCase):
+    def test_closure_of_a_chain(self):
+        self.assertEqual(sorted(containment.closure({"C": "B", "B": "A"})),
+                         [("A", "B", 1), ("A", "C", 2), ("B", "C", 1)])
+
+    def test_cycle_is_cut(self):
+        got = containment.closure({"A": "B", "B": "A"})
+        self.assertEqual(sorted(got), [("A", "B", 1), ("B", "A", 1)])
+
+    def test_rebuild_reads_the_mirror_per_instance(self):
+        for pid, parent in [("C", "B"), ("B", "A"), ("A", "")]:
+            HwdbComponentEvent.objects.create(part_type_id="T", part_id=pid,
+                                              parent_part_id=parent)
+        HwdbComponentEvent.objects.create(instance="dev", part_type_id="T",
+                                          part_id="X", parent_part_id="Y")
+        self.assertEqual(containment.rebuild("prod"), 3)
+        self.assertEqual(_paths(), [("A", "B", 1), ("A", "C", 2), ("B", "C", 1)])
+        self.assertEqual(_paths("dev"), [])
+
+    def test_rebuild_command(self):
+        HwdbComponentEvent.objects.create(part_type_id="T", part_id="B",
+                                          parent_part_id="A")
+        ContainmentPath.objects.create(ancestor="X", descendant="Y", depth=1)
+        out = io.StringIO()
+        call_command("rebuild_containment", "--instance", "prod", stdout=out)
+        self.assertIn("prod: 1 containment path(s)", out.getvalue())
+        self.assertEqual(_paths(), [("A", "B", 1)])
+
+
+class SetParentsTest(TestCase):
+    def setUp(self):
+        containment.set_parents("prod", {"B": "A", "C": "B", "D": "C"})
+
+    def test_moving_an_item_carries_its_subtree(self):
+        self.assertEqual(containment.set_parents("prod", {"C": "Z"}), 1)
+        self.assertEqual(containment.descendants("prod", "Z"), [("C", 1), ("D", 2)])
+        self.assertEqual(containment.descendants("prod", "A"), [("B", 1)])
+        self.assertEqual(containment.ancestors("prod", "D"), ["C", "Z"])
+
+    def test_unchanged_edges_and_cycles_are_no_ops(self):
+        before = _paths()
+        self.assertEqual(containment.set_parents("prod", {"B": "A"}), 0)
+        with self.assertLogs("explore.containment", "WARNING"):
+            self.assertEqual(containment.set_parents("prod", {"A": "D"}), 0)
+        self.assertEqual(_paths(), before)
+
+    def test_freeing_an_item(self):
+        containment.set_parents("prod", {"C": ""})
+        self.assertEqual(containment.ancestors("prod", "D"), ["C"])
+        self.assertEqual(containment.n_inside("prod", "A"), 1)
+
+    def test_children_map_is_the_subtree_edges(self):
+        containment.set_parents("prod", {"E": "B"})
+        self.assertEqual(containment.children_map("prod", "A"),
+                         {"A": ["B"], "B": ["C", "E"], "C": ["D"]})
+        self.assertEqual(containment.children_map("prod", "C"), {"C": ["D"]})
+
+    def test_set_contents_drops_members_that_left(self):
+        containment.set_contents("prod", "B", ["E"])
+        self.assertEqual(containment.descendants("prod", "B"), [("E", 1)])
+        self.assertEqual(containment.ancestors("prod", "C"), [])
+
+
+class HookTest(TestCase):
+    def test_box_refresh_updates_the_closure(self):
+        containment.set_parents("prod", {"BOX": "CRATE", "OLD": "BOX"})
+        shipments._mirror_box_parent("prod", "BOX", [{"part_id": "NEW"}])
+        self.assertEqual(containment.ancestors("prod", "NEW"), ["BOX", "CRATE"])
+        self.assertEqual(containment.ancestors("prod", "OLD"), [])
+
+    def test_parent_sweep_updates_the_closure(self):
+        from explore import events
+        HwdbComponentEvent.objects.create(part_type_id="T", part_id="P1")
+        api = mock.MagicMock()
+        with mock.patch("explore.events._list_rows",
+                        return_value=[{"part_id": "P1", "parent_part_id": "BOX"}]):
+            self.assertEqual(events.sweep_parents(api, "prod", "T"), 1)
+        self.assertEqual(containment.ancestors("prod", "P1"), ["BOX"])
+
+    def test_full_resync_drops_the_edges_of_items_it_no_longer_mirrors(self):
+        from explore import events
+        from explore.tests.test_events import _fake_client, _node
+        _node()
+        for pid in ("P1", "GONE"):
+            HwdbComponentEvent.objects.create(part_type_id="D05700200001",
+                                              part_id=pid, parent_part_id="BOX")
+        containment.rebuild("prod")
+        client = _fake_client(["P1"], {})
+        with mock.patch("explore.events.FnalDbApiClient", return_value=client):
+            list(events.sync_test_events("https://x", "bearer", "D05700200001",
+                                         mode="full"))
+        self.assertEqual(containment.ancestors("prod", "GONE"), [])
+        self.assertEqual(containment.descendants("prod", "BOX"), [])   # P1's detail has no parent
+
+
+class PartPageTest(TestCase):
+    def test_part_page_shows_holders_and_contents(self):
+        user = get_user_model().objects.create_user("c", "c@c.io", "pw")
+        self.client.force_login(user)
+        pid = "D05700200099-00007"
+        containment.set_parents("dev", {pid: "BOX-1", "BOX-1": "CRATE-1",
+                                        "KID-1": pid})
+        api = mock.MagicMock()
+        api.get_component.return_value = {"data": {"serial_number": "SN-7",
+                                                   "component_type": {"name": "X"}}}
+        api.get_locations.return_value = api.get_subcomponents.return_value = {"data": []}
+        api.get_images.return_value = api.get_tests.return_value = {"data": []}
+        api.get_test_types.return_value = {"data": []}
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=api):
+            body = self.client.get(f"/hw/dev/part/{pid}/").content.decode()
+        self.assertIn("Inside", body)
+        self.assertLess(body.index("CRATE-1"), body.index("BOX-1"))   # outermost first
+        self.assertIn("1 item inside", body)
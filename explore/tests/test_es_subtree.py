@@ -1,6 +1,6 @@
-"""Tests for the executive summary's sub-component list: ``subtree_rows``
-(direct children only since Hajime's 2026-07-30 call — the recursive walk ran
-deep and slow on CRUs; node-capped, cable-end aware) and the htmx-loaded
+"""Tests for the executive summary's sub-component tree: ``subtree_rows``
+(the full tree again, walked in parallel waves per level with the mirror's
+edges as read-ahead; node-capped, cable-end aware) and the htmx-loaded
 partial that shows it on the ES page.
 
     python manage.py test explore
@@ -13,6 +13,7 @@ from unittest import mock
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
+from explore import containment, parts
 from explore.parts import subtree_rows
 from hwdb.fnal.bearer import FnalLinkRequired
 
@@ -37,9 +38,7 @@ def _walk_api(tree, components=None):
 
 
 class SubtreeWalkTest(TestCase):
-    def test_direct_children_only_with_statuses(self):
-        # Hajime 2026-07-30: one level only — nested sub-components are
-        # neither listed nor fetched.
+    def test_full_tree_in_pre_order_with_statuses(self):
         api = _walk_api(
             {BOX: [_row("A"), _row("B")], "A": [_row("A1")], "A1": [_row("A1a")]},
             components={"B": {"status": {"name": "In Repair"},
@@ -47,14 +46,43 @@ class SubtreeWalkTest(TestCase):
         rows, truncated = subtree_rows(api, BOX)
         self.assertFalse(truncated)
         self.assertEqual([(r["part_id"], r["depth"]) for r in rows],
-                         [("A", 0), ("B", 0)])
-        b = rows[1]
+                         [("A", 0), ("A1", 1), ("A1a", 2), ("B", 0)])
+        b = rows[3]
         self.assertEqual(b["status"], "In Repair")
         self.assertFalse(b["uploaded"])
         self.assertTrue(b["certified"])
-        self.assertEqual(rows[0]["status"], "Passed")
-        # only the root's manifest is read — children are never walked
-        api.get_subcomponents.assert_called_once_with(BOX)
+        self.assertEqual(rows[2]["status"], "Passed")
+        # every node's manifest read once; the root's record never
+        self.assertEqual(sorted(c.args[0] for c in api.get_subcomponents.call_args_list),
+                         ["A", "A1", "A1a", "B", BOX])
+        self.assertNotIn(BOX, [c.args[0] for c in api.get_component.call_args_list])
+
+    def test_one_wave_per_level_and_one_with_a_good_guess(self):
+        tree = {BOX: [_row("A")], "A": [_row("A1")], "A1": [_row("A1a")]}
+        with mock.patch("explore.parts.fetch_map", wraps=parts.fetch_map) as fm:
+            subtree_rows(_walk_api(tree), BOX)
+        self.assertEqual(sum(1 for c in fm.call_args_list if c.args[2]), 4)
+        with mock.patch("explore.parts.fetch_map", wraps=parts.fetch_map) as fm:
+            rows, _ = subtree_rows(_walk_api(tree), BOX,
+                                   guess={BOX: ["A"], "A": ["A1"], "A1": ["A1a"]})
+        self.assertEqual(sum(1 for c in fm.call_args_list if c.args[2]), 1)
+        self.assertEqual([r["part_id"] for r in rows], ["A", "A1", "A1a"])
+
+    def test_stale_guess_is_verified_not_trusted(self):
+        # the mirror says X sits in BOX and A1 in A; live, X left and A1
+        # moved under B — rows follow the live manifests only
+        api = _walk_api({BOX: [_row("A"), _row("B")], "B": [_row("A1")]})
+        rows, _ = subtree_rows(api, BOX, guess={BOX: ["A", "X"], "A": ["A1"]})
+        self.assertEqual([(r["part_id"], r["depth"]) for r in rows],
+                         [("A", 0), ("B", 0), ("A1", 1)])
+
+    def test_known_facts_skip_record_reads(self):
+        api = _walk_api({BOX: [_row("A"), _row("B")]})
+        known = {"A": {"status": "Cached", "uploaded": True, "certified": True,
+                       "component_id": 9}}
+        rows, _ = subtree_rows(api, BOX, known=known)
+        self.assertEqual(rows[0]["status"], "Cached")
+        self.assertEqual([c.args[0] for c in api.get_component.call_args_list], ["B"])
 
     def test_unmounted_children_are_excluded(self):
         api = _walk_api({BOX: [_row("A"), _row("GONE", op="unmount")]})
@@ -122,8 +150,8 @@ class SubtreeCableTest(TestCase):
         self.assertEqual(rows[0]["status"], "Passed")  # fetched with the base PID
 
     def test_peer_backrefs_do_not_become_contents(self):
-        # The cable's own manifest (its peers) is never fetched now — only
-        # the root's rows are listed, so connectivity can't leak in.
+        # The cable's own manifest is read, but it is all peers — its ends'
+        # connectivity, its own parent included — so nothing leaks in.
         rows, _ = subtree_rows(self._cable_api(), self.FLANGE)
         listed = {r["part_id"] for r in rows}
         self.assertNotIn(self.BOARD, listed)
@@ -148,7 +176,7 @@ class SubtreePartialViewTest(TestCase):
         return (mock.patch("explore.views.mint_for", return_value="bearer"),
                 mock.patch("explore.views.FnalDbApiClient", return_value=api))
 
-    def test_partial_renders_direct_children_with_flags(self):
+    def test_partial_renders_the_whole_tree_with_flags(self):
         api = _walk_api({BOX: [_row("D05700300001-00012", "FEB", "FEB1")],
                          "D05700300001-00012": [_row("Z00100300001-07630", "LArASIC", "U1")]})
         m1, m2 = self._mocked(api)
@@ -160,11 +188,11 @@ class SubtreePartialViewTest(TestCase):
         self.assertEqual(resp["Cache-Control"], "no-store")
         html = resp.content.decode()
         self.assertIn("D05700300001-00012", html)
-        # one level only (Hajime 2026-07-30): the FEB's own contents stay out
-        self.assertNotIn("Z00100300001-07630", html)
+        self.assertIn("Z00100300001-07630", html)   # the FEB's own contents
+        self.assertIn("--depth: 1;", html)
         self.assertIn('<span class="es-yes">Yes</span>', html)  # uploaded
         self.assertIn('<span class="es-no">No</span>', html)    # certified
-        self.assertIn("1 direct sub-component", html)
+        self.assertIn("2 sub-components", html)
         # the template's own commentary must not leak into the page ({# #}
         # is single-line only — a multi-line one renders literally)
         self.assertNotIn("swapped in by htmx", html)
@@ -192,3 +220,27 @@ class SubtreePartialViewTest(TestCase):
             resp = self.client.get(PAGE)
         self.assertEqual(resp.status_code, 200)
         self.assertIn("Couldn’t load the sub-component tree", resp.content.decode())
+
+    def test_session_reuses_node_facts_and_mirrored_edges(self):
+        containment.set_parents("dev", {"D05700300001-00012": BOX})
+        api = _walk_api({BOX: [_row("D05700300001-00012", "FEB", "FEB1")]})
+        m1, m2 = self._mocked(api)
+        with m1, m2, mock.patch("explore.views.subtree_rows",
+                                wraps=subtree_rows) as walk:
+            self.client.get(PAGE)
+            self.assertEqual(walk.call_args.kwargs["guess"],
+                             {BOX: ["D05700300001-00012"]})
+            self.client.get(PAGE)
+        # the second load re-reads the manifests but not the record
+        self.assertEqual(api.get_component.call_count, 1)
+        self.assertEqual(api.get_subcomponents.call_count, 4)
+
+    def test_signing_an_item_drops_its_cached_facts(self):
+        from explore import views
+        session = self.client.session
+        session[views._SUBTREE_FACTS] = {"dev": {"A": {"status": "x", "at": 9e99}}}
+        session.save()
+        request = mock.Mock(session=self.client.session)
+        with mock.patch("explore.views.instance_of", return_value="dev"):
+            views._subtree_forget(request, "A")
+        self.assertEqual(request.session[views._SUBTREE_FACTS], {"dev": {}})
@@ -16,7 +16,7 @@ from django.utils import timezone
 
 from explore import events, navigation
 from explore.models import HierarchyNode as H
-from explore.models import HwdbComponentEvent, HwdbTestEvent
+from explore.models import HwdbComponentEvent, HwdbTestEvent, HwdbTestType, PartKey
 from explore.queries import component_type_progress, component_update_progress
 from hwdb.fnal.bearer import FnalLinkRequired
 
@@ -179,7 +179,7 @@ class SyncTestEventsTest(TestCase):
             {"created": "2025-05-11T10:00:00+00:00", "test_type": {"name": "y"}},
         ]}, mode="full")
         self.assertEqual(HwdbTestEvent.objects.count(), 2)
-        self.assertFalse(HwdbTestEvent.objects.filter(test_type_name="x").exists())
+        self.assertFalse(HwdbTestEvent.objects.filter(test_type__name="x").exists())
 
     def test_incremental_skips_known_components(self):
         self._run(["P1"], {"P1": [{"created": "2025-03-10T10:00:00+00:00", "test_type": {"name": "x"}}]})
@@ -198,7 +198,7 @@ class SyncTestEventsTest(TestCase):
         }, mode="components")
         self.assertEqual(HwdbComponentEvent.objects.count(), 2)        # rewritten: P1 + P2
         self.assertEqual(HwdbTestEvent.objects.count(), 2)            # P1's original kept + P2's
-        self.assertFalse(HwdbTestEvent.objects.filter(test_type_name="SHOULD_NOT_REFETCH").exists())
+        self.assertFalse(HwdbTestEvent.objects.filter(test_type__name="SHOULD_NOT_REFETCH").exists())
 
     def test_skips_records_without_created(self):
         self._run(["P1"], {"P1": [
@@ -208,14 +208,53 @@ class SyncTestEventsTest(TestCase):
         self.assertEqual(HwdbTestEvent.objects.count(), 1)
 
 
+class InternedTestEventTest(TestCase):
+    def test_names_and_part_ids_are_interned_per_instance(self):
+        at = datetime(2025, 3, 10, tzinfo=dt_timezone.utc)
+        rows = HwdbTestEvent.build("prod", "D05700200001",
+                                   [("P1", "a", at), ("P1", "b", at), ("P2", "a", at)])
+        again = HwdbTestEvent.build("prod", "D05700200001", [("P2", "a", at)])
+        dev = HwdbTestEvent.build("dev", "D05700200001", [("P2", "a", at)])
+        self.assertEqual(again[0].part_key_id, rows[2].part_key_id)
+        self.assertEqual(again[0].test_type_id, rows[0].test_type_id)
+        self.assertNotEqual(dev[0].part_key_id, again[0].part_key_id)
+        self.assertNotEqual(dev[0].test_type_id, again[0].test_type_id)
+        self.assertEqual(PartKey.objects.count(), 3)
+        self.assertEqual(HwdbTestType.objects.count(), 3)
+
+    def test_rebuilding_known_values_writes_nothing(self):
+        at = datetime(2025, 3, 10, tzinfo=dt_timezone.utc)
+        HwdbTestEvent.build("prod", "D05700200001", [("P1", "a", at)])
+        with self.assertNumQueries(2):      # one lookup per table, no inserts
+            HwdbTestEvent.build("prod", "D05700200001", [("P1", "a", at)])
+
+    def test_naming_events_costs_no_query_per_row(self):
+        at = datetime(2025, 3, 10, tzinfo=dt_timezone.utc)
+        HwdbTestEvent.objects.bulk_create(HwdbTestEvent.build(
+            "prod", "D05700200001", [("P1", "a", at), ("P2", "b", at)]))
+        with self.assertNumQueries(1):
+            names = [str(e) for e in HwdbTestEvent.objects.select_related("test_type")]
+        self.assertIn("HwdbTestEvent(D05700200001, a, 2025-03-10)", names)
+        with self.assertNumQueries(1):
+            [str(e) for e in HwdbTestEvent.objects.all()]   # the id, not a lookup
+
+    def test_admin_lists_events_in_one_query(self):
+        from django.contrib import admin
+        from django.test import RequestFactory
+        at = datetime(2025, 3, 10, tzinfo=dt_timezone.utc)
+        HwdbTestEvent.objects.bulk_create(HwdbTestEvent.build(
+            "prod", "D05700200001", [(f"P{i}", f"t{i % 3}", at) for i in range(6)]))
+        model_admin = admin.site._registry[HwdbTestEvent]
+        with self.assertNumQueries(1):
+            [str(e) for e in model_admin.get_queryset(RequestFactory().get("/"))]
+
+
 class ComponentTypeProgressTest(TestCase):
     def test_one_series_per_test_type(self):
         ptid = "D05700200001"
-        for name, day in [("a", 10), ("a", 11), ("b", 12)]:
-            HwdbTestEvent.objects.create(
-                part_type_id=ptid, part_id="", test_type_name=name,
-                created=datetime(2025, 3, day, tzinfo=dt_timezone.utc),
-            )
+        HwdbTestEvent.objects.bulk_create(HwdbTestEvent.build("prod", ptid, [
+            ("", name, datetime(2025, 3, day, tzinfo=dt_timezone.utc))
+            for name, day in [("a", 10), ("a", 11), ("b", 12)]]))
         ranges = component_type_progress("prod", ptid)
         self.assertEqual(set(ranges), {"month", "3month", "all"})  # no 1year projection
         names = [s["name"] for s in ranges["all"]["series"]]
@@ -305,7 +344,7 @@ class PhysicsDatePathTest(TestCase):
         self.assertEqual(evs.count(), 1)
         e = evs.first()
         self.assertEqual((e.created.year, e.created.month, e.created.day), (2026, 1, 5))  # physics, not May 29
-        self.assertEqual(e.test_type_name, "CryoT QC Test")
+        self.assertEqual(e.test_type.name, "CryoT QC Test")
 
     def test_non_ce_type_has_no_physics_field(self):
         self.assertIsNone(events.physics_date_field("prod", "D05700200001"))   # TDE AMC
@@ -373,7 +412,7 @@ class TestDateRegistryTest(TestCase):
 
         e = HwdbTestEvent.objects.get(part_type_id="D00400100003")
         self.assertEqual((e.created.year, e.created.month, e.created.day), (2023, 7, 20))
-        self.assertEqual(e.test_type_name, "Dark Noise SiPM Counts")
+        self.assertEqual(e.test_type.name, "Dark Noise SiPM Counts")
 
 
 class ComponentUpdateProgressTest(TestCase):
@@ -461,10 +500,8 @@ class ExplorePlotViewTest(TestCase):
 
     def test_synced_node_renders_both_charts(self):
         node = _node(tests_synced_at=timezone.now(), n_tests=1)
-        HwdbTestEvent.objects.create(
-            part_type_id=node.part_type_id, part_id="", test_type_name="amc_bandwidth_test",
-            created=datetime(2025, 3, 10, tzinfo=dt_timezone.utc),
-        )
+        HwdbTestEvent.objects.bulk_create(HwdbTestEvent.build("prod", node.part_type_id, [
+            ("", "amc_bandwidth_test", datetime(2025, 3, 10, tzinfo=dt_timezone.utc))]))
         HwdbComponentEvent.objects.create(
             part_type_id=node.part_type_id, part_id="P1",
             created=datetime(2025, 1, 5, tzinfo=dt_timezone.utc),
@@ -478,9 +515,8 @@ class ExplorePlotViewTest(TestCase):
 
     def test_overlay_selector_renders_on_components_chart_only(self):
         node = _node(tests_synced_at=timezone.now(), n_tests=1)
-        HwdbTestEvent.objects.create(
-            part_type_id=node.part_type_id, part_id="", test_type_name="t",
-            created=datetime(2025, 3, 10, tzinfo=dt_timezone.utc))
+        HwdbTestEvent.objects.bulk_create(HwdbTestEvent.build("prod", node.part_type_id, [
+            ("", "t", datetime(2025, 3, 10, tzinfo=dt_timezone.utc))]))
         HwdbComponentEvent.objects.create(
             part_type_id=node.part_type_id, part_id="P1", status="Passed",
             updated=datetime(2025, 3, 10, tzinfo=dt_timezone.utc))
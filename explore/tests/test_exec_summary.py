@@ -9,14 +9,20 @@ reportlab PDF generation, gate-convention upload. HWDB is mocked.
 from __future__ import annotations
 
 import base64
+import io
 import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone as dt_timezone
 from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, override_settings
 
-from explore import execsummary
+from explore import esrender, execsummary, parts
 from hwdb.fnal.bearer import FnalLinkRequired
 
 BOX = "D00599800007-00128"
@@ -35,6 +41,25 @@ CFG = {
 }
 
 
+_RENDER_SETTINGS = None
+
+
+def setUpModule():
+    # Summary renders land in a throwaway cache, inline unless a test asks
+    # for the background pool.
+    global _RENDER_SETTINGS
+    tmp = tempfile.mkdtemp()
+    _RENDER_SETTINGS = (tmp, override_settings(
+        ES_PDF_CACHE_DIR=tmp, ES_PDF_WORKERS=0, ES_PLOT_WORKERS=0))
+    _RENDER_SETTINGS[1].enable()
+
+
+def tearDownModule():
+    tmp, cm = _RENDER_SETTINGS
+    cm.disable()
+    shutil.rmtree(tmp, True)
+
+
 def _api(cfg=CFG, es=None, todos=None, roles=(41,), log=None, sub_es=None,
          plot_fields=None):
     api = mock.MagicMock()
@@ -292,6 +317,95 @@ class NumericPlotRenderTest(TestCase):
         self.assertIsNone(execsummary._get_by_path({"a": {"b": 1}}, "a.c"))
 
 
+class PlotRenderCacheTest(TestCase):
+    """Numeric plot PNGs are cached by (record, plot config, label); slots
+    share their HWDB reads; misses draw in the plot process pool."""
+
+    def setUp(self):
+        _render_cache(self)
+        self.cfg = execsummary._normalize(CFG_PLOTS)
+
+    def test_unchanged_record_reuses_the_png(self):
+        api = _plots_api()
+        with mock.patch("explore.execsummary.render_numeric_plot",
+                        wraps=execsummary.render_numeric_plot) as draw:
+            first = execsummary.resolve_plots(api, self.cfg, BOX, lambda pid: [], [])
+            again = execsummary.resolve_plots(api, self.cfg, BOX, lambda pid: [], [])
+        self.assertEqual(draw.call_count, 1)
+        self.assertEqual(first[2]["bytes"], again[2]["bytes"])
+
+    def test_new_record_data_or_config_draws_again(self):
+        api = _plots_api()
+        with mock.patch("explore.execsummary.render_numeric_plot",
+                        wraps=execsummary.render_numeric_plot) as draw:
+            execsummary.resolve_plots(api, self.cfg, BOX, lambda pid: [], [])
+            api.get_tests.side_effect = lambda pid, test_type_id=None, history=False: {
+                "data": [{"id": 77, "test_data": {"DATA/gain": [2.0, 2.1]}}]}
+            execsummary.resolve_plots(api, self.cfg, BOX, lambda pid: [], [])
+            rebinned = execsummary._normalize({**CFG_PLOTS, "plots": [
+                {**CFG_PLOTS["plots"][2], "bins": 10}]})
+            execsummary.resolve_plots(api, rebinned, BOX, lambda pid: [], [])
+        self.assertEqual(draw.call_count, 3)
+
+    def test_slots_share_one_read_per_pid_and_test_type(self):
+        api = _plots_api()
+        execsummary.resolve_plots(api, self.cfg, BOX, lambda pid: [], [])
+        # the noise image and the gain plot both read BOX's "RoomT QC" history
+        self.assertEqual(api.get_tests.call_count, 1)
+        children = mock.Mock(return_value=[{"part_id": "D05700300001-00012",
+                                            "functional_position": "FEB1"}])
+        twice = execsummary._normalize({**CFG_PLOTS, "plots": [
+            CFG_PLOTS["plots"][1], {**CFG_PLOTS["plots"][1], "title": "FEB again"}]})
+        execsummary.resolve_plots(api, twice, BOX, children, [])
+        children.assert_called_once_with(BOX)
+
+    def test_a_failed_shared_read_reports_on_every_slot(self):
+        api = _plots_api()
+        api.get_tests.side_effect = RuntimeError("502 from HWDB")
+        blocks = execsummary.resolve_plots(api, self.cfg, BOX, lambda pid: [], [])
+        self.assertIn("502 from HWDB", blocks[0]["error"])
+        self.assertIn("502 from HWDB", blocks[2]["error"])
+        self.assertEqual(api.get_tests.call_count, 1)
+
+    @override_settings(ES_PLOT_WORKERS=1)
+    def test_misses_draw_in_the_process_pool(self):
+        api = _plots_api()
+        blocks = execsummary.resolve_plots(api, self.cfg, BOX, lambda pid: [], [])
+        self.assertIsNone(blocks[2]["error"])
+        self.assertTrue(blocks[2]["bytes"].startswith(b"\x89PNG"))
+        self.assertIsNotNone(esrender._pool)
+        esrender._reset_pool()
+
+    def test_a_renderer_that_raises_costs_its_slot_a_note(self):
+        def boom(*args):
+            raise RuntimeError("bad axis")
+
+        with self.assertLogs("explore.esrender", "ERROR"):
+            (png, note), = esrender.render_plots([("f" * 64, boom, ())])
+        self.assertIsNone(png)
+        self.assertIn("bad axis", note)
+
+    def test_downloads_go_out_together_and_fail_per_block(self):
+        api = _plots_api()
+
+        def get_image_response(image_id):
+            if image_id != "img-noise":
+                raise RuntimeError("gone")
+            return mock.Mock(content=PNG)
+
+        api.get_image_response.side_effect = get_image_response
+        blocks = [
+            {"image_id": "img-noise", "image_name": "noise.png", "is_pdf": False},
+            {"image_id": "img-feb", "image_name": "feb.png", "is_pdf": False},
+        ]
+        with mock.patch("explore.parts.fetch_map", wraps=parts.fetch_map) as fan:
+            execsummary.download_plot_images(api, blocks)
+        fan.assert_called_once()
+        self.assertEqual(blocks[0]["bytes"], PNG)
+        self.assertIn("Failed to download image (image_id=img-feb): gone",
+                      blocks[1]["error"])
+
+
 class ImagePlotPageTest(TestCase):
     def setUp(self):
         self.user = get_user_model().objects.create_user("s", "s@s.io", "pw")
@@ -543,7 +657,7 @@ class EngineTest(TestCase):
         self.assertNotIn("GATE", first)
         self.assertIn("QA/QC Tests - Passed All", first)
         self.assertIn("SUB-COMPONENTS", first)             # in flow, no page break
-        self.assertIn("direct sub-component", first)
+        self.assertIn("sub-component", first)
         self.assertIn("D05700300001-00012", first)
         self.assertIn("Z00100300001-07630", first)
         self.assertIn("QC-CERT.", first)
@@ -598,7 +712,8 @@ class SubtreeEsLinkTest(TestCase):
             [{"image_id": 7,
               "image_name": f"ExecutiveSummary_{pid}_20260730120000.pdf"}]
             if pid.endswith("00012") else [])}
-        request = mock.Mock(resolver_match=mock.Mock(namespace="explore_dev"))
+        request = mock.Mock(resolver_match=mock.Mock(namespace="explore_dev"),
+                            session={})
         rows, truncated = _es_link_subtree(request, api, BOX)
         self.assertFalse(truncated)
         by_pid = {r["part_id"]: r for r in rows}
@@ -1105,6 +1220,210 @@ class GenerateResetUploadTest(TestCase):
         self.assertIn("link", resp["Location"])
 
 
+# ---- off-request, content-addressed summary renders --------------------------
+
+def _render_cache(test):
+    """A fresh render cache for one test, so earlier renders can't hit."""
+    tmp = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, tmp, True)
+    cm = override_settings(ES_PDF_CACHE_DIR=tmp)
+    cm.enable()
+    test.addCleanup(cm.disable)
+
+
+class SummaryRenderTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user("s", "s@s.io", "pw")
+        self.client.force_login(self.user)
+        _render_cache(self)
+
+    def _signed(self):
+        return _api(es=[_entry("Chao Zhang", 2), _entry("Hajime Muramatsu", 1)])
+
+    def test_identical_regenerate_reuses_the_render(self):
+        api = self._signed()
+        m1, m2 = _mocked(api)
+        with m1, m2, mock.patch("explore.execsummary.build_detail_pdf",
+                                wraps=execsummary.build_detail_pdf) as build:
+            self.client.post(PAGE, {"action": "generate"})
+            resp = self.client.post(PAGE, {"action": "generate"}, follow=True)
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(api.post_component_image.call_count, 2)   # posted each time
+        self.assertIn("Summary generated and posted", resp.content.decode())
+
+    def test_a_cached_render_is_stamped_at_each_delivery(self):
+        api = self._signed()
+        m1, m2 = _mocked(api)
+        posted = []
+        api.post_component_image.side_effect = (
+            lambda pid, f, name, **kw: posted.append(f.read()) or {"status": "OK"})
+        with m1, m2, mock.patch("explore.execsummary.build_detail_pdf",
+                                wraps=execsummary.build_detail_pdf) as build:
+            for day in (3, 5):
+                with mock.patch("django.utils.timezone.now", return_value=datetime(
+                        2026, 8, day, 9, 30, tzinfo=dt_timezone.utc)):
+                    self.client.post(PAGE, {"action": "generate"})
+        self.assertEqual(build.call_count, 1)
+        from pypdf import PdfReader
+        stamps = [PdfReader(io.BytesIO(pdf)).pages[0].extract_text() for pdf in posted]
+        self.assertIn("Generated 2026-08-03", stamps[0])
+        self.assertIn("Generated 2026-08-05", stamps[1])
+        self.assertNotIn("2026-08-03", stamps[1])
+
+    def test_default_sign_reuses_the_render_a_minute_later(self):
+        api = _api(cfg=None)
+        m1, m2 = _mocked(api)
+        with m1, m2, mock.patch("explore.execsummary.build_default_pdf",
+                                wraps=execsummary.build_default_pdf) as build:
+            for minute in (1, 2):
+                with mock.patch("django.utils.timezone.now", return_value=datetime(
+                        2026, 8, 3, 9, minute, tzinfo=dt_timezone.utc)):
+                    self.client.post(PAGE, {
+                        "action": "default_sign", "status_id": "140",
+                        "certified": "on", "uploaded": "on"})
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(api.post_component_image.call_count, 2)
+
+    def test_a_changed_input_renders_again(self):
+        api = self._signed()
+        m1, m2 = _mocked(api)
+        with m1, m2, mock.patch("explore.execsummary.build_detail_pdf",
+                                wraps=execsummary.build_detail_pdf) as build:
+            self.client.post(PAGE, {"action": "generate"})
+            api.get_component.return_value = {"data": {
+                "status": {"id": 140, "name": "QA/QC Tests - Use As Is"},
+                "certified_qaqc": True, "qaqc_uploaded": True}}
+            self.client.post(PAGE, {"action": "generate"})
+        self.assertEqual(build.call_count, 2)
+
+    @override_settings(ES_PDF_WORKERS=1)
+    def test_background_render_polls_then_posts_once(self):
+        self.addCleanup(esrender._reset_pool)
+        api = self._signed()
+        m1, m2 = _mocked(api)
+        with m1, m2:
+            # The pool process takes a moment to spawn, so the page always
+            # comes back before the render does.
+            resp = self.client.post(PAGE, {"action": "generate"}, follow=True)
+            html = resp.content.decode()
+            self.assertIn("Rendering the summary PDF", html)
+            self.assertIn(f"/hw/dev/part/{BOX}/exec-summary/render/", html)
+            api.post_component_image.assert_not_called()
+            pending = self.client.session["explore_es_pending"]["dev"][BOX]
+            self.assertEqual(esrender.wait(pending["key"], timeout=120).state,
+                             esrender.DONE)
+            ready = self.client.get(f"{PAGE}render/")
+            self.client.get(f"{PAGE}render/")
+            api.post_component_image.assert_not_called()   # a poll only reports
+            tick = self.client.post(f"{PAGE}render/")
+            again = self.client.post(f"{PAGE}render/")
+        self.assertIn(f'hx-post="{PAGE}render/"', ready.content.decode())
+        self.assertEqual(tick["Cache-Control"], "no-store")
+        body = tick.content.decode()
+        self.assertIn("Summary generated and posted as ExecutiveSummary_", body)
+        self.assertIn(f"{PAGE}pdf/{pending['key']}/", body)
+        api.post_component_image.assert_called_once()
+        self.assertEqual(again.content.decode().strip(), "")   # delivered once
+
+        pdf = self.client.get(f"{PAGE}pdf/{pending['key']}/")
+        self.assertEqual(pdf["Content-Type"], "application/pdf")
+        self.assertTrue(b"".join(pdf.streaming_content).startswith(b"%PDF"))
+
+    @override_settings(ES_PDF_WORKERS=1)
+    def test_overlapping_deliveries_post_once(self):
+        """Two tabs read the same pending render before either clears it:
+        only the one that claims the ticket uploads."""
+        self.addCleanup(esrender._reset_pool)
+        api = self._signed()
+        m1, m2 = _mocked(api)
+        with m1, m2:
+            self.client.post(PAGE, {"action": "generate"})
+            stale = self.client.session["explore_es_pending"]
+            esrender.wait(stale["dev"][BOX]["key"], timeout=120)
+            first = self.client.post(f"{PAGE}render/")
+            session = self.client.session
+            session["explore_es_pending"] = stale   # the other tab's view
+            session.save()
+            second = self.client.post(f"{PAGE}render/")
+        api.post_component_image.assert_called_once()
+        self.assertIn("Summary generated and posted", first.content.decode())
+        self.assertEqual(second.content.decode().strip(), "")
+
+    def test_render_and_pdf_need_a_login(self):
+        self.client.logout()
+        key = "0" * 64
+        for url in (f"{PAGE}render/", f"{PAGE}pdf/{key}/"):
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 302, url)
+            self.assertIn("login", resp["Location"])
+
+    def test_failed_render_is_reported_and_not_posted(self):
+        api = self._signed()
+        m1, m2 = _mocked(api)
+        with m1, m2, mock.patch("explore.execsummary.build_detail_pdf",
+                                side_effect=RuntimeError("layout overflow")):
+            resp = self.client.post(PAGE, {"action": "generate"}, follow=True)
+        api.post_component_image.assert_not_called()
+        self.assertIn("Summary not posted — layout overflow", resp.content.decode())
+
+
+class RenderCacheTest(TestCase):
+    def setUp(self):
+        _render_cache(self)
+
+    def test_key_covers_embedded_bytes_and_attachment(self):
+        form = {"status_label": "Unknown", "plot_blocks": [{"bytes": PNG}]}
+        key = esrender.render_key("detail", BOX, form)
+        self.assertEqual(key, esrender.render_key("detail", BOX, dict(form)))
+        self.assertNotEqual(key, esrender.render_key(
+            "detail", BOX, {**form, "plot_blocks": [{"bytes": PNG + b"x"}]}))
+        self.assertNotEqual(key, esrender.render_key("detail", BOX, form, b"%PDF"))
+        self.assertNotEqual(key, esrender.render_key("default", BOX, form))
+        with mock.patch.object(esrender, "RENDER_VERSION", esrender.RENDER_VERSION + 1):
+            self.assertNotEqual(key, esrender.render_key("detail", BOX, form))
+
+    def test_a_render_whose_process_is_gone_counts_as_missing(self):
+        key = esrender.render_key("detail", BOX, {"n": 1})
+        esrender._set_state(esrender._root(), key, esrender.RENDERING)
+        self.assertEqual(esrender.status(key).state, esrender.RENDERING)
+        with mock.patch.object(esrender.os, "kill", side_effect=ProcessLookupError):
+            self.assertEqual(esrender.status(key).state, esrender.MISSING)
+        with mock.patch.object(esrender.socket, "gethostname", return_value="elsewhere"):
+            self.assertEqual(esrender.status(key).state, esrender.RENDERING)
+
+    @override_settings(ES_PDF_WORKERS=1)
+    def test_a_render_process_that_dies_fails_the_job(self):
+        self.addCleanup(esrender._reset_pool)
+        key = esrender.render_key("detail", BOX, {"n": "crash"})
+        with self.assertLogs("explore.esrender", "WARNING"):
+            esrender.submit(key, os._exit, 1)
+            job = esrender.wait(key, timeout=120)
+        self.assertEqual(job.state, esrender.FAILED)
+        self.assertIn("process died", job.error)
+        self.assertIsNone(esrender._pool)   # the broken pool was dropped
+
+    def test_prune_drops_long_unused_renders(self):
+        old = esrender.render_key("detail", BOX, {"n": "old"})
+        new = esrender.render_key("detail", BOX, {"n": "new"})
+        esrender.submit(old, lambda: b"%PDF old")
+        esrender.submit(new, lambda: b"%PDF new")
+        past = time.time() - (esrender.KEEP_DAYS + 1) * 86400
+        os.utime(esrender.lookup(old), (past, past))
+        self.assertEqual(esrender.prune(), 1)
+        self.assertIsNone(esrender.lookup(old))
+        self.assertIsNotNone(esrender.lookup(new))
+
+    def test_a_delivery_is_claimed_once_and_only_when_done(self):
+        key = esrender.render_key("detail", BOX, {"n": 1})
+        ticket = "a" * 32
+        self.assertFalse(esrender.claim(key, ticket))   # nothing rendered yet
+        esrender.submit(key, lambda: b"%PDF")
+        self.assertFalse(esrender.claim(key, "../x"))
+        self.assertTrue(esrender.claim(key, ticket))
+        self.assertFalse(esrender.claim(key, ticket))
+        self.assertTrue(esrender.claim(key, "b" * 32))   # another delivery
+
+
 # ---- "notify next signee" mailto draft (#91) --------------------------------
 
 CFG_EMAILS = {**CFG, "signees": [
@@ -6,6 +6,7 @@ ADR-0010/0012). HWDB fetch is mocked — no network.
 
 from __future__ import annotations
 
+import json
 from unittest import mock
 
 from django.contrib.auth import get_user_model
@@ -17,6 +18,7 @@ from explore import curation, hierarchy, navigation
 from explore.models import HierarchyNode as H
 from explore.models import HierarchySyncState
 from hwdb.fnal.bearer import FnalLinkRequired
+from hwdb.testing import QueryBudgetMixin
 
 
 def _chain(ptid, sid=57, sname="FD-VD TDE", ssid=2, ssname="Digital electronics",
@@ -225,7 +227,7 @@ class SyncHierarchyTest(TestCase):
         self.assertFalse(H.objects.filter(part_type_id="D05700200099").exists())
 
 
-class NavigationTest(TestCase):
+class NavigationTest(QueryBudgetMixin, TestCase):
     """Drill-in navigation + deep-link URLs (issue #40)."""
 
     def setUp(self):
@@ -247,6 +249,13 @@ class NavigationTest(TestCase):
         self.assertEqual(resp.status_code, 302)
         self.assertIn(reverse("explore:login"), resp["Location"])
 
+    def test_tree_page_query_budget(self):
+        # Cold caches: the two trees' version stamps, one mirror scan and one
+        # read for every extra project's systems (not one per project).
+        navigation.clear_tree_cache()
+        with self.assertQueryBudget(15):
+            self._html(reverse("explore:home"))
+
     def test_browse_root_shows_region_cards(self):
         html = self._html(reverse("explore:browse"))   # drill-in navigator (home is now the tree)
         self.assertIn("Far Detector", html)
@@ -469,6 +478,35 @@ class SidebarTest(TestCase):
         self.assertTrue(mock_region["dim"])
         self.assertIsNone(mock_region["url"])
 
+    def test_tree_structure_cached_per_hierarchy_version(self):
+        navigation.clear_tree_cache()
+        self._find(navigation.sidebar_tree("prod", {}), "AMC")
+        # Warm: the version stamp (one sync-state read) and nothing else —
+        # no node scan, whatever the page's ctx.
+        leaf = H.objects.get(part_type_id="D05700200001")
+        ctx = navigation.leaf_sidebar_ctx("prod", leaf)
+        with self.assertNumQueries(1):
+            tree = navigation.sidebar_tree("prod", ctx)
+        self.assertTrue(self._find(tree, "AMC")["current"])
+        self.assertFalse(self._find(navigation.sidebar_tree("prod", {}), "AMC")["current"])
+        # A leaf sync saves the node → a new version, rebuilt tree.
+        leaf.n_components, leaf.tests_synced_at = 7, timezone.now()
+        leaf.save(update_fields=["n_components", "tests_synced_at"])
+        self.assertEqual(self._find(navigation.sidebar_tree("prod", {}), "AMC")["count"], 7)
+        # A bulk update moves it only through touch(), as the syncs do.
+        H.objects.filter(part_type_id="D05700200001").update(n_components=9)
+        self.assertEqual(self._find(navigation.sidebar_tree("prod", {}), "AMC")["count"], 7)
+        HierarchySyncState.touch("prod")
+        self.assertEqual(self._find(navigation.sidebar_tree("prod", {}), "AMC")["count"], 9)
+
+    def test_curated_tree_is_shared_and_read_only(self):
+        tree = navigation.curated_tree("prod")
+        self.assertIs(navigation.curated_tree("prod"), tree)
+        with self.assertRaises(TypeError):
+            tree["children"][0]["n"] = 0
+        self.assertIsInstance(tree["children"], tuple)
+        self.assertEqual(json.loads(json.dumps(tree))["kind"], "root")
+
     def test_sidebar_rendered_with_chevrons(self):
         u = get_user_model().objects.create_user("sb", "s@s.io", "pw")
         self.client.force_login(u)
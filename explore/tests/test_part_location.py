@@ -14,6 +14,7 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 
 from explore.models import ShipmentItem
+from explore.tests.test_parts import _part_page
 from hwdb.fnal.bearer import FnalLinkRequired
 
 # Hajime's ship/receive walkthrough type — explicitly curated as a dev
@@ -58,7 +59,7 @@ class LocationFormRenderTest(TestCase):
         api = _api()
         m1, m2 = _mocked(api)
         with m1, m2:
-            html = self.client.get(DEV_PAGE).content.decode()
+            html = _part_page(self.client, DEV_PAGE)
         self.assertIn("Update location", html)
         self.assertIn(f"{DEV_POST}", html)
         self.assertIn("Brookhaven National Laboratory", html)
@@ -68,7 +69,7 @@ class LocationFormRenderTest(TestCase):
         api = _api()
         m1, m2 = _mocked(api)
         with m1, m2:
-            html = self.client.get(f"/hw/part/{PROD_BOX}/").content.decode()
+            html = _part_page(self.client, f"/hw/part/{PROD_BOX}/")
         self.assertNotIn("Update location", html)
         api.get_institutions.assert_not_called()
 
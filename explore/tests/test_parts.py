@@ -9,16 +9,24 @@ case is exercised in test_shipments.py (is_shipping=True). HWDB fetch is mocked.
 from __future__ import annotations
 
 import json
+import re
+import threading
+import time
 from unittest import mock
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from explore import navigation, parts, shipments
+from explore import navigation, parts, search, shipments
 from explore.models import HierarchyNode as H
 from explore.models import HwdbComponentEvent
+from hwdb.api_client import FnalDbApiClient
+from hwdb.fake import FakeHwdb, Fleet
 from hwdb.fnal.bearer import FnalLinkRequired
+from hwdb.testing import QueryBudgetMixin
 
 
 class SpecSectionsTest(TestCase):
@@ -165,8 +173,7 @@ class EnrichTestDataTest(TestCase):
         return api
 
     def test_oid_status_and_has_data_backfilled_from_per_type(self):
-        d = parts.part_detail(self._api(), "D08100100003-00226", is_shipping=False)
-        t = d["tests"][0]
+        t = parts.part_tests(self._api(), "D08100100003-00226")[0]
         self.assertEqual(t["test_id"], 15023)    # → FNAL component_test data link
         self.assertEqual(t["test_type_id"], 42)  # → our test_data JSON download
         self.assertEqual(t["status"], "Passed")  # real status, not the empty list value
@@ -183,7 +190,7 @@ class EnrichTestDataTest(TestCase):
             return {"data": [{"id": 15023, "status": {"name": "Passed"},
                               "created": "2026-05-29T00:00:00"}]}  # no images
         api.get_tests.side_effect = get_tests
-        t = parts.part_detail(api, "D08100100003-14194", is_shipping=False)["tests"][0]
+        t = parts.part_tests(api, "D08100100003-14194")[0]
         self.assertEqual(t["test_id"], 15023)
         self.assertFalse(t["has_data"])          # no files → link hidden
 
@@ -260,12 +267,8 @@ class NormalizeStatusTest(TestCase):
         api.get_component.return_value = {"data": {
             "serial_number": "SN-1", "status": {"id": 1, "name": "Available"},
             "component_type": {"name": "Test Type 003"}}}
-        api.get_locations.return_value = {"data": []}
-        api.get_subcomponents.return_value = {"data": []}
-        api.get_images.return_value = {"data": []}
-        api.get_tests.return_value = {"data": []}
-        api.get_test_types.return_value = {"data": []}
-        d = parts.part_detail(api, "D00599800003-00210", is_shipping=False)
+        api.get_container.return_value = {"data": []}
+        d = parts.part_item(api, "D00599800003-00210")
         self.assertEqual(d["status"], "Unknown")
         self.assertIn(("Status", "Unknown"),
                       [(f["label"], f["value"]) for f in d["facts"]])
@@ -348,8 +351,8 @@ class CableEndsTest(TestCase):
             m.return_value = {"data": []}
         return api
 
-    def test_part_detail_flags_cable_and_fetches_type_ends(self):
-        d = parts.part_detail(self._cable_api(), "Z00100300080-00001", is_shipping=False)
+    def test_manifest_flags_cable_and_fetches_type_ends(self):
+        d = parts.part_manifest(self._cable_api(), "Z00100300080-00001")
         self.assertTrue(d["is_cable"])
         self.assertEqual(d["cable_ends"], [{"name": "FCP Flange", "connectors": 1},
                                            {"name": "FCT Board", "connectors": 1}])
@@ -357,7 +360,7 @@ class CableEndsTest(TestCase):
     def test_generic_part_is_not_a_cable_and_skips_the_type_fetch(self):
         api = self._cable_api()
         api.get_component.return_value = {"data": {"category": "generic"}}
-        d = parts.part_detail(api, "Z00100300037-00001", is_shipping=False)
+        d = parts.part_manifest(api, "Z00100300037-00001")
         self.assertFalse(d["is_cable"])
         self.assertEqual(d["cable_ends"], [])
         api.get_component_type.assert_not_called()
@@ -365,7 +368,7 @@ class CableEndsTest(TestCase):
     def test_failed_type_fetch_degrades_to_no_ends(self):
         api = self._cable_api()
         api.get_component_type.side_effect = RuntimeError("502")
-        d = parts.part_detail(api, "Z00100300080-00001", is_shipping=False)
+        d = parts.part_manifest(api, "Z00100300080-00001")
         self.assertTrue(d["is_cable"])
         self.assertEqual(d["cable_ends"], [])
 
@@ -467,7 +470,7 @@ class CableContainerTest(TestCase):
                  "functional_position": "Cold Outer SH",
                  "container": {"part_id": self.FLANGE,
                                "component_type": {"name": "HVS Test Flange"}}}]
-        d = parts.part_detail(self._api(rows), self.CABLE, is_shipping=False)
+        d = parts.part_item(self._api(rows), self.CABLE)
         self.assertIsNone(d["container"])
 
     def test_genuine_box_container_still_shows(self):
@@ -475,7 +478,7 @@ class CableContainerTest(TestCase):
                  "functional_position": "Slot 1",
                  "container": {"part_id": "D08120200001-00001",
                                "component_type": {"name": "CE Shipping Box"}}}]
-        d = parts.part_detail(self._api(rows), self.CABLE, is_shipping=False)
+        d = parts.part_item(self._api(rows), self.CABLE)
         self.assertEqual(d["container"]["part_id"], "D08120200001-00001")
 
 
@@ -516,7 +519,161 @@ class AssemblyTreeTest(TestCase):
         self.assertIsNone(kids[-1]["status"])  # beyond the cap → listed, no status
 
 
-class AssemblyViewTest(TestCase):
+class PaneFanOutTest(TestCase):
+    """The pane loaders run their HWDB reads as a dependency graph: a box
+    with many children costs about two round-trips of wall time, not one
+    per call."""
+
+    DELAY = 0.2
+
+    def _api(self, n_kids):
+        delay = self.DELAY
+
+        def slow(value):
+            def call(*a, **kw):
+                time.sleep(delay)
+                return value(*a, **kw) if callable(value) else value
+            return call
+
+        api = mock.MagicMock()
+        api.get_component.side_effect = slow(
+            lambda pid: {"data": {"status": {"name": "Passed"}}})
+        api.get_subcomponents.side_effect = slow({"data": [
+            {"part_id": f"K{i}", "operation": "mount"} for i in range(n_kids)]})
+        api.get_test_types.side_effect = slow({"data": [{"name": "HV", "id": 1}]})
+        api.get_tests.side_effect = slow(
+            lambda pid, test_type_id=None, history=False: {"data": [
+                {"test_type": "HV", "id": 7, "created": "2026-01-01"}]})
+        return api
+
+    def test_manifest_latency_bounded_by_dependency_depth(self):
+        api = self._api(n_kids=8)
+        t0 = time.monotonic()
+        asm = parts.part_manifest(api, "B1-00001")
+        elapsed = time.monotonic() - t0
+        self.assertEqual([k["status"] for k in asm["manifest"]], ["Passed"] * 8)
+        # 1 + 8 component reads and the manifest, serially ≥ 2 s; the graph
+        # is two hops deep.
+        self.assertEqual(api.get_component.call_count, 9)
+        self.assertLess(elapsed, 5 * self.DELAY)
+
+    def test_tests_latency_bounded_by_dependency_depth(self):
+        api = self._api(n_kids=0)
+        t0 = time.monotonic()
+        tests = parts.part_tests(api, "B1-00001")
+        elapsed = time.monotonic() - t0
+        self.assertEqual(tests[0]["test_id"], 7)
+        self.assertLess(elapsed, 3 * self.DELAY)   # list + types at once, then history
+
+    def test_second_wave_fans_out_from_the_workers_client(self):
+        # One client per thread: the child-status reads build their clients
+        # off the worker that asked for them, not off the caller's.
+        api = self._api(n_kids=3)
+        reads = []
+
+        class Client:
+            def __init__(self, source):
+                self.source = source
+
+            def get_component(self, pid):
+                reads.append((pid, self.source))
+                return api.get_component(pid)
+
+            def get_subcomponents(self, pid):
+                return api.get_subcomponents(pid)
+
+        with mock.patch.object(parts, "_thread_client", Client):
+            asm = parts.part_manifest(api, "B1-00001")
+        self.assertEqual([k["status"] for k in asm["manifest"]], ["Passed"] * 3)
+        kids = [source for pid, source in reads if pid.startswith("K")]
+        self.assertEqual(len(kids), 3)
+        self.assertTrue(all(isinstance(source, Client) for source in kids))
+
+    def test_component_failure_still_raises(self):
+        api = self._api(n_kids=0)
+        api.get_component.side_effect = RuntimeError("502")
+        with self.assertRaises(RuntimeError):
+            parts.part_manifest(api, "B1-00001")
+
+
+class PageReadTest(TestCase):
+    """parts.page_read — the panes of one page view share a read."""
+
+    def test_concurrent_panes_make_one_call(self):
+        api = mock.MagicMock()
+        api.get_component.side_effect = lambda pid: time.sleep(0.1) or {"data": {}}
+        load = "a" * 32
+        threads = [threading.Thread(target=parts.page_read,
+                                    args=(api, "P-1", "component", load))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(api.get_component.call_count, 1)
+
+    def test_without_a_page_view_every_call_reads(self):
+        api = mock.MagicMock()
+        api.get_images.return_value = {"data": [{"image_id": "i"}]}
+        parts.page_read(api, "P-1", "images")
+        parts.page_read(api, "P-1", "images")
+        self.assertEqual(api.get_images.call_count, 2)
+
+    def test_a_failed_read_is_not_kept(self):
+        api = mock.MagicMock()
+        api.get_component.side_effect = [RuntimeError("502"), {"data": {"ok": 1}}]
+        load = "b" * 32
+        with self.assertRaises(RuntimeError):
+            parts.page_read(api, "P-1", "component", load)
+        self.assertEqual(parts.page_read(api, "P-1", "component", load),
+                         {"data": {"ok": 1}})
+
+    def test_the_flight_outlives_its_first_pane(self):
+        # A's read fails, so B (waiting) reads again; C arriving during B's
+        # read must wait for B rather than find no flight and read a third time.
+        failed, b_reading, b_done = threading.Event(), threading.Event(), threading.Event()
+
+        def get_component(pid):
+            if not failed.is_set():
+                failed.wait(5)
+                raise RuntimeError("502")
+            b_reading.set()
+            b_done.wait(5)
+            return {"data": {}}
+
+        api = mock.MagicMock()
+        api.get_component.side_effect = get_component
+        load = parts.page_load("prod", 1, "c" * 32)
+
+        def pane():
+            try:
+                parts.page_read(api, "P-1", "component", load)
+            except RuntimeError:
+                pass
+
+        a, b, c = (threading.Thread(target=pane) for _ in range(3))
+        a.start()
+        time.sleep(0.05)
+        b.start()
+        time.sleep(0.05)
+        failed.set()
+        self.assertTrue(b_reading.wait(5))
+        c.start()
+        time.sleep(0.05)
+        b_done.set()
+        for t in (a, b, c):
+            t.join()
+        self.assertEqual(api.get_component.call_count, 2)
+        self.assertEqual(parts._flights, {})
+
+    def test_a_load_id_is_scoped_to_the_user_and_instance(self):
+        load = "d" * 32
+        self.assertNotEqual(parts.page_load("prod", 1, load), parts.page_load("prod", 2, load))
+        self.assertNotEqual(parts.page_load("prod", 1, load), parts.page_load("dev", 1, load))
+        self.assertEqual(parts.page_load("prod", 1, ""), "")
+
+
+class AssemblyViewTest(QueryBudgetMixin, TestCase):
     """The lazy-expand endpoint /hw/assembly/<pid>/."""
 
     def setUp(self):
@@ -537,6 +694,23 @@ class AssemblyViewTest(TestCase):
         self.assertEqual(child["url"], "/hw/part/C1/")
         self.assertEqual(child["status"], "Unknown")   # obsolete default (#75)
 
+    def test_hwdb_call_budget(self):
+        # 50 children against the fake HWDB: the manifest, then one status
+        # read per child up to the cap — and no per-child DB query.
+        fleet = Fleet([("D05700200001", 60)], n_boxes=1, box_slots=100)
+        server = FakeHwdb(fleet).make_server()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = "http://%s:%d/api/v1" % server.server_address[:2]
+        box = f"{Fleet.BOX_TYPE}-00001"
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient",
+                        lambda _api, bearer: FnalDbApiClient(url, bearer)), \
+             self.assertQueryBudget(4, max_hwdb_calls=1 + parts._STATUS_FETCH_CAP):
+            resp = self.client.get(f"/hw/assembly/{box}/")
+        self.assertEqual(len(resp.json()["children"]), 50)
+
     def test_fnal_link_required_returns_409(self):
         with mock.patch("explore.views.mint_for", side_effect=FnalLinkRequired()):
             resp = self.client.get("/hw/assembly/B1/")
@@ -560,6 +734,16 @@ class AssemblyViewTest(TestCase):
         self.assertEqual(child["url"], "/hw/part/Z00100300064-00001/")
 
 
+_LAZY_PANE = re.compile(r'hx-get="([^"]+)" hx-trigger="load"')
+
+
+def _part_page(client, url) -> str:
+    """A part page as the browser ends up with it: the mirror skeleton plus
+    every lazily loaded pane's fragment."""
+    html = client.get(url).content.decode()
+    return html + "".join(client.get(u).content.decode() for u in _LAZY_PANE.findall(html))
+
+
 class PartViewTest(TestCase):
     def setUp(self):
         self.user = get_user_model().objects.create_user("p", "p@p.io", "pw")
@@ -592,16 +776,17 @@ class PartViewTest(TestCase):
         # section just degrades to empty, not a 502 (ADR-0014 hardening).
         api = self._api()
         api.get_tests.side_effect = RuntimeError("404 from HWDB")
-        d = parts.part_detail(api, "X-1", is_shipping=False)
-        self.assertEqual(d["tests"], [])
-        self.assertEqual(d["facts"][0]["label"], "Serial number")  # rest still built
+        api.get_container.return_value = {"data": []}
+        self.assertEqual(parts.part_tests(api, "X-1"), [])
+        item = parts.part_item(api, "X-1")
+        self.assertEqual(item["facts"][0]["label"], "Serial number")  # rest still built
 
     def test_renders_generic_part(self):
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=self._api()):
             resp = self.client.get(self.url)
+            body = _part_page(self.client, self.url)
         self.assertEqual(resp.status_code, 200)
-        body = resp.content.decode()
         self.assertIn("SN-7", body)             # item fact
         self.assertIn("RoomT", body)            # test summary
         self.assertIn("/view/images/component_test/15023", body)  # per-test data link to FNAL
@@ -609,6 +794,19 @@ class PartViewTest(TestCase):
         self.assertIn("Specifications", body)   # generic spec card
         self.assertNotIn("In Transit", body)    # no shipping framing for a normal part
 
+    def test_panes_of_one_page_view_share_their_reads(self):
+        api = self._api()
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=api):
+            _part_page(self.client, self.url)
+            # item, assembly and documents all need the record; assembly and
+            # the catch-all attachments need the manifest and images.
+            self.assertEqual(api.get_component.call_count, 1)
+            self.assertEqual(api.get_images.call_count, 1)
+            self.assertEqual(api.get_subcomponents.call_count, 1)
+            _part_page(self.client, self.url)        # a new page view reads afresh
+            self.assertEqual(api.get_component.call_count, 2)
+
     def test_shows_latest_spec_with_datasheet_level_fields(self):
         # An FNAL-UI edit appends a new specifications entry whose fields sit
         # at the top level (no DATA envelope) — the page must show that entry.
@@ -621,7 +819,7 @@ class PartViewTest(TestCase):
             ]}}
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=api):
-            body = self.client.get(self.url).content.decode()
+            body = _part_page(self.client, self.url)
         self.assertIn("Vendor", body)
         self.assertIn("Acme", body)
         self.assertNotIn("original", body)   # superseded entry
@@ -637,7 +835,7 @@ class PartViewTest(TestCase):
             }]}}
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=api):
-            body = self.client.get(self.url).content.decode()
+            body = _part_page(self.client, self.url)
         self.assertIn("Show 5 more…", body)           # 15 fields, 10 shown
         self.assertIn('class="sd-vfold"', body)       # 400-char value folds
         self.assertIn("v13", body)                    # folded ≠ dropped
@@ -649,7 +847,7 @@ class PartViewTest(TestCase):
             "specifications": [{"Curve": [1, 2, 3]}]}}
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=api):
-            body = self.client.get(self.url).content.decode()
+            body = _part_page(self.client, self.url)
         self.assertIn('class="sd-jview"', body)                    # preview link
         self.assertIn('class="sd-jdata" data-label="Curve"', body)  # modal payload
         self.assertIn('<dialog id="sd-jmodal">', body)             # shared viewer
@@ -672,7 +870,7 @@ class PartViewTest(TestCase):
              "type_name": "Bias FT flange", "functional_position": "Cold Bottom FCT"}]}
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=api):
-            body = self.client.get(self.url).content.decode()
+            body = _part_page(self.client, self.url)
         self.assertIn("<h2>Cable ends</h2>", body)        # diagram card
         self.assertIn('id="cable-ends-data"', body)       # ends JSON for the SVG
         self.assertIn('id="cable-used-data"', body)       # occupancy JSON (#72)
@@ -701,14 +899,14 @@ class PartViewTest(TestCase):
         }.get(pid, [])}
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=api):
-            body = self.client.get(self.url).content.decode()
+            body = _part_page(self.client, self.url)
         self.assertIn("via FCP Flange:1", body)            # cable-side end recovered
         self.assertIn('"FCP Flange:1"', body)              # occupied slot in the used JSON
 
     def test_generic_part_has_no_cable_card(self):
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=self._api()):
-            body = self.client.get(self.url).content.decode()
+            body = _part_page(self.client, self.url)
         self.assertNotIn("<h2>Cable ends</h2>", body)
         self.assertIn("Assembly (0)", body)
 
@@ -723,7 +921,7 @@ class PartViewTest(TestCase):
              "functional_position": "Cold Inner SH"}]}
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=api):
-            body = self.client.get(self.url).content.decode()
+            body = _part_page(self.client, self.url)
         self.assertIn("asm-caret is-leaf", body)
         self.assertIn("Cable end — open the cable for its connections", body)
         self.assertIn(".Flange:3", body)
@@ -745,13 +943,14 @@ class PartViewTest(TestCase):
             "test_description": "Check the chip"}).encode())
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=api):
-            resp = self.client.get("/hw/dev/part/D05700200099-00007/")
-        html = resp.content.decode()
+            html = _part_page(self.client, "/hw/dev/part/D05700200099-00007/")
+            es = self.client.get("/hw/dev/part/D05700200099-00007/pane/es/")
+            docs = self.client.get("/hw/dev/part/D05700200099-00007/pane/documents/")
         # The summary lives in the ES card's selector; the catch-all
         # Attachments pane must not list it again (#77 follow-up).
-        self.assertEqual([a["image_id"] for a in resp.context["exec_summaries"]],
+        self.assertEqual([a["image_id"] for a in es.context["exec_summaries"]],
                          ["es9"])
-        self.assertEqual([a["image_id"] for a in resp.context["other_attachments"]],
+        self.assertEqual([a["image_id"] for a in docs.context["other_attachments"]],
                          ["i9"])
         self.assertIn("Executive summary", html)
         # Dashboard-style header lines, from the config JSON
@@ -770,12 +969,96 @@ class PartViewTest(TestCase):
         api.get_component_type_images.return_value = {"data": []}
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=api):
-            html = self.client.get("/hw/dev/part/D05700200099-00007/").content.decode()
+            html = _part_page(self.client, "/hw/dev/part/D05700200099-00007/")
         self.assertIn("Executive summary", html)
         self.assertIn("/hw/dev/part/D05700200099-00007/exec-summary/", html)
         self.assertNotIn("Consortium:", html)
 
 
+class PartPaneTest(TestCase):
+    """The part page is a mirror-only skeleton; each live card is its own
+    htmx fragment with its own HWDB reads and cache policy."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user("pp", "p@p.io", "pw")
+        self.client.force_login(self.user)
+        self.url = "/hw/part/D05700200099-00007/"
+        HwdbComponentEvent.objects.create(
+            part_type_id="D05700200099", part_id="D05700200099-00007",
+            status="In Production", parent_part_id="BOX-1")
+
+    @override_settings(HWDB_WRITE_INSTANCES=["dev"])
+    def test_skeleton_renders_from_the_mirror_without_hwdb_reads(self):
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient") as client:
+            resp = self.client.get(self.url)
+        client.assert_not_called()
+        html = resp.content.decode()
+        self.assertIn("In Production", html)                       # mirrored status pill
+        for pane in ("item", "tests", "documents", "assembly", "timeline"):
+            self.assertRegex(html, rf'hx-get="{self.url}pane/{pane}/\?load=[0-9a-f]{{32}}" '
+                                   r'hx-trigger="load"')
+        self.assertNotIn("pane/packing/", html)                    # write instances only
+        self.assertNotIn("pane/es/", html)
+
+    def test_each_pane_makes_only_its_own_reads(self):
+        api = PartViewTest._api(self)
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=api):
+            html = self.client.get(self.url + "pane/tests/").content.decode()
+        self.assertIn("RoomT", html)
+        api.get_component.assert_not_called()
+        api.get_images.assert_not_called()
+        api.get_locations.assert_not_called()
+
+    def test_cache_policy_per_pane(self):
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient",
+                        return_value=PartViewTest._api(self)):
+            tests = self.client.get(self.url + "pane/tests/")
+            timeline = self.client.get(self.url + "pane/timeline/")
+        self.assertEqual(tests["Cache-Control"], "private, max-age=300")
+        self.assertEqual(timeline["Cache-Control"], "no-store")
+
+    def test_a_replayed_load_id_shares_nothing_across_users(self):
+        url = self.url + "pane/documents/?load=" + "e" * 32
+        other = get_user_model().objects.create_user("qq", "q@q.io", "pw")
+        api = PartViewTest._api(self)
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=api):
+            self.client.get(url)
+            self.client.force_login(other)
+            self.client.get(url)
+        self.assertEqual(api.get_component.call_count, 2)
+
+    def test_item_pane_swaps_in_live_status_and_mirror_parent(self):
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient",
+                        return_value=PartViewTest._api(self)):
+            html = self.client.get(self.url + "pane/item/").content.decode()
+        self.assertIn('id="pd-status" class="sd-pill" hx-swap-oob="true">Passed<', html)
+        self.assertIn(">BOX-1</a>", html)                          # containment fallback
+
+    def test_pane_errors_render_in_place_at_200(self):
+        with mock.patch("explore.views.mint_for", side_effect=FnalLinkRequired()):
+            resp = self.client.get(self.url + "pane/tests/")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("re-link", resp.content.decode())
+        self.assertEqual(resp["Cache-Control"], "no-store")
+        api = PartViewTest._api(self)
+        api.get_component.side_effect = RuntimeError("502 from HWDB")
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=api):
+            resp = self.client.get(self.url + "pane/item/")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("Couldn’t load this from HWDB", resp.content.decode())
+
+    @override_settings(HWDB_WRITE_INSTANCES=["dev"])
+    def test_unknown_and_gated_panes(self):
+        self.assertEqual(self.client.get(self.url + "pane/nope/").status_code, 404)
+        self.assertEqual(self.client.get(self.url + "pane/es/").status_code, 403)
+
+
 class TestDataDownloadTest(TestCase):
     """Per-test test_data JSON download (the dashboard's test-data export)."""
 
@@ -969,10 +1252,41 @@ class SearchTest(TestCase):
         match = next(p for p in d["parts"] if p["part_id"] == "D05700200099-00001")
         self.assertEqual(match["serial_number"], "2502-18564")
 
+    def test_unrelated_save_leaves_the_index_alone(self):
+        part = HwdbComponentEvent.objects.get(part_id="D05700200099-00001")
+        part.status = "Passed"
+        with CaptureQueriesContext(connection) as ctx:
+            part.save()
+        writes = [q["sql"] for q in ctx.captured_queries
+                  if "core_searchdoc" in q["sql"] and not q["sql"].startswith("SELECT")]
+        self.assertEqual(writes, [])
+        part.serial_number = "2502-99999"
+        part.save()
+        d = self.client.get("/hw/search/api/", {"q": "2502-99999"}).json()
+        self.assertEqual([p["part_id"] for p in d["parts"]], ["D05700200099-00001"])
+
     def test_short_query_returns_empty(self):
         d = self.client.get("/hw/search/api/", {"q": "a"}).json()
         self.assertEqual(d, {"types": [], "parts": [], "direct_part": None})
 
+    def test_bulk_synced_parts_are_indexed_and_ranked(self):
+        # The tests sync bulk-writes components (no signals) and re-syncs the
+        # type's slice; an exact serial hit outranks a substring hit.
+        HwdbComponentEvent.objects.bulk_create([
+            HwdbComponentEvent(part_type_id="D05700200099", part_id="D05700200099-00000",
+                               serial_number="X2502-18564"),
+            HwdbComponentEvent(part_type_id="D05700200099", part_id="D05700200099-00002",
+                               serial_number="2502-18565")])
+        search.index_parts("prod", "D05700200099")
+        d = self.client.get("/hw/search/api/", {"q": "2502-18564"}).json()
+        self.assertEqual([p["part_id"] for p in d["parts"]],
+                         ["D05700200099-00001", "D05700200099-00000"])
+        HwdbComponentEvent.objects.filter(part_id="D05700200099-00000").delete()
+        search.index_parts("prod", "D05700200099")
+        d = self.client.get("/hw/search/api/", {"q": "2502-1856"}).json()
+        self.assertEqual([p["part_id"] for p in d["parts"]],
+                         ["D05700200099-00001", "D05700200099-00002"])
+
 
 class LeafSidebarCtxTest(TestCase):
     """A part page's sidebar ctx must open the whole branch down to the
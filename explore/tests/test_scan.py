@@ -6,17 +6,22 @@ regexes), the scan submit/feed endpoints, and the packing page's hookup.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest import mock
 
+from asgiref.sync import sync_to_async
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 
-from explore import scanning
+from explore import scanfeed, scanning
 from explore.models import PackScan
 
 SUBMIT = "/hw/dev/scan/submit/"
 FEED = "/hw/dev/scan/feed/"
+COMMIT = "/hw/dev/scan/commit/"
+STREAM = "/hw/dev/scan/stream/"
 PID = "D05700300001-00012"
 BOX = "D00599800007-00128"       # dev-curated shipping type
 
@@ -195,6 +200,182 @@ class ScanEndpointsTest(TestCase):
         self.assertIn('var BOX = "";', html)
 
 
+def _session_api():
+    """HWDB mock for a packing session: a four-FEB box, FEB2 occupied."""
+    api = _cart_api()
+    api.get_component_type.return_value = {"status": "OK", "data": {"connectors": {
+        f"FEB{i}": "D05700300001" for i in range(1, 5)}}}
+    return api
+
+
+class PackingSessionTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user("w", "w@w.io", "pw")
+        self.client.force_login(self.user)
+
+    def _scan(self, api, *pids):
+        m1, m2 = _mocked(api)
+        with m1, m2:
+            return [json.loads(self.client.post(
+                SUBMIT, {"text": pid, "box": BOX, "batch": "1"}).content)
+                for pid in pids]
+
+    def _commit(self, api, **extra):
+        m1, m2 = _mocked(api)
+        with m1, m2:
+            return self.client.post(COMMIT, {"box": BOX, **extra})
+
+    def test_scans_queue_locally_after_one_state_read(self):
+        api = _session_api()
+        got = self._scan(api, "D05700300001-00001", "D05700300001-00002",
+                         "D05700300001-00001", "D05700300001-00003",
+                         "D05700300001-00004")
+        self.assertEqual([g["queued"] for g in got], [True, True, False, True, False])
+        self.assertIn("FEB1", got[0]["message"])
+        self.assertIn("FEB3", got[1]["message"])          # FEB2 is occupied
+        self.assertIn("already queued", got[2]["message"])
+        self.assertIn("no free position", got[4]["message"])
+        api.get_subcomponents.assert_called_once()         # the cached state
+        api.patch_subcomponents.assert_not_called()
+        feed = json.loads(self.client.get(FEED).content)["scans"]
+        self.assertEqual([s["queued"] for s in feed], [True, True, False, True, False])
+
+    def test_commit_links_the_queue_in_one_patch(self):
+        api = _session_api()
+        self._scan(api, "D05700300001-00001", "D05700300001-00002")
+        body = json.loads(self._commit(api).content)
+        self.assertEqual([a["position"] for a in body["added"]], ["FEB1", "FEB3"])
+        api.patch_subcomponents.assert_called_once_with(BOX, {
+            "component": {"part_id": BOX},
+            "subcomponents": {"FEB1": "D05700300001-00001",
+                              "FEB2": "D05700300001-00099",
+                              "FEB3": "D05700300001-00002", "FEB4": None}})
+        # The queued rows became outcome rows for the pack page's poller.
+        self.assertEqual(list(PackScan.objects.order_by("id").values_list("ok", "position")),
+                         [(True, "FEB1"), (True, "FEB3")])
+        self.assertEqual(self._commit(api).status_code, 422)   # nothing left queued
+
+    def test_refused_item_is_dropped_and_the_rest_retried(self):
+        api = _session_api()
+        self._scan(api, "D05700300001-00001", "D05700300001-00002")
+        api.patch_subcomponents.side_effect = [
+            {"status": "ERROR",
+             "data": "The component 'D05700300001-00002' is already in use"},
+            {"status": "OK", "data": "Updated"}]
+        api.get_container.return_value = {"data": []}
+        api.get_component_status.return_value = {"data": {}}
+        body = json.loads(self._commit(api).content)
+        self.assertEqual([a["pid"] for a in body["added"]], ["D05700300001-00001"])
+        self.assertEqual(body["failed"][0]["pid"], "D05700300001-00002")
+        self.assertIn("already in use", body["failed"][0]["message"])
+        self.assertEqual(api.patch_subcomponents.call_count, 2)
+        retry = api.patch_subcomponents.call_args[0][1]["subcomponents"]
+        self.assertEqual((retry["FEB1"], retry["FEB3"]), ("D05700300001-00001", None))
+
+    def test_unattributed_refusal_falls_back_to_per_item(self):
+        api = _session_api()
+        self._scan(api, "D05700300001-00001", "D05700300001-00002")
+        api.patch_subcomponents.side_effect = [
+            {"status": "ERROR", "data": "bad request"},
+            {"status": "OK", "data": "Updated"},
+            {"status": "ERROR", "data": "not yet available"}]
+        api.get_container.return_value = {"data": []}
+        api.get_component_status.return_value = {"data": {}}
+        body = json.loads(self._commit(api).content)
+        self.assertEqual([a["pid"] for a in body["added"]], ["D05700300001-00001"])
+        self.assertEqual([f["pid"] for f in body["failed"]], ["D05700300001-00002"])
+
+    def test_slot_taken_since_queueing_is_reassigned(self):
+        api = _session_api()
+        self._scan(api, "D05700300001-00001")
+        api.get_subcomponents.return_value = {"data": [
+            {"part_id": "D05700300001-00098", "functional_position": "FEB1",
+             "operation": "mount"}]}
+        body = json.loads(self._commit(api).content)
+        self.assertEqual(body["added"], [{"pid": "D05700300001-00001", "position": "FEB2"}])
+
+    def test_scan_queued_during_the_commit_stays_queued(self):
+        api = _session_api()
+        self._scan(api, "D05700300001-00001")
+
+        def patch(*_args):   # a second scan lands while the PATCH is out
+            PackScan.objects.create(instance="dev", username="w", box_part_id=BOX,
+                                    part_id="D05700300001-00002", position="FEB3")
+            return {"status": "OK", "data": "Updated"}
+
+        api.patch_subcomponents.side_effect = patch
+        body = json.loads(self._commit(api).content)
+        self.assertEqual([a["pid"] for a in body["added"]], ["D05700300001-00001"])
+        self.assertEqual(dict(PackScan.objects.values_list("part_id", "ok")),
+                         {"D05700300001-00001": True, "D05700300001-00002": None})
+
+    def test_rows_queued_for_the_same_slot_are_reslotted(self):
+        api = _session_api()
+        for pid in ("D05700300001-00001", "D05700300001-00002"):   # two racing scans
+            PackScan.objects.create(instance="dev", username="w", box_part_id=BOX,
+                                    part_id=pid, position="FEB1")
+        body = json.loads(self._commit(api).content)
+        self.assertEqual(body["added"], [
+            {"pid": "D05700300001-00001", "position": "FEB1"},
+            {"pid": "D05700300001-00002", "position": "FEB3"}])
+        self.assertEqual(body["failed"], [])
+        self.assertFalse(PackScan.objects.filter(ok=None).exists())
+
+    def test_discard_drops_the_queue(self):
+        api = _session_api()
+        self._scan(api, "D05700300001-00001")
+        self.assertEqual(json.loads(self._commit(api, discard="1").content)["discarded"], 1)
+        self.assertFalse(PackScan.objects.exists())
+        api.patch_subcomponents.assert_not_called()
+
+    def test_session_scan_page(self):
+        PackScan.objects.create(instance="dev", username="w", part_id=PID,
+                                box_part_id=BOX, position="FEB1")
+        html = self.client.get(f"/hw/dev/scan/?box={BOX}&batch=1").content.decode()
+        self.assertIn("Packing session for", html)
+        self.assertIn('id="nQueued">1<', html)
+        self.assertIn("var BATCH = true;", html)
+
+
+class ScanStreamTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user("w", "w@w.io", "pw")
+
+    def test_wsgi_answers_no_content(self):
+        # EventSource stops on 204 and the pack page falls back to polling.
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(STREAM).status_code, 204)
+
+    async def test_stream_resumes_after_last_event_id(self):
+        old = await PackScan.objects.acreate(instance="dev", username="w", part_id=PID)
+        new = await PackScan.objects.acreate(instance="dev", username="w",
+                                             part_id="D05700300001-00013")
+        await self.async_client.aforce_login(self.user)
+        with mock.patch.object(scanfeed, "LIFETIME_SECONDS", 0):
+            resp = await self.async_client.get(STREAM, headers={"Last-Event-ID": str(old.id)})
+            self.assertEqual(resp["Content-Type"], "text/event-stream")
+            body = b"".join([c async for c in resp.streaming_content]).decode()
+        self.assertTrue(body.startswith("retry: "))
+        self.assertIn(f"id: {new.id}\nevent: scans\n", body)
+        self.assertIn("D05700300001-00013", body)
+        self.assertNotIn(PID, body)
+
+    async def test_notify_wakes_a_waiting_stream(self):
+        with mock.patch.object(scanfeed, "POLL_SECONDS", 30):
+            gen = scanfeed.stream("dev", "w", 0)
+            self.assertTrue((await anext(gen)).startswith(b"retry: "))
+            nxt = asyncio.ensure_future(anext(gen))
+            await asyncio.sleep(0.05)       # the stream is now parked on its event
+            self.assertFalse(nxt.done())
+            await sync_to_async(PackScan.objects.create)(
+                instance="dev", username="w", part_id=PID)
+            scanfeed.notify("dev", "w")
+            chunk = await asyncio.wait_for(nxt, 2)
+            await gen.aclose()
+        self.assertIn(PID.encode(), chunk)
+        self.assertEqual(scanfeed._listeners, {})
+
+
 class PackPageHookupTest(TestCase):
     def setUp(self):
         self.user = get_user_model().objects.create_user("w", "w@w.io", "pw")
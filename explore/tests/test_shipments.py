@@ -8,16 +8,26 @@ shipping-leaf rendering. HWDB fetch is mocked — no network.
 
 from __future__ import annotations
 
+import io
+import os
+import shutil
+import tempfile
+from pathlib import Path
 from unittest import mock
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
+from PIL import Image
 
-from explore import curation, navigation, parts, shipments
+from explore import curation, imagecache, navigation, parts, shipments
 from explore.models import HierarchyNode as H
 from explore.models import HwdbComponentEvent, ShipmentItem
+from explore.tests.test_parts import _part_page
+from hwdb.testing import QueryBudgetMixin
 from hwdb.fnal.bearer import FnalLinkRequired, FnalUnavailable
 
 SHIP_PTID = "D08120200001"  # curated CE Shipping box (FD CE › CE Shipping Box)
@@ -496,8 +506,8 @@ class ShipmentDetailsTest(TestCase):
         self.assertTrue(all(not s["fields"] and not s["attachments"] for s in secs))
 
 
-class PartDetailEngineTest(TestCase):
-    """parts.part_detail — the generic engine (box page is is_shipping=True)."""
+class PartPaneLoaderTest(TestCase):
+    """The part page's pane loaders (box page is is_shipping=True)."""
 
     def _api(self, component=None, images=None, tests=None):
         api = mock.MagicMock()
@@ -517,11 +527,12 @@ class PartDetailEngineTest(TestCase):
         return api
 
     def test_timeline_sorted_desc_and_manifest_filters_unmount(self):
-        d = parts.part_detail(self._api(), "B1", is_shipping=False)
-        self.assertEqual(d["timeline"][0]["location"], "In Transit")
-        self.assertEqual(d["timeline"][0]["location_id"], 0)
-        self.assertEqual([m["part_id"] for m in d["manifest"]], ["P1"])
-        self.assertTrue(d["has_location"])
+        api = self._api()
+        timeline = parts.part_timeline(api, "B1")
+        self.assertEqual(timeline[0]["location"], "In Transit")
+        self.assertEqual(timeline[0]["location_id"], 0)
+        manifest = parts.part_manifest(api, "B1")["manifest"]
+        self.assertEqual([m["part_id"] for m in manifest], ["P1"])
 
     def test_shipping_box_uses_lifecycle_sections_and_attachments(self):
         api = self._api(
@@ -529,7 +540,7 @@ class PartDetailEngineTest(TestCase):
             images=[{"image_id": "img-1", "image_name": "label.pdf"},
                     {"image_id": None, "image_name": "broken"}],  # dropped (no id)
         )
-        d = parts.part_detail(api, "B1", is_shipping=True)
+        d = parts.part_documents(api, "B1", is_shipping=True)
         self.assertEqual(_sec(d["sections"], "Info @ Warehouse")["fields"][0]["label"], "SKU")
         self.assertEqual([a["image_id"] for a in d["attachments"]], ["img-1"])
 
@@ -541,7 +552,7 @@ class PartDetailEngineTest(TestCase):
             images=[{"image_id": "img-jpg", "image_name": "inspect.JPG"},
                     {"image_id": "img-pdf", "image_name": "bol.pdf"}],
         )
-        secs = parts.part_detail(api, "B1", is_shipping=True)["sections"]
+        secs = parts.part_documents(api, "B1", is_shipping=True)["sections"]
         atts = {a["image_id"]: a for a in _sec(secs, "Shipping")["attachments"]}
         self.assertTrue(atts["img-jpg"]["is_image"])    # .JPG (case-insensitive)
         self.assertFalse(atts["img-pdf"]["is_image"])   # .pdf → download chip
@@ -554,7 +565,8 @@ class PartDetailEngineTest(TestCase):
                 {"Shipping Checklist": [{"Image ID for this Shipping Sheet": "img-1"}]}),
             images=[{"image_id": "img-1", "image_name": "D08120200001-00002-shipping-label.pdf"}],
         )
-        att = _sec(parts.part_detail(api, "B1", is_shipping=True)["sections"], "Shipping")["attachments"][0]
+        att = _sec(parts.part_documents(api, "B1", is_shipping=True)["sections"],
+                   "Shipping")["attachments"][0]
         self.assertEqual(att["label"], "Shipping Sheet")
         self.assertEqual(att["filename"], "D08120200001-00002-shipping-label.pdf")
 
@@ -585,8 +597,8 @@ class ShipmentDetailPageTest(TestCase):
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=self._api()):
             resp = self.client.get(self.url)
+            body = _part_page(self.client, self.url)
         self.assertEqual(resp.status_code, 200)
-        body = resp.content.decode()
         self.assertIn(self.part_id, body)
         # All three lifecycle sections render, even the empty ones.
         self.assertIn("Pre-shipping", body)
@@ -615,8 +627,8 @@ class ShipmentDetailPageTest(TestCase):
         ]}
         with mock.patch("explore.views.mint_for", return_value="bearer"), \
              mock.patch("explore.views.FnalDbApiClient", return_value=api):
-            resp = self.client.get(self.url)
-        html = resp.content.decode()
+            html = _part_page(self.client, self.url)
+            resp = self.client.get(self.url + "pane/documents/")
         self.assertIn('id="pd-sheets"', html)
         # Short labels like the ES pane: the filename's timestamp for the
         # new naming era, the upload time for the legacy fixed name.
@@ -627,7 +639,7 @@ class ShipmentDetailPageTest(TestCase):
                          ["s-new", "s-old"])                      # newest first
         self.assertEqual([a["image_id"] for a in resp.context["other_attachments"]],
                          ["other"])                               # sheets deduped
-        pre = next(s for s in resp.context["detail"]["sections"]
+        pre = next(s for s in resp.context["sections"]
                    if s["title"] == "Pre-shipping")
         self.assertEqual(pre["attachments"], [])                  # chip replaced
 
@@ -644,6 +656,22 @@ class ShipmentDetailPageTest(TestCase):
         self.assertIn("Couldn", resp.content.decode())  # "Couldn't load …" banner
 
 
+def _cache_dir(test):
+    """Point the image cache at a throwaway directory for one test."""
+    tmp = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, tmp, True)
+    cm = override_settings(HWDB_IMAGE_CACHE_DIR=tmp)
+    cm.enable()
+    test.addCleanup(cm.disable)
+    return tmp
+
+
+def _png(w=600, h=400) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (w, h), "teal").save(buf, "PNG")
+    return buf.getvalue()
+
+
 class ShipmentImageViewTest(TestCase):
     """Attachment/label download proxy (bearer-gated bytes streamed through)."""
 
@@ -651,6 +679,7 @@ class ShipmentImageViewTest(TestCase):
         self.user = get_user_model().objects.create_user("img", "i@i.io", "pw")
         self.client.force_login(self.user)
         self.url = "/hw/shipment-image/img-7/"
+        self.root = _cache_dir(self)
 
     def _api(self):
         api = mock.MagicMock()
@@ -681,6 +710,130 @@ class ShipmentImageViewTest(TestCase):
         self.assertEqual(resp.status_code, 409)
         self.assertEqual(resp.json()["error"], "fnal_link")
 
+    def test_repeat_views_are_served_from_the_disk_cache(self):
+        api = self._api()
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=api):
+            first = self.client.get(self.url)
+            b"".join(first.streaming_content)
+            again = self.client.get(self.url, {"name": "label.pdf"})
+            body = b"".join(again.streaming_content)
+            cond = self.client.get(self.url, HTTP_IF_NONE_MATCH=again["ETag"])
+        api.get_image_response.assert_called_once_with("img-7")   # one HWDB fetch
+        self.assertEqual(body, b"%PDF-bytes")
+        self.assertEqual(again["Content-Type"], "application/pdf")
+        self.assertEqual(first["ETag"], again["ETag"])
+        self.assertIn("immutable", again["Cache-Control"])
+        self.assertEqual(cond.status_code, 304)
+
+    def test_cache_hit_still_needs_a_linked_session(self):
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=self._api()):
+            b"".join(self.client.get(self.url).streaming_content)
+        with mock.patch("explore.views.mint_for", side_effect=FnalLinkRequired()):
+            self.assertEqual(self.client.get(self.url).status_code, 409)
+
+    def test_thumb_serves_a_downscaled_jpeg(self):
+        api = self._api()
+        api.get_image_response.return_value.headers = {"Content-Type": "image/png"}
+        api.get_image_response.return_value.iter_content.return_value = iter([_png()])
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=api):
+            resp = self.client.get(self.url, {"name": "photo.png", "thumb": "1"})
+        self.assertEqual(resp["Content-Type"], "image/jpeg")
+        self.assertTrue(resp["Content-Disposition"].startswith("inline"))
+        im = Image.open(io.BytesIO(b"".join(resp.streaming_content)))
+        self.assertLessEqual(max(im.size), imagecache.THUMB_PX)
+
+    def test_thumb_of_a_non_image_falls_back_to_the_original(self):
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=self._api()):
+            resp = self.client.get(self.url, {"thumb": "1"})
+        self.assertEqual(resp["Content-Type"], "application/pdf")
+        self.assertEqual(b"".join(resp.streaming_content), b"%PDF-bytes")
+
+
+    def _racing_lookup(self, unlink):
+        """``imagecache.lookup`` whose first hit has ``unlink(entry)`` run on
+        it right away — another worker evicting between lookup and read."""
+        real, raced = imagecache.lookup, []
+
+        def lookup(inst, image_id):
+            entry = real(inst, image_id)
+            if entry is not None and not raced:
+                raced.append(entry)
+                unlink(entry)
+            return entry
+        return mock.patch.object(imagecache, "lookup", side_effect=lookup)
+
+    def test_blob_evicted_after_lookup_is_fetched_again(self):
+        api = self._api()
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=api):
+            b"".join(self.client.get(self.url).streaming_content)
+            api.get_image_response.return_value.iter_content.return_value = iter(
+                [b"%PDF-", b"bytes"])
+            with self._racing_lookup(lambda e: e.path.unlink()):
+                resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(b"".join(resp.streaming_content), b"%PDF-bytes")
+        self.assertEqual(api.get_image_response.call_count, 2)
+
+    def test_thumbnail_evicted_before_read_is_made_again(self):
+        api = self._api()
+        api.get_image_response.return_value.headers = {"Content-Type": "image/png"}
+        api.get_image_response.return_value.iter_content.return_value = iter([_png()])
+        real, calls = imagecache.thumbnail, []
+        gone = imagecache.Entry(Path(self.root) / "thumbs" / "gone.jpg", "image/jpeg", "gone")
+
+        def thumbnail(entry):
+            # found on disk, then evicted before it's opened
+            calls.append(entry)
+            return gone if len(calls) == 1 else real(entry)
+        with mock.patch("explore.views.mint_for", return_value="bearer"), \
+             mock.patch("explore.views.FnalDbApiClient", return_value=api), \
+             mock.patch.object(imagecache, "thumbnail", side_effect=thumbnail):
+            resp = self.client.get(self.url, {"thumb": "1"})
+        self.assertEqual(resp["Content-Type"], "image/jpeg")
+        self.assertEqual(len(calls), 2)
+        api.get_image_response.assert_called_once()   # the blob was still there
+
+
+class ImageCacheEvictionTest(TestCase):
+    def setUp(self):
+        self.root = _cache_dir(self)
+
+    def test_evicts_least_recently_served_first(self):
+        old = imagecache.store("prod", "a", [b"x" * 600], "image/png")
+        os.utime(old.path, (1, 1))                      # served long ago
+        new = imagecache.store("prod", "b", [b"y" * 600], "image/png")
+        self.assertEqual(imagecache.evict(max_bytes=1000), 1)
+        self.assertFalse(old.path.exists())
+        self.assertTrue(new.path.exists())
+        self.assertIsNone(imagecache.lookup("prod", "a"))   # dangling ref = miss
+        self.assertEqual(imagecache.lookup("prod", "b").etag, new.etag)
+
+    def test_thumbnail_of_an_evicted_blob_raises_not_found(self):
+        entry = imagecache.store("prod", "a", [_png()], "image/png")
+        entry.path.unlink()
+        with self.assertRaises(FileNotFoundError):
+            imagecache.thumbnail(entry)
+
+    def test_stores_rescan_only_past_the_cap(self):
+        with override_settings(HWDB_IMAGE_CACHE_MAX_MB=1), \
+             mock.patch.object(imagecache, "evict", wraps=imagecache.evict) as evict:
+            imagecache.store("prod", "a", [b"a" * 1000], "image/png")   # learns the total
+            for i in range(5):
+                imagecache.store("prod", f"b{i}", [bytes([i]) * 1000], "image/png")
+            self.assertEqual(evict.call_count, 1)
+            imagecache.store("prod", "big", [b"z" * (1024 * 1024)], "image/png")
+            self.assertEqual(evict.call_count, 2)
+
+    def test_identical_bytes_share_one_blob(self):
+        a = imagecache.store("prod", "a", [b"same"], "image/png")
+        b = imagecache.store("dev", "b", [b"same"], "image/png")
+        self.assertEqual(a.path, b.path)
+
 
 class ShipStatusTest(TestCase):
     """ShipmentItem.ship_status — the #87 bucket rule: transit wins, then
@@ -705,7 +858,7 @@ class ShipStatusTest(TestCase):
         self.assertEqual(self._item(location_id=None, n_contents=0).ship_status, "empty")
 
 
-class ShipmentsPageTest(TestCase):
+class ShipmentsPageTest(QueryBudgetMixin, TestCase):
     """Top-level Shipments dashboard (Hajime's ask; #87 redesign: status tabs
     + shipping sidebar + search + per-row refresh)."""
 
@@ -886,6 +1039,31 @@ class ShipmentsPageTest(TestCase):
         pg2 = self.client.get(url, {"tab": "packing", "page": 2}).context["page_obj"]
         self.assertEqual(len(pg2.object_list), 4)
 
+    def test_query_count_independent_of_box_and_type_count(self):
+        def _n_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.get(reverse("explore:shipments"), {"tab": "packing"})
+            return len(ctx.captured_queries)
+
+        base = _n_queries()
+        other = H.objects.create(
+            level=H.LEVEL_TYPE, parent=self.leaf.parent, system_id=81,
+            system_name="FD CE", subsystem_id=202, subsystem_name="CE Shipping Box",
+            name="Spare box", part_type_id="D08120200002", n_components=0)
+        ShipmentItem.objects.bulk_create([
+            ShipmentItem(part_type_id=ptid, part_id=f"{ptid}-{i:05d}",
+                         location_id=1, n_contents=1)
+            for ptid in (self.leaf.part_type_id, other.part_type_id)
+            for i in range(120)
+        ])
+        self.assertEqual(_n_queries(), base)
+
+    def test_query_budget(self):
+        # Session + user, the shipping types (one read for every curated
+        # shipping subsystem), the counts and the page.
+        with self.assertQueryBudget(12):
+            self.client.get(reverse("explore:shipments"), {"tab": "transit"})
+
     def test_every_row_has_a_refresh_button(self):
         html = self.client.get(reverse("explore:shipments")).content.decode()
         self.assertIn("/hw/part/B1/refresh-shipment/", html)
@@ -907,7 +1085,7 @@ class ShipmentsPageTest(TestCase):
         self.assertNotIn("Start packing", html)
 
 
-class ShipmentsSearchApiTest(TestCase):
+class ShipmentsSearchApiTest(QueryBudgetMixin, TestCase):
     """GET shipments/search/ — live results for the page's search box,
     mirroring the header find (shipping types + boxes from the mirror)."""
 
@@ -971,6 +1149,10 @@ class ShipmentsSearchApiTest(TestCase):
         data = self.client.get(self.url, {"q": "D08120200001-000"}).json()
         self.assertEqual(len(data["boxes"]), 8)
 
+    def test_query_budget(self):
+        with self.assertQueryBudget(8):
+            self.client.get(self.url, {"q": "box"})
+
     def test_page_wires_up_the_live_search(self):
         html = self.client.get(reverse("explore:shipments")).content.decode()
         self.assertIn('id="ship-search"', html)
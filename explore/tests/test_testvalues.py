@@ -0,0 +1,199 @@
+"""Tests for the numeric test-data mirror behind type-wide ("sum") ES plots:
+extraction during the tests sync, the population query, and the ES / leaf
+plots drawn from it. HWDB fetch is mocked — no network.
+
+    python manage.py test explore
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from explore import events, execsummary, navigation, testvalues
+from explore.models import HwdbTestValue
+from explore.tests.test_events import _fake_client, _node
+
+PTID = "D05700200001"
+
+CFG = {"plots": [
+    {"title": "Gain", "test_type_name": "RoomT QC", "data_paths": ["gain"], "sum": True},
+    {"title": "Gain vs V", "test_type_name": "RoomT QC",
+     "data_paths": ["V", "gain"], "sum": True},
+    {"title": "Length", "item_paths": ["DATA.length"], "sum": True},
+    {"title": "Noise", "test_type_name": "RoomT QC", "data_paths": ["noise"]},
+]}
+
+
+def setUpModule():
+    global _CACHE
+    tmp = tempfile.mkdtemp()
+    _CACHE = (tmp, override_settings(ES_PDF_CACHE_DIR=tmp, ES_PLOT_WORKERS=0))
+    _CACHE[1].enable()
+
+
+def tearDownModule():
+    tmp, cm = _CACHE
+    cm.disable()
+    shutil.rmtree(tmp, True)
+
+
+def _value(pid, path, value, idx=0, tt="RoomT QC", test_id=1):
+    return HwdbTestValue.objects.create(
+        part_type_id=PTID, part_id=pid, test_type_name=tt, test_id=test_id,
+        path=path, idx=idx, value=value)
+
+
+class ValueSpecTest(TestCase):
+    def test_only_sum_plots_opt_in(self):
+        spec = testvalues.value_spec(execsummary._normalize(CFG))
+        self.assertEqual(spec, {"RoomT QC": ["gain", "V"],
+                                testvalues.ITEM_SPECS: ["DATA.length"]})
+
+    def test_no_config_means_no_values(self):
+        self.assertEqual(testvalues.value_spec(None), {})
+
+    def test_extract_flattens_lists_and_drops_non_numbers(self):
+        got = testvalues.extract({"gain": [1, "2.5", "bad", [3]], "V": 7}, ["gain", "V", "x"])
+        self.assertEqual(got, [("gain", 0, 1.0), ("gain", 1, 2.5), ("gain", 2, 3.0),
+                               ("V", 0, 7.0)])
+
+
+class SyncValuesTest(TestCase):
+    def setUp(self):
+        _node()
+
+    def _client(self, gain):
+        client = _fake_client(["P1", "P2"], {})
+        client.get_tests.side_effect = lambda pid, test_type_id=None, history=False: {
+            "data": [{"id": 10 + int(pid[1]), "test_data": {"gain": gain[pid], "V": 5}},
+                     {"id": 1, "test_data": {"gain": -1}}]}   # older record, ignored
+        detail = client._make_request.side_effect
+
+        def _make_request(method, endpoint, data=None, params=None):
+            body = detail(method, endpoint, data, params)
+            if endpoint.startswith("components/"):
+                body["data"]["specifications"] = [{"DATA": {"length": 1.0}},
+                                                  {"DATA": {"length": 2.0}}]
+            return body
+        client._make_request.side_effect = _make_request
+        return client
+
+    def _run(self, client, mode="incremental"):
+        spec = testvalues.value_spec(execsummary._normalize(CFG))
+        with mock.patch("explore.events.FnalDbApiClient", return_value=client), \
+                mock.patch("explore.testvalues.spec_for", return_value=spec):
+            return list(events.sync_test_events("https://x", "bearer", PTID, mode=mode))
+
+    def test_sync_mirrors_latest_record_and_item_spec_values(self):
+        self._run(self._client({"P1": [1.0, 2.0], "P2": 3.0}))
+        rows = HwdbTestValue.objects.filter(part_type_id=PTID)
+        self.assertEqual(
+            sorted(rows.filter(path="gain").values_list("part_id", "test_id", "idx", "value")),
+            [("P1", 11, 0, 1.0), ("P1", 11, 1, 2.0), ("P2", 12, 0, 3.0)])
+        # the latest spec entry wins, stored under the "" test type
+        self.assertEqual(
+            sorted(rows.filter(test_type_name="").values_list("part_id", "value")),
+            [("P1", 2.0), ("P2", 2.0)])
+        self.assertFalse(rows.filter(path="noise").exists())   # not a "sum" plot
+
+    def test_full_resync_rewrites_and_incremental_leaves_known_items(self):
+        self._run(self._client({"P1": 1.0, "P2": 2.0}))
+        self._run(self._client({"P1": 9.0, "P2": 9.0}))
+        self.assertEqual(HwdbTestValue.objects.filter(path="gain", value=9.0).count(), 0)
+        self._run(self._client({"P1": 9.0, "P2": 9.0}), mode="full")
+        self.assertEqual(
+            sorted(HwdbTestValue.objects.filter(path="gain").values_list("value", flat=True)),
+            [9.0, 9.0])
+
+    def test_types_without_sum_plots_fetch_nothing_extra(self):
+        client = _fake_client(["P1"], {"P1": []})
+        with mock.patch("explore.events.FnalDbApiClient", return_value=client), \
+                mock.patch("explore.testvalues.spec_for", return_value={}):
+            list(events.sync_test_events("https://x", "bearer", PTID))
+        client.get_tests.assert_called_once_with("P1")
+        self.assertFalse(HwdbTestValue.objects.exists())
+
+
+class PopulationTest(TestCase):
+    def setUp(self):
+        self.cfg = execsummary._normalize(CFG)
+
+    def test_histogram_population_across_items(self):
+        _value("P1", "gain", 1.0)
+        _value("P1", "gain", 2.0, idx=1)
+        _value("P2", "gain", 3.0)
+        data, n = testvalues.population_data("prod", PTID, self.cfg["plots"][0])
+        self.assertEqual(data, {"gain": [1.0, 2.0, 3.0]})
+        self.assertEqual(n, 2)
+
+    def test_scatter_pairs_points_with_both_coordinates(self):
+        _value("P1", "V", 5.0)
+        _value("P1", "gain", 1.0)
+        _value("P2", "gain", 3.0)   # no V on P2 — dropped
+        data, n = testvalues.population_data("prod", PTID, self.cfg["plots"][1])
+        self.assertEqual(data, {"V": [5.0], "gain": [1.0]})
+        self.assertEqual(n, 1)
+
+    def test_unchanged_values_reuse_the_png(self):
+        _value("P1", "gain", 1.0)
+        with mock.patch("explore.execsummary.render_numeric_plot",
+                        wraps=execsummary.render_numeric_plot) as draw:
+            png, note, n = testvalues.population_plot("prod", PTID, self.cfg["plots"][0])
+            again, _note, _n = testvalues.population_plot("prod", PTID, self.cfg["plots"][0])
+            _value("P2", "gain", 4.0)
+            testvalues.population_plot("prod", PTID, self.cfg["plots"][0])
+        self.assertTrue(png.startswith(b"\x89PNG"))
+        self.assertEqual(png, again)
+        self.assertEqual(draw.call_count, 2)
+
+    def test_empty_mirror_explains_itself(self):
+        png, note, n = testvalues.population_plot("prod", PTID, self.cfg["plots"][0])
+        self.assertIsNone(png)
+        self.assertIn("next test sync", note)
+
+    def test_resolve_plots_adds_the_population_to_sum_slots(self):
+        _value("P1", "gain", 1.0)
+        api = mock.MagicMock()
+        api.get_tests.side_effect = lambda pid, test_type_id=None, history=False: {
+            "data": [{"id": 1, "test_data": {"gain": [1.0], "V": [5.0], "noise": [2.0]}}]}
+        api.get_component.return_value = {"data": {"specifications": [
+            {"DATA": {"length": 1.0}}]}}
+        blocks = execsummary.resolve_plots(api, self.cfg, f"{PTID}-00001",
+                                           lambda pid: [], [], instance="prod")
+        self.assertIn("pop_png_b64", blocks[0])
+        self.assertEqual(blocks[0]["pop_n"], 1)
+        self.assertIn("next test sync", blocks[2]["pop_note"])   # no lengths mirrored
+        self.assertNotIn("pop_n", blocks[3])                       # not a "sum" plot
+        pdf = execsummary.build_detail_pdf(f"{PTID}-00001", {"plot_blocks": blocks})
+        self.assertTrue(pdf.startswith(b"%PDF"))
+
+
+class LeafPopulationCardTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user("pop", "p@p.io", "pw")
+        self.client.force_login(self.user)
+
+    def test_leaf_lists_mirrored_paths_and_serves_their_histograms(self):
+        node = _node(tests_synced_at=timezone.now())
+        _value("P1", "gain", 1.0)
+        html = self.client.get(navigation.leaf_path_for("prod", node.part_type_id)).content.decode()
+        self.assertIn("Test-data populations", html)
+        url = reverse("explore:type_population", args=[PTID])
+        self.assertIn(f"{url}?tt=RoomT+QC&amp;path=gain", html)
+        resp = self.client.get(url, {"tt": "RoomT QC", "path": "gain"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["Content-Type"], "image/png")
+        self.assertEqual(self.client.get(url, {"tt": "RoomT QC", "path": "nope"}).status_code,
+                         404)
+
+    def test_no_card_without_mirrored_values(self):
+        node = _node(tests_synced_at=timezone.now())
+        html = self.client.get(navigation.leaf_path_for("prod", node.part_type_id)).content.decode()
+        self.assertNotIn("Test-data populations", html)
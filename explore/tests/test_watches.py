@@ -1,6 +1,7 @@
 """Tests for watch/notify (#90): subscriptions on types, boxes and items,
 the derived watched feed + unread badge, and the profile "Watching" section.
-No notification storage — everything derives from ActivityEvent.
+No notification storage — the feed derives from ActivityEvent, the badge
+from each user's WatchCursor (ADR-0026).
 
     python manage.py test explore
 """
@@ -16,7 +17,7 @@ from django.urls import reverse
 from django.utils import timezone
 
 from explore import activity, navigation, watches
-from explore.models import ActivityEvent, WatchSubscription
+from explore.models import ActivityEvent, WatchCursor, WatchSubscription
 from explore.tests.test_events import _node
 from explore.tests.test_profile import _api as _profile_api
 from explore.tests.test_profile import _mocked as _profile_mocked
@@ -25,14 +26,10 @@ PTID = "D05700200001"
 
 
 def _event(kind=ActivityEvent.KIND_SYNC, summary="x", part_id="",
-           part_type_id="", instance="prod", ago=None):
-    e = ActivityEvent.objects.create(
-        instance=instance, kind=kind, summary=summary,
-        part_id=part_id, part_type_id=part_type_id)
-    if ago is not None:
-        ActivityEvent.objects.filter(pk=e.pk).update(
-            created_at=timezone.now() - ago)
-    return e
+           part_type_id="", instance="prod"):
+    activity.log(instance, kind, summary, part_id=part_id,
+                 part_type_id=part_type_id)
+    return ActivityEvent.objects.latest("id")
 
 
 class WatchEngineTest(TestCase):
@@ -62,8 +59,8 @@ class WatchEngineTest(TestCase):
             {"type-level", "part of type"})
 
     def test_unread_counts_only_events_after_seen(self):
+        _event(part_type_id=PTID)                          # before subscribing
         watches.toggle("prod", "chaoz", part_type_id=PTID)
-        _event(part_type_id=PTID, ago=timedelta(hours=1))  # before subscribing
         self.assertEqual(watches.unread_count("prod", "chaoz"), 0)
         _event(part_type_id=PTID)
         self.assertEqual(watches.unread_count("prod", "chaoz"), 1)
@@ -83,6 +80,59 @@ class WatchEngineTest(TestCase):
         self.assertEqual(watches.unread_count("dev", "chaoz"), 1)
         self.assertEqual(watches.unread_count("prod", "chaoz"), 0)
 
+    def test_log_counts_for_every_matching_watcher(self):
+        watches.toggle("prod", "chaoz", part_type_id=PTID)
+        watches.toggle("prod", "ana", part_id="P1", part_type_id=PTID)
+        watches.toggle("prod", "bob", part_id="P2", part_type_id=PTID)
+        _event(part_id="P1", part_type_id=PTID)
+        _event(part_type_id=PTID)
+        self.assertEqual(dict(WatchCursor.objects.values_list("username", "unread")),
+                         {"chaoz": 2, "ana": 1, "bob": 0})
+
+    def test_unwatch_drops_its_events_from_the_count(self):
+        watches.toggle("prod", "chaoz", part_type_id=PTID)
+        watches.toggle("prod", "chaoz", part_id="B1")
+        _event(part_type_id=PTID)
+        _event(part_id="B1")
+        self.assertEqual(watches.unread_count("prod", "chaoz"), 2)
+        watches.toggle("prod", "chaoz", part_type_id=PTID)
+        self.assertEqual(watches.unread_count("prod", "chaoz"), 1)
+
+    def test_prune_recounts_the_badge(self):
+        watches.toggle("prod", "chaoz", part_type_id=PTID)
+        old = _event(part_type_id=PTID)
+        _event(part_type_id=PTID)
+        ActivityEvent.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=activity.RETENTION_DAYS + 1))
+        self.assertEqual(watches.unread_count("prod", "chaoz"), 2)
+        self.assertEqual(activity.prune(), 1)
+        self.assertEqual(watches.unread_count("prod", "chaoz"), 1)
+
+    def test_with_unread_marks_rows_after_the_cursor(self):
+        _event(summary="before", part_type_id=PTID)
+        watches.toggle("prod", "chaoz", part_type_id=PTID)
+        _event(summary="seen", part_type_id=PTID)
+        WatchCursor.objects.update(seen_at=timezone.now())
+        _event(summary="new", part_type_id=PTID)
+        _event(summary="unwatched", part_type_id="D99999999999")
+        rows = watches.with_unread(ActivityEvent.for_instance("prod"), "prod", "chaoz")
+        self.assertEqual({e.summary: e.is_unread for e in rows},
+                         {"before": False, "seen": False, "new": True,
+                          "unwatched": False})
+
+    def test_badge_and_feed_cost_do_not_grow_with_watches(self):
+        def cost():
+            with self.assertNumQueries(3):
+                watches.unread_count("prod", "chaoz")
+                list(watches.with_unread(watches.watched_events("prod", "chaoz"),
+                                         "prod", "chaoz")[:20])
+        watches.toggle("prod", "chaoz", part_type_id=PTID)
+        _event(part_type_id=PTID)
+        cost()
+        for i in range(50):
+            watches.toggle("prod", "chaoz", part_id=f"P{i}")
+        cost()
+
 
 class WatchToggleViewTest(TestCase):
     def setUp(self):
@@ -130,6 +180,14 @@ class BadgeAndWatchedTabTest(TestCase):
         html = self.client.get(reverse("explore:activities")).content.decode()
         self.assertIn("eh-avatar-badge", html)
 
+    def test_pruned_events_leave_the_badge(self):
+        old = _event(part_type_id=PTID, summary="expired")
+        ActivityEvent.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=activity.RETENTION_DAYS + 1))
+        activity.prune()
+        html = self.client.get(reverse("explore:activities")).content.decode()
+        self.assertNotIn("eh-avatar-badge", html)
+
     def test_no_unread_no_badge(self):
         html = self.client.get(reverse("explore:activities")).content.decode()
         self.assertNotIn("eh-avatar-badge", html)
@@ -0,0 +1,143 @@
+"""Numeric test-data mirror behind type-wide ("sum") ES plots.
+
+An ES config's numeric plot can ask for the type-wide population
+(``"sum": true``) — every item's value at the plot's ``data_paths`` /
+``item_paths``, not just this item's. Fetching that live means a read per
+item of the type, which the mirror-light rule forbids; instead the tests
+sync extracts just those values into ``HwdbTestValue`` while it already
+holds each record (``extract_values``), and the population plots are one
+indexed query away (``population_data`` / ``population_plot``).
+
+Only opted-in paths are kept: a type whose config has no ``"sum"`` plot
+mirrors nothing extra. Rows follow the sync's own cadence — new items
+land on an incremental run, re-tests on a full one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from . import esrender, execsummary
+from .models import HwdbTestValue
+
+logger = logging.getLogger(__name__)
+
+# Values kept per (record, path) — a waveform at a "sum" path shouldn't turn
+# one record into a million rows.
+MAX_PER_PATH = 2000
+# ""-named rows come from the latest Item Specifications entry (item_paths).
+ITEM_SPECS = ""
+
+
+def value_spec(cfg: dict | None) -> dict[str, list[str]]:
+    """``{test_type_name: [paths]}`` the config's population plots read;
+    ``ITEM_SPECS`` keys the item_paths ones."""
+    spec: dict[str, list[str]] = {}
+    for p in (cfg or {}).get("plots") or []:
+        if p.get("kind") != "numeric" or not p.get("population"):
+            continue
+        if p.get("data_paths"):
+            if not p.get("test_type_name"):
+                continue
+            key, paths = p["test_type_name"], p["data_paths"]
+        else:
+            key, paths = ITEM_SPECS, p.get("item_paths") or []
+        have = spec.setdefault(key, [])
+        have += [x for x in paths if x not in have]
+    return {k: v for k, v in spec.items() if v}
+
+
+def spec_for(api, part_type_id: str) -> dict[str, list[str]]:
+    """The type's opted-in paths, read off its ES config; ``{}`` when it has
+    no config (or it can't be read — the sync goes on without values)."""
+    try:
+        cfg, _msg = execsummary.load_config(api, part_type_id)
+    except Exception as e:
+        logger.warning("test values: ES config for %s unreadable: %s", part_type_id, e)
+        return {}
+    return value_spec(cfg) if isinstance(cfg, dict) else {}
+
+
+def extract(root, paths) -> list[tuple[str, int, float]]:
+    """``[(path, idx, value)]`` — the numbers at each path of ``root`` (a
+    test_data dict or a spec entry), lists flattened in order."""
+    out = []
+    for path in paths:
+        v = execsummary._get_by_path(root, path)
+        nums = execsummary._flatten_numeric(v if isinstance(v, list) else [v])
+        out += [(path, i, x) for i, x in enumerate(nums[:MAX_PER_PATH])]
+    return out
+
+
+def extract_values(api, part_id: str, spec: dict[str, list[str]], *,
+                   tests: bool, detail: dict | None = None) -> tuple[list, list]:
+    """``(test_values, item_values)`` for one item, as
+    ``(test_type_name, test_id, path, idx, value)`` rows: the latest record
+    of each opted-in test type when ``tests``, and the item_paths out of
+    ``detail`` (the ``components/{pid}`` body the sync already fetched)."""
+    test_values, item_values = [], []
+    if tests:
+        for name, paths in spec.items():
+            if name == ITEM_SPECS:
+                continue
+            rec, _err = execsummary._test_record_at(api, part_id, name, 0)
+            if not rec:
+                continue
+            test_values += [(name, rec.get("id"), *v)
+                            for v in extract(rec.get("test_data") or {}, paths)]
+    if detail is not None and spec.get(ITEM_SPECS):
+        from .shipments import _spec_block
+        entry = _spec_block(detail)
+        if entry is not None:
+            item_values = [(ITEM_SPECS, None, *v)
+                           for v in extract(entry, spec[ITEM_SPECS])]
+    return test_values, item_values
+
+
+def population_data(instance: str, part_type_id: str, plot: dict) -> tuple[dict, int]:
+    """``({path: [values]}, n_items)`` — the mirrored population of one
+    numeric plot, shaped as the dict ``render_numeric_plot`` addresses. For
+    a two-path scatter both lists are aligned on (item, record, index), so
+    only points with both coordinates survive."""
+    paths = plot.get("data_paths") or plot.get("item_paths") or []
+    name = plot.get("test_type_name", "") if plot.get("data_paths") else ITEM_SPECS
+    rows = (HwdbTestValue.for_instance(instance)
+            .filter(part_type_id=part_type_id, test_type_name=name, path__in=paths)
+            .order_by("part_id", "idx")
+            .values_list("part_id", "test_id", "path", "idx", "value"))
+    by_path: dict[str, dict] = {p: {} for p in paths}
+    for pid, test_id, path, idx, value in rows:
+        by_path[path][(pid, test_id, idx)] = value
+    if len(paths) == 2:
+        keys = [k for k in by_path[paths[0]] if k in by_path[paths[1]]]
+    else:
+        keys = list(by_path[paths[0]]) if paths else []
+    data = {p: [by_path[p][k] for k in keys] for p in paths}
+    return data, len({k[0] for k in keys})
+
+
+def population_plot(instance: str, part_type_id: str, plot: dict):
+    """``(png | None, note | None, n_items)`` — the plot drawn over every
+    mirrored item of the type, through the ES plot cache (keyed by the data,
+    so a sync that changes nothing re-renders nothing)."""
+    data, n = population_data(instance, part_type_id, plot)
+    if not n:
+        return None, ("No mirrored values yet — they fill in with the type’s "
+                      "next test sync."), 0
+    label = f"all {n} items"
+    digest = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+    key = esrender.plot_key(f"population:{instance}:{part_type_id}:{digest}",
+                            plot, label)
+    (png, note), = esrender.render_plots(
+        [(key, execsummary.render_numeric_plot, (data, plot, label))])
+    return png, note, n
+
+
+def mirrored_paths(instance: str, part_type_id: str) -> list[tuple[str, str]]:
+    """``[(test_type_name, path)]`` the mirror holds values for."""
+    return list(HwdbTestValue.for_instance(instance)
+                .filter(part_type_id=part_type_id)
+                .values_list("test_type_name", "path")
+                .distinct().order_by("test_type_name", "path"))
@@ -13,6 +13,8 @@ urlpatterns = [
     path("hierarchy/summary/", views.explore_type_summary_view, name="type_summary"),
     path("type-locations/<str:part_type_id>/", views.explore_type_locations_view,
          name="type_locations"),
+    path("type-population/<str:part_type_id>/", views.explore_type_population_view,
+         name="type_population"),
     path("shipments/", views.shipments_view, name="shipments"),
     path("shipments/search/", views.explore_shipments_search_api_view,
          name="shipments_search_api"),
@@ -26,6 +28,8 @@ urlpatterns = [
     path("scan/", views.explore_scan_view, name="scan"),
     path("scan/submit/", views.explore_scan_submit_view, name="scan_submit"),
     path("scan/feed/", views.explore_scan_feed_view, name="scan_feed"),
+    path("scan/stream/", views.explore_scan_stream_view, name="scan_stream"),
+    path("scan/commit/", views.explore_scan_commit_view, name="scan_commit"),
     path("box-create/<str:part_type_id>/", views.explore_box_create_view,
          name="box_create"),
     path("box-type/<str:part_type_id>/", views.explore_box_type_view,
@@ -42,6 +46,8 @@ urlpatterns = [
     path("shipment-image/<str:image_id>/", views.explore_shipment_image_view, name="shipment_image"),
     path("test-data/<str:part_id>/<str:test_type_id>/", views.explore_test_data_view, name="test_data"),
     path("part/<str:part_id>/", views.explore_part_view, name="part"),
+    path("part/<str:part_id>/pane/<slug:pane>/", views.explore_part_pane_view,
+         name="part_pane"),
     path("part/<str:part_id>/location/", views.explore_part_location_view,
          name="part_location"),
     path("part/<str:part_id>/pack/", views.explore_box_pack_view, name="box_pack"),
@@ -51,6 +57,10 @@ urlpatterns = [
          name="exec_summary"),
     path("part/<str:part_id>/exec-summary/plot/<int:index>/",
          views.explore_es_plot_view, name="es_plot"),
+    path("part/<str:part_id>/exec-summary/render/",
+         views.explore_es_render_view, name="es_render"),
+    path("part/<str:part_id>/exec-summary/pdf/<slug:key>/",
+         views.explore_es_pdf_view, name="es_pdf"),
     path("part/<str:part_id>/es-subtree/", views.explore_es_subtree_view,
          name="es_subtree"),
     path("part/<str:part_id>/preship/", views.explore_preship_view, name="preship"),
@@ -1,18 +1,24 @@
 import io
 import json
 import logging
+import operator
 import re
+import time
+import uuid
 from datetime import datetime, timedelta
+from functools import reduce
 from urllib.parse import urlencode
 
 import requests
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_not_required
+from django.core.handlers.asgi import ASGIRequest
 from django.core.paginator import Paginator
-from django.db.models import F, Q
+from django.db import transaction
+from django.db.models import Count, F, Q
 from django.http import (
-    Http404, HttpResponse, HttpResponseBadRequest, HttpResponseForbidden,
+    FileResponse, Http404, HttpResponse, HttpResponseBadRequest, HttpResponseForbidden,
     JsonResponse,
     StreamingHttpResponse,
 )
@@ -22,14 +28,16 @@ from django.utils import timezone
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.views.decorators.http import require_POST
 
+from core import search as core_search
 from core.queries import chart_config
 from hwdb.api_client import FnalDbApiClient
 from hwdb.fnal import flow
 from hwdb.fnal import session as fnal_session
 from hwdb.fnal.bearer import FnalLinkRequired, FnalUnavailable, mint_for
 
-from . import (activity, charts, checklists, curation, events, execsummary,
-               navigation, parts, scanning, watches)
+from . import (activity, charts, checklists, containment, curation, esrender,
+               events, execsummary, imagecache, navigation, parts, scanfeed,
+               scanning, search, testvalues, watches)
 from .auth import fnal_login_required, provision_and_login
 from .events import physics_date_field, sync_test_events
 from .hierarchy import sync_hierarchy, sync_system
@@ -42,7 +50,7 @@ from .queries import (
     component_breakdowns, component_qc_flags, component_type_progress,
     component_update_filters, component_update_progress,
 )
-from .parts import assembly_children, current_container, part_detail, subtree_rows
+from .parts import assembly_children, current_container, subtree_rows
 from .shipments import _spec_data, current_manifest, refresh_box, sync_shipments
 
 logger = logging.getLogger(__name__)
@@ -254,7 +262,7 @@ def explore_view(request, trail=None):
     # the type from the mirror (HwdbComponentEvent), each row opening its part
     # page. Mirror-backed like the box table, so no live HWDB on render.
     parts_page = None
-    breakdowns, qc_flags = [], []
+    breakdowns, qc_flags, populations = [], [], []
     if leaf and leaf.tests_synced_at:
         part_rows = (HwdbComponentEvent.for_instance(inst)
                      .filter(part_type_id=leaf.part_type_id)
@@ -265,6 +273,14 @@ def explore_view(request, trail=None):
         # + binary QC flags (#51).
         breakdowns = component_breakdowns(inst, leaf.part_type_id)
         qc_flags = component_qc_flags(inst, leaf.part_type_id)
+        # Type-wide test-data histograms — the values the sync mirrors for
+        # the type's "sum" ES plots; each image is its own request.
+        populations = [
+            {"test_type_name": tt, "path": path,
+             "url": _rev(request, "explore:type_population",
+                         args=[leaf.part_type_id]) + "?" + urlencode(
+                             {"tt": tt, "path": path})}
+            for tt, path in testvalues.mirrored_paths(inst, leaf.part_type_id)]
 
     # htmx pager clicks swap just their pane (keyed by hx-target), so the page
     # keeps its scroll position instead of reloading and jumping to the top.
@@ -290,6 +306,7 @@ def explore_view(request, trail=None):
             "parts_page": parts_page,
             "breakdowns": breakdowns,
             "qc_flags": qc_flags,
+            "populations": populations,
             "is_shipping": is_shipping,
             "shipments": shipments,
             "shipment_synced_at": shipment_synced_at,
@@ -403,6 +420,28 @@ def explore_type_locations_view(request, part_type_id):
     return JsonResponse({"total": total, "rows": rows})
 
 
+@login_not_required
+@fnal_login_required
+def explore_type_population_view(request, part_type_id):
+    """One type-wide histogram PNG off the numeric test-data mirror
+    (``testvalues``): ``?tt=`` the test type ("" for Item Specifications),
+    ``?path=`` the mirrored path. Mirror-only; the PNG comes through the ES
+    plot cache, so it only re-renders after a sync changed the values."""
+    tt, path = request.GET.get("tt", ""), request.GET.get("path", "")
+    if not path:
+        raise Http404("No path.")
+    plot = {"title": tt or "Item Specifications", "test_type_name": tt,
+            "data_paths": [path] if tt else [], "item_paths": [] if tt else [path],
+            "bins": 40}
+    png, note, _n = testvalues.population_plot(
+        instance_of(request), part_type_id, plot)
+    if not png:
+        raise Http404(note or "No plot.")
+    resp = HttpResponse(png, content_type="image/png")
+    resp["Cache-Control"] = "private, max-age=300"
+    return resp
+
+
 # Shipments dashboard status tabs (#87). In Transit is HWDB location id 0;
 # otherwise contents decide the bucket — see ShipmentItem.ship_status.
 _SHIP_TABS = [
@@ -463,15 +502,35 @@ def _shipping_ptids(inst):
     """Every curated shipping type: explicit ids + every mirrored type under a
     curated shipping subsystem (the "86.990" selectors)."""
     ptids = set(curation.shipping_types(inst))
-    for sid, ssid in curation.shipping_subsystems(inst):
+    selectors = [Q(system_id=sid, subsystem_id=ssid)
+                 for sid, ssid in curation.shipping_subsystems(inst)]
+    if selectors:
         # Selectors are project-D coordinates (#71) — see curation._ptid_coord.
+        # One read for all of them (not one per subsystem).
         ptids.update(HierarchyNode.for_instance(inst).filter(
+            reduce(operator.or_, selectors),
             level=HierarchyNode.LEVEL_TYPE, project="D",
-            system_id=sid, subsystem_id=ssid,
         ).values_list("part_type_id", flat=True))
     return ptids
 
 
+def _shipping_leaves(inst, ptids):
+    """{ptid: leaf} for the shipping types already in the mirror, in one
+    read — a curated type not yet refreshed into the mirror is absent."""
+    leaves = {}
+    for leaf in (HierarchyNode.for_instance(inst)
+                 .filter(level=HierarchyNode.LEVEL_TYPE, part_type_id__in=ptids)
+                 .order_by("part_type_id")):
+        leaves.setdefault(leaf.part_type_id, leaf)
+    return leaves
+
+
+def _box_counts(inst, ptids):
+    """{ptid: mirrored boxes} in one grouped query."""
+    return dict(ShipmentItem.for_instance(inst).filter(part_type_id__in=ptids)
+                .values_list("part_type_id").annotate(n=Count("id")))
+
+
 @login_not_required
 @fnal_login_required
 def shipments_view(request):
@@ -479,61 +538,67 @@ def shipments_view(request):
     box across the curated shipping types, split into status tabs — In transit
     / In packing / Empty box — with a shipping-only sidebar (?type= filter),
     search (?q=, matches box PID / type name / type id), and a per-row refresh.
-    Reads the mirror only."""
+    Reads the mirror only: one ``ShipmentItem`` query set drives the tab
+    counts (one conditional aggregate over the ``status`` column) and the
+    DB-sorted, DB-paged table, which walks the tab's index, so page cost
+    doesn't grow with the number of boxes."""
     inst = instance_of(request)
-    ptids = _shipping_ptids(inst)
+    leaves = _shipping_leaves(inst, _shipping_ptids(inst))
+    n_boxes = _box_counts(inst, leaves)
 
     # entries feeds the sidebar; sync_targets the sweep buttons.
-    boxes, entries, sync_targets = [], [], []
-    for ptid in sorted(ptids):
-        leaf = HierarchyNode.for_instance(inst).filter(
-            level=HierarchyNode.LEVEL_TYPE, part_type_id=ptid).first()
-        if not leaf:  # curated but not yet refreshed into the mirror
-            continue
-        sync_targets.append({
-            "ptid": ptid, "name": leaf.name,
-            "url": _rev(request, "explore:shipment_sync", args=[ptid]),
-        })
-        path = navigation.leaf_path_for(inst, ptid)
-        rows = list(ShipmentItem.for_instance(inst).filter(part_type_id=ptid))
-        entries.append((leaf, len(rows)))
-        for r in rows:
-            boxes.append({"box": r, "type_name": leaf.name, "ptid": ptid,
-                          "path": path, "status": r.ship_status})
+    entries = [(leaf, n_boxes.get(ptid, 0)) for ptid, leaf in leaves.items()]
+    sync_targets = [{
+        "ptid": ptid, "name": leaf.name,
+        "url": _rev(request, "explore:shipment_sync", args=[ptid]),
+    } for ptid, leaf in leaves.items()]
 
     sel_type = request.GET.get("type") or ""
-    if sel_type and sel_type not in {leaf.part_type_id for leaf, _n in entries}:
+    if sel_type and sel_type not in leaves:
         sel_type = ""
     q = (request.GET.get("q") or "").strip()
     tab = request.GET.get("tab") or ""
 
-    def _match(b):
+    hits = ShipmentItem.for_instance(inst).filter(part_type_id__in=leaves)
+    if q:
+        # Type name/id matches are resolved against the (small) leaf map; box
+        # PIDs match in SQL.
         needle = q.lower()
-        return (needle in b["box"].part_id.lower()
-                or needle in b["type_name"].lower()
-                or needle in b["ptid"].lower())
+        typed = [ptid for ptid, leaf in leaves.items()
+                 if needle in leaf.name.lower() or needle in ptid.lower()]
+        hits = hits.filter(Q(part_id__icontains=q) | Q(part_type_id__in=typed))
 
-    hits = [b for b in boxes if _match(b)] if q else boxes
-    if q and len(hits) == 1:
+    def _tab_counts(qs):
+        return qs.aggregate(**{k: Count("id", filter=Q(status=k))
+                               for k, _l, _c in _SHIP_TABS})
+
+    counts = _tab_counts(hits)
+    if q and sum(counts.values()) == 1:
         # A query that narrows to exactly ONE box shows that box: jump to its
         # status tab, and drop a type filter that would hide it.
-        tab = hits[0]["status"]
+        tab = next(k for k, n in counts.items() if n)
         sel_type = ""
-    filtered = [b for b in hits if not sel_type or b["ptid"] == sel_type]
+    filtered = hits.filter(part_type_id=sel_type) if sel_type else hits
+    if sel_type:
+        counts = _tab_counts(filtered)
 
     if tab not in {k for k, _l, _c in _SHIP_TABS}:
         tab = "transit"
-    counts = {k: 0 for k, _l, _c in _SHIP_TABS}
-    for b in filtered:
-        counts[b["status"]] += 1
-
-    rows = [b for b in filtered if b["status"] == tab]
     # Most-recently-arrived first (for transit boxes that's the transit event).
-    rows.sort(key=lambda x: (
-        -(x["box"].last_arrived.timestamp() if x["box"].last_arrived else 0),
-        x["box"].part_id,
-    ))
+    rows = filtered.filter(status=tab).order_by(
+        F("last_arrived").desc(nulls_last=True), "part_id")
     page_obj = Paginator(rows, 50).get_page(request.GET.get("page"))
+    regions = navigation.all_regions(inst)
+    paths = {}
+    for box in page_obj.object_list:
+        if box.part_type_id not in paths:
+            paths[box.part_type_id] = navigation.leaf_path_of(
+                inst, leaves[box.part_type_id], regions)
+    page_obj.object_list = [
+        {"box": box, "type_name": leaves[box.part_type_id].name,
+         "ptid": box.part_type_id, "path": paths[box.part_type_id],
+         "status": box.status}
+        for box in page_obj.object_list]
 
     def _qs(k, page=None):
         params = {"tab": k}
@@ -565,8 +630,7 @@ def shipments_view(request):
         "n_types": len(entries),
         "sync_targets": sync_targets,
         "sel_type": sel_type,
-        "sel_leaf": next((leaf for leaf, _n in entries
-                          if leaf.part_type_id == sel_type), None),
+        "sel_leaf": leaves.get(sel_type),
         "q": q,
         **pane_ctx,
     })
@@ -586,20 +650,15 @@ def explore_shipments_search_api_view(request):
     ptids = _shipping_ptids(inst)
     needle = q.lower()
 
-    types = []
-    for ptid in sorted(ptids):
-        leaf = HierarchyNode.for_instance(inst).filter(
-            level=HierarchyNode.LEVEL_TYPE, part_type_id=ptid).first()
-        if not leaf or (needle not in leaf.name.lower()
-                        and needle not in ptid.lower()):
-            continue
-        types.append({
-            "name": leaf.name, "part_type_id": ptid,
-            "n": ShipmentItem.for_instance(inst).filter(part_type_id=ptid).count(),
-            "url": "?" + urlencode({"type": ptid}),
-        })
-        if len(types) >= 5:
-            break
+    leaves = _shipping_leaves(inst, ptids)
+    matched = [leaf for ptid, leaf in leaves.items()
+               if needle in leaf.name.lower() or needle in ptid.lower()][:5]
+    n_boxes = _box_counts(inst, [leaf.part_type_id for leaf in matched])
+    types = [{
+        "name": leaf.name, "part_type_id": leaf.part_type_id,
+        "n": n_boxes.get(leaf.part_type_id, 0),
+        "url": "?" + urlencode({"type": leaf.part_type_id}),
+    } for leaf in matched]
 
     labels = {k: lbl for k, lbl, _c in _SHIP_TABS}
     boxes = [{
@@ -802,7 +861,11 @@ def explore_shipment_image_view(request, image_id):
 
     The bytes are bearer-gated, so we mint and stream them through rather than
     handing the browser a direct FNAL link. ``?name=`` sets the download
-    filename (sanitised).
+    filename (sanitised). HWDB never changes an image id's bytes, so they're
+    kept in the on-disk cache (``imagecache``) after the first fetch and sent
+    with an ETag + ``immutable``; ``?thumb=1`` serves a downscaled preview for
+    thumbnail grids (the original when it isn't a raster image). A cache hit
+    still requires a linked session — the mint is the access check.
     """
     try:
         bearer = mint_for(request)
@@ -813,22 +876,46 @@ def explore_shipment_image_view(request, image_id):
     except FnalUnavailable:
         return JsonResponse({"error": "unavailable"}, status=502)
 
-    api = FnalDbApiClient(settings.HWDB_PROFILES[instance_of(request)]["api"], bearer)
-    try:
-        upstream = api.get_image_response(image_id)
-    except Exception:
-        logger.exception("explore_shipment_image_view(%s) crashed", image_id)
+    inst = instance_of(request)
+    etag_in = request.headers.get("If-None-Match")
+    entry, served, body = imagecache.lookup(inst, image_id), None, None
+    # Twice at most: another worker's eviction can unlink the blob or its
+    # thumbnail between the lookup and the read — then look again, and
+    # re-fetch from HWDB if the blob itself went.
+    for attempt in range(2):
+        if entry is None:
+            api = FnalDbApiClient(settings.HWDB_PROFILES[inst]["api"], bearer)
+            try:
+                upstream = api.get_image_response(image_id)
+                entry = imagecache.store(
+                    inst, image_id, upstream.iter_content(chunk_size=65536),
+                    upstream.headers.get("Content-Type", "application/octet-stream"))
+            except Exception:
+                logger.exception("explore_shipment_image_view(%s) crashed", image_id)
+                return JsonResponse({"error": "fetch_failed"}, status=502)
+        try:
+            served = (imagecache.thumbnail(entry) or entry) if request.GET.get("thumb") else entry
+            if etag_in != f'"{served.etag}"':
+                body = open(served.path, "rb")
+            break
+        except FileNotFoundError:
+            logger.info("image cache: %s evicted mid-read, retrying", image_id)
+            entry = imagecache.lookup(inst, image_id) if attempt == 0 else None
+    else:
         return JsonResponse({"error": "fetch_failed"}, status=502)
 
-    raw = request.GET.get("name") or f"hwdb-{image_id}"
-    safe = "".join(c for c in raw if c.isalnum() or c in " ._-").strip() or f"hwdb-{image_id}"
-    # ?inline=1 → view in the browser (thumbnail click); default → download.
-    disposition = "inline" if request.GET.get("inline") else "attachment"
-    resp = StreamingHttpResponse(
-        upstream.iter_content(chunk_size=65536),
-        content_type=upstream.headers.get("Content-Type", "application/octet-stream"),
-    )
-    resp["Content-Disposition"] = f'{disposition}; filename="{safe}"'
+    etag = f'"{served.etag}"'
+    if body is None:
+        resp = HttpResponse(status=304)
+    else:
+        raw = request.GET.get("name") or f"hwdb-{image_id}"
+        safe = "".join(c for c in raw if c.isalnum() or c in " ._-").strip() or f"hwdb-{image_id}"
+        # ?inline=1 → view in the browser (thumbnail click); default → download.
+        disposition = "inline" if request.GET.get("inline") or request.GET.get("thumb") else "attachment"
+        resp = FileResponse(body, content_type=served.content_type)
+        resp["Content-Disposition"] = f'{disposition}; filename="{safe}"'
+    resp["ETag"] = etag
+    resp["Cache-Control"] = "private, max-age=31536000, immutable"
     return resp
 
 
@@ -871,10 +958,18 @@ def explore_part_view(request, part_id):
     and a location timeline — live from HWDB. A shipping box additionally shows
     its shipment lifecycle. FNAL-gated; an unlinked user is bounced to link with
     a ?next back here.
+
+    The page itself is a skeleton drawn from the local mirror alone (the
+    type's leaf, the item's ``HwdbComponentEvent`` row, the box's
+    ``ShipmentItem`` and ``BoxChecklist`` runs) — it makes no HWDB call
+    beyond the session's cached bearer. Every live card is its own htmx
+    fragment (``explore_part_pane_view``), loaded after first paint; the
+    page's ``page_load`` id lets those fragments share their common HWDB
+    reads (``parts.page_read``).
     """
     inst = instance_of(request)
     try:
-        bearer = mint_for(request)
+        mint_for(request)
     except FnalLinkRequired:
         link = reverse("hwdb:link")
         return redirect(f"{link}?{urlencode({'next': request.get_full_path(), 'reason': 'expired'})}")
@@ -885,57 +980,138 @@ def explore_part_view(request, part_id):
 
     ptid = part_id.rsplit("-", 1)[0]
     is_shipping = curation.is_shipping_type(inst, ptid)
-    api = FnalDbApiClient(settings.HWDB_PROFILES[inst]["api"], bearer)
-    try:
-        detail = part_detail(api, part_id, is_shipping)
-    except Exception as e:
-        logger.exception("explore_part_view(%s) crashed", part_id)
-        return render(request, "explore/part_detail.html",
-                      {"part_id": part_id, "unavailable": True,
-                       "error_detail": f"{type(e).__name__}: {e}" if settings.DEBUG else None,
-                       "sidebar": navigation.sidebar_tree(inst, {})})
-
     leaf = HierarchyNode.for_instance(inst).filter(
         level=HierarchyNode.LEVEL_TYPE, part_type_id=ptid).first()
     # Open + highlight this part's component type in the sidebar tree.
     side_ctx = navigation.leaf_sidebar_ctx(inst, leaf) if leaf else {}
     box = (ShipmentItem.for_instance(inst).filter(part_id=part_id).first()
            if is_shipping else None)
-    # Mirror fallback for containment (issue #63): used only when the live
-    # /container call yields nothing (detail.container is preferred).
-    mirror_parent = (HwdbComponentEvent.for_instance(inst)
-                     .filter(part_id=part_id).exclude(parent_part_id="")
-                     .values_list("parent_part_id", flat=True).first())
     # First write feature (issue #61): boxes on a write-enabled instance get
-    # the Update-location form; its dropdown needs the institution list.
+    # the Update-location form and the packing card.
     can_update_location = is_shipping and inst in settings.HWDB_WRITE_INSTANCES
-    # The type's ES config (consortium, description) for the Executive-summary
-    # card. Any type carrying one is "marked" for an ES — the interim mark
-    # until the hierarchy-chart one exists.
-    es_cfg, es_cfg_msg = (execsummary.load_config(api, ptid)
-                          if inst in settings.HWDB_WRITE_INSTANCES else (None, ""))
     # The ES card shows for EVERY item on a write instance (2026-07-30):
     # configless types run the ES page in DEFAULT mode, so any item can
     # carry a summary.
     can_es = inst in settings.HWDB_WRITE_INSTANCES
-    exec_summaries = sorted(
-        (a for a in detail["attachments"]
+
+    return render(request, "explore/part_detail.html", {
+        # A box belongs to the Shipments tab; everything else to Hardware.
+        "active_nav": "shipments" if is_shipping else "hardware",
+        "sidebar": navigation.sidebar_tree(inst, side_ctx),
+        "part_id": part_id,
+        "ptid": ptid,
+        "page_load": uuid.uuid4().hex,
+        "watching": watches.is_watched(
+            inst, activity.actor_of(request),
+            part_id=part_id, part_type_id=ptid),
+        # The mirrored record: header status until the Item card lands.
+        "mirror": HwdbComponentEvent.for_instance(inst).filter(part_id=part_id).first(),
+        # Containment from the mirrored closure: what holds it (outermost
+        # first) and how much sits inside it, at any depth.
+        "held_by": containment.ancestors(inst, part_id)[::-1],
+        "n_inside": containment.n_inside(inst, part_id),
+        "is_shipping": is_shipping,
+        "leaf": leaf,
+        "leaf_path": navigation.leaf_path_for(inst, ptid) if leaf else None,
+        "box": box,
+        "hwdb_ui_base": settings.HWDB_PROFILES[inst]["ui"],
+        "can_update_location": can_update_location,
+        "can_es": can_es,
+        # Ship/receive checklist runs on this box (issue #65), by workflow.
+        "checklists": ({c.workflow: c for c in
+                        BoxChecklist.for_instance(inst).filter(part_id=part_id)}
+                       if can_update_location else {}),
+    })
+
+
+_PAGE_LOAD = re.compile(r"[0-9a-f]{32}")
+
+
+def _page_load(request, inst) -> str:
+    """The page view a pane belongs to (``?load=``), scoped to this user and
+    instance, or "" — its panes share their HWDB reads under it
+    (``parts.page_read``)."""
+    load = request.GET.get("load", "")
+    return parts.page_load(inst, request.user.pk,
+                           load if _PAGE_LOAD.fullmatch(load) else "")
+
+
+def _pane_item(request, api, inst, part_id, ptid, is_shipping):
+    # Mirror fallback for containment (issue #63): used only when the live
+    # /container call yields nothing.
+    mirror_parent = (HwdbComponentEvent.for_instance(inst)
+                     .filter(part_id=part_id).exclude(parent_part_id="")
+                     .values_list("parent_part_id", flat=True).first())
+    return {"item": parts.part_item(api, part_id, _page_load(request, inst)),
+            "mirror_parent": mirror_parent}
+
+
+def _pane_tests(request, api, inst, part_id, ptid, is_shipping):
+    return {"tests": parts.part_tests(api, part_id),
+            "hwdb_ui_base": settings.HWDB_PROFILES[inst]["ui"]}
+
+
+def _pane_assembly(request, api, inst, part_id, ptid, is_shipping):
+    return {"asm": parts.part_manifest(api, part_id, _page_load(request, inst))}
+
+
+def _pane_packing(request, api, inst, part_id, ptid, is_shipping):
+    # Packing card (issue #63): the box's slot schema + occupants; the item
+    # picker is its own page. None when the connectors fetch fails (the
+    # card just doesn't render).
+    manifest = current_manifest(parts.page_read(
+        api, part_id, "subcomponents", _page_load(request, inst)))
+    return {"packing": _packing_context(api, inst, ptid, manifest)}
+
+
+def _pane_timeline(request, api, inst, part_id, ptid, is_shipping):
+    can_update_location = is_shipping and inst in settings.HWDB_WRITE_INSTANCES
+    return {
+        "timeline": parts.part_timeline(api, part_id),
+        "can_update_location": can_update_location,
+        "institutions": _institution_options(api) if can_update_location else [],
+        "arrived_default": timezone.localtime().strftime("%Y-%m-%dT%H:%M"),
+    }
+
+
+def _exec_summaries(part_id, attachments) -> list[dict]:
+    """Executive summaries already on an item (issue #53): attachments
+    matching the Dashboard's gate convention, newest first (the gate filename
+    embeds the timestamp, so name order is chronological)."""
+    sums = sorted(
+        (a for a in attachments
          if (a["image_name"] or "").lower().startswith(
              f"executivesummary_{part_id.lower()}_")),
         key=lambda a: a["image_name"] or "", reverse=True)
-    for a in exec_summaries:
+    for a in sums:
         a["label"] = _summary_label(a["image_name"])
-    packing = (_packing_context(api, inst, ptid, detail["manifest"])
-               if can_update_location else None)
+    return sums
+
+
+def _pane_es(request, api, inst, part_id, ptid, is_shipping):
+    # The type's ES config (consortium, description) for the card's header.
+    # Any type carrying one is "marked" for an ES — the interim mark until
+    # the hierarchy-chart one exists.
+    es_cfg, es_cfg_msg = execsummary.load_config(api, ptid)
+    attachments = parts.part_attachments(api, part_id, _page_load(request, inst))
+    return {"exec_summaries": _exec_summaries(part_id, attachments),
+            "es_cfg": es_cfg, "es_cfg_msg": es_cfg_msg}
+
+
+def _pane_documents(request, api, inst, part_id, ptid, is_shipping):
+    docs = parts.part_documents(api, part_id, is_shipping, _page_load(request, inst))
+    sections, attachments = docs["sections"], docs["attachments"]
+    # Documents move up into the Shipping Workflows card when it renders.
+    workflows = is_shipping and inst in settings.HWDB_WRITE_INSTANCES
 
     # Every shipping sheet on the box (each checklist run appends one, both
-    # naming eras) — the Pre-shipping card lists them in a newest-first
-    # selector instead of a single chip (#77).
+    # naming eras) — listed in a newest-first selector instead of a single
+    # chip (#77).
     def _is_sheet(name):
         n = (name or "").lower()
         return n.startswith("shippingsheet_") or n.endswith("-shipping-label.pdf")
     shipping_sheets = sorted(
-        (a for a in detail["attachments"] if _is_sheet(a["image_name"])),
+        (a for a in attachments if _is_sheet(a["image_name"])),
         key=lambda a: a.get("created") or "", reverse=True) if is_shipping else []
     for a in shipping_sheets:
         # Short label like the ES pane: the filename's embedded timestamp,
@@ -946,56 +1122,78 @@ def explore_part_view(request, part_id):
         a["label"] = lbl
     sheet_ids = {a["image_id"] for a in shipping_sheets}
     if shipping_sheets:
-        for sec in detail["sections"]:
+        for sec in sections:
             sec["attachments"] = [x for x in sec["attachments"]
                                   if x["image_id"] not in sheet_ids]
 
     # Catch-all attachments minus the ones shown elsewhere: spec-section
     # chips, the shipping-sheet selector, and the Executive-summary card
-    # (only when that card actually renders — same condition as the template).
-    shown = {a["image_id"] for sec in detail["sections"] for a in sec["attachments"]}
+    # (only when that card renders — on write instances).
+    shown = {a["image_id"] for sec in sections for a in sec["attachments"]}
     shown |= sheet_ids
-    if can_es:
-        shown |= {a["image_id"] for a in exec_summaries}
-    other_attachments = [a for a in detail["attachments"] if a["image_id"] not in shown]
-
-    return render(request, "explore/part_detail.html", {
-        # A box belongs to the Shipments tab; everything else to Hardware.
-        "active_nav": "shipments" if is_shipping else "hardware",
-        "sidebar": navigation.sidebar_tree(inst, side_ctx),
-        "part_id": part_id,
-        "ptid": ptid,
-        "watching": watches.is_watched(
-            inst, activity.actor_of(request),
-            part_id=part_id, part_type_id=ptid),
-        "detail": detail,
-        "is_shipping": is_shipping,
-        "other_attachments": other_attachments,
-        "leaf": leaf,
-        "leaf_path": navigation.leaf_path_for(inst, ptid) if leaf else None,
-        "box": box,
-        "mirror_parent": mirror_parent,
-        "hwdb_ui_base": settings.HWDB_PROFILES[inst]["ui"],
-        "can_update_location": can_update_location,
-        "institutions": _institution_options(api) if can_update_location else [],
-        "arrived_default": timezone.localtime().strftime("%Y-%m-%dT%H:%M"),
-        # Packing card (issue #63): the box's slot schema + occupants; the
-        # item picker is its own page. None when writes are off or the
-        # connectors fetch fails (the card just doesn't render).
-        "packing": packing,
+    if inst in settings.HWDB_WRITE_INSTANCES:
+        shown |= {a["image_id"] for a in _exec_summaries(part_id, attachments)}
+    return {
+        "sections": sections,
+        "workflows": workflows,
         "shipping_sheets": shipping_sheets,
-        # Executive summaries already on this item (issue #53): attachments
-        # matching the Dashboard's gate convention, newest first (the gate
-        # filename embeds the timestamp, so name order is chronological).
-        "exec_summaries": exec_summaries,
-        "es_cfg": es_cfg,
-        "es_cfg_msg": es_cfg_msg,
-        "can_es": can_es,
-        # Ship/receive checklist runs on this box (issue #65), by workflow.
-        "checklists": ({c.workflow: c for c in
-                        BoxChecklist.for_instance(inst).filter(part_id=part_id)}
-                       if can_update_location else {}),
-    })
+        "other_attachments": [a for a in attachments if a["image_id"] not in shown],
+    }
+
+
+# The part page's lazy cards: pane → (builder, heading for the error card,
+# Cache-Control, write instances only). Item facts and test results only
+# change through HWDB itself, so the browser may reuse them briefly; the
+# rest change under the explorer's own writes (pack/unlink, location posts,
+# checklist sheets, summaries) and must be fresh when the user lands back.
+_PART_PANES = {
+    "item": (_pane_item, "Item", "private, max-age=60", False),
+    "tests": (_pane_tests, "Tests", "private, max-age=300", False),
+    "documents": (_pane_documents, "Specifications", "no-store", False),
+    "assembly": (_pane_assembly, "Assembly", "no-store", False),
+    "timeline": (_pane_timeline, "Location timeline", "no-store", False),
+    "packing": (_pane_packing, "Packing", "no-store", True),
+    "es": (_pane_es, "Executive summary", "no-store", True),
+}
+
+
+@login_not_required
+@fnal_login_required
+def explore_part_pane_view(request, part_id, pane):
+    """One live card of the part page, swapped in by htmx after the
+    skeleton paints; each pane makes only its own HWDB reads. Errors render
+    in the card at 200 — htmx 1.x doesn't swap non-2xx responses."""
+    if pane not in _PART_PANES:
+        raise Http404(f"no part pane {pane!r}")
+    build, title, cache_control, write_only = _PART_PANES[pane]
+    inst = instance_of(request)
+    ptid = part_id.rsplit("-", 1)[0]
+    is_shipping = curation.is_shipping_type(inst, ptid)
+    if write_only and inst not in settings.HWDB_WRITE_INSTANCES:
+        return HttpResponseForbidden("Not enabled here.")
+    if pane == "packing" and not is_shipping:
+        return HttpResponseForbidden("Not a shipping box.")
+    ctx = {"part_id": part_id, "ptid": ptid, "is_shipping": is_shipping,
+           "title": title, "error": None}
+    try:
+        bearer = mint_for(request)
+    except FnalLinkRequired:
+        ctx["error"] = "link"
+    except FnalUnavailable:
+        ctx["error"] = "unavailable"
+    if ctx["error"] is None:
+        api = FnalDbApiClient(settings.HWDB_PROFILES[inst]["api"], bearer)
+        try:
+            ctx.update(build(request, api, inst, part_id, ptid, is_shipping))
+        except Exception as e:
+            logger.exception("explore_part_pane_view(%s, %s) crashed", part_id, pane)
+            ctx["error"] = "fetch_failed"
+            ctx["error_detail"] = f"{type(e).__name__}: {e}" if settings.DEBUG else None
+    template = ("explore/_part_pane_error.html" if ctx["error"]
+                else f"explore/_part_{pane}.html")
+    resp = render(request, template, ctx)
+    resp["Cache-Control"] = "no-store" if ctx["error"] else cache_control
+    return resp
 
 
 def _summary_label(name: str) -> str:
@@ -1356,31 +1554,46 @@ def _refusal_detail(api, pid, detail) -> str:
     return str(detail)
 
 
-def _scan_link(api, inst, box_pid, pid) -> tuple[bool, str]:
-    """Scan-to-cart: link ONE scanned item into the box right away — the
-    shopping-cart behavior. Returns (ok, message); the message shows on the
-    phone and in the pack page's scan log. Same auto-assign + full-dict
-    PATCH + refusal enrichment as the picker's add flow."""
-    ptid = box_pid.rsplit("-", 1)[0]
-    connectors = _box_connectors(api, ptid)
+def _box_state(api, box_pid) -> tuple[dict, dict]:
+    """The box's connectors and its live ``position → occupant`` state (None
+    = free) — two HWDB reads."""
+    connectors = _box_connectors(api, box_pid.rsplit("-", 1)[0])
     manifest = current_manifest(api.get_subcomponents(box_pid).get("data"))
     current = {pos: None for pos in connectors}
     for m in manifest:
         if m["functional_position"] in current:
             current[m["functional_position"]] = m["part_id"]
+    return connectors, current
+
+
+def _cart_slot(inst, connectors, current, pid) -> tuple[str | None, str]:
+    """The free position a scanned ``pid`` takes given ``current``, or
+    (None, why not) — the scan paths' local checks, no HWDB call."""
     if pid in current.values():
-        return False, f"{pid} is already in this box."
+        return None, f"{pid} is already in this box."
     ctid = pid.rsplit("-", 1)[0]
     if ctid not in set(connectors.values()):
-        return False, f"this box has no positions for {ctid} items."
+        return None, f"this box has no positions for {ctid} items."
     free = [pos for pos in sorted(current, key=str)
             if current[pos] is None and connectors.get(pos) == ctid]
     if not free:
-        return False, f"no free position left for {ctid} items."
+        return None, f"no free position left for {ctid} items."
     block = _procedure_status_block(inst, pid)
     if block:
-        return False, f"not added — {block}."
-    pos = free[0]
+        return None, f"not added — {block}."
+    return free[0], ""
+
+
+def _scan_link(api, inst, box_pid, pid) -> tuple[bool, str]:
+    """Scan-to-cart: link ONE scanned item into the box right away — the
+    shopping-cart behavior. Returns (ok, message); the message shows on the
+    phone and in the pack page's scan log. Same auto-assign + full-dict
+    PATCH + refusal enrichment as the picker's add flow."""
+    ptid = box_pid.rsplit("-", 1)[0]
+    connectors, current = _box_state(api, box_pid)
+    pos, why = _cart_slot(inst, connectors, current, pid)
+    if pos is None:
+        return False, why
     payload = {"component": {"part_id": box_pid},
                "subcomponents": {**current, pos: pid}}
     try:
@@ -1395,6 +1608,113 @@ def _scan_link(api, inst, box_pid, pid) -> tuple[bool, str]:
     return True, f"added to “{pos}”"
 
 
+# Packing sessions (batch scan-to-cart): the phone's session caches each
+# box's state, so a scan is checked locally and queued; the commit links the
+# whole queue with one PATCH. The TTL bounds how stale a queued slot gets —
+# the commit re-reads the box live either way.
+_PACK_SESSION = "explore_pack_session"
+PACK_SESSION_TTL = 10 * 60
+
+
+def _pack_session_state(request, api, inst, box_pid) -> tuple[dict, dict]:
+    """``_box_state`` through this session's cache."""
+    now = time.time()
+    key = f"{inst}:{box_pid}"
+    store = {k: v for k, v in (request.session.get(_PACK_SESSION) or {}).items()
+             if now - v["at"] < PACK_SESSION_TTL}
+    if key not in store:
+        connectors, current = _box_state(api, box_pid)
+        store[key] = {"connectors": connectors, "current": current, "at": now}
+        request.session[_PACK_SESSION] = store
+    return store[key]["connectors"], store[key]["current"]
+
+
+def _pack_session_forget(request, inst, box_pid) -> None:
+    store = request.session.get(_PACK_SESSION) or {}
+    if store.pop(f"{inst}:{box_pid}", None) is not None:
+        request.session[_PACK_SESSION] = store
+
+
+def _queued_scans(inst, username, box_pid):
+    """This user's queued (uncommitted) packing-session scans for a box."""
+    return (PackScan.for_instance(inst)
+            .filter(username=username, box_part_id=box_pid, ok=None)
+            .exclude(position=""))
+
+
+def _scan_queue(request, api, inst, box_pid, pid) -> tuple[str | None, str]:
+    """Batch scan-to-cart: give ``pid`` a slot against the cached box state
+    plus the slots already queued. Returns (position, message); position
+    None = refused."""
+    connectors, current = _pack_session_state(request, api, inst, box_pid)
+    queue = dict(_queued_scans(inst, request.user.get_username(), box_pid)
+                 .values_list("position", "part_id"))
+    if pid in queue.values():
+        return None, f"{pid} is already queued for this box."
+    pos, why = _cart_slot(inst, connectors, {**current, **queue}, pid)
+    return (pos, f"queued for “{pos}”") if pos else (None, why)
+
+
+def _commit_queue(api, inst, box_pid, queue: list) -> tuple[dict, list, list]:
+    """Link a packing session's ``[(position, pid)]`` queue into the box
+    with ONE full-dict PATCH against its live state. A slot taken since
+    queueing — or queued twice, by two scans racing — is re-assigned within
+    the type. When HWDB refuses the batch, the items
+    its message names are dropped and the rest retried; a refusal naming
+    none falls back to one PATCH per item, as the picker does, so one bad
+    item can't sink the batch. Returns (state, added [(pid, position)],
+    failed [(pid, detail)])."""
+    connectors, state = _box_state(api, box_pid)
+    pending, failed = {}, []
+    for pos, pid in queue:
+        taken = {**state, **pending}
+        if (taken.get(pos, "") is not None or pid in taken.values()
+                or connectors.get(pos) != pid.rsplit("-", 1)[0]):
+            pos, why = _cart_slot(inst, connectors, taken, pid)
+            if pos is None:
+                failed.append((pid, why))
+                continue
+        pending[pos] = pid
+
+    added = []
+    while pending:
+        try:
+            body = api.patch_subcomponents(box_pid, {
+                "component": {"part_id": box_pid},
+                "subcomponents": {**state, **pending}})
+            ok, detail = body.get("status") == "OK", body.get("data")
+        except requests.RequestException as e:
+            logger.warning("scan-commit: patch into %s failed: %s", box_pid, e)
+            ok, detail = False, _hwdb_error_detail(e)
+        if ok:
+            state.update(pending)
+            added += [(pid, pos) for pos, pid in pending.items()]
+            break
+        named = [pos for pos, pid in pending.items() if pid in str(detail)]
+        if named:
+            for pos in named:
+                pid = pending.pop(pos)
+                failed.append((pid, _refusal_detail(api, pid, detail)))
+            continue
+        for pos, pid in pending.items():
+            try:
+                body = api.patch_subcomponents(box_pid, {
+                    "component": {"part_id": box_pid},
+                    "subcomponents": {**state, pos: pid}})
+                ok, detail = body.get("status") == "OK", body.get("data")
+            except requests.RequestException as e:
+                logger.warning("scan-commit: patch %s into %s failed: %s",
+                               pid, box_pid, e)
+                ok, detail = False, _hwdb_error_detail(e)
+            if ok:
+                state[pos] = pid
+                added.append((pid, pos))
+            else:
+                failed.append((pid, _refusal_detail(api, pid, detail)))
+        break
+    return state, added, failed
+
+
 @login_not_required
 @fnal_login_required
 def explore_box_pack_view(request, part_id):
@@ -1479,7 +1799,9 @@ def explore_box_pack_view(request, part_id):
                                  show_all=show_all),
             "scan_url": scan_url,
             "scan_qr_svg": scanning.qr_svg(scan_url),
+            "scan_batch_url": f"{scan_path}&batch=1",
             "scan_feed_url": _rev(request, "explore:scan_feed"),
+            "scan_stream_url": _rev(request, "explore:scan_stream"),
             "scan_since": scan_since,
         })
 
@@ -1607,16 +1929,23 @@ def explore_scan_view(request):
 
     Opened from a pack page, the URL carries ``?box=<PID>`` and each scan is
     linked into that box immediately (scan-to-cart); without a box, scans
-    just queue for the same username's open packing page (select mode)."""
+    just queue for the same username's open packing page (select mode).
+    ``&batch=1`` opens a packing session instead: scans queue against the
+    box and one "Link" tap commits them together."""
     inst = instance_of(request)
     if inst not in settings.HWDB_WRITE_INSTANCES:
         return HttpResponseForbidden("Scanning is not enabled here.")
     box = (request.GET.get("box") or "").strip()
     if not re.fullmatch(r"[A-Z]\d{11}-\d{5}", box):
         box = ""
+    batch = bool(box) and request.GET.get("batch") == "1"
     return render(request, "explore/scan.html", {
         "submit_url": _rev(request, "explore:scan_submit"),
+        "commit_url": _rev(request, "explore:scan_commit"),
         "box": box,
+        "batch": batch,
+        "n_queued": (_queued_scans(inst, request.user.get_username(), box).count()
+                     if batch else 0),
     })
 
 
@@ -1630,8 +1959,11 @@ def explore_scan_submit_view(request):
 
     With a ``box`` field the item is linked into that box right away
     (scan-to-cart) and the outcome rides on the row + the JSON response —
-    the phone shows it and the pack page's poller logs it. Without a box,
-    the row just queues for the desktop's selection (ok = NULL)."""
+    the phone shows it and the pack page's poller logs it. With ``batch=1``
+    as well, the scan is only checked against the session's cached box
+    state and queued (``position`` set, ok = NULL) for the commit below.
+    Without a box, the row just queues for the desktop's selection
+    (ok = NULL)."""
     inst = instance_of(request)
     if inst not in settings.HWDB_WRITE_INSTANCES:
         return JsonResponse({"error": "writes disabled"}, status=403)
@@ -1643,7 +1975,8 @@ def explore_scan_submit_view(request):
         username=user, created_at__lt=timezone.now() - timedelta(days=1)).delete()
 
     box = (request.POST.get("box") or "").strip()
-    ok, result = None, ""
+    batch = request.POST.get("batch") == "1"
+    ok, result, position = None, "", ""
     if box:
         if (not re.fullmatch(r"[A-Z]\d{11}-\d{5}", box)
                 or not curation.is_shipping_type(inst, box.rsplit("-", 1)[0])):
@@ -1656,20 +1989,90 @@ def explore_scan_submit_view(request):
                 status=403)
         api = FnalDbApiClient(settings.HWDB_PROFILES[inst]["api"], bearer)
         try:
-            ok, result = _scan_link(api, inst, box, pid)
+            if batch:
+                position, result = _scan_queue(request, api, inst, box, pid)
+                ok = None if position else False
+            else:
+                ok, result = _scan_link(api, inst, box, pid)
         except requests.RequestException as e:
             logger.warning("scan-add: state fetch for %s failed: %s", box, e)
             ok, result = False, f"couldn’t read the box’s state — {_hwdb_error_detail(e)}"
     row = PackScan.objects.create(instance=inst, username=user, part_id=pid,
-                                  box_part_id=box, ok=ok, result=result)
-    return JsonResponse({"pid": pid, "id": row.id, "ok": ok, "message": result})
+                                  box_part_id=box, position=position or "",
+                                  ok=ok, result=result)
+    transaction.on_commit(lambda: scanfeed.notify(inst, user))
+    return JsonResponse({"pid": pid, "id": row.id, "ok": ok, "message": result,
+                         "queued": bool(position)})
+
+
+@login_not_required
+@fnal_login_required
+@require_POST
+def explore_scan_commit_view(request):
+    """Close a packing session: link this user's queued scans for ``box``
+    (``_commit_queue`` — one PATCH), refresh the box once, and replace the
+    queued rows with outcome rows, so the pack page's poller logs them like
+    scan-to-cart scans. ``discard=1`` drops the queue instead."""
+    inst = instance_of(request)
+    if inst not in settings.HWDB_WRITE_INSTANCES:
+        return JsonResponse({"error": "writes disabled"}, status=403)
+    box = (request.POST.get("box") or "").strip()
+    if (not re.fullmatch(r"[A-Z]\d{11}-\d{5}", box)
+            or not curation.is_shipping_type(inst, box.rsplit("-", 1)[0])):
+        return JsonResponse({"error": "not a packable box"}, status=422)
+    user = request.user.get_username()
+    queued = _queued_scans(inst, user, box)
+    _pack_session_forget(request, inst, box)
+    if request.POST.get("discard") == "1":
+        n, _ = queued.delete()
+        return JsonResponse({"discarded": n})
+    # Snapshot the queue: scans queued while the PATCH is out stay queued.
+    rows = list(queued.order_by("id").values_list("id", "position", "part_id"))
+    if not rows:
+        return JsonResponse({"error": "nothing queued"}, status=422)
+    try:
+        bearer = mint_for(request)
+    except (FnalLinkRequired, FnalUnavailable):
+        return JsonResponse(
+            {"error": "FNAL sign-in expired — reload the scan page"}, status=403)
+    api = FnalDbApiClient(settings.HWDB_PROFILES[inst]["api"], bearer)
+    ptid = box.rsplit("-", 1)[0]
+    try:
+        state, added, failed = _commit_queue(
+            api, inst, box, [(pos, pid) for _id, pos, pid in rows])
+    except requests.RequestException as e:
+        logger.warning("scan-commit: state fetch for %s failed: %s", box, e)
+        return JsonResponse(
+            {"error": f"couldn’t read the box’s state — {_hwdb_error_detail(e)}"},
+            status=503)
+    if added:
+        _refresh_box_quietly(api, inst, ptid, box)
+        if state and all(state.values()):
+            activity.log(inst, ActivityEvent.KIND_PACK,
+                         f"{box} fully packed — all {len(state)} "
+                         f"position(s) filled",
+                         part_id=box, part_type_id=ptid,
+                         actor=activity.actor_of(request))
+    outcome = ([PackScan(instance=inst, username=user, part_id=pid, box_part_id=box,
+                         position=pos, ok=True, result=f"added to “{pos}”")
+                for pid, pos in added]
+               + [PackScan(instance=inst, username=user, part_id=pid, box_part_id=box,
+                           ok=False, result=f"not added — {detail}"[:300])
+                  for pid, detail in failed])
+    with transaction.atomic():
+        PackScan.objects.filter(pk__in=[i for i, _pos, _pid in rows]).delete()
+        PackScan.objects.bulk_create(outcome)
+        transaction.on_commit(lambda: scanfeed.notify(inst, user))
+    return JsonResponse({
+        "added": [{"pid": pid, "position": pos} for pid, pos in added],
+        "failed": [{"pid": pid, "message": detail} for pid, detail in failed]})
 
 
 @login_not_required
 @fnal_login_required
 def explore_scan_feed_view(request):
-    """The desktop packing page's poll target: this user's scans newer than
-    ``?since=<id>``, oldest first."""
+    """The desktop packing page's poll target when the push feed below isn't
+    served: this user's scans newer than ``?since=<id>``, oldest first."""
     inst = instance_of(request)
     if inst not in settings.HWDB_WRITE_INSTANCES:
         return JsonResponse({"error": "writes disabled"}, status=403)
@@ -1677,15 +2080,38 @@ def explore_scan_feed_view(request):
         since = int(request.GET.get("since") or 0)
     except ValueError:
         since = 0
-    rows = (PackScan.for_instance(inst)
-            .filter(username=request.user.get_username(), id__gt=since)
-            .order_by("id")[:100])
-    scans = [{"id": r.id, "pid": r.part_id, "ok": r.ok, "message": r.result,
-              "box": r.box_part_id} for r in rows]
+    scans = scanfeed.rows_after(inst, request.user.get_username(), since)
     return JsonResponse({"scans": scans,
                          "last": scans[-1]["id"] if scans else since})
 
 
+@login_not_required
+async def explore_scan_stream_view(request):
+    """The pack page's push feed (``scanfeed.stream``): server-sent events
+    carrying the same scan dicts as the poll endpoint above, resuming after
+    ``Last-Event-ID`` (or ``?since=``). Served under ASGI only — anywhere
+    else it answers 204, which tells ``EventSource`` to stop and the page to
+    fall back to polling."""
+    inst = instance_of(request)
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({"error": "sign in"}, status=401)
+    if inst not in settings.HWDB_WRITE_INSTANCES:
+        return JsonResponse({"error": "writes disabled"}, status=403)
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    try:
+        since = int(request.headers.get("Last-Event-ID")
+                    or request.GET.get("since") or 0)
+    except ValueError:
+        since = 0
+    resp = StreamingHttpResponse(scanfeed.stream(inst, user.get_username(), since),
+                                 content_type="text/event-stream")
+    resp["Cache-Control"] = "no-store"
+    resp["X-Accel-Buffering"] = "no"   # don't let a proxy sit on the events
+    return resp
+
+
 def _next_position_names(existing, prefix: str, count: int) -> list[str]:
     """``count`` new position names ``{prefix}{n}``, numbering on from the
     highest existing ``{prefix}<number>`` so re-runs never collide."""
@@ -2141,7 +2567,8 @@ def explore_exec_summary_view(request, part_id):
     summary PDF is generated (reportlab, DETAIL layout minus plots) and
     uploaded under the pre-shipping gate's naming convention. Without a
     config the page runs DEFAULT mode: one whoami signature, status/flag
-    patch, and a minimal PDF. HWDB holds all state.
+    patch, and a minimal PDF. HWDB holds all state; the PDFs render off the
+    request through a content-keyed cache (ADR-0021).
 
     POST actions: ``sign`` / ``default_sign`` / ``generate`` (optionally with
     a supplemental-material PDF appended to the summary) / ``reset`` /
@@ -2179,7 +2606,7 @@ def explore_exec_summary_view(request, part_id):
      saved_plot_fields) = execsummary.fetch_es_state(api, part_id)
     plot_blocks = (execsummary.resolve_plots(
         api, cfg, part_id, _children_of(api), images_rows,
-        plot_fields=saved_plot_fields)
+        plot_fields=saved_plot_fields, instance=inst)
         if cfg and cfg["plots"] else [])
     full_name, role_ids, role_names = _whoami_context(api)
     signing = (execsummary.compute_status(cfg, es_list, role_ids, role_names)
@@ -2222,6 +2649,7 @@ def explore_exec_summary_view(request, part_id):
         "summaries": summaries,
         "plot_blocks": plot_blocks,
         "ptid": ptid,
+        "es_rendering": _es_pending(request, part_id) is not None,
     })
 
 
@@ -2276,19 +2704,78 @@ def _has_es_map(api, pids) -> dict:
     return parts.fetch_map(api, _check, pids)
 
 
+# Session key: instance → pid → a subtree node's facts (status, QC flags,
+# component_id, has_es) with the time they were read. A signing session
+# revisits the same tree page after page; the edges are re-verified live
+# each time, the per-node facts only once they are SUBTREE_FACTS_TTL old.
+_SUBTREE_FACTS = "explore_subtree_facts"
+SUBTREE_FACTS_TTL = 20 * 60   # seconds
+_FACT_KEYS = ("status", "uploaded", "certified", "component_id")
+
+
+def _subtree_facts(request) -> dict:
+    """This session's fresh node facts for the current instance."""
+    now = time.time()
+    facts = (request.session.get(_SUBTREE_FACTS) or {}).get(instance_of(request)) or {}
+    return {pid: f for pid, f in facts.items()
+            if now - f.get("at", 0) < SUBTREE_FACTS_TTL}
+
+
+def _subtree_remember(request, updates: dict) -> None:
+    """Merge ``pid → facts`` into the session cache (dropping stale ones)."""
+    now = time.time()
+    facts = _subtree_facts(request)
+    for pid, f in updates.items():
+        facts[pid] = {**facts.get(pid, {}), **f, "at": now}
+    store = request.session.get(_SUBTREE_FACTS) or {}
+    store[instance_of(request)] = facts
+    request.session[_SUBTREE_FACTS] = store
+
+
+def _subtree_forget(request, part_id) -> None:
+    """Drop one item's cached facts — its status or summary just changed."""
+    store = request.session.get(_SUBTREE_FACTS) or {}
+    if store.get(instance_of(request), {}).pop(part_id, None) is not None:
+        request.session[_SUBTREE_FACTS] = store
+
+
+def _session_subtree(request, api, part_id, *, es=False) -> tuple[list[dict], bool]:
+    """``subtree_rows`` for ``part_id`` with the mirror's edges as its
+    read-ahead and this session's node facts standing in for record reads;
+    ``es`` also fills each row's ``has_es`` (cached the same way). Rows whose
+    record read failed aren't cached, so the next page retries them."""
+    known = _subtree_facts(request)
+    rows, truncated = subtree_rows(
+        api, part_id, guess=containment.children_map(
+            instance_of(request), part_id, parts._SUBTREE_NODE_CAP),
+        known={pid: {k: f[k] for k in _FACT_KEYS}
+               for pid, f in known.items() if all(k in f for k in _FACT_KEYS)})
+    fresh = {r["part_id"]: {k: r.get(k) for k in _FACT_KEYS}
+             for r in rows if r.get("status") is not None}
+    if es:
+        ask = [r["part_id"] for r in rows if "has_es" not in known.get(r["part_id"], {})]
+        has = _has_es_map(api, ask)
+        for r in rows:
+            pid = r["part_id"]
+            r["has_es"] = has[pid] if pid in has else known[pid]["has_es"]
+            if has.get(pid) is not None:
+                fresh.setdefault(pid, {})["has_es"] = has[pid]
+    _subtree_remember(request, fresh)
+    return rows, truncated
+
+
 def _es_link_subtree(request, api, part_id) -> tuple[list[dict], bool]:
-    """The direct sub-components for the PDF's Sub-components table, each
-    child that already HAS a generated executive summary linking its
+    """The full sub-component tree for the PDF's Sub-components table, each
+    item that already HAS a generated executive summary linking its
     images page in the FNAL HWDB web UI, where the ES PDFs are listed —
     a permanent host, unlike this app's (Chao 2026-07-31: a locally
     generated PDF was baking 127.0.0.1 proxy links into HWDB). No
     login-free direct PDF URL exists (``/img/{id}`` demands a bearer,
     probed 2026-07-31), so the images page is the closest stable target."""
     ui = settings.HWDB_PROFILES[instance_of(request)]["ui"]
-    rows, truncated = subtree_rows(api, part_id)
-    es = _has_es_map(api, [r["part_id"] for r in rows])
+    rows, truncated = _session_subtree(request, api, part_id, es=True)
     for r in rows:
-        if es.get(r["part_id"]) and r.get("component_id"):
+        if r.get("has_es") and r.get("component_id"):
             r["es_url"] = f"{ui}/view/images/component/{r['component_id']}"
     return rows, truncated
 
@@ -2374,6 +2861,9 @@ def _exec_summary_action(request, api, part_id, ptid, cfg, page_url):
     page with flash messages."""
     action = request.POST.get("action") or ("sign" if request.POST.get("sign") else "")
     inst = instance_of(request)
+    # Signing patches the item's status/flags — a parent's sub-component
+    # tree must re-read them.
+    _subtree_forget(request, part_id)
 
     def _form_flags():
         try:
@@ -2392,10 +2882,11 @@ def _exec_summary_action(request, api, part_id, ptid, cfg, page_url):
             messages.error(request, "Both QA/QC flags must be confirmed before "
                                     "signing — still unchecked: " + ", ".join(missing) + ".")
             return redirect(page_url)
-        ts = timezone.localtime().strftime(execsummary.TIMESTAMP_FMT)
         comments = (request.POST.get("comments") or "").strip() or f"signed by {full_name}"
         _patch_item_flags(api, part_id, sid, certified, uploaded, comments)
-        signinfo = {"signature": full_name, "comments": comments, "timestamp": ts,
+        # Dated by the "Generated" stamp at delivery, like the DETAIL
+        # layout — so, like it, keyed on content alone.
+        signinfo = {"signature": full_name, "comments": comments,
                     "status_label": execsummary.STATUS_LABEL_BY_ID.get(sid, "Unknown"),
                     "certified_flag": certified, "uploaded_flag": uploaded,
                     "instance": instance_of(request),
@@ -2405,20 +2896,13 @@ def _exec_summary_action(request, api, part_id, ptid, cfg, page_url):
                                  f"/edit/component/{part_id}")}
         # The comments log rides into the DEFAULT PDF too (#86).
         _es, _td, def_log, _se, _pf = execsummary.fetch_es_state(api, part_id)
-        pdf_bytes = execsummary.build_default_pdf(
-            part_id, signinfo, _es_link_subtree(request, api, part_id),
-            log=def_log)
-        name = f"ExecutiveSummary_{part_id}_{timezone.now():{execsummary.FILENAME_TS_FMT}}.pdf"
-        err = _upload_summary_pdf(api, part_id, io.BytesIO(pdf_bytes), name)
-        if err:
-            messages.error(request, f"Summary PDF upload failed — {err}")
-        else:
-            messages.success(request, f"Signed and posted {name}.")
-            activity.log(inst, ActivityEvent.KIND_ES,
-                         f"{part_id}: Executive Summary (default) signed and posted",
-                         part_id=part_id, part_type_id=ptid,
-                         actor=activity.actor_of(request))
-        return redirect(page_url)
+        subtree = _es_link_subtree(request, api, part_id)
+        key = esrender.render_key("default", part_id, {
+            "signinfo": signinfo, "subtree": subtree, "log": def_log})
+        return _deliver_summary(
+            request, api, part_id, ptid, "default", key,
+            (execsummary.build_default_pdf, part_id, signinfo, subtree, def_log),
+            page_url)
 
     if action == "comment":
         # Standalone comment (Hajime 2026-07-30): posts at any time,
@@ -2601,7 +3085,7 @@ def _exec_summary_action(request, api, part_id, ptid, cfg, page_url):
             plot_blocks = execsummary.resolve_plots(
                 api, cfg, part_id, _children_of(api),
                 _safe_get_data(api.get_images, part_id),
-                plot_fields=saved_plot_fields)
+                plot_fields=saved_plot_fields, instance=inst)
             # The page's per-slot source toggle travels with the POST: the
             # PDF embeds whichever source is showing (a mistaken upload can
             # be overridden by the data_paths plot).
@@ -2617,7 +3101,7 @@ def _exec_summary_action(request, api, part_id, ptid, cfg, page_url):
         type_path = (" / ".join(x for x in (
             curation.project_label(inst, leaf.project).rsplit(" (", 1)[0],
             leaf.system_name, leaf.subsystem_name) if x) if leaf else "")
-        pdf_bytes = execsummary.build_detail_pdf(part_id, {
+        form = {
             "type_name": leaf.name if leaf else "",
             "type_path": type_path,
             "consortium": cfg["consortium_name"],
@@ -2639,29 +3123,138 @@ def _exec_summary_action(request, api, part_id, ptid, cfg, page_url):
             "references": cfg["references"],
             "subtree": _es_link_subtree(request, api, part_id),
             "plot_blocks": plot_blocks,
-        })
-        if supp:
-            try:
-                pdf_bytes = execsummary.append_pdf(pdf_bytes, supp)
-            except ValueError as e:
-                messages.error(request, f"Summary not posted — {e}")
-                return redirect(page_url)
-        name = f"ExecutiveSummary_{part_id}_{timezone.now():{execsummary.FILENAME_TS_FMT}}.pdf"
-        err = _upload_summary_pdf(api, part_id, io.BytesIO(pdf_bytes), name)
-        if err:
-            messages.error(request, f"Summary PDF upload failed — {err}")
-        else:
-            messages.success(request, f"Summary generated and posted as {name}.")
-            activity.log(inst, ActivityEvent.KIND_ES,
-                         f"{part_id}: Executive Summary generated and posted",
-                         part_id=part_id, part_type_id=ptid,
-                         actor=activity.actor_of(request))
-        return redirect(page_url)
+        }
+        key = esrender.render_key("detail", part_id, form, supp or None)
+        return _deliver_summary(
+            request, api, part_id, ptid, "detail", key,
+            (execsummary.render_detail_pdf, part_id, form, supp or None), page_url)
 
     messages.error(request, "Unknown action.")
     return redirect(page_url)
 
 
+# Session key: instance → part id → the summary render this user is waiting
+# on ({"key", "kind", "ticket"}); the ticket is the one delivery that
+# ``esrender.claim`` hands to a single POST once the render is finished.
+_ES_PENDING = "explore_es_pending"
+
+# kind → (flash on success, activity line)
+_ES_DELIVERY = {
+    "detail": ("Summary generated and posted as {name}.",
+               "Executive Summary generated and posted"),
+    "default": ("Signed and posted {name}.",
+                "Executive Summary (default) signed and posted"),
+}
+
+
+def _deliver_summary(request, api, part_id, ptid, kind, key, render, page_url):
+    """Render a summary PDF off the request (``esrender``) and post it.
+    ``render`` is ``(function, *args)``, handed to a pool process. A
+    cached render — the same inputs rendered before — posts right away;
+    otherwise the page comes back with a progress poller
+    (``explore_es_render_view``) that has it posted once it lands."""
+    job = esrender.submit(key, *render)
+    if job.state == esrender.DONE:
+        ok, text = _post_rendered_summary(request, api, part_id, ptid, kind, key)
+        (messages.success if ok else messages.error)(request, text)
+    elif job.state == esrender.RENDERING:
+        pending = request.session.get(_ES_PENDING) or {}
+        pending.setdefault(instance_of(request), {})[part_id] = {
+            "key": key, "kind": kind, "ticket": uuid.uuid4().hex}
+        request.session[_ES_PENDING] = pending
+    else:
+        messages.error(request, f"Summary not posted — {job.error or 'the render failed'}")
+    return redirect(page_url)
+
+
+def _post_rendered_summary(request, api, part_id, ptid, kind, key):
+    """Upload a finished render under the gate convention → (ok, flash)."""
+    path = esrender.lookup(key)
+    if path is None:
+        return False, "Summary not posted — the rendered PDF went missing; generate again."
+    name = f"ExecutiveSummary_{part_id}_{timezone.now():{execsummary.FILENAME_TS_FMT}}.pdf"
+    pdf = execsummary.stamp_pdf(
+        path.read_bytes(),
+        f"Generated {timezone.localtime():{execsummary.TIMESTAMP_FMT}}")
+    err = _upload_summary_pdf(api, part_id, io.BytesIO(pdf), name)
+    if err:
+        return False, f"Summary PDF upload failed — {err}"
+    _subtree_forget(request, part_id)   # it has an ES now
+    posted, line = _ES_DELIVERY[kind]
+    activity.log(instance_of(request), ActivityEvent.KIND_ES,
+                 f"{part_id}: {line}", part_id=part_id, part_type_id=ptid,
+                 actor=activity.actor_of(request))
+    return True, posted.format(name=name)
+
+
+def _es_pending(request, part_id) -> dict | None:
+    return ((request.session.get(_ES_PENDING) or {})
+            .get(instance_of(request), {}).get(part_id))
+
+
+def _es_pending_clear(request, part_id) -> None:
+    pending = request.session.get(_ES_PENDING) or {}
+    pending.get(instance_of(request), {}).pop(part_id, None)
+    request.session[_ES_PENDING] = pending
+
+
+@login_not_required
+@fnal_login_required
+def explore_es_render_view(request, part_id):
+    """A summary render (``_deliver_summary``). GET is one poll tick and
+    only reports: the progress line while it renders, then a fragment that
+    POSTs back here once. The POST delivers — it claims the pending ticket
+    (``esrender.claim``, exclusive across tabs and workers), uploads, and
+    shows the outcome with a link to the PDF; a losing claim renders empty.
+    Renders at 200 like the other ES fragments (htmx 1.x doesn't swap
+    non-2xx); no-store so a poll is never answered from cache."""
+    pending = _es_pending(request, part_id)
+    ctx = {"part_id": part_id, "job": None, "rendering": False,
+           "ready": False, "ok": False, "text": ""}
+    if pending is not None:
+        job = esrender.status(pending["key"])
+        ctx["job"] = job
+        if request.method != "POST":
+            ctx["rendering"] = job.state == esrender.RENDERING
+            ctx["ready"] = not ctx["rendering"]
+        elif job.state != esrender.RENDERING:
+            _es_pending_clear(request, part_id)
+            if job.state != esrender.DONE:
+                ctx["text"] = f"Summary not posted — {job.error or 'the render was lost; generate again'}"
+            else:
+                try:
+                    bearer = mint_for(request)
+                except (FnalLinkRequired, FnalUnavailable):
+                    ctx["text"] = ("Summary rendered but not posted — the FNAL "
+                                   "session expired; re-link and generate again.")
+                else:
+                    if esrender.claim(job.key, pending.get("ticket", "")):
+                        api = FnalDbApiClient(
+                            settings.HWDB_PROFILES[instance_of(request)]["api"], bearer)
+                        ctx["ok"], ctx["text"] = _post_rendered_summary(
+                            request, api, part_id, part_id.rsplit("-", 1)[0],
+                            pending["kind"], job.key)
+    resp = render(request, "explore/_es_render.html", ctx)
+    resp["Cache-Control"] = "no-store"
+    return resp
+
+
+@login_not_required
+@fnal_login_required
+def explore_es_pdf_view(request, part_id, key):
+    """A rendered summary PDF from the render cache, inline. The key is the
+    content hash, so the bytes behind it never change."""
+    if instance_of(request) not in settings.HWDB_WRITE_INSTANCES:
+        return HttpResponseForbidden("Executive summaries are not enabled here.")
+    path = esrender.lookup(key)
+    if path is None:
+        raise Http404("No such rendered summary.")
+    resp = FileResponse(open(path, "rb"), content_type="application/pdf")
+    resp["Content-Disposition"] = f'inline; filename="ExecutiveSummary_{part_id}.pdf"'
+    resp["Cache-Control"] = "private, max-age=31536000, immutable"
+    return resp
+
+
 def _safe_get_data(fn, *args) -> list:
     try:
         return fn(*args).get("data") or []
@@ -3327,13 +3920,14 @@ def explore_assembly_view(request, part_id):
 @login_not_required
 @fnal_login_required
 def explore_es_subtree_view(request, part_id):
-    """The executive summary's sub-component list: the DIRECT children only
-    (Hajime 2026-07-30 — the recursive walk ran deep and slow on CRUs) with
-    per-item status / uploaded / certified, loaded lazily via htmx so the
-    signing page renders fast. Read-only. Errors render as in-page hints at
-    200 — htmx 1.x doesn't swap non-2xx responses (the page's error handler
-    covers those). no-store: Safari caches XHR GETs aggressively when no
-    Cache-Control is sent, and a stale cached fragment survives refreshes."""
+    """The executive summary's sub-component tree — every level, walked in
+    parallel waves with the mirror's edges as read-ahead (``_session_subtree``)
+    — with per-item status / uploaded / certified, loaded lazily via htmx so
+    the signing page renders fast. Read-only. Errors render as in-page hints
+    at 200 — htmx 1.x doesn't swap non-2xx responses (the page's error
+    handler covers those). no-store: Safari caches XHR GETs aggressively
+    when no Cache-Control is sent, and a stale cached fragment survives
+    refreshes."""
     ctx = {"part_id": part_id, "rows": [], "truncated": False, "error": None,
            "show_es": False}
     try:
@@ -3344,28 +3938,28 @@ def explore_es_subtree_view(request, part_id):
         ctx["error"] = "unavailable"
     if ctx["error"] is None:
         api = FnalDbApiClient(settings.HWDB_PROFILES[instance_of(request)]["api"], bearer)
-        try:
-            ctx["rows"], ctx["truncated"] = subtree_rows(api, part_id)
-        except Exception:
-            logger.exception("explore_es_subtree_view(%s) crashed", part_id)
-            ctx["error"] = "fetch_failed"
-    if ctx["error"] is None:
-        # The ES column (#83): on a config-carrying type, each child gets its
+        # The ES column (#83): on a config-carrying type, each item gets its
         # ES-page link (and whether a summary exists yet) merged into the
-        # rows. Best-effort — a failure just leaves the list without the
-        # column.
+        # rows. Best-effort — a failed config read just leaves the list
+        # without the column.
         try:
             cfg, _msg = execsummary.load_config(api, part_id.rsplit("-", 1)[0])
-            if cfg and ctx["rows"]:
-                has = _has_es_map(api, [r["part_id"] for r in ctx["rows"]])
-                for row in ctx["rows"]:
-                    row["es"] = {"has_es": bool(has.get(row["part_id"])),
-                                 "url": _rev(request, "explore:exec_summary",
-                                             args=[row["part_id"]])}
-                ctx["show_es"] = True
         except Exception:
             logger.warning("es subtree: sub-ES info for %s failed",
                            part_id, exc_info=True)
+            cfg = None
+        try:
+            ctx["rows"], ctx["truncated"] = _session_subtree(
+                request, api, part_id, es=bool(cfg))
+        except Exception:
+            logger.exception("explore_es_subtree_view(%s) crashed", part_id)
+            ctx["error"] = "fetch_failed"
+        if cfg and ctx["rows"]:
+            for row in ctx["rows"]:
+                row["es"] = {"has_es": bool(row.get("has_es")),
+                             "url": _rev(request, "explore:exec_summary",
+                                         args=[row["part_id"]])}
+            ctx["show_es"] = True
     resp = render(request, "explore/_es_subtree.html", ctx)
     resp["Cache-Control"] = "no-store"
     return resp
@@ -3391,22 +3985,20 @@ def explore_search_view(request):
 def explore_activities_view(request):
     """The Activities feed (#88): latest mirrored changes on this instance —
     sync summaries (one row per run, never per item) and in-app writes.
-    Mirror-only; a rolling window pruned to the last month, so the part page
-    stays the authoritative history.
+    Mirror-only; a rolling window pruned to the last month (``manage.py
+    prune_activity``), so the part page stays the authoritative history.
 
     ``?watched=1`` (#90) narrows the feed to events matching the user's
     watches. Unread rows are highlighted; reading is an explicit act — the
     "Mark all read" button (watch_seen) — never a side effect of a visit."""
     inst = instance_of(request)
-    activity.prune()
     actor = activity.actor_of(request)
     watched = request.GET.get("watched") == "1"
     n_watches = watches.subs_for(inst, actor).count()
     qs = (watches.watched_events(inst, actor) if watched
           else ActivityEvent.for_instance(inst))
-    unread_ids = set(watches.unread_events(inst, actor)
-                     .values_list("id", flat=True))
-    page_obj = Paginator(qs, 100).get_page(request.GET.get("page"))
+    page_obj = Paginator(watches.with_unread(qs, inst, actor), 100).get_page(
+        request.GET.get("page"))
     return render(request, "explore/activities.html", {
         "active_nav": "activities",
         "sidebar": navigation.sidebar_tree(inst, {}),
@@ -3414,7 +4006,7 @@ def explore_activities_view(request):
         "retention_days": activity.RETENTION_DAYS,
         "watched": watched,
         "n_watches": n_watches,
-        "unread_ids": unread_ids,
+        "unread_total": watches.unread_count(inst, actor),
     })
 
 
@@ -3515,8 +4107,6 @@ def explore_profile_view(request):
     for s in subs:
         s.url = (_rev(request, "explore:part", args=[s.part_id]) if s.part_id
                  else navigation.leaf_path_for(inst, s.part_type_id))
-    unread_ids = set(watches.unread_events(inst, actor)
-                     .values_list("id", flat=True))
     return render(request, "explore/profile.html", {
         "active_nav": "profile",
         "sidebar": navigation.sidebar_tree(inst, {}),
@@ -3525,9 +4115,9 @@ def explore_profile_view(request):
         "roles": roles,
         "initials": initials,
         "watch_subs": subs,
-        "watch_events": list(watches.watched_events(inst, actor)[:20]),
-        "unread_ids": unread_ids,
-        "unread_total": len(unread_ids),
+        "watch_events": list(watches.with_unread(
+            watches.watched_events(inst, actor), inst, actor)[:20]),
+        "unread_total": watches.unread_count(inst, actor),
     })
 
 
@@ -3535,21 +4125,22 @@ def explore_profile_view(request):
 @fnal_login_required
 def explore_search_api_view(request):
     """JSON results for the instant search box — component types + mirrored
-    parts matching ``q`` (substring, case-insensitive), plus a direct-open hint
-    when ``q`` looks like a full part id. Reads only the mirror."""
+    parts matching ``q`` (substring, case-insensitive, ranked by the search
+    index), plus a direct-open hint when ``q`` looks like a full part id.
+    Reads only the mirror."""
     q = (request.GET.get("q") or "").strip()
     if len(q) < 2:
         return JsonResponse({"types": [], "parts": [], "direct_part": None})
 
     inst = instance_of(request)
+    hits = [d.key for d in core_search.query(inst, search.TYPE, q, 25)]
+    leaves = {n.part_type_id: n for n in HierarchyNode.for_instance(inst)
+              .filter(level=HierarchyNode.LEVEL_TYPE, part_type_id__in=hits)}
+    regions = navigation.all_regions(inst)
     types = []
-    type_qs = (HierarchyNode.for_instance(inst)
-               .filter(level=HierarchyNode.LEVEL_TYPE)
-               .filter(Q(name__icontains=q) | Q(part_type_id__icontains=q)
-                       | Q(full_name__icontains=q))
-               .order_by("system_name", "subsystem_name", "name")[:25])
-    for n in type_qs:
-        path = navigation.leaf_path_for(inst, n.part_type_id)
+    for ptid in hits:
+        n = leaves.get(ptid)
+        path = n and navigation.leaf_path_of(inst, n, regions)
         if path:  # only types whose curated family is browsable are reachable
             types.append({
                 "name": n.name, "part_type_id": n.part_type_id,
@@ -3558,13 +4149,9 @@ def explore_search_api_view(request):
             })
 
     parts = [
-        {"part_id": pid, "part_type_id": ptid, "serial_number": serial,
-         "path": _rev(request, "explore:part", args=[pid])}
-        for pid, ptid, serial in (HwdbComponentEvent.for_instance(inst)
-                                  .filter(Q(part_id__icontains=q)
-                                          | Q(serial_number__icontains=q))
-                                  .order_by("part_id")
-                                  .values_list("part_id", "part_type_id", "serial_number")[:25])
+        {"part_id": d.key, "part_type_id": d.ref, "serial_number": d.note,
+         "path": _rev(request, "explore:part", args=[d.key])}
+        for d in core_search.query(inst, search.PART, q, 25)
     ]
     direct = q if _PID_RE.match(q) else None
     return JsonResponse({
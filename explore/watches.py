@@ -1,20 +1,27 @@
 """Watch/notify (#90): subscriptions over the Activities feed.
 
 A watch targets a component type (``part_type_id``, ``part_id`` empty) or a
-single part — box or item (``part_id`` set). Notifications are derived at
-read time from ``ActivityEvent`` rows matching the user's watches; nothing is
-fanned out or stored per notification, so storage stays flat and the 30-day
-activity retention bounds everything. A part-level watch matches events on
-that exact part; a type-level watch matches every event carrying the type
+single part — box or item (``part_id`` set). A part-level watch matches events
+on that exact part; a type-level watch matches every event carrying the type
 (including part-level events of parts of that type).
+
+Nothing is stored per notification. The watched feed is a join: events
+whose type is among the user's type watches or whose part is among their
+part watches — two subqueries, however many watches there are. Unread state
+is one ``WatchCursor`` per user: ``notify`` (called by ``activity.log``)
+bumps the counter of everyone an event matches, through the
+``(instance, part_type_id)`` / ``(instance, part_id)`` indexes on
+``WatchSubscription``; ``mark_seen`` zeroes it; a prune of the feed
+recounts it (``recount_unread``), so the badge never counts events the feed
+no longer has (ADR-0026).
 """
 
 from __future__ import annotations
 
-from django.db.models import Q
+from django.db.models import BooleanField, Exists, ExpressionWrapper, F, OuterRef, Q, Value
 from django.utils import timezone
 
-from .models import ActivityEvent, WatchSubscription
+from .models import ActivityEvent, WatchCursor, WatchSubscription
 
 
 def subs_for(instance: str, username: str):
@@ -35,45 +42,83 @@ def toggle(instance: str, username: str, *, part_id: str = "",
         part_id=part_id, part_type_id=part_type_id)
     if existing.exists():
         existing.delete()
+        _recount(instance, username)
         return False
     WatchSubscription.objects.create(
         instance=instance, username=username,
         part_id=part_id, part_type_id=part_type_id, label=label)
+    WatchCursor.objects.get_or_create(instance=instance, username=username)
     return True
 
 
-def _match_q(subs, unread_only: bool = False) -> Q | None:
-    """OR of one clause per watch; None when the user watches nothing."""
-    q = None
-    for s in subs:
-        clause = (Q(part_id=s.part_id) if s.part_id
-                  else Q(part_type_id=s.part_type_id))
-        if unread_only:
-            clause &= Q(created_at__gt=s.seen_at)
-        q = clause if q is None else q | clause
-    return q
-
-
 def watched_events(instance: str, username: str):
     """All feed events matching the user's watches (newest first)."""
-    q = _match_q(subs_for(instance, username))
-    if q is None:
-        return ActivityEvent.objects.none()
-    return ActivityEvent.for_instance(instance).filter(q)
-
-
-def unread_events(instance: str, username: str):
-    """Matching events newer than each watch's last-seen mark (newest first) —
-    the badge count and the profile's "new on your watches" list."""
-    q = _match_q(subs_for(instance, username), unread_only=True)
-    if q is None:
-        return ActivityEvent.objects.none()
-    return ActivityEvent.for_instance(instance).filter(q)
+    subs = subs_for(instance, username)
+    types = subs.filter(part_id="").values("part_type_id")
+    parts = subs.exclude(part_id="").values("part_id")
+    return ActivityEvent.for_instance(instance).filter(
+        Q(part_type_id__in=types) | Q(part_id__in=parts))
+
+
+def _unread_q(instance: str, username: str, seen_at) -> Q:
+    """Newer than the cursor and matched by a watch that already existed
+    when the event was logged — what ``notify`` counted."""
+    subs = subs_for(instance, username).filter(created_at__lte=OuterRef("created_at"))
+    return Q(created_at__gt=seen_at) & (
+        Exists(subs.filter(part_id="", part_type_id=OuterRef("part_type_id")))
+        | Exists(subs.exclude(part_id="").filter(part_id=OuterRef("part_id"))))
+
+
+def with_unread(qs, instance: str, username: str):
+    """Feed events annotated with ``is_unread``. Checked per row fetched, so
+    a page costs the same however many events are unread."""
+    cursor = WatchCursor.for_instance(instance).filter(username=username).first()
+    if cursor is None or not cursor.unread:
+        return qs.annotate(is_unread=Value(False))
+    return qs.annotate(is_unread=ExpressionWrapper(
+        _unread_q(instance, username, cursor.seen_at), output_field=BooleanField()))
+
+
+def notify(event: ActivityEvent) -> None:
+    """Count ``event`` as unread for everyone watching its type or part."""
+    match = Q()
+    if event.part_type_id:
+        match |= Q(part_id="", part_type_id=event.part_type_id)
+    if event.part_id:
+        match |= Q(part_id=event.part_id)
+    if not match:
+        return
+    watchers = WatchSubscription.for_instance(event.instance).filter(match)
+    WatchCursor.for_instance(event.instance).filter(
+        username__in=watchers.values("username")).update(unread=F("unread") + 1)
+
+
+def _recount(instance: str, username: str) -> None:
+    """Rebuild the counter from the feed — after an unwatch, whose events
+    no longer count."""
+    cursor = WatchCursor.for_instance(instance).filter(username=username).first()
+    if cursor is None:
+        return
+    cursor.unread = ActivityEvent.for_instance(instance).filter(
+        _unread_q(instance, username, cursor.seen_at)).count()
+    cursor.save(update_fields=["unread"])
+
+
+def recount_unread() -> int:
+    """Rebuild every non-zero counter from the feed — after ``activity.prune``
+    deleted events they may still count. Returns how many were rebuilt."""
+    cursors = list(WatchCursor.objects.filter(unread__gt=0)
+                   .values_list("instance", "username"))
+    for instance, username in cursors:
+        _recount(instance, username)
+    return len(cursors)
 
 
 def unread_count(instance: str, username: str) -> int:
-    return unread_events(instance, username).count()
+    return WatchCursor.for_instance(instance).filter(
+        username=username).values_list("unread", flat=True).first() or 0
 
 
 def mark_seen(instance: str, username: str) -> None:
-    subs_for(instance, username).update(seen_at=timezone.now())
+    WatchCursor.for_instance(instance).filter(username=username).update(
+        unread=0, seen_at=timezone.now())
@@ -14,6 +14,9 @@ from pathlib import Path
 
 import requests
 
+from . import calls
+from .fnal import bearer as fnal_bearer
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,9 +26,14 @@ class FnalDbApiClient:
         # One Session per client = one keep-alive TCP/TLS pool. Halves
         # per-call latency vs. fresh ``requests.request`` (no handshake).
         # Sessions aren't fully thread-safe, so the parallel orchestrator
-        # constructs one client per worker thread.
-        self.session = requests.Session()
+        # constructs one client per worker thread. The session also times
+        # every call (hwdb.calls).
+        self.session = calls.InstrumentedSession(base_url)
         self.session.headers["Authorization"] = f"Bearer {bearer}"
+        # A 401 means HWDB refused this bearer: drop it from the session
+        # bearer cache so the next request mints a fresh one (ADR-0019).
+        self.session.hooks["response"].append(
+            lambda r, *a, **kw: fnal_bearer.reject(bearer) if r.status_code == 401 else None)
 
     def _make_request(self, method, endpoint, data=None, params=None):
         url = f"{self.base_url}/{endpoint}"
@@ -0,0 +1,648 @@
+"""Repeatable timings of the hot paths, for ``manage.py bench``.
+
+Each scenario builds its own data (in the throwaway database the command
+creates) and, where HWDB is involved, runs the real engine against the
+in-process fake server (``hwdb.fake``) — so the numbers cover our code,
+the client and the HTTP round trip, but not HWDB itself:
+
+- ``sync_family`` / ``sync_test_events`` — a cold sync of ``size`` items;
+- ``upload_tray`` — ``iter_upload_chips_parallel`` over a 480-chip tray;
+- ``sync_hierarchy`` — the walk of every curated system;
+- ``ranges_for_series`` / ``component_update_filters`` — the chart builders;
+- ``sidebar_tree`` / ``curated_tree`` — cold (cache cleared) and warm;
+- ``shipments_view`` — the shipments page through the full middleware stack;
+- ``parse_csv`` — a tray's worth of RTS CSVs.
+
+A run is ``{"meta": …, "results": {key: stats}}``; ``compare`` checks one
+against a saved baseline on the median.
+
+``PLANS`` are the explorer's hot mirror reads (leaf charts, the parts
+table, lookups by part, sweeps, shipments tabs, the activity feed and
+watches); ``explain`` seeds a mirror and returns each one's query plan, and
+``plan_problems`` points out full-table scans and sorts in one.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import random
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+from hwdb.fake import FakeHwdb, Faults, Fleet
+
+INSTANCE = "prod"
+TRAY = 480
+# The LArASIC chip type and an explorer type, at curated coordinates.
+CHIP_TYPE = "D08100100004"
+EVENT_TYPE = "D05700200001"
+SHIP_TYPE = "D08699000012"
+
+
+@dataclass
+class Case:
+    """One prepared measurement: ``run`` is timed and returns how many items
+    it handled; ``reset`` (untimed) runs before every repetition."""
+    run: Callable[[], int]
+    reset: Callable[[], None] | None = None
+
+
+@dataclass
+class Scenario:
+    name: str
+    build: Callable[["Env", int | None], Case]
+    sized: bool = False
+
+
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def scenario(name: str, *, sized: bool = False):
+    def register(build):
+        SCENARIOS[name] = Scenario(name, build, sized)
+        return build
+    return register
+
+
+class Env:
+    """Shared state across scenarios: one fake HWDB server whose fleet each
+    scenario swaps in, and the scratch directory."""
+
+    def __init__(self, latency_ms: float = 0.0, workers: int | None = None):
+        self.app = FakeHwdb(Fleet([]), Faults(seed=0))
+        if latency_ms:
+            self.app.faults.set("latency_ms", str(latency_ms))
+        self.workers = workers
+        self._server = None
+        self.tmp = Path(tempfile.mkdtemp(prefix="bench-"))
+
+    @property
+    def api_url(self) -> str:
+        if self._server is None:
+            self._server = self.app.make_server()
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def serve(self, fleet: Fleet) -> str:
+        self.app.fleet = fleet
+        return self.api_url
+
+    def worker_kw(self) -> dict:
+        return {"workers": self.workers} if self.workers else {}
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        shutil.rmtree(self.tmp, True)
+
+
+# ---- Statistics -----------------------------------------------------------
+
+def percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated percentile (``q`` in 0..100) of ``values``."""
+    s = sorted(values)
+    if not s:
+        return math.nan
+    k = (len(s) - 1) * q / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    return s[lo] + (s[hi] - s[lo]) * (k - lo)
+
+
+def summarize(seconds: list[float], items: int) -> dict:
+    ms = [t * 1000 for t in seconds]
+    p50 = percentile(ms, 50)
+    return {
+        "n": len(ms), "items": items,
+        "mean_ms": round(statistics.fmean(ms), 3), "min_ms": round(min(ms), 3),
+        "p50_ms": round(p50, 3), "p90_ms": round(percentile(ms, 90), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "throughput_per_s": round(items / (p50 / 1000), 1) if p50 else None,
+    }
+
+
+def measure(case: Case, *, repeat: int, warmup: int) -> dict:
+    times, items = [], 0
+    for i in range(warmup + repeat):
+        if case.reset:
+            case.reset()
+        t0 = time.perf_counter()
+        items = case.run()
+        dt = time.perf_counter() - t0
+        if i >= warmup:
+            times.append(dt)
+    return summarize(times, items)
+
+
+def keys_for(names, sizes) -> list[tuple[str, Scenario, int | None]]:
+    """``(result key, scenario, size)`` for the selected scenarios."""
+    out = []
+    for name in names:
+        sc = SCENARIOS[name]
+        for size in (sizes if sc.sized else [None]):
+            out.append((f"{name}[{size}]" if sc.sized else name, sc, size))
+    return out
+
+
+def run(names, sizes, *, repeat=3, warmup=1, latency_ms=0.0, workers=None,
+        progress=None) -> dict:
+    """Measure every selected scenario; returns ``{key: stats}``."""
+    env = Env(latency_ms, workers)
+    results = {}
+    try:
+        for key, sc, size in keys_for(names, sizes):
+            if progress:
+                progress(key)
+            results[key] = measure(sc.build(env, size), repeat=repeat, warmup=warmup)
+    finally:
+        env.close()
+    return results
+
+
+def compare(current: dict, baseline: dict, *, threshold: float,
+            floor_ms: float = 1.0) -> list[dict]:
+    """Per shared key: the baseline and current median and their ratio, with
+    ``regressed`` set when the median grew past ``threshold`` (0.2 = 20%)
+    by more than ``floor_ms`` (timer noise on sub-millisecond cases)."""
+    rows = []
+    for key in sorted(set(current) & set(baseline)):
+        base, cur = baseline[key]["p50_ms"], current[key]["p50_ms"]
+        ratio = cur / base if base else math.inf
+        rows.append({"key": key, "base_ms": base, "cur_ms": cur, "ratio": round(ratio, 3),
+                     "regressed": ratio > 1 + threshold and cur - base > floor_ms})
+    return rows
+
+
+# ---- Scenarios ------------------------------------------------------------
+
+def _drain(gen) -> None:
+    for _line in gen:
+        pass
+
+
+@scenario("sync_family", sized=True)
+def _sync_family(env, size):
+    from hwdb.models import HwdbChip, HwdbSyncState
+    from hwdb.sync import sync_family
+
+    url = env.serve(Fleet([(CHIP_TYPE, size)], tests_per_item=2))
+
+    def reset():
+        HwdbChip.objects.filter(family="larasic").delete()
+        HwdbSyncState.objects.filter(family="larasic").delete()
+
+    def run():
+        _drain(sync_family("larasic", part_type_id=CHIP_TYPE, api_base_url=url,
+                           bearer="bench", **env.worker_kw()))
+        return size
+    return Case(run, reset)
+
+
+def _hierarchy(env, fleet) -> int:
+    """Mirror ``fleet``'s tree (the leaves the explorer engines need)."""
+    from explore.hierarchy import sync_hierarchy
+    from hwdb.api_client import FnalDbApiClient
+
+    _drain(sync_hierarchy(FnalDbApiClient(env.serve(fleet), "bench"), INSTANCE))
+    return len(fleet.types)
+
+
+@scenario("sync_test_events", sized=True)
+def _sync_test_events(env, size):
+    from explore.events import sync_test_events
+    from explore.models import HierarchyNode, HwdbComponentEvent, HwdbTestEvent
+
+    fleet = Fleet([(EVENT_TYPE, size)])
+    _hierarchy(env, fleet)
+
+    def reset():
+        HwdbComponentEvent.for_instance(INSTANCE).filter(part_type_id=EVENT_TYPE).delete()
+        HwdbTestEvent.for_instance(INSTANCE).filter(part_type_id=EVENT_TYPE).delete()
+        (HierarchyNode.for_instance(INSTANCE).filter(part_type_id=EVENT_TYPE)
+         .update(tests_synced_at=None))
+
+    def run():
+        _drain(sync_test_events(env.api_url, "bench", EVENT_TYPE, instance=INSTANCE,
+                                **env.worker_kw()))
+        return size
+    return Case(run, reset)
+
+
+@scenario("upload_tray")
+def _upload_tray(env, _size):
+    from hwdb.api_client import FnalDbApiClient
+    from hwdb.upload.larasic import iter_upload_chips_parallel
+
+    now = datetime(2025, 9, 24, 16, 59, tzinfo=dt_timezone.utc)
+    chips = [SimpleNamespace(serial_number=f"002-{i:05d}", tray_id="B005T0011",
+                             warm_tested_at=now, cold_tested_at=now + timedelta(hours=2),
+                             warm_csv_attached_at=None, cold_csv_attached_at=None)
+             for i in range(1, TRAY + 1)]
+    state = {}
+
+    def reset():
+        # A fresh, empty chip type each time: every chip is a create.
+        url = env.serve(Fleet([(CHIP_TYPE, 0)]))
+        tts = env.app.fleet.types[CHIP_TYPE]["test_types"]
+        state["factory"] = lambda: FnalDbApiClient(url, "bench")
+        state["ids"] = {"RT": tts[0]["id"], "LN": tts[1]["id"]}
+
+    def run():
+        out = list(iter_upload_chips_parallel(
+            chips, client_factory=state["factory"], part_type_id=CHIP_TYPE,
+            instance=INSTANCE, attach_csvs=False, test_type_ids=state["ids"],
+            **env.worker_kw()))
+        failed = [r.error for _chip, r in out if r.error]
+        if failed:
+            raise RuntimeError(f"upload_tray: {len(failed)} chips failed, e.g. {failed[0]}")
+        return len(out)
+    return Case(run, reset)
+
+
+def _curated_fleet(per_system: int = 4) -> Fleet:
+    """A few empty types in every curated system, plus the scenario types."""
+    from explore import curation
+
+    types = [(f"D{sid:03d}{sub:03d}{k:05d}", 0)
+             for sid in sorted(curation.curated_system_ids(INSTANCE))
+             for sub in (1, 2) for k in range(1, per_system // 2 + 1)]
+    return Fleet(types + [(EVENT_TYPE, 0), (SHIP_TYPE, 0)])
+
+
+@scenario("sync_hierarchy")
+def _sync_hierarchy(env, _size):
+    fleet = _curated_fleet()
+    return Case(lambda: _hierarchy(env, fleet))
+
+
+def _tree_case(env, build, *, cold):
+    """Items = mirrored component types in the tree."""
+    from explore import navigation
+
+    n = _hierarchy(env, _curated_fleet())
+
+    def run():
+        build()
+        return n
+    return Case(run, navigation.clear_tree_cache if cold else None)
+
+
+@scenario("sidebar_tree_cold")
+def _sidebar_cold(env, _size):
+    from explore import navigation
+    return _tree_case(env, lambda: navigation.sidebar_tree(INSTANCE, {}), cold=True)
+
+
+@scenario("sidebar_tree_warm")
+def _sidebar_warm(env, _size):
+    from explore import navigation
+    return _tree_case(env, lambda: navigation.sidebar_tree(INSTANCE, {}), cold=False)
+
+
+@scenario("curated_tree_cold")
+def _curated_cold(env, _size):
+    from explore import navigation
+    return _tree_case(env, lambda: navigation.curated_tree(INSTANCE), cold=True)
+
+
+def _dates(n: int, seed: int = 0) -> list[datetime]:
+    rng = random.Random(seed)
+    t0 = datetime(2023, 1, 1, tzinfo=dt_timezone.utc)
+    return [t0 + timedelta(minutes=rng.randrange(0, 3 * 365 * 24 * 60)) for _ in range(n)]
+
+
+@scenario("ranges_for_series", sized=True)
+def _ranges(env, size):
+    from core.queries import _ranges_for_series
+
+    specs = [("Warm", "#f80", _dates(size, 1)), ("Cold", "#08f", _dates(size, 2)),
+             ("Both", "#080", _dates(size // 2, 3))]
+
+    def run():
+        _ranges_for_series(specs)
+        return sum(len(dates) for _n, _c, dates in specs)
+    return Case(run)
+
+
+@scenario("component_update_filters", sized=True)
+def _update_filters(env, size):
+    from explore.models import HwdbComponentEvent
+    from explore.queries import component_update_filters
+
+    rng = random.Random(size)
+    HwdbComponentEvent.for_instance(INSTANCE).filter(part_type_id=EVENT_TYPE).delete()
+    HwdbComponentEvent.objects.bulk_create([
+        HwdbComponentEvent(
+            instance=INSTANCE, part_type_id=EVENT_TYPE, part_id=f"{EVENT_TYPE}-{i:05d}",
+            created=d, updated=d + timedelta(days=rng.randrange(0, 30)),
+            status=rng.choice(["In Fabrication", "Passed All", "Use As Is", "Failed"]),
+            qaqc_uploaded=rng.random() < 0.8, certified_qaqc=rng.random() < 0.6)
+        for i, d in enumerate(_dates(size), 1)], batch_size=1000)
+
+    def run():
+        component_update_filters(INSTANCE, EVENT_TYPE)
+        return size
+    return Case(run)
+
+
+@scenario("shipments_view")
+def _shipments(env, _size):
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+    from django.urls import reverse
+
+    from explore.models import ShipmentItem
+
+    _hierarchy(env, _curated_fleet())
+    ShipmentItem.for_instance(INSTANCE).delete()
+    boxes = 2000
+    arrived = _dates(boxes, 4)
+    ShipmentItem.objects.bulk_create([
+        ShipmentItem(instance=INSTANCE, part_type_id=SHIP_TYPE,
+                     part_id=f"{SHIP_TYPE}-{i:05d}", location_name="BNL",
+                     location_id=0 if i % 5 == 0 else 7, n_contents=i % 9,
+                     last_arrived=arrived[i - 1])
+        for i in range(1, boxes + 1)], batch_size=1000)
+    user, _ = get_user_model().objects.get_or_create(username="bench")
+    client = Client()
+    client.force_login(user)
+    url = reverse("explore:shipments")
+
+    def run():
+        resp = client.get(url)
+        if resp.status_code != 200:
+            raise RuntimeError(f"shipments_view answered {resp.status_code}")
+        return boxes
+    return Case(run)
+
+
+def _rts_csv(path: Path, serial: str, env: str) -> None:
+    """One Karla-format RTS CSV (the layout ``csv_parser`` reads)."""
+    path.write_text(
+        "UTC_Time,09_24_2025_16_59_20\nRTS_timestamp,20250924165920\n"
+        f"tester,Bench\ntestsite,BNL\nenv,{env}\nRTS_Property_ID,RTS-7\n"
+        "Tray_ID,B005T0011\nFE_in_Tray,Tray31\nDAT_SN,DAT-001\nFE_in_Socket,SKT6\n"
+        "Test_01_Power_Consumption,200mV_sedcBufOFF_seBuffOFF,"
+        "vdda_P=31.5,vddo_P=22.1,vddp_P=18.4,"
+        + ",".join(f"CH{ch}=(ped={600 + ch};rms=5.4;posAmp={3900 + ch};negAmp={595 + ch})"
+                   for ch in range(16)) + "\n")
+
+
+@scenario("parse_csv")
+def _parse_csv(env, _size):
+    from hwdb.upload.csv_parser import parse_csv
+
+    root = env.tmp / "rts"
+    root.mkdir(exist_ok=True)
+    paths = []
+    for i in range(1, TRAY + 1):
+        p = root / f"002_{i:05d}_20250924165920_Tray31_SKT6_RT.csv"
+        _rts_csv(p, f"002_{i:05d}", "RT")
+        paths.append(p)
+
+    def run():
+        for p in paths:
+            parse_csv(p)
+        return len(paths)
+    return Case(run)
+
+
+# ---- Query plans ----------------------------------------------------------
+
+@dataclass
+class QueryPlan:
+    """A mirror read to explain: ``build`` returns the queryset; ``allow``
+    lists the ``plan_problems`` that are fine for it (with the reason)."""
+    build: Callable
+    allow: tuple[str, ...] = ()
+
+
+PLANS: dict[str, QueryPlan] = {}
+# A second type and a box, so every plan filters out rows of the same table.
+OTHER_TYPE = "D05700200002"
+BOX = f"{SHIP_TYPE}-00001"
+
+
+def query_plan(name: str, *, allow: tuple[str, ...] = ()):
+    def register(build):
+        PLANS[name] = QueryPlan(build, allow)
+        return build
+    return register
+
+
+def seed_mirror(size: int = 2000) -> None:
+    """Mirror rows in both instances for the plans to run against: ``size``
+    items and tests of two types, boxes, feed events, watches and scans."""
+    from explore.models import (ActivityEvent, HierarchyNode, HwdbComponentEvent,
+                                HwdbTestEvent, PackScan, ShipmentItem, WatchSubscription)
+
+    dates = _dates(size, 5)
+    for inst in (INSTANCE, "dev"):
+        HierarchyNode.objects.bulk_create([
+            HierarchyNode(instance=inst, level=HierarchyNode.LEVEL_TYPE, project="D",
+                          system_id=57, system_name="S", subsystem_id=sub, name=f"T{k}",
+                          part_type_id=f"D057{sub:03d}{k:05d}")
+            for sub in range(1, 11) for k in range(1, 11)])
+        for ptid in (EVENT_TYPE, OTHER_TYPE):
+            HwdbComponentEvent.objects.bulk_create([
+                HwdbComponentEvent(instance=inst, part_type_id=ptid, part_id=f"{ptid}-{i:05d}",
+                                   created=d, updated=None if i % 10 == 0 else d,
+                                   parent_part_id=BOX if i % 50 == 0 else "")
+                for i, d in enumerate(dates, 1)], batch_size=1000)
+            HwdbTestEvent.objects.bulk_create(HwdbTestEvent.build(inst, ptid, [
+                (f"{ptid}-{i:05d}", f"Test {i % 4}", d) for i, d in enumerate(dates, 1)]),
+                batch_size=1000)
+        ShipmentItem.objects.bulk_create([
+            ShipmentItem(instance=inst, part_type_id=SHIP_TYPE if i % 2 else OTHER_TYPE,
+                         part_id=f"{SHIP_TYPE}-{i:05d}", location_id=i % 3,
+                         n_contents=i % 4, last_arrived=None if i % 9 == 0 else d)
+            for i, d in enumerate(dates, 1)], batch_size=1000)
+        ActivityEvent.objects.bulk_create([
+            ActivityEvent(instance=inst, kind="sync", summary="s",
+                          part_type_id=EVENT_TYPE if i % 7 == 0 else OTHER_TYPE,
+                          part_id=f"{EVENT_TYPE}-{i:05d}" if i % 3 == 0 else "")
+            for i in range(1, size + 1)], batch_size=1000)
+        PackScan.objects.bulk_create([
+            PackScan(instance=inst, username=f"user{i % 20}", part_id=f"P{i}")
+            for i in range(1, size + 1)], batch_size=1000)
+        WatchSubscription.objects.bulk_create(
+            [WatchSubscription(instance=inst, username=f"user{u}",
+                               part_type_id=f"D057{u + 1:03d}00001") for u in range(20)]
+            + [WatchSubscription(instance=inst, username=f"user{i % 20}",
+                                 part_id=f"{EVENT_TYPE}-{i:05d}")
+               for i in range(3, size + 1, 3)], batch_size=1000)
+
+
+def explain(names=None, size: int = 2000) -> dict[str, str]:
+    """``{plan name: EXPLAIN output}`` over a freshly seeded mirror (run it
+    in a throwaway database)."""
+    from django.db import connection
+
+    seed_mirror(size)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return {name: PLANS[name].build().explain() for name in (names or PLANS)}
+
+
+_SCAN = re.compile(r"\bSCAN (?!CONSTANT)|\bSeq Scan\b")
+_SORT = re.compile(r"\bUSE TEMP B-TREE\b|(?:^|->)\s*(?:Incremental )?Sort\b", re.M)
+# An index search narrowed by the instance alone reads half the table.
+_INSTANCE_ONLY = re.compile(r"\(instance=\?\)|Index Cond: \(\(?instance\)?::text = [^)]*\)$",
+                            re.M)
+
+
+def plan_problems(plan: str) -> list[str]:
+    """What's wrong with a plan (SQLite or PostgreSQL): a full scan, a
+    sort, an index used for its ``instance`` column only."""
+    return [problem for problem, pattern in (("full scan", _SCAN), ("sort", _SORT),
+                                             ("instance only", _INSTANCE_ONLY))
+            if pattern.search(plan)]
+
+
+def compare_plans(current: dict, baseline: dict) -> list[dict]:
+    """The shared plans whose text changed, with both texts and problems."""
+    return [{"name": name, "before": baseline[name], "after": current[name],
+             "problems_before": plan_problems(baseline[name]),
+             "problems_after": plan_problems(current[name])}
+            for name in sorted(set(current) & set(baseline))
+            if current[name] != baseline[name]]
+
+
+def _events(model):
+    return model.for_instance(INSTANCE)
+
+
+@query_plan("leaf_test_chart")
+def _leaf_test_chart():
+    from explore.models import HwdbTestEvent
+    return (_events(HwdbTestEvent).filter(part_type_id=EVENT_TYPE)
+            .values_list("test_type_id", "created"))
+
+
+@query_plan("leaf_component_chart")
+def _leaf_component_chart():
+    from explore.models import HwdbComponentEvent
+    return (_events(HwdbComponentEvent).filter(part_type_id=EVENT_TYPE)
+            .values_list("updated", "created"))
+
+
+@query_plan("leaf_parts_page")
+def _leaf_parts_page():
+    from django.db.models import F
+
+    from explore.models import HwdbComponentEvent
+    return (_events(HwdbComponentEvent).filter(part_type_id=EVENT_TYPE)
+            .order_by(F("updated").desc(nulls_last=True),
+                      F("created").desc(nulls_last=True), "part_id")[:50])
+
+
+@query_plan("part_mirror_row")
+def _part_mirror_row():
+    from explore.models import HwdbComponentEvent
+    return _events(HwdbComponentEvent).filter(part_id=f"{EVENT_TYPE}-00042")[:1]
+
+
+@query_plan("box_members")
+def _box_members():
+    from explore.models import HwdbComponentEvent
+    return _events(HwdbComponentEvent).filter(parent_part_id=BOX).values_list("part_id")
+
+
+@query_plan("search_mirrored_types", allow=("instance only",))   # every type
+def _search_mirrored_types():
+    from explore.models import HwdbComponentEvent
+    return _events(HwdbComponentEvent).values_list("part_type_id").distinct()
+
+
+@query_plan("enabled_sweep")
+def _enabled_sweep():
+    from explore.models import HwdbComponentEvent
+    return (_events(HwdbComponentEvent)
+            .filter(part_type_id=EVENT_TYPE, part_id__in=[f"{EVENT_TYPE}-00007"])
+            .values_list("id"))
+
+
+@query_plan("leaf_lookup", allow=("sort",))   # sorts the one row it finds
+def _leaf_lookup():
+    from explore.models import HierarchyNode as H
+    return _events(H).filter(level=H.LEVEL_TYPE, part_type_id=EVENT_TYPE)[:1]
+
+
+@query_plan("subsystem_leaves")
+def _subsystem_leaves():
+    from explore.models import HierarchyNode as H
+    return _events(H).filter(level=H.LEVEL_TYPE, project="D", system_id=57,
+                             subsystem_id=2)
+
+
+@query_plan("leaf_boxes")
+def _leaf_boxes():
+    from explore.models import ShipmentItem
+    return _events(ShipmentItem).filter(part_type_id=SHIP_TYPE, n_contents__gt=0)
+
+
+@query_plan("shipments_tab")
+def _shipments_tab():
+    from django.db.models import F
+
+    from explore.models import ShipmentItem
+    return (_events(ShipmentItem).filter(part_type_id__in=[SHIP_TYPE], status="transit")
+            .order_by(F("last_arrived").desc(nulls_last=True), "part_id")[:50])
+
+
+@query_plan("box_row")
+def _box_row():
+    from explore.models import ShipmentItem
+    return _events(ShipmentItem).filter(part_id=BOX)[:1]
+
+
+@query_plan("activity_feed", allow=("instance only",))   # walks newest first
+def _activity_feed():
+    from explore.models import ActivityEvent
+    return _events(ActivityEvent).order_by("-created_at")[:100]
+
+
+@query_plan("watched_type_events")
+def _watched_type_events():
+    from explore.models import ActivityEvent
+    return _events(ActivityEvent).filter(part_type_id=EVENT_TYPE).order_by("-created_at")[:100]
+
+
+@query_plan("watched_part_events")
+def _watched_part_events():
+    from explore.models import ActivityEvent
+    return (_events(ActivityEvent).filter(part_id=f"{EVENT_TYPE}-00003")
+            .order_by("-created_at")[:100])
+
+
+@query_plan("event_watchers")
+def _event_watchers():
+    from django.db.models import Q
+
+    from explore.models import WatchSubscription
+    return _events(WatchSubscription).filter(
+        Q(part_id="", part_type_id=EVENT_TYPE) | Q(part_id=f"{EVENT_TYPE}-00003")
+    ).order_by().values("username")
+
+
+@query_plan("watched_feed", allow=("instance only",))   # walks the feed newest first
+def _watched_feed():
+    from explore import watches
+    return watches.watched_events(INSTANCE, "user3")[:100]
+
+
+@query_plan("scan_feed")
+def _scan_feed():
+    from explore.models import PackScan
+    return _events(PackScan).filter(username="user3", id__gt=100).order_by("id")[:50]
@@ -0,0 +1,239 @@
+"""Timing of every HWDB call, per request and in a rolling slow-call log.
+
+``FnalDbApiClient`` reports each response here (a ``requests`` response
+hook, so the JSON calls, image downloads and uploads are all covered) as a
+``Call``: the endpoint as a template (``components/{part_id}/tests``), the
+instance, HTTP status, bytes, latency, how many times the same call had
+just failed (its retry count) and the view it ran under. Each call is
+logged on ``hwdb.calls`` at DEBUG and:
+
+- added to the current request's ``Collector`` — ``HwdbCallsMiddleware``
+  opens one per request, turns it into ``Server-Timing`` entries and, with
+  ``HWDB_CALL_FOOTER``, a footer on HTML pages;
+- kept in the slow-call log (``slow_calls``, also a WARNING) if it took at
+  least ``HWDB_SLOW_CALL_MS``.
+
+The collector lives in a context variable, so worker threads don't see it
+on their own — a pool fanning out inside a request passes
+``initializer=calls.inherit()``. Calls made outside any request (syncs,
+commands) are only logged and checked against the threshold.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+
+import requests
+from django.conf import settings
+
+from . import metrics
+
+logger = logging.getLogger("hwdb.calls")
+
+# Path segments that vary per call → their placeholder (first match wins).
+_TEMPLATE_RULES = [
+    (re.compile(r"^[A-Z]\d{11}-\d+$"), "{part_id}"),
+    (re.compile(r"^[A-Z]\d{11}$"), "{part_type_id}"),
+    (re.compile(r"^\d+$"), "{id}"),
+]
+
+
+def template(path: str) -> str:
+    """``components/D05700200001-00042/tests/863`` →
+    ``components/{part_id}/tests/{id}``."""
+    out = []
+    for seg in path.strip("/").split("/"):
+        out.append(next((ph for rx, ph in _TEMPLATE_RULES if rx.match(seg)), seg))
+    return "/".join(out)
+
+
+def instance_for(base_url: str) -> str:
+    """The ``HWDB_PROFILES`` key whose API is ``base_url`` ("" if none, or
+    if several share it — the ``HWDB_API_OVERRIDE`` rig)."""
+    hits = [k for k, p in settings.HWDB_PROFILES.items()
+            if p["api"].rstrip("/") == base_url.rstrip("/")]
+    return hits[0] if len(hits) == 1 else ""
+
+
+@dataclass(frozen=True)
+class Call:
+    method: str
+    endpoint: str
+    instance: str
+    status: int
+    bytes: int
+    ms: float
+    retries: int
+    view: str
+    at: float = field(default_factory=time.time)
+
+
+class Collector:
+    """The HWDB calls of one request (thread-safe: pools append to it)."""
+
+    def __init__(self, view: str = ""):
+        self.view = view
+        self.calls: list[Call] = []
+        self._lock = threading.Lock()
+
+    def add(self, call: Call) -> None:
+        with self._lock:
+            self.calls.append(call)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(c.ms for c in self.calls)
+
+    def by_endpoint(self) -> list[dict]:
+        """``[{method, endpoint, n, ms, bytes}]``, slowest total first."""
+        groups: dict[tuple[str, str], dict] = {}
+        with self._lock:
+            calls = list(self.calls)
+        for c in calls:
+            g = groups.setdefault((c.method, c.endpoint), {
+                "method": c.method, "endpoint": c.endpoint, "n": 0, "ms": 0.0, "bytes": 0})
+            g["n"] += 1
+            g["ms"] += c.ms
+            g["bytes"] += c.bytes
+        return sorted(groups.values(), key=lambda g: -g["ms"])
+
+
+_current: contextvars.ContextVar[Collector | None] = contextvars.ContextVar(
+    "hwdb_calls", default=None)
+# How many slow calls the log keeps (oldest dropped first).
+SLOW_LOG_SIZE = 200
+_slow: deque[Call] = deque(maxlen=SLOW_LOG_SIZE)
+_slow_lock = threading.Lock()
+
+
+def current() -> Collector | None:
+    return _current.get()
+
+
+@contextmanager
+def collecting(view: str = ""):
+    """Collect the calls made in this context (and in pools that inherit it)."""
+    collector = Collector(view)
+    token = _current.set(collector)
+    try:
+        yield collector
+    finally:
+        _current.reset(token)
+
+
+def inherit(init=None):
+    """A ``ThreadPoolExecutor`` initializer that hands the caller's collector
+    to each worker thread (then runs ``init``, if given)."""
+    collector = _current.get()
+
+    def _init():
+        _current.set(collector)
+        if init is not None:
+            init()
+    return _init
+
+
+def record(call: Call) -> None:
+    logger.debug("hwdb call", extra={"hwdb_call": asdict(call)})
+    metrics.inc("hwdb_responses_total", instance=call.instance, endpoint=call.endpoint,
+                status=metrics.status_class(call.status))
+    if call.status:
+        metrics.observe("hwdb_request_duration_seconds", call.ms / 1000,
+                        instance=call.instance, endpoint=call.endpoint, method=call.method)
+    collector = _current.get()
+    if collector is not None:
+        collector.add(call)
+    if call.ms >= settings.HWDB_SLOW_CALL_MS:
+        with _slow_lock:
+            _slow.append(call)
+        logger.warning("slow HWDB call: %s %s %.0f ms (status %s, %d retries, view %s)",
+                       call.method, call.endpoint, call.ms, call.status, call.retries,
+                       call.view or "-")
+
+
+def slow_calls() -> list[Call]:
+    """The slow-call log, newest first."""
+    with _slow_lock:
+        return list(reversed(_slow))
+
+
+def clear_slow_calls() -> None:
+    with _slow_lock:
+        _slow.clear()
+
+
+class Recorder:
+    """The client side: a ``requests`` response hook that times each call,
+    plus the per-client memory of which calls just failed (for ``retries``)."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        self.instance = instance_for(base_url)
+        self._failing: dict[tuple[str, str], int] = {}
+
+    def _endpoint(self, req) -> str:
+        url = req.url.split("?", 1)[0]
+        return template(url[len(self.base_url):] if url.startswith(self.base_url) else url)
+
+    def _retries(self, req, ok: bool) -> int:
+        key = (req.method, req.url)
+        retries = self._failing.pop(key, 0)
+        if not ok:
+            self._failing[key] = retries + 1
+        return retries
+
+    def failed(self, req, seconds: float) -> None:
+        """A call that got no response (connection error, timeout)."""
+        collector = _current.get()
+        record(Call(method=req.method, endpoint=self._endpoint(req), instance=self.instance,
+                    status=0, bytes=0, ms=seconds * 1000,
+                    retries=self._retries(req, False),
+                    view=collector.view if collector else ""))
+
+    def __call__(self, response, *args, **kwargs):
+        req = response.request
+        if req is None:       # not sent by a session (hand-built in tests)
+            return
+        retries = self._retries(req, response.ok)
+        # A streamed body (image downloads) is left unread — its declared
+        # length stands in; the hook runs before requests reads the others.
+        size = response.headers.get("Content-Length", "")
+        if size.isdigit():
+            size = int(size)
+        else:
+            size = 0 if kwargs.get("stream") else len(response.content or b"")
+        collector = _current.get()
+        record(Call(
+            method=req.method, endpoint=self._endpoint(req), instance=self.instance,
+            status=response.status_code, bytes=size,
+            ms=response.elapsed.total_seconds() * 1000, retries=retries,
+            view=collector.view if collector else ""))
+
+
+class InstrumentedSession(requests.Session):
+    """The client's session: every response goes through a ``Recorder``;
+    calls in flight and calls that never got a response are counted too."""
+
+    def __init__(self, base_url: str):
+        super().__init__()
+        self.recorder = Recorder(base_url)
+        self.hooks["response"].append(self.recorder)
+
+    def send(self, request, **kwargs):
+        instance = self.recorder.instance
+        metrics.gauge_add("hwdb_in_flight_requests", 1, instance=instance)
+        started = time.monotonic()
+        try:
+            return super().send(request, **kwargs)
+        except requests.RequestException:
+            self.recorder.failed(request, time.monotonic() - started)
+            raise
+        finally:
+            metrics.gauge_add("hwdb_in_flight_requests", -1, instance=instance)
@@ -0,0 +1,178 @@
+"""Bulk export of the mirror and QC tables as CSV or NDJSON, streamed.
+
+``EXPORTS`` lists what can be exported; ``stream`` turns one table plus its
+filters (instance, part type, date range) into an iterator of bytes that
+``/hwdb/export/<table>/`` serves as a ``StreamingHttpResponse`` and
+``manage.py export`` writes to a file. Rows are read through a chunked
+cursor (``iterator(chunk_size=…)``, server-side on PostgreSQL) and encoded
+as they arrive, so memory stays flat whatever the table size; ``gzip``
+compresses on the fly.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from core.models import CableTest, FembTest, LArASIC
+from explore.instances import NAMESPACE_BY_INSTANCE
+from explore.models import HwdbComponentEvent, HwdbTestEvent, ShipmentItem
+
+from .models import HwdbChip
+
+CHUNK_ROWS = 2000
+# Encoded output is handed on in blocks of about this size.
+BLOCK_BYTES = 64 * 1024
+FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+class ExportError(ValueError):
+    """A bad table name or filter; the message is safe to show."""
+
+
+@dataclass(frozen=True)
+class Export:
+    model: type
+    columns: tuple[str, ...]
+    date_field: str
+    part_type_field: str = ""     # "" = no part-type filter
+    scoped: bool = False          # instance-scoped mirror table
+    headers: tuple[str, ...] = ()  # () = the columns, "__" → "_"
+
+
+EXPORTS = {
+    "component_events": Export(
+        HwdbComponentEvent,
+        ("instance", "part_type_id", "part_id", "serial_number", "created", "updated",
+         "created_by", "status", "manufacturer", "institution", "is_installed",
+         "qaqc_uploaded", "certified_qaqc", "parent_part_id", "enabled"),
+        "created", "part_type_id", scoped=True),
+    "test_events": Export(
+        HwdbTestEvent,
+        ("instance", "part_type_id", "part_key__part_id", "test_type__name", "created"),
+        "created", "part_type_id", scoped=True,
+        headers=("instance", "part_type_id", "part_id", "test_type_name", "created")),
+    "shipments": Export(
+        ShipmentItem,
+        ("instance", "part_type_id", "part_id", "location_name", "location_id",
+         "n_contents", "last_arrived", "shipped_date", "received_date"),
+        "last_arrived", "part_type_id", scoped=True),
+    "hwdb_chips": Export(
+        HwdbChip,
+        ("family", "serial_number", "part_id", "part_type_id", "latest_rt_test_at",
+         "latest_ln_test_at", "last_seen_at"),
+        "last_seen_at", "part_type_id"),
+    "larasic": Export(
+        LArASIC,
+        ("serial_number", "status", "tray_id", "warm_tested_at", "cold_tested_at",
+         "is_in_hwdb", "qc_tests_uploaded", "femb__version", "femb__serial_number",
+         "femb_pos", "last_update"),
+        "last_update"),
+    "femb_tests": Export(
+        FembTest,
+        ("femb__version", "femb__serial_number", "timestamp", "test_type", "test_env",
+         "site", "status", "report_filename"),
+        "timestamp"),
+    "cable_tests": Export(
+        CableTest,
+        ("cable__serial_number", "timestamp", "test_type", "test_env", "site", "status",
+         "report_filename"),
+        "timestamp"),
+}
+
+
+def _bound(value: str, end: bool) -> datetime:
+    """A ``since``/``until`` value: a date (the whole day) or a datetime,
+    in local time unless it carries an offset."""
+    try:
+        d = parse_date(value)
+        dt = datetime.combine(d, time.max if end else time.min) if d else parse_datetime(value)
+    except ValueError:
+        dt = None
+    if dt is None:
+        raise ExportError(f"not a date: {value!r}")
+    return dt if timezone.is_aware(dt) else timezone.make_aware(dt)
+
+
+def queryset(table: str, *, instance: str = "prod", part_type: str = "",
+             since: str = "", until: str = ""):
+    """The rows to export, as ``values_list`` tuples in primary-key order."""
+    spec = EXPORTS.get(table)
+    if spec is None:
+        raise ExportError(f"unknown table {table!r} (one of {', '.join(EXPORTS)})")
+    if spec.scoped and instance not in NAMESPACE_BY_INSTANCE:
+        raise ExportError(f"unknown instance {instance!r}")
+    qs = spec.model.for_instance(instance) if spec.scoped else spec.model.objects.all()
+    if part_type:
+        if not spec.part_type_field:
+            raise ExportError(f"{table} has no part type")
+        qs = qs.filter(**{spec.part_type_field: part_type})
+    if since:
+        qs = qs.filter(**{f"{spec.date_field}__gte": _bound(since, end=False)})
+    if until:
+        qs = qs.filter(**{f"{spec.date_field}__lte": _bound(until, end=True)})
+    return qs.order_by("pk").values_list(*spec.columns)
+
+
+def _cell(v):
+    if isinstance(v, (datetime, date)):
+        return v.isoformat()
+    return v
+
+
+def _encode_csv(columns, rows):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(["" if v is None else _cell(v) for v in row])
+        if buf.tell() >= BLOCK_BYTES:
+            yield buf.getvalue().encode()
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue().encode()
+
+
+def _encode_ndjson(columns, rows):
+    out, size = [], 0
+    for row in rows:
+        line = json.dumps({c: _cell(v) for c, v in zip(columns, row)}) + "\n"
+        out.append(line)
+        size += len(line)
+        if size >= BLOCK_BYTES:
+            yield "".join(out).encode()
+            out, size = [], 0
+    yield "".join(out).encode()
+
+
+def _gzip(blocks):
+    z = zlib.compressobj(wbits=31)   # gzip container
+    for block in blocks:
+        data = z.compress(block)
+        if data:
+            yield data
+    yield z.flush()
+
+
+def stream(table: str, fmt: str = "csv", *, gzip: bool = False, **filters):
+    """The export as an iterator of byte blocks. Filters are checked (and
+    raise ``ExportError``) before the first block is produced."""
+    if fmt not in FORMATS:
+        raise ExportError(f"unknown format {fmt!r} (csv or ndjson)")
+    qs = queryset(table, **filters)
+    spec = EXPORTS[table]
+    columns = list(spec.headers) or [c.replace("__", "_") for c in spec.columns]
+    rows = qs.iterator(chunk_size=CHUNK_ROWS)
+    blocks = (_encode_csv if fmt == "csv" else _encode_ndjson)(columns, rows)
+    return _gzip(blocks) if gzip else blocks
+
+
+def filename(table: str, fmt: str, gzip: bool = False) -> str:
+    return f"{table}.{fmt}" + (".gz" if gzip else "")
@@ -0,0 +1,538 @@
+"""A stand-in HWDB REST server for offline load testing.
+
+Every engine test stubs ``FnalDbApiClient`` with a ``MagicMock``, which says
+nothing about throughput, connection reuse or how the thread fan-outs behave
+against a slow or flaky server. ``manage.py fake_hwdb`` serves the endpoints
+the client uses from a synthetic, seeded fleet, over real HTTP/1.1 with
+keep-alive, with per-endpoint latency and fault injection:
+
+- ``Fleet`` — component types, items, tests, locations and box contents,
+  generated deterministically from a seed; writes (create, PATCH, POST
+  location/test/image) land in it, so a sync after an upload sees them.
+- ``Faults`` — per endpoint name (``ROUTES``; ``*`` = every endpoint): a
+  latency plus jitter, and the rates of 429s, 503s and timeouts (the request
+  is held, then the connection dropped without a response).
+- ``FakeHwdb`` — routes a request to the fleet and counts what it served;
+  ``GET /_fake/stats`` reports requests, faults and TCP connections, so
+  keep-alive reuse is measurable.
+
+Bearers aren't checked. The response shapes follow what the explorer and
+upload code read, not the full HWDB schema.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import re
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# A 1×1 PNG — the body of every image / QR-code download.
+_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082")
+
+STATUSES = [(100, "In Fabrication"), (110, "Waiting on QA/QC Tests"),
+            (120, "Passed All"), (140, "Use As Is"), (150, "Failed")]
+
+# (endpoint name, method, path pattern under the API base). The names are
+# what ``Faults`` and the stats key on.
+ROUTES = [
+    ("systems", "GET", r"systems/(?P<project>\w)"),
+    ("subsystems", "GET", r"subsystems/(?P<project>\w)/(?P<system>\d+)"),
+    ("part-types", "GET", r"component-types/(?P<project>\w)/(?P<system>\d+)/(?P<sub>\d+)"),
+    ("list", "GET", r"component-types/(?P<ptid>[A-Z]\d{11})/components"),
+    ("create", "POST", r"component-types/(?P<ptid>[A-Z]\d{11})/components"),
+    ("test-types", "GET", r"component-types/(?P<ptid>[A-Z]\d{11})/test-types"),
+    ("write", "POST", r"component-types/(?P<ptid>[A-Z]\d{11})/test-types"),
+    ("type-images", "GET", r"component-types/(?P<ptid>[A-Z]\d{11})/images"),
+    ("write", "POST", r"component-types/(?P<ptid>[A-Z]\d{11})/images"),
+    ("component-type", "GET", r"component-types/(?P<ptid>[A-Z]\d{11})"),
+    ("write", "PATCH", r"component-types/(?P<ptid>[A-Z]\d{11})"),
+    ("tests", "GET", r"components/(?P<pid>[^/]+)/tests(?:/(?P<ttid>\d+))?"),
+    ("post-test", "POST", r"components/(?P<pid>[^/]+)/tests"),
+    ("locations", "GET", r"components/(?P<pid>[^/]+)/locations"),
+    ("post-location", "POST", r"components/(?P<pid>[^/]+)/locations"),
+    ("subcomponents", "GET", r"components/(?P<pid>[^/]+)/subcomponents"),
+    ("patch-subcomponents", "PATCH", r"components/(?P<pid>[^/]+)/subcomponents"),
+    ("container", "GET", r"components/(?P<pid>[^/]+)/container"),
+    ("status", "GET", r"components/(?P<pid>[^/]+)/status"),
+    ("images", "GET", r"components/(?P<pid>[^/]+)/images"),
+    ("write", "POST", r"components/(?P<pid>[^/]+)/images"),
+    ("component", "GET", r"components/(?P<pid>[^/]+)"),
+    ("patch-component", "PATCH", r"components/(?P<pid>[^/]+)"),
+    ("write", "POST", r"component-tests/(?P<test_id>\d+)/images"),
+    ("image", "GET", r"img/(?P<image_id>[^/]+)"),
+    ("image", "GET", r"get-qrcode/(?P<pid>[^/]+)"),
+    ("whoami", "GET", r"users/whoami"),
+    ("roles", "GET", r"roles"),
+    ("institutions", "GET", r"institutions"),
+]
+_COMPILED = [(name, method, re.compile(rf"{pattern}/?"))
+             for name, method, pattern in ROUTES]
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat(timespec="seconds")
+
+
+# ---- Faults ---------------------------------------------------------------
+
+@dataclass
+class Fault:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_429: float = 0.0
+    rate_503: float = 0.0
+    rate_timeout: float = 0.0
+
+
+class Faults:
+    """Per-endpoint fault settings: a ``*`` default per field, overridable
+    per endpoint name. ``timeout_s`` is how long a "timed out" request is
+    held before its connection is dropped."""
+
+    FIELDS = ("latency_ms", "jitter_ms", "rate_429", "rate_503", "rate_timeout")
+
+    def __init__(self, timeout_s: float = 30.0, seed: int | None = None):
+        self.timeout_s = timeout_s
+        self.defaults: dict[str, float] = {}
+        self.overrides: dict[str, dict[str, float]] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def set(self, field: str, spec: str) -> None:
+        """Apply ``"name=value,name=value"`` (a bare value means ``*``) to
+        one ``Fault`` field, e.g. ``set("latency_ms", "40,list=300")``."""
+        if field not in self.FIELDS:
+            raise ValueError(f"unknown fault field {field!r}")
+        names = {n for n, _m, _p in ROUTES}
+        for part in filter(None, (p.strip() for p in spec.split(","))):
+            name, _, value = part.rpartition("=")
+            if name in ("", "*"):
+                self.defaults[field] = float(value)
+            elif name in names:
+                self.overrides.setdefault(name, {})[field] = float(value)
+            else:
+                raise ValueError(f"unknown endpoint {name!r}")
+
+    def for_endpoint(self, name: str) -> Fault:
+        return Fault(**{**self.defaults, **self.overrides.get(name, {})})
+
+    def draw(self, name: str) -> tuple[float, str | None]:
+        """(seconds to wait, injected fault or None) for one request."""
+        f = self.for_endpoint(name)
+        with self._lock:
+            delay = max(0.0, f.latency_ms + self._rng.uniform(-f.jitter_ms, f.jitter_ms))
+            roll = self._rng.random()
+        for kind, rate in (("timeout", f.rate_timeout), ("429", f.rate_429),
+                           ("503", f.rate_503)):
+            if roll < rate:
+                return delay / 1000, kind
+            roll -= rate
+        return delay / 1000, None
+
+
+# ---- Fleet ----------------------------------------------------------------
+
+class Fleet:
+    """A synthetic HWDB: ``types`` is ``[(part_type_id, n_items)]``. Each type
+    sits at the system/subsystem its id encodes (D·SSS·PPP·NNNNN), so the
+    curated hierarchy walk finds it. Item types get ``tests_per_item`` test
+    records each (over ``len(TEST_TYPES)`` test types, named like the
+    LArASIC QC tests so the chip sync and upload resolve them); ``n_boxes``
+    boxes of ``BOX_TYPE`` hold ``box_slots`` positions of the first item
+    type, about half of them filled."""
+
+    BOX_TYPE = "D00599800001"
+    TEST_TYPES = ["RoomT QC Test", "CryoT QC Test", "Visual"]
+
+    def __init__(self, types, *, tests_per_item=3, n_boxes=0, box_slots=8, seed=0):
+        rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.types: dict[str, dict] = {}
+        self.items: dict[str, dict] = {}
+        self.by_type: dict[str, list[str]] = {}
+        self.tests: dict[str, list[dict]] = {}
+        self.locations: dict[str, list[dict]] = {}
+        self.subs: dict[str, list[dict]] = {}
+        self.images: dict[str, list[dict]] = {}
+        self._next_id = 1000
+        t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        for ptid, count in types:
+            self._add_type(ptid, f"Type {ptid[-4:]}")
+            for i in range(1, count + 1):
+                created = t0 + timedelta(hours=rng.randrange(0, 20000))
+                self._add_item(ptid, i, created, rng)
+                self.tests[self._pid(ptid, i)] = [
+                    self._test(ptid, k % len(self.TEST_TYPES),
+                               created + timedelta(days=k + 1), rng)
+                    for k in range(tests_per_item)]
+
+        if n_boxes and types:
+            child = types[0][0]
+            self._add_type(self.BOX_TYPE, "Shipping Box",
+                           connectors={f"Slot{k}": child
+                                       for k in range(1, box_slots + 1)})
+            free = iter(self.by_type[child])
+            for b in range(1, n_boxes + 1):
+                box = self._add_item(self.BOX_TYPE, b, t0, rng)["part_id"]
+                self.locations[box] = [{
+                    "location": {"id": 7, "name": "BNL"}, "comments": "",
+                    "arrived": _iso(t0 + timedelta(days=b))}]
+                for k in range(1, box_slots // 2 + 1):
+                    pid = next(free, None)
+                    if pid is None:
+                        break
+                    self.subs[box] = self.subs.get(box, []) + [{
+                        "part_id": pid, "type_name": self.types[child]["name"],
+                        "functional_position": f"Slot{k}", "operation": "mount"}]
+                    self.items[pid]["parent_part_id"] = box
+
+    # -- building --
+    @staticmethod
+    def _pid(ptid, n):
+        return f"{ptid}-{n:05d}"
+
+    def _add_type(self, ptid, name, *, connectors=None):
+        system, subsystem = int(ptid[1:4]), int(ptid[4:7])
+        self.types[ptid] = {
+            "part_type_id": ptid, "name": name,
+            "full_name": f"{ptid[0]}.{system}.{subsystem}.{name}",
+            "category": "generic", "system": system, "subsystem": subsystem,
+            "connectors": connectors or {}, "manufacturers": [], "comments": "",
+            "properties": {"specifications": [{"datasheet": {"Length": None}}]},
+            "test_types": [{"id": 900 + k, "name": name_}
+                           for k, name_ in enumerate(self.TEST_TYPES)],
+        }
+        self.by_type.setdefault(ptid, [])
+
+    def _add_item(self, ptid, n, created, rng):
+        pid = self._pid(ptid, n)
+        sid, sname = rng.choice(STATUSES)
+        self.items[pid] = {
+            "part_id": pid, "serial_number": f"SN{n:06d}",
+            "created": _iso(created), "updated": _iso(created + timedelta(days=3)),
+            "creator": {"name": "Fake Factory"},
+            "status": {"id": sid, "name": sname},
+            "manufacturer": {"id": 1, "name": "Acme"},
+            "institution": {"id": 7, "name": "BNL"},
+            "component_type": {"part_type_id": ptid, "name": self.types[ptid]["name"]},
+            "is_installed": False, "qaqc_uploaded": rng.random() < 0.8,
+            "certified_qaqc": rng.random() < 0.6, "enabled": True,
+            "parent_part_id": "",
+            "specifications": [{"DATA": {"Length": round(rng.uniform(9, 11), 3)}}],
+        }
+        self.by_type[ptid].append(pid)
+        return self.items[pid]
+
+    def _test(self, ptid, k, created, rng):
+        self._next_id += 1
+        tt = self.types[ptid]["test_types"][k]
+        return {"id": self._next_id, "test_type": {"id": tt["id"], "name": tt["name"]},
+                "created": _iso(created), "status": {"name": "Pass"},
+                "comments": "", "images": [],
+                "test_data": {"Test Date": created.strftime("%Y/%m/%d"),
+                              "gain": [round(rng.gauss(10, 1), 3) for _ in range(4)],
+                              "noise": round(rng.gauss(2, 0.2), 3)}}
+
+    # -- reads --
+    def listing(self, ptid, query):
+        pids = self.by_type.get(ptid)
+        if pids is None:
+            return 404, {"status": "ERROR", "data": f"No component type {ptid}"}
+        rows = [self.items[p] for p in pids]
+        if "serial_number" in query:
+            rows = [r for r in rows if r["serial_number"] == query["serial_number"]]
+        page = max(1, int(query.get("page", 1)))
+        size = max(1, min(int(query.get("size", 100)), 1000))
+        chunk = rows[(page - 1) * size: page * size]
+        keys = ("part_id", "serial_number", "created", "status", "parent_part_id",
+                "enabled", "qaqc_uploaded", "certified_qaqc")
+        return 200, {"status": "OK", "data": [{k: r[k] for k in keys} for r in chunk],
+                     "pagination": {"page": page, "page_size": size, "total": len(rows),
+                                    "pages": max(1, -(-len(rows) // size))}}
+
+    def component(self, pid):
+        item = self.items.get(pid)
+        if item is None:
+            return 404, {"status": "ERROR", "data": f"No component {pid}"}
+        return 200, {"status": "OK", "data": item}
+
+    def tests_of(self, pid, ttid=None):
+        rows = self.tests.get(pid, [])
+        if ttid is not None:
+            rows = [t for t in rows if t["test_type"]["id"] == int(ttid)]
+        return 200, {"status": "OK", "data": sorted(rows, key=lambda t: t["created"],
+                                                      reverse=True)}
+
+    def container(self, pid):
+        parent = (self.items.get(pid) or {}).get("parent_part_id")
+        if not parent:
+            return 200, {"status": "OK", "data": []}
+        ptid = parent.rsplit("-", 1)[0]
+        return 200, {"status": "OK", "data": [{
+            "operation": "mount", "created": self.items[pid]["updated"],
+            "container": {"part_id": parent,
+                          "component_type": {"name": self.types[ptid]["name"]}}}]}
+
+    # -- writes --
+    def create(self, ptid, payload):
+        if ptid not in self.types:
+            return 404, {"status": "ERROR", "data": f"No component type {ptid}"}
+        with self.lock:
+            n = len(self.by_type[ptid]) + 1
+            item = self._add_item(ptid, n, datetime.now(timezone.utc), random.Random(n))
+        item["serial_number"] = (payload or {}).get("serial_number") or item["serial_number"]
+        return 200, {"status": "OK", "data": "Created", "part_id": item["part_id"],
+                     "id": n}
+
+    def patch_component(self, pid, payload):
+        item = self.items.get(pid)
+        if item is None:
+            return 404, {"status": "ERROR", "data": f"No component {pid}"}
+        payload = payload or {}
+        with self.lock:
+            if isinstance(payload.get("status"), dict):
+                item["status"] = payload["status"]
+            if "specifications" in payload:
+                item["specifications"] = item["specifications"] + [payload["specifications"]]
+            item["updated"] = _iso(datetime.now(timezone.utc))
+        return 200, {"status": "OK", "data": "Updated"}
+
+    def patch_subcomponents(self, box, payload):
+        if box not in self.items:
+            return 404, {"status": "ERROR", "data": f"No component {box}"}
+        positions = (payload or {}).get("subcomponents") or {}
+        with self.lock:
+            for pid in filter(None, positions.values()):
+                if pid not in self.items:
+                    return 200, {"status": "ERROR", "data": f"The component '{pid}' does not exist"}
+                held = self.items[pid]["parent_part_id"]
+                if held and held != box:
+                    return 200, {"status": "ERROR",
+                                 "data": f"The component '{pid}' is already in use"}
+            for m in self.subs.get(box, []):
+                self.items[m["part_id"]]["parent_part_id"] = ""
+            self.subs[box] = [
+                {"part_id": pid, "functional_position": pos, "operation": "mount",
+                 "type_name": self.items[pid]["component_type"]["name"]}
+                for pos, pid in positions.items() if pid]
+            for m in self.subs[box]:
+                self.items[m["part_id"]]["parent_part_id"] = box
+        return 200, {"status": "OK", "data": "Updated"}
+
+    def post_location(self, pid, payload):
+        if pid not in self.items:
+            return 404, {"status": "ERROR", "data": f"No component {pid}"}
+        payload = payload or {}
+        with self.lock:
+            self.locations.setdefault(pid, []).insert(0, {
+                "location": {"id": (payload.get("location") or {}).get("id") or 0,
+                             "name": "Somewhere"},
+                "arrived": payload.get("arrived") or _iso(datetime.now(timezone.utc)),
+                "comments": payload.get("comments") or ""})
+        return 200, {"status": "OK", "data": "Created"}
+
+    def post_test(self, pid, payload):
+        if pid not in self.items:
+            return 404, {"status": "ERROR", "data": f"No component {pid}"}
+        payload = payload or {}
+        ptid = pid.rsplit("-", 1)[0]
+        name = payload.get("test_type")
+        tt = next((t for t in self.types[ptid]["test_types"] if t["name"] == name), None)
+        if tt is None:
+            return 200, {"status": "ERROR", "data": f"No test type {name!r}"}
+        with self.lock:
+            self._next_id += 1
+            self.tests.setdefault(pid, []).append({
+                "id": self._next_id, "test_type": dict(tt), "status": {"name": "Pass"},
+                "created": _iso(datetime.now(timezone.utc)), "images": [],
+                "comments": payload.get("comments") or "",
+                "test_data": payload.get("test_data") or {}})
+            return 200, {"status": "OK", "data": "Created", "test_id": self._next_id}
+
+
+# ---- Server ---------------------------------------------------------------
+
+class FakeHwdb:
+    """Route → fleet, with faults applied and counts kept."""
+
+    def __init__(self, fleet: Fleet, faults: Faults | None = None, prefix: str = "/api/v1"):
+        self.fleet = fleet
+        self.faults = faults or Faults()
+        self.prefix = prefix.rstrip("/")
+        self._lock = threading.Lock()
+        self.stats = {"requests": {}, "faults": {}, "connections": 0}
+
+    def _count(self, bucket, key):
+        with self._lock:
+            self.stats[bucket][key] = self.stats[bucket].get(key, 0) + 1
+
+    def route(self, method: str, path: str) -> tuple[str, dict] | None:
+        if path.startswith(self.prefix + "/"):
+            path = path[len(self.prefix) + 1:]
+        for name, m, rx in _COMPILED:
+            if m == method and (hit := rx.fullmatch(path)):
+                return name, hit.groupdict()
+        return None
+
+    def respond(self, name: str, args: dict, query: dict, payload) -> tuple[int, object]:
+        """(HTTP status, JSON body — or raw bytes for downloads)."""
+        f = self.fleet
+        if name == "systems":
+            systems = sorted({t["system"] for t in f.types.values()})
+            return 200, {"status": "OK", "data": [{"id": s, "name": f"System {s}"}
+                                                  for s in systems]}
+        if name == "subsystems":
+            system = int(args["system"])
+            subs = sorted({t["subsystem"] for t in f.types.values() if t["system"] == system})
+            return 200, {"status": "OK", "data": [
+                {"subsystem_id": s, "subsystem_name": f"Subsystem {s}"} for s in subs]}
+        if name == "part-types":
+            system, sub = int(args["system"]), int(args["sub"])
+            return 200, {"status": "OK", "data": [
+                {k: t[k] for k in ("part_type_id", "name", "full_name", "category")}
+                for t in f.types.values() if (t["system"], t["subsystem"]) == (system, sub)]}
+        if name == "list":
+            return f.listing(args["ptid"], query)
+        if name == "create":
+            return f.create(args["ptid"], payload)
+        if name in ("component-type", "test-types"):
+            t = f.types.get(args["ptid"])
+            if t is None:
+                return 404, {"status": "ERROR", "data": f"No component type {args['ptid']}"}
+            return 200, {"status": "OK",
+                         "data": t["test_types"] if name == "test-types" else t}
+        if name == "type-images":
+            return 200, {"status": "OK", "data": []}
+        if name == "component":
+            return f.component(args["pid"])
+        if name == "patch-component":
+            return f.patch_component(args["pid"], payload)
+        if name == "tests":
+            return f.tests_of(args["pid"], args.get("ttid"))
+        if name == "post-test":
+            return f.post_test(args["pid"], payload)
+        if name == "locations":
+            return 200, {"status": "OK", "data": f.locations.get(args["pid"], [])}
+        if name == "post-location":
+            return f.post_location(args["pid"], payload)
+        if name == "subcomponents":
+            return 200, {"status": "OK", "data": f.subs.get(args["pid"], [])}
+        if name == "patch-subcomponents":
+            return f.patch_subcomponents(args["pid"], payload)
+        if name == "container":
+            return f.container(args["pid"])
+        if name == "status":
+            item = f.items.get(args["pid"]) or {}
+            return 200, {"status": "OK", "data": {"status": item.get("status"),
+                                                  "enabled": item.get("enabled")}}
+        if name == "images":
+            return 200, {"status": "OK", "data": f.images.get(args["pid"], [])}
+        if name == "image":
+            return 200, _PNG
+        if name == "whoami":
+            return 200, {"status": "OK", "data": {"username": "fake", "full_name": "Fake User"}}
+        if name == "roles":
+            return 200, {"status": "OK", "data": []}
+        if name == "institutions":
+            return 200, {"status": "OK", "data": [{"id": 7, "name": "BNL"}]}
+        return 200, {"status": "OK", "data": "Accepted"}   # generic writes
+
+    def handler_class(self):
+        app = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"      # keep-alive, like HWDB's front end
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out as two writes; without this, Nagle
+                # plus the client's delayed ACK adds ~40 ms to every response.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with app._lock:
+                    app.stats["connections"] += 1
+
+            def log_message(self, fmt, *args):
+                logger.debug("fake_hwdb: " + fmt, *args)
+
+            def _send(self, status, body, ctype="application/json"):
+                data = body if isinstance(body, bytes) else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "image/png" if isinstance(body, bytes)
+                                 else ctype)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _handle(self, method):
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if parts.path == "/_fake/stats":
+                    return self._send(200, app.stats)
+                hit = app.route(method, parts.path)
+                if hit is None:
+                    return self._send(404, {"status": "ERROR",
+                                            "data": f"no fake route for {method} {parts.path}"})
+                name, args = hit
+                app._count("requests", name)
+                delay, fault = app.faults.draw(name)
+                if fault == "timeout":
+                    app._count("faults", "timeout")
+                    time.sleep(app.faults.timeout_s)
+                    self.close_connection = True
+                    return
+                time.sleep(delay)
+                if fault:
+                    app._count("faults", fault)
+                    return self._send(int(fault), {"status": "ERROR",
+                                                   "data": f"injected {fault}"})
+                payload = None
+                if raw and "json" in (self.headers.get("Content-Type") or ""):
+                    try:
+                        payload = json.loads(raw)
+                    except ValueError:
+                        return self._send(400, {"status": "ERROR", "data": "bad JSON"})
+                query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+                status, body = app.respond(name, args, query, payload)
+                self._send(status, body)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def do_PATCH(self):
+                self._handle("PATCH")
+
+        return Handler
+
+    def make_server(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """A threaded server (not yet serving); ``port=0`` picks a free one."""
+        server = ThreadingHTTPServer((host, port), self.handler_class())
+        server.daemon_threads = True
+        return server
+
+
+def parse_types(spec: str) -> list[tuple[str, int]]:
+    """``"D05700200001:500,D05700300001:2000"`` → ``[(ptid, n), …]``."""
+    out = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        ptid, _, n = part.partition(":")
+        if not re.fullmatch(r"[A-Z]\d{11}", ptid):
+            raise ValueError(f"not a part type id: {ptid!r}")
+        out.append((ptid, int(n or 100)))
+    return out
@@ -1,10 +1,13 @@
-"""Per-request bearer minting from the session's vault token (issue #11).
+"""Bearer minting from the session's vault token (issue #11, ADR-0019).
 
-We don't cache bearers: each request that talks to hwdb mints a fresh
-~10h bearer from the user's encrypted vault token in the session. Mint cost
-is one HTTPS round-trip to vault (~50-150ms); within a request the caller
-mints once and reuses the bearer for every hwdb call (so a bulk insert of N
-records is 1 mint, N inserts).
+A minted ~10h bearer is cached in the session — AES-GCM encrypted like the
+vault token, under ``BEARER_KEY`` — until ``REFRESH_AHEAD`` before its JWT
+``exp``, so most requests skip the vault round-trip (~50-150ms) entirely.
+The cache is dropped on relink (``session.store_link``) and whenever HWDB
+answers 401 to it (``reject``, called by the API client); the next
+``mint_for`` then mints afresh. Within a request the caller mints once and
+reuses the bearer for every hwdb call (so a bulk insert of N records is 1
+mint, N inserts).
 
 Two failure modes, mapped to the Q9 surface by the @with_fnal_bearer
 decorator:
@@ -16,17 +19,30 @@ decorator:
 from __future__ import annotations
 
 import base64
+import hashlib
 import logging
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
 
 import requests
 from django.utils import timezone
 
+from .. import metrics
 from . import crypto, flow
-from .session import LINK_KEY
+from .session import BEARER_KEY, LINK_KEY
 
 logger = logging.getLogger(__name__)
 
+# Re-mint this long before a cached bearer's ``exp``, so a bearer handed to a
+# sync or upload doesn't lapse mid-way.
+REFRESH_AHEAD = timedelta(minutes=10)
+
+# Digests of bearers HWDB answered 401 to. Per process: another worker may
+# still try its session copy once, get its own 401 and drop it the same way.
+_REJECTED: set[str] = set()
+_REJECTED_MAX = 1024
+_REJECTED_LOCK = threading.Lock()
+
 
 class FnalLinkRequired(Exception):
     """The session has no usable vault token; the user must (re)link."""
@@ -36,13 +52,70 @@ class FnalUnavailable(Exception):
     """Vault/mint failed transiently; re-linking won't help."""
 
 
+def _digest(bearer: str) -> str:
+    return hashlib.sha256(bearer.encode()).hexdigest()
+
+
+def reject(bearer: str) -> None:
+    """Mark ``bearer`` as refused by HWDB (a 401) so no session reuses it."""
+    with _REJECTED_LOCK:
+        if len(_REJECTED) >= _REJECTED_MAX:
+            _REJECTED.clear()
+        _REJECTED.add(_digest(bearer))
+
+
+def forget(request) -> None:
+    """Drop the session's cached bearer; the next ``mint_for`` mints."""
+    request.session.pop(BEARER_KEY, None)
+
+
+def _cached(request) -> str | None:
+    entry = request.session.get(BEARER_KEY)
+    if not entry:
+        return None
+    try:
+        if datetime.fromisoformat(entry["expires_at"]) - REFRESH_AHEAD <= timezone.now():
+            raise ValueError("due for refresh")
+        bearer = crypto.decrypt(
+            base64.b64decode(entry["ct"]), base64.b64decode(entry["nonce"]),
+        ).decode()
+    except Exception:
+        forget(request)
+        return None
+    if _digest(bearer) in _REJECTED:
+        forget(request)
+        return None
+    return bearer
+
+
+def _remember(request, bearer: str) -> None:
+    """Cache ``bearer`` until its JWT ``exp``; one without a readable
+    ``exp`` isn't cached (it's minted again next request, as before)."""
+    try:
+        exp = datetime.fromtimestamp(int(flow.jwt_claims(bearer)["exp"]), dt_timezone.utc)
+    except Exception:
+        return
+    ciphertext, nonce = crypto.encrypt(bearer.encode())
+    request.session[BEARER_KEY] = {
+        "ct": base64.b64encode(ciphertext).decode(),
+        "nonce": base64.b64encode(nonce).decode(),
+        "expires_at": exp.isoformat(),
+    }
+
+
 def mint_for(request) -> str:
-    """Decrypt the session vault token and mint a fresh bearer."""
+    """The session's bearer: the cached one while it's fresh, else a fresh
+    mint from the decrypted vault token (then cached)."""
     data = request.session.get(LINK_KEY)
     if not data:
         raise FnalLinkRequired("no FNAL link in session")
     if datetime.fromisoformat(data["vault_expires_at"]) <= timezone.now():
+        forget(request)
         raise FnalLinkRequired("vault token expired")
+    bearer = _cached(request)
+    if bearer:
+        metrics.inc("fnal_bearer_total", result="cached")
+        return bearer
 
     try:
         vault_token = crypto.decrypt(
@@ -54,8 +127,9 @@ def mint_for(request) -> str:
         raise FnalLinkRequired("vault token unreadable")
 
     try:
-        return flow.mint_bearer(vault_token, data["credkey"])
+        bearer = flow.mint_bearer(vault_token, data["credkey"])
     except requests.HTTPError as e:
+        metrics.inc("fnal_bearer_total", result="failed")
         status = e.response.status_code if e.response is not None else None
         if status in (401, 403):
             logger.warning("FNAL bearer mint rejected (%s); relink", status)
@@ -63,5 +137,9 @@ def mint_for(request) -> str:
         logger.warning("FNAL bearer mint failed (HTTP %s)", status)
         raise FnalUnavailable("could not mint bearer")
     except Exception as e:
+        metrics.inc("fnal_bearer_total", result="failed")
         logger.warning("FNAL bearer mint error: %s", e)
         raise FnalUnavailable("could not mint bearer")
+    metrics.inc("fnal_bearer_total", result="minted")
+    _remember(request, bearer)
+    return bearer
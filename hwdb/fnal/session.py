@@ -5,11 +5,13 @@ several people with different FNAL identities, so a per-User row would let
 concurrent guests mint bearers as each other. Each browser session holds its
 own encrypted vault token instead. No model, no migration.
 
-Two keys:
+Three keys:
 - ``FLOW_KEY``  — the in-progress device flow (poll_body + expiry + next),
   present only between starting a link and completing it.
 - ``LINK_KEY``  — the completed link: the encrypted vault token, credkey, and
   vault-token expiry. Read per-request by ``bearer.mint_for`` (issue #11).
+- ``BEARER_KEY`` — the last minted bearer, encrypted, with its JWT expiry
+  (``bearer.mint_for``'s cache, ADR-0019). Dropped whenever the link changes.
 
 Binary ciphertext/nonce are base64'd because the session uses the JSON
 serializer.
@@ -26,6 +28,7 @@ from . import crypto, flow
 
 FLOW_KEY = "fnal_link_flow"
 LINK_KEY = "fnal_link"
+BEARER_KEY = "fnal_bearer"
 
 
 def set_flow(
@@ -64,3 +67,4 @@ def store_link(request, login: flow.LoginResult) -> None:
         "credkey": login.credkey,
         "vault_expires_at": expires_at.isoformat(),
     }
+    request.session.pop(BEARER_KEY, None)  # minted from the old vault token
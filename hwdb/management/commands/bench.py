@@ -0,0 +1,139 @@
+"""Time the sync, upload, chart and navigation hot paths (``hwdb.bench``).
+
+Runs in a throwaway test database, against an in-process fake HWDB, and
+writes JSON — per scenario the repetitions, items handled, mean/min/p50/
+p90/p99 in ms and items per second at the median:
+
+    python manage.py bench --out bench.json
+    python manage.py bench sync_family sync_test_events --sizes 1000,10000,50000
+    python manage.py bench --compare baseline.json --threshold 0.2
+
+``--compare`` prints the median against the baseline's for every shared
+scenario and fails (exit 1) if any grew by more than the threshold. The
+large sizes take minutes — they're opt-in; ``--latency`` adds a simulated
+HWDB round trip (ms) to every fake request.
+
+``--explain`` adds the query plan of every mirror read in ``bench.PLANS``
+to the run (``"plans"``), over a seeded mirror of ``--plan-rows`` items per
+type; against a baseline that has plans too, every plan that changed is
+printed before and after, with its scans and sorts:
+
+    python manage.py bench --explain sync_test_events --out after.json \
+        --compare before.json
+"""
+import json
+import platform
+import subprocess
+import sys
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from hwdb import bench
+
+
+class Command(BaseCommand):
+    help = "Benchmark the hot paths against a fake HWDB; optionally compare to a baseline."
+
+    def add_arguments(self, parser):
+        parser.add_argument("scenarios", nargs="*",
+                            help="Scenario names (default: all; see --list).")
+        parser.add_argument("--sizes", default="1000",
+                            help="Item counts for the sized scenarios (default: 1000).")
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--warmup", type=int, default=1)
+        parser.add_argument("--latency", type=float, default=0.0,
+                            help="Fake HWDB latency per request, ms (default: 0).")
+        parser.add_argument("--workers", type=int, default=None,
+                            help="Thread-pool size for the sync/upload engines "
+                                 "(default: each engine's own).")
+        parser.add_argument("--out", default="", help="Write the JSON here (default: stdout).")
+        parser.add_argument("--compare", default="", metavar="BASELINE",
+                            help="A previous run's JSON to compare against.")
+        parser.add_argument("--threshold", type=float, default=0.2,
+                            help="Allowed median growth before failing (default: 0.2 = 20%%).")
+        parser.add_argument("--explain", action="store_true",
+                            help="Also record the query plans of the mirror reads.")
+        parser.add_argument("--plan-rows", type=int, default=2000,
+                            help="Items per type in the mirror --explain seeds (default: 2000).")
+        parser.add_argument("--list", action="store_true")
+
+    def handle(self, *args, **opts):
+        if opts["list"]:
+            for sc in bench.SCENARIOS.values():
+                self.stdout.write(f"{sc.name}{'  (sized)' if sc.sized else ''}")
+            return
+        names = opts["scenarios"] or list(bench.SCENARIOS)
+        unknown = [n for n in names if n not in bench.SCENARIOS]
+        if unknown:
+            raise CommandError(f"unknown scenario(s): {', '.join(unknown)} — see --list")
+        try:
+            sizes = [int(s) for s in opts["sizes"].split(",") if s.strip()]
+        except ValueError:
+            raise CommandError(f"--sizes must be integers, got {opts['sizes']!r}")
+        baseline = None
+        if opts["compare"]:
+            try:
+                with open(opts["compare"]) as f:
+                    saved = json.load(f)
+                baseline, baseline_plans = saved["results"], saved.get("plans", {})
+            except (OSError, ValueError, KeyError) as e:
+                raise CommandError(f"can't read baseline {opts['compare']}: {e}")
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True,
+                                                      serialize=False)
+        try:
+            results = bench.run(
+                names, sizes, repeat=opts["repeat"], warmup=opts["warmup"],
+                latency_ms=opts["latency"], workers=opts["workers"],
+                progress=lambda key: self.stderr.write(f"bench: {key}"))
+            # Last: the seeded mirror would otherwise sit under the scenarios.
+            plans = bench.explain(size=opts["plan_rows"]) if opts["explain"] else None
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = {"meta": self._meta(opts, sizes), "results": results}
+        if plans is not None:
+            report["plans"] = plans
+        text = json.dumps(report, indent=2)
+        if opts["out"]:
+            with open(opts["out"], "w") as f:
+                f.write(text + "\n")
+        else:
+            self.stdout.write(text)
+
+        if baseline is not None and plans is not None:
+            for p in bench.compare_plans(plans, baseline_plans):
+                self.stderr.write(f"plan {p['name']} changed: {p['problems_before'] or 'ok'} → "
+                                  f"{p['problems_after'] or 'ok'}\n"
+                                  f"  before: {p['before']}\n  after:  {p['after']}")
+        if baseline is not None:
+            rows = bench.compare(results, baseline, threshold=opts["threshold"])
+            for r in rows:
+                flag = "REGRESSED" if r["regressed"] else "ok"
+                self.stderr.write(f"{r['key']:<36} {r['base_ms']:>10.1f} → "
+                                  f"{r['cur_ms']:>10.1f} ms  ×{r['ratio']:<6} {flag}")
+            bad = [r["key"] for r in rows if r["regressed"]]
+            if bad:
+                raise CommandError(f"{len(bad)} scenario(s) regressed past "
+                                   f"{opts['threshold']:.0%}: {', '.join(bad)}")
+
+    @staticmethod
+    def _meta(opts, sizes) -> dict:
+        try:
+            commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                    capture_output=True, text=True, cwd=settings.BASE_DIR,
+                                    timeout=10).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            commit = ""
+        return {"commit": commit, "at": timezone.now().isoformat(timespec="seconds"),
+                "python": sys.version.split()[0], "django": django.get_version(),
+                "platform": platform.platform(), "database": connection.vendor,
+                "sizes": sizes, "repeat": opts["repeat"], "warmup": opts["warmup"],
+                "latency_ms": opts["latency"]}
@@ -0,0 +1,53 @@
+"""Stream a mirror or QC table to a file (or stdout) as CSV or NDJSON
+(``hwdb.export``):
+
+    python manage.py export test_events --format ndjson --gzip \\
+        --part-type D05700200001 --since 2026-01-01 --out test_events.ndjson.gz
+    python manage.py export femb_tests > femb_tests.csv
+
+Rows are read in chunks and written as they arrive, so a million-row table
+needs no more memory than a small one.
+"""
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hwdb import export
+
+
+class Command(BaseCommand):
+    help = "Export a mirror/QC table as CSV or NDJSON (streamed)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("table", nargs="?", choices=sorted(export.EXPORTS))
+        parser.add_argument("--format", default="csv", choices=sorted(export.FORMATS))
+        parser.add_argument("--gzip", action="store_true")
+        parser.add_argument("--instance", default="prod",
+                            help="HWDB instance of the mirror tables (default: prod).")
+        parser.add_argument("--part-type", default="")
+        parser.add_argument("--since", default="", help="Date or datetime (inclusive).")
+        parser.add_argument("--until", default="", help="Date or datetime (inclusive).")
+        parser.add_argument("--out", default="", help="File to write (default: stdout).")
+        parser.add_argument("--list", action="store_true", help="List the tables.")
+
+    def handle(self, *args, **opts):
+        if opts["list"] or not opts["table"]:
+            for name, spec in export.EXPORTS.items():
+                self.stdout.write(f"{name:<18} {spec.model._meta.label}")
+            return
+        try:
+            blocks = export.stream(
+                opts["table"], opts["format"], gzip=opts["gzip"],
+                instance=opts["instance"], part_type=opts["part_type"],
+                since=opts["since"], until=opts["until"])
+        except export.ExportError as e:
+            raise CommandError(str(e)) from e
+        if opts["out"]:
+            with open(opts["out"], "wb") as f:
+                for block in blocks:
+                    f.write(block)
+        else:
+            out = sys.stdout.buffer
+            for block in blocks:
+                out.write(block)
+            out.flush()
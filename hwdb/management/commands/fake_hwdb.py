@@ -0,0 +1,79 @@
+"""Serve a synthetic HWDB over HTTP for offline load testing (``hwdb.fake``).
+
+Point the app (or a sync command) at it with ``HWDB_API_OVERRIDE``; any
+bearer is accepted:
+
+    python manage.py fake_hwdb --types D05700200001:2000,D05700300001:500 \\
+        --boxes 20 --latency 40,list=250 --jitter 10 --rate-503 tests=0.02
+    HWDB_API_OVERRIDE=http://127.0.0.1:8765/api/v1 \\
+        python manage.py resync_components --bearer x --instance dev
+
+Fault flags take ``endpoint=value`` lists (a bare value applies to every
+endpoint); the endpoint names are listed by ``--list-endpoints``. Counts of
+requests, injected faults and TCP connections are at ``/_fake/stats`` and
+printed on exit.
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hwdb.fake import ROUTES, FakeHwdb, Faults, Fleet, parse_types
+
+
+class Command(BaseCommand):
+    help = "Run a fake HWDB REST server with a synthetic fleet and injected faults."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--prefix", default="/api/v1",
+                            help="API base path (default: /api/v1).")
+        parser.add_argument(
+            "--types", default="D05700200001:500,D05700300001:200",
+            help="Fleet as part_type_id:count,… (default: two types).")
+        parser.add_argument("--tests-per-item", type=int, default=3)
+        parser.add_argument("--boxes", type=int, default=0,
+                            help="Shipping boxes holding items of the first type.")
+        parser.add_argument("--box-slots", type=int, default=8)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--latency", default="", help="ms, e.g. 40,list=250")
+        parser.add_argument("--jitter", default="", help="± ms, same syntax")
+        parser.add_argument("--rate-429", default="", help="0..1, same syntax")
+        parser.add_argument("--rate-503", default="", help="0..1, same syntax")
+        parser.add_argument("--rate-timeout", default="", help="0..1, same syntax")
+        parser.add_argument("--timeout-seconds", type=float, default=30.0,
+                            help="How long a timed-out request is held (default: 30).")
+        parser.add_argument("--list-endpoints", action="store_true")
+
+    def handle(self, *args, **opts):
+        if opts["list_endpoints"]:
+            for name in sorted({n for n, _m, _p in ROUTES}):
+                self.stdout.write(name)
+            return
+        faults = Faults(timeout_s=opts["timeout_seconds"], seed=opts["seed"])
+        try:
+            for field, flag in (("latency_ms", "latency"), ("jitter_ms", "jitter"),
+                                ("rate_429", "rate_429"), ("rate_503", "rate_503"),
+                                ("rate_timeout", "rate_timeout")):
+                faults.set(field, opts[flag])
+            types = parse_types(opts["types"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        fleet = Fleet(types, tests_per_item=opts["tests_per_item"],
+                      n_boxes=opts["boxes"], box_slots=opts["box_slots"],
+                      seed=opts["seed"])
+        app = FakeHwdb(fleet, faults, prefix=opts["prefix"])
+        server = app.make_server(opts["host"], opts["port"])
+        host, port = server.server_address[:2]
+        self.stdout.write(
+            f"fake HWDB: {len(fleet.items)} items in {len(fleet.types)} types at "
+            f"http://{host}:{port}{app.prefix}\n"
+            f"  HWDB_API_OVERRIDE=http://{host}:{port}{app.prefix}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(json.dumps(app.stats, indent=2))
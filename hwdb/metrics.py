@@ -0,0 +1,366 @@
+"""Operational metrics in the Prometheus text format, served at ``/metrics``.
+
+What's measured (``METRICS`` lists every series with its labels):
+
+- HWDB traffic — latency per endpoint template and instance, responses by
+  status class (429 counted apart from the other 4xx), calls in flight;
+- sync engines — run time, items and items/s of the latest run, per engine;
+- uploads — chips ok/failed, per run and in total;
+- FNAL bearers — cached reuse vs. fresh mint vs. failure;
+- caches — hits and misses of the tree, image, ES PDF and ES plot caches;
+- views — DB queries, HWDB calls and time per request.
+
+Every gunicorn worker keeps its own values in memory and writes them to
+``METRICS_DIR/<pid>.json`` (at most every ``FLUSH_SECONDS``, and before a
+scrape); a scrape merges every worker's file. Counters and histograms of a
+worker that has exited stay in the sum, so a recycled worker doesn't make
+them drop; in-flight gauges count live workers only. Empty the directory
+when the service restarts.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+FLUSH_SECONDS = 5
+
+_LATENCY = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+_SYNC = (1, 5, 15, 60, 300, 900, 3600, 4 * 3600)
+_COUNT = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+_CHIPS = (1, 10, 50, 100, 250, 500, 1000)
+_VIEW = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+@dataclass(frozen=True)
+class Metric:
+    name: str
+    kind: str            # counter | gauge | histogram
+    help: str
+    labels: tuple = ()
+    buckets: tuple = ()
+    # Gauges across workers: "livesum" adds up the live workers' values,
+    # "latest" keeps the most recently set one.
+    merge: str = "livesum"
+
+
+METRICS = {m.name: m for m in [
+    Metric("hwdb_request_duration_seconds", "histogram",
+           "HWDB call latency (time to response headers).",
+           ("instance", "endpoint", "method"), _LATENCY),
+    Metric("hwdb_responses_total", "counter",
+           "HWDB responses by status class (2xx, 3xx, 4xx, 429, 5xx; error = no response).",
+           ("instance", "endpoint", "status")),
+    Metric("hwdb_in_flight_requests", "gauge",
+           "HWDB calls waiting on a response.", ("instance",)),
+    Metric("sync_duration_seconds", "histogram",
+           "Sync engine run time, by outcome (ok, error, aborted).",
+           ("engine", "outcome"), _SYNC),
+    Metric("sync_items_total", "counter",
+           "Items processed by the sync engines.", ("engine",)),
+    Metric("sync_last_items_per_second", "gauge",
+           "Throughput of the engine's latest finished run.", ("engine",), merge="latest"),
+    Metric("upload_chips_total", "counter",
+           "Chips through a batch upload, by result.", ("outcome",)),
+    Metric("upload_run_chips", "histogram",
+           "Chips per batch upload run, by result.", ("outcome",), _CHIPS),
+    Metric("fnal_bearer_total", "counter",
+           "Bearers handed out: cached (reused), minted, or failed.", ("result",)),
+    Metric("cache_requests_total", "counter",
+           "Cache lookups by cache and result (hit, miss).", ("cache", "result")),
+    Metric("view_db_queries", "histogram",
+           "Database queries per request, by view.", ("view",), _COUNT),
+    Metric("view_hwdb_calls", "histogram",
+           "HWDB calls per request, by view.", ("view",), _COUNT),
+    Metric("view_duration_seconds", "histogram",
+           "Request time until the response is returned, by view.", ("view",), _VIEW),
+]}
+
+
+# ---- This process's values -----------------------------------------------
+
+_lock = threading.Lock()
+# name → {label values: counter float | [gauge value, set-at] | histogram
+# [per-bucket counts…, +Inf count, sum]}
+_values: dict[str, dict[tuple, object]] = {}
+_dirty = False
+_flusher: threading.Thread | None = None
+
+
+def _key(metric: Metric, labels: dict) -> tuple:
+    if set(labels) != set(metric.labels):
+        raise ValueError(f"{metric.name} takes labels {metric.labels}, got {sorted(labels)}")
+    return tuple(str(labels[n]) for n in metric.labels)
+
+
+def _touch() -> None:
+    global _dirty, _flusher
+    _dirty = True
+    if _flusher is None and settings.METRICS_DIR:
+        _flusher = threading.Thread(target=_flush_loop, name="metrics-flush", daemon=True)
+        _flusher.start()
+
+
+def inc(name: str, by: float = 1, **labels) -> None:
+    m = METRICS[name]
+    key = _key(m, labels)
+    with _lock:
+        series = _values.setdefault(name, {})
+        series[key] = series.get(key, 0) + by
+        _touch()
+
+
+def gauge_add(name: str, delta: float, **labels) -> None:
+    m = METRICS[name]
+    key = _key(m, labels)
+    with _lock:
+        series = _values.setdefault(name, {})
+        value = series.get(key, [0, 0])[0] + delta
+        series[key] = [value, time.time()]
+        _touch()
+
+
+def gauge_set(name: str, value: float, **labels) -> None:
+    m = METRICS[name]
+    key = _key(m, labels)
+    with _lock:
+        _values.setdefault(name, {})[key] = [value, time.time()]
+        _touch()
+
+
+def observe(name: str, value: float, **labels) -> None:
+    m = METRICS[name]
+    key = _key(m, labels)
+    with _lock:
+        series = _values.setdefault(name, {})
+        h = series.get(key)
+        if h is None:
+            h = series[key] = [0] * (len(m.buckets) + 1) + [0.0]
+        # Stored per bucket (not cumulative); rendering accumulates.
+        i = next((i for i, b in enumerate(m.buckets) if value <= b), len(m.buckets))
+        h[i] += 1
+        h[-1] += value
+        _touch()
+
+
+def reset() -> None:
+    """Forget this process's values (tests)."""
+    global _dirty
+    with _lock:
+        _values.clear()
+        _dirty = False
+
+
+# ---- Instrumentation helpers ---------------------------------------------
+
+class _JobState(threading.local):
+    job = None
+
+
+_job = _JobState()
+
+
+class _Job:
+    def __init__(self, engine: str):
+        self.engine = engine
+        self.items = 0
+        self.started = time.monotonic()
+
+
+def sync_job(engine: str):
+    """Decorate a sync engine (a generator function): its run time and
+    outcome are recorded when the generator finishes (ok), raises (error) or
+    is closed early (aborted); inside it, ``sync_items`` counts its items."""
+    def decorate(gen_fn):
+        @wraps(gen_fn)
+        def wrapper(*args, **kwargs):
+            job = _Job(engine)
+            gen = gen_fn(*args, **kwargs)
+            outcome = "error"
+            try:
+                while True:
+                    outer, _job.job = _job.job, job
+                    try:
+                        line = next(gen)
+                    except StopIteration:
+                        outcome = "ok"
+                        return
+                    finally:
+                        _job.job = outer
+                    yield line
+            except GeneratorExit:
+                outcome = "aborted"
+                gen.close()
+                raise
+            finally:
+                seconds = time.monotonic() - job.started
+                observe("sync_duration_seconds", seconds, engine=engine, outcome=outcome)
+                if job.items:
+                    inc("sync_items_total", job.items, engine=engine)
+                if outcome == "ok" and seconds > 0:
+                    gauge_set("sync_last_items_per_second", round(job.items / seconds, 3),
+                              engine=engine)
+        return wrapper
+    return decorate
+
+
+def sync_items(n: int) -> None:
+    """Add ``n`` processed items to the running sync (no-op outside one)."""
+    if _job.job is not None:
+        _job.job.items += n
+
+
+def cache_lookup(cache: str, hit: bool, n: int = 1) -> None:
+    if n:
+        inc("cache_requests_total", n, cache=cache, result="hit" if hit else "miss")
+
+
+def status_class(status: int) -> str:
+    if status == 429:
+        return "429"
+    return f"{status // 100}xx" if status else "error"
+
+
+# ---- Sharing across workers ----------------------------------------------
+
+def _snapshot() -> dict:
+    with _lock:
+        return {name: [[list(k), v] for k, v in series.items()]
+                for name, series in _values.items()}
+
+
+def flush() -> None:
+    """Write this process's values to its file under ``METRICS_DIR``."""
+    global _dirty
+    root = settings.METRICS_DIR
+    if not root:
+        return
+    root = Path(root)
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({"pid": os.getpid(), "values": _snapshot()})
+        fd, tmp = tempfile.mkstemp(dir=root, prefix=".tmp-")
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+        os.replace(tmp, root / f"{os.getpid()}.json")
+        _dirty = False
+    except OSError as e:
+        logger.warning("metrics: flush to %s failed: %s", root, e)
+
+
+def _flush_loop() -> None:
+    while True:
+        time.sleep(FLUSH_SECONDS)
+        if _dirty:
+            flush()
+
+
+atexit.register(lambda: _dirty and flush())
+
+
+def _alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _sources() -> list[tuple[bool, dict]]:
+    """``(alive, values)`` per worker: every file in ``METRICS_DIR`` (this
+    process's freshly written), or just this process when there's no dir."""
+    if not settings.METRICS_DIR:
+        return [(True, _snapshot())]
+    flush()
+    out = []
+    for path in sorted(Path(settings.METRICS_DIR).glob("*.json")):
+        try:
+            doc = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        out.append((_alive(int(doc.get("pid") or 0)), doc.get("values") or {}))
+    return out
+
+
+def collect() -> dict[str, dict[tuple, object]]:
+    """Every worker's values merged, in the in-memory shape."""
+    merged: dict[str, dict[tuple, object]] = {}
+    for alive, values in _sources():
+        for name, rows in values.items():
+            m = METRICS.get(name)
+            if m is None:
+                continue
+            series = merged.setdefault(name, {})
+            for labels, v in rows:
+                key = tuple(labels)
+                if m.kind == "counter":
+                    series[key] = series.get(key, 0) + v
+                elif m.kind == "histogram":
+                    old = series.get(key)
+                    series[key] = v if old is None else [a + b for a, b in zip(old, v)]
+                elif m.merge == "latest":
+                    if key not in series or v[1] > series[key][1]:
+                        series[key] = v
+                elif alive:
+                    old = series.get(key, [0, 0])
+                    series[key] = [old[0] + v[0], max(old[1], v[1])]
+    return merged
+
+
+# ---- Exposition ----------------------------------------------------------
+
+def _esc(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values, extra: str = "") -> str:
+    parts = [f'{n}="{_esc(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _num(v: float) -> str:
+    if v == math.inf:
+        return "+Inf"
+    return repr(float(v)) if isinstance(v, float) and not v.is_integer() else str(int(v))
+
+
+def render(merged: dict | None = None) -> str:
+    """The Prometheus text exposition (format 0.0.4) of ``collect()``."""
+    merged = collect() if merged is None else merged
+    lines = []
+    for name, m in METRICS.items():
+        lines.append(f"# HELP {name} {m.help}")
+        lines.append(f"# TYPE {name} {m.kind}")
+        for key, v in sorted(merged.get(name, {}).items()):
+            if m.kind == "counter":
+                lines.append(f"{name}{_labels(m.labels, key)} {_num(v)}")
+            elif m.kind == "gauge":
+                lines.append(f"{name}{_labels(m.labels, key)} {_num(v[0])}")
+            else:
+                running = 0
+                for bound, n in zip(m.buckets + (math.inf,), v[:-1]):
+                    running += n
+                    le = 'le="' + _num(bound) + '"'
+                    lines.append(f"{name}_bucket{_labels(m.labels, key, le)} {running}")
+                lines.append(f"{name}_sum{_labels(m.labels, key)} {_num(v[-1])}")
+                lines.append(f"{name}_count{_labels(m.labels, key)} {running}")
+    return "\n".join(lines) + "\n"
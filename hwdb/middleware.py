@@ -0,0 +1,150 @@
+"""Per-request accounting: HWDB calls (``hwdb.calls``) and view metrics.
+
+``HwdbCallsMiddleware`` opens a call collector around each request and
+reports what it gathered: a ``Server-Timing`` header (the total, then the
+costliest endpoints — the browser's network panel shows them against the
+request), and with
+``HWDB_CALL_FOOTER`` a footer on full HTML pages listing every endpoint hit
+plus the recent slow-call log. A streamed response's body runs after the
+header has gone out, so its calls only reach the log and slow-call check.
+
+``ViewMetricsMiddleware`` feeds ``hwdb.metrics`` the DB queries, HWDB calls
+and time of each request, labelled by view name.
+
+``QueryProfileMiddleware`` profiles a request's queries by shape when asked
+to (``hwdb.profiler``).
+"""
+
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.template.loader import render_to_string
+
+from . import calls, metrics, profiler
+
+# Server-Timing entries past the total; the rest are summed into the total only.
+SERVER_TIMING_ENDPOINTS = 8
+
+
+def server_timing(collector: calls.Collector) -> str:
+    n = len(collector.calls)
+    parts = [f'hwdb;dur={collector.total_ms:.1f};desc="{n} HWDB call{"" if n == 1 else "s"}"']
+    for i, g in enumerate(collector.by_endpoint()[:SERVER_TIMING_ENDPOINTS]):
+        parts.append(f'hwdb{i};dur={g["ms"]:.1f};desc="{g["method"]} {g["endpoint"]} ×{g["n"]}"')
+    return ", ".join(parts)
+
+
+class HwdbCallsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with calls.collecting() as collector:
+            request.hwdb_calls = collector
+            response = self.get_response(request)
+        if collector.calls:
+            timing = server_timing(collector)
+            if response.has_header("Server-Timing"):
+                timing = f"{response['Server-Timing']}, {timing}"
+            response["Server-Timing"] = timing
+        if settings.HWDB_CALL_FOOTER:
+            self._footer(request, response, collector)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        rm = request.resolver_match
+        request.hwdb_calls.view = rm.view_name if rm else view_func.__name__
+
+    @staticmethod
+    def _footer(request, response, collector):
+        if (getattr(response, "streaming", False)
+                or not response.get("Content-Type", "").startswith("text/html")
+                or getattr(request, "htmx", False)):
+            return
+        content = response.content
+        at = content.rfind(b"</body>")
+        if at < 0:
+            return
+        html = render_to_string("hwdb/_calls_footer.html", {
+            "collector": collector, "groups": collector.by_endpoint(),
+            "slow": calls.slow_calls()[:10], "slow_ms": settings.HWDB_SLOW_CALL_MS,
+        }).encode()
+        response.content = content[:at] + html + content[at:]
+        if response.has_header("Content-Length"):
+            response["Content-Length"] = str(len(response.content))
+
+
+class ViewMetricsMiddleware:
+    """Inside ``HwdbCallsMiddleware`` (it reads the request's collector).
+    Queries are counted on this thread's connection only."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = 0
+
+        def count(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        started = time.monotonic()
+        with connection.execute_wrapper(count):
+            response = self.get_response(request)
+        view = getattr(request, "metrics_view", "") or "unresolved"
+        metrics.observe("view_duration_seconds", time.monotonic() - started, view=view)
+        metrics.observe("view_db_queries", queries, view=view)
+        collector = getattr(request, "hwdb_calls", None)
+        if collector is not None:
+            metrics.observe("view_hwdb_calls", len(collector.calls), view=view)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        rm = request.resolver_match
+        request.metrics_view = rm.view_name if rm else view_func.__name__
+
+
+class QueryProfileMiddleware:
+    """After ``AuthenticationMiddleware`` (the header toggle is staff-only
+    outside ``DEBUG``), so session and user lookups aren't counted."""
+
+    HEADER = "X-Query-Profile"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not self._wanted(request):
+            return self.get_response(request)
+        with profiler.profiling() as profile:
+            request.query_profile = profile
+            response = self.get_response(request)
+        repeats = profile.repeats()
+        for sql, n, ms in repeats:
+            profiler.logger.warning("%s: %d× (%.1f ms) %s", profile.view, n, ms, sql)
+        response["X-Query-Count"] = str(profile.count)
+        response["X-Query-Repeats"] = str(len(repeats))
+        timing = f'db;dur={profile.ms:.1f};desc="{profile.count} queries"'
+        if response.has_header("Server-Timing"):
+            timing = f"{response['Server-Timing']}, {timing}"
+        response["Server-Timing"] = timing
+        profiler.tally(profile)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = getattr(request, "query_profile", None)
+        if profile is not None:
+            rm = request.resolver_match
+            profile.view = rm.view_name if rm else view_func.__name__
+
+    def _wanted(self, request) -> bool:
+        if settings.QUERY_PROFILE:
+            return True
+        if self.HEADER not in request.headers:
+            return False
+        user = getattr(request, "user", None)
+        return settings.DEBUG or bool(user and user.is_staff)
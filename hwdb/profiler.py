@@ -0,0 +1,170 @@
+"""Query profiling per view: how many queries a request ran, how long they
+took, and which query *shapes* repeated — the N+1 signature (one query per
+row of a loop).
+
+A shape is the SQL with its literals and ``IN (…)`` lists folded, so the
+per-row ``SELECT … WHERE part_type_id = %s`` of a loop all land on one
+shape however the rows differ. ``QueryProfileMiddleware`` profiles a request
+when ``QUERY_PROFILE`` is on, or per request with an ``X-Query-Profile``
+header (staff, or anyone under ``DEBUG``); each profiled request gets
+``X-Query-Count``/``X-Query-Repeats`` headers and a ``db`` Server-Timing
+entry, and shapes run at least ``REPEAT_THRESHOLD`` times are logged on
+``hwdb.profiler``.
+
+Profiled views are tallied per process, and every
+``QUERY_PROFILE_REPORT_SECONDS`` the worst offenders are written to
+``QUERY_PROFILE_DIR/<pid>.txt``. Tests hold views to a budget with
+``hwdb.testing.QueryBudgetMixin``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger("hwdb.profiler")
+
+# A shape run this many times in one request is reported as a likely N+1.
+REPEAT_THRESHOLD = 3
+# Rows in the periodic report.
+REPORT_ROWS = 20
+
+_IN_LIST = re.compile(r"\bIN \((?:%s|\?)(?:, (?:%s|\?))*\)", re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?\b")
+# Transaction bookkeeping repeats by design (one per atomic block).
+_SKIP = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def shape(sql: str) -> str:
+    """``sql`` with literals as ``?`` and every ``IN (…)`` list as one."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    return _IN_LIST.sub("IN (…)", sql)
+
+
+class Profile:
+    """The queries one block of code ran on this thread's connection."""
+
+    def __init__(self, view: str = ""):
+        self.view = view
+        self.count = 0
+        self.ms = 0.0
+        self.shapes: Counter = Counter()
+        self.shape_ms: Counter = Counter()
+
+    def add(self, sql: str, ms: float) -> None:
+        if sql.lstrip().upper().startswith(_SKIP):
+            return
+        s = shape(sql)
+        self.count += 1
+        self.ms += ms
+        self.shapes[s] += 1
+        self.shape_ms[s] += ms
+
+    def repeats(self, threshold: int = REPEAT_THRESHOLD) -> list[tuple[str, int, float]]:
+        """``(shape, times, ms)`` for each shape run ``threshold``+ times,
+        most frequent first."""
+        return [(s, n, self.shape_ms[s]) for s, n in self.shapes.most_common()
+                if n >= threshold]
+
+
+@contextmanager
+def profiling(view: str = ""):
+    """Profile the queries run inside the block on this thread."""
+    profile = Profile(view)
+
+    def wrapper(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            profile.add(sql, (time.perf_counter() - started) * 1000)
+
+    with connection.execute_wrapper(wrapper):
+        yield profile
+
+
+# ---- Per-view tallies and the periodic report ----------------------------
+
+_lock = threading.Lock()
+_stats: dict[str, dict] = {}
+_since = time.time()
+_last_report = time.monotonic()
+
+
+def tally(profile: Profile) -> None:
+    """Add a finished request's profile to its view's tally (and write the
+    report when it's due)."""
+    global _last_report
+    worst = profile.repeats(1)[:1]
+    with _lock:
+        st = _stats.setdefault(profile.view or "unresolved", {
+            "requests": 0, "queries": 0, "max_queries": 0, "ms": 0.0,
+            "worst_repeat": 0, "worst_shape": ""})
+        st["requests"] += 1
+        st["queries"] += profile.count
+        st["max_queries"] = max(st["max_queries"], profile.count)
+        st["ms"] += profile.ms
+        if worst and worst[0][1] > st["worst_repeat"]:
+            st["worst_repeat"], st["worst_shape"] = worst[0][1], worst[0][0]
+        due = time.monotonic() - _last_report >= settings.QUERY_PROFILE_REPORT_SECONDS
+        if due:
+            _last_report = time.monotonic()
+    if due:
+        write_report()
+
+
+def report(rows: int = REPORT_ROWS) -> list[dict]:
+    """The worst views: most-repeated shape first, then mean queries."""
+    with _lock:
+        out = [{"view": view, **st, "mean_queries": st["queries"] / st["requests"],
+                "mean_ms": st["ms"] / st["requests"]} for view, st in _stats.items()]
+    out.sort(key=lambda r: (-r["worst_repeat"], -r["mean_queries"], r["view"]))
+    return out[:rows]
+
+
+def render_report(rows: int = REPORT_ROWS) -> str:
+    since = datetime.fromtimestamp(_since, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    lines = [f"Query profile, pid {os.getpid()}, {since} – {now} UTC",
+             f"{'view':<40} {'reqs':>6} {'mean q':>7} {'max q':>6} {'mean ms':>8}  worst repeat"]
+    for r in report(rows):
+        worst = f"{r['worst_repeat']}× {r['worst_shape'][:200]}" if r["worst_repeat"] > 1 else "-"
+        lines.append(f"{r['view']:<40} {r['requests']:>6} {r['mean_queries']:>7.1f} "
+                     f"{r['max_queries']:>6} {r['mean_ms']:>8.1f}  {worst}")
+    return "\n".join(lines) + "\n"
+
+
+def write_report() -> Path | None:
+    """Write the report to ``QUERY_PROFILE_DIR/<pid>.txt`` ("" = don't)."""
+    root = settings.QUERY_PROFILE_DIR
+    if not root:
+        return None
+    path = Path(root) / f"{os.getpid()}.txt"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(render_report())
+    except OSError as e:
+        logger.warning("query profile: report to %s failed: %s", path, e)
+        return None
+    return path
+
+
+def reset() -> None:
+    """Forget the tallies (tests)."""
+    global _since, _last_report
+    with _lock:
+        _stats.clear()
+        _since = time.time()
+        _last_report = time.monotonic()
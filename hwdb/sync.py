@@ -22,6 +22,7 @@ from django.utils import timezone
 
 from core.models import LArASIC
 
+from . import metrics
 from .api_client import FnalDbApiClient
 from .models import HwdbChip, HwdbSyncState, LarasicSyncState
 
@@ -198,6 +199,7 @@ def _stamp_larasic_legacy_flags(hwdb_serials: dict) -> Iterator[str]:
     )
 
 
+@metrics.sync_job("sync_family")
 def sync_family(
     family: str,
     *,
@@ -361,6 +363,7 @@ def sync_family(
             yield from _stamp_larasic_legacy_flags(hwdb_serials)
 
         state.chips_total = len(hwdb_serials)
+        metrics.sync_items(len(hwdb_serials))
         state.chips_new = chips_new_total
         state.chips_disappeared = disappeared
         state.finished_at = timezone.now()
@@ -0,0 +1,39 @@
+"""Test helpers: per-view query and HWDB-call budgets.
+
+``assertQueryBudget`` fails a test whose block runs more queries than its
+budget or repeats one query shape ``max_repeats``+ times (an N+1 —
+``hwdb.profiler``), listing the offending shapes::
+
+    class ShipmentsPageTest(QueryBudgetMixin, TestCase):
+        def test_budget(self):
+            with self.assertQueryBudget(8):
+                self.client.get(reverse("explore:shipments"))
+
+Budgets go a little above today's count, so an added query is a choice and
+a per-row one fails at once.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from . import calls, profiler
+
+
+class QueryBudgetMixin:
+    @contextmanager
+    def assertQueryBudget(self, max_queries: int, *,
+                          max_repeats: int = profiler.REPEAT_THRESHOLD,
+                          max_hwdb_calls: int | None = None):
+        with calls.collecting() as collector, profiler.profiling() as profile:
+            yield profile
+        problems = []
+        if profile.count > max_queries:
+            problems.append(f"{profile.count} queries, budget {max_queries}")
+        for sql, n, _ms in profile.repeats(max_repeats):
+            problems.append(f"{n}× {sql}")
+        if max_hwdb_calls is not None and len(collector.calls) > max_hwdb_calls:
+            problems.append(f"{len(collector.calls)} HWDB calls, budget {max_hwdb_calls}")
+        if problems:
+            shapes = "\n".join(f"  {n}× {sql}" for sql, n in profile.shapes.most_common(10))
+            self.fail("Over budget: " + "; ".join(problems) + f"\nTop query shapes:\n{shapes}")
@@ -7,6 +7,8 @@
 from __future__ import annotations
 
 import base64
+import itertools
+import json
 from datetime import timedelta
 from types import SimpleNamespace
 from unittest import mock
@@ -17,9 +19,10 @@ from django.urls import reverse
 from django.utils import timezone
 
 from cets.testutils import make_cets_user
-from hwdb.fnal import crypto
+from hwdb.api_client import FnalDbApiClient
+from hwdb.fnal import bearer, crypto
 from hwdb.fnal.bearer import FnalLinkRequired, FnalUnavailable, mint_for
-from hwdb.fnal.session import LINK_KEY
+from hwdb.fnal.session import BEARER_KEY, LINK_KEY, store_link
 
 
 def _link(token="s.vault-token", credkey="chaoz", expires_in=timedelta(days=28)):
@@ -92,6 +95,71 @@ class MintForTest(TestCase):
                 mint_for(req)
 
 
+_JTI = itertools.count()
+
+
+def _jwt(exp_in=timedelta(hours=10)):
+    body = {"exp": int((timezone.now() + exp_in).timestamp()), "jti": next(_JTI)}
+    seg = base64.urlsafe_b64encode(json.dumps(body).encode()).decode().rstrip("=")
+    return f"eyJhbGciOiJub25lIn0.{seg}.sig"
+
+
+class BearerCacheTest(TestCase):
+    """Minted bearers are cached (encrypted) in the session until shortly
+    before their JWT exp (ADR-0019)."""
+
+    def _mint(self, req, token):
+        with mock.patch("hwdb.fnal.bearer.flow.mint_bearer", return_value=token) as m:
+            got = mint_for(req)
+        return got, m.call_count
+
+    def test_second_request_reuses_cached_bearer(self):
+        token = _jwt()
+        req = _req({LINK_KEY: _link()})
+        self.assertEqual(self._mint(req, token), (token, 1))
+        self.assertNotIn(token, str(req.session[BEARER_KEY]))  # encrypted at rest
+        self.assertEqual(self._mint(req, "unused"), (token, 0))
+
+    def test_bearer_near_expiry_is_reminted(self):
+        req = _req({LINK_KEY: _link()})
+        self._mint(req, _jwt(exp_in=bearer.REFRESH_AHEAD - timedelta(minutes=1)))
+        fresh = _jwt()
+        self.assertEqual(self._mint(req, fresh), (fresh, 1))
+
+    def test_hwdb_401_drops_cached_bearer(self):
+        token = _jwt()
+        req = _req({LINK_KEY: _link()})
+        self._mint(req, token)
+        bearer.reject(token)
+        fresh = _jwt(exp_in=timedelta(hours=9))
+        self.assertEqual(self._mint(req, fresh), (fresh, 1))
+
+    def test_api_client_rejects_bearer_on_401(self):
+        api = FnalDbApiClient("https://hwdb.example", "tok-401")
+        resp = requests.Response()
+        resp.status_code = 401
+        with mock.patch.object(bearer, "reject") as rej:
+            for hook in api.session.hooks["response"]:
+                hook(resp)
+        rej.assert_called_once_with("tok-401")
+
+    def test_relink_and_expired_link_drop_cache(self):
+        req = _req({LINK_KEY: _link()})
+        self._mint(req, _jwt())
+        store_link(req, SimpleNamespace(vault_token="s.new", credkey="chaoz",
+                                        vault_lease_seconds=3600))
+        self.assertNotIn(BEARER_KEY, req.session)
+        self._mint(req, _jwt())
+        req.session[LINK_KEY] = _link(expires_in=timedelta(days=-1))
+        with self.assertRaises(FnalLinkRequired):
+            mint_for(req)
+        self.assertNotIn(BEARER_KEY, req.session)
+
+    def test_non_jwt_bearer_is_not_cached(self):
+        req = _req({LINK_KEY: _link()})
+        self._mint(req, "opaque")
+        self.assertNotIn(BEARER_KEY, req.session)
+
 class WithFnalBearerDecoratorTest(TestCase):
     def setUp(self):
         user = make_cets_user()
@@ -0,0 +1,148 @@
+"""Tests for the benchmark suite (``hwdb.bench`` / ``manage.py bench``): the
+statistics, the baseline comparison, a few scenarios run small, and the
+query plans of the mirror reads.
+
+    python manage.py test hwdb
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+
+from hwdb import bench
+
+
+class StatsTest(SimpleTestCase):
+    def test_percentiles_interpolate(self):
+        values = [4.0, 1.0, 3.0, 2.0]
+        self.assertEqual(bench.percentile(values, 0), 1.0)
+        self.assertEqual(bench.percentile(values, 50), 2.5)
+        self.assertEqual(bench.percentile(values, 100), 4.0)
+        self.assertAlmostEqual(bench.percentile(values, 90), 3.7)
+
+    def test_summary_reports_throughput_at_the_median(self):
+        stats = bench.summarize([0.1, 0.2, 0.3], items=50)
+        self.assertEqual(stats["p50_ms"], 200.0)
+        self.assertEqual(stats["throughput_per_s"], 250.0)
+        self.assertEqual(stats["n"], 3)
+
+    def test_compare_flags_growth_past_threshold_and_floor(self):
+        base = {"a": {"p50_ms": 100.0}, "b": {"p50_ms": 100.0}, "c": {"p50_ms": 0.2},
+                "gone": {"p50_ms": 1.0}}
+        cur = {"a": {"p50_ms": 119.0}, "b": {"p50_ms": 130.0}, "c": {"p50_ms": 0.5},
+               "new": {"p50_ms": 1.0}}
+        rows = {r["key"]: r for r in bench.compare(cur, base, threshold=0.2)}
+        self.assertEqual(set(rows), {"a", "b", "c"})
+        self.assertFalse(rows["a"]["regressed"])
+        self.assertTrue(rows["b"]["regressed"])
+        self.assertFalse(rows["c"]["regressed"])   # ×2.5, but under the noise floor
+
+    def test_sized_scenarios_get_one_key_per_size(self):
+        keys = [k for k, _sc, _n in bench.keys_for(["sync_test_events", "parse_csv"],
+                                                    [10, 20])]
+        self.assertEqual(keys, ["sync_test_events[10]", "sync_test_events[20]", "parse_csv"])
+
+
+class ScenarioTest(TestCase):
+    def test_small_run_of_engine_and_local_scenarios(self):
+        results = bench.run(["sync_test_events", "ranges_for_series", "parse_csv"], [20],
+                            repeat=2, warmup=0)
+        self.assertEqual(set(results), {"sync_test_events[20]", "ranges_for_series[20]",
+                                        "parse_csv"})
+        self.assertEqual(results["sync_test_events[20]"]["items"], 20)
+        self.assertEqual(results["parse_csv"]["items"], bench.TRAY)
+        self.assertTrue(all(r["n"] == 2 and r["p50_ms"] > 0 for r in results.values()))
+
+
+class PlanTest(TestCase):
+    def test_mirror_reads_use_instance_first_indexes(self):
+        plans = bench.explain(size=300)
+        self.assertEqual(set(plans), set(bench.PLANS))
+        for name, plan in plans.items():
+            with self.subTest(name, plan=plan):
+                problems = set(bench.plan_problems(plan)) - set(bench.PLANS[name].allow)
+                self.assertFalse(problems)
+
+    def test_shipments_tab_walks_its_index(self):
+        plan = bench.explain(["shipments_tab"], size=300)["shipments_tab"]
+        self.assertIn("explore_shipmentitem_tab (instance=? AND status=?)", plan)
+
+
+class PlanProblemsTest(SimpleTestCase):
+    def test_reads_sqlite_and_postgres_plans(self):
+        cases = [
+            ("4 0 0 SCAN explore_activityevent USING INDEX x", ["full scan"]),
+            ("3 0 0 SEARCH t USING INDEX x (instance=?)\n"
+             "47 0 0 USE TEMP B-TREE FOR RIGHT PART OF ORDER BY", ["sort", "instance only"]),
+            ("3 0 0 SEARCH t USING INDEX x (instance=? AND part_id=?)", []),
+            ("Limit\n  ->  Sort  (cost=1.1..1.2)\n        ->  Seq Scan on t", ["full scan", "sort"]),
+            ("Index Scan using x on t\n  Index Cond: ((instance)::text = 'prod'::text)",
+             ["instance only"]),
+            ("Index Scan using x on t\n  Index Cond: (((instance)::text = 'prod'::text) "
+             "AND ((part_id)::text = 'P'::text))", []),
+        ]
+        for plan, problems in cases:
+            with self.subTest(plan):
+                self.assertEqual(bench.plan_problems(plan), problems)
+
+    def test_compare_plans_lists_the_changed_ones(self):
+        before = {"a": "SCAN t", "b": "SEARCH t USING INDEX i (instance=? AND x=?)"}
+        after = {"a": "SEARCH t USING INDEX j (instance=? AND y=?)", "b": before["b"]}
+        [row] = bench.compare_plans(after, before)
+        self.assertEqual((row["name"], row["problems_before"], row["problems_after"]),
+                         ("a", ["full scan"], []))
+
+
+class CommandTest(SimpleTestCase):
+    def _call(self, baseline, current, *, base_plans=None, plans=None, **kw):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp, True)
+        (tmp / "base.json").write_text(json.dumps({"results": baseline,
+                                                   "plans": base_plans or {}}))
+        cmd = "hwdb.management.commands.bench"
+        # The suite already runs in a test database — the command's own
+        # set-up is skipped here.
+        with mock.patch("hwdb.bench.run", return_value=current), \
+                mock.patch("hwdb.bench.explain", return_value=plans), \
+                mock.patch(f"{cmd}.setup_test_environment"), \
+                mock.patch(f"{cmd}.teardown_test_environment"), \
+                mock.patch(f"{cmd}.connection", vendor="sqlite"):
+            call_command("bench", "parse_csv", out=str(tmp / "run.json"),
+                         compare=str(tmp / "base.json"), stderr=self.stderr, **kw)
+        return json.loads((tmp / "run.json").read_text())
+
+    def setUp(self):
+        self.stderr = io.StringIO()
+
+    def test_writes_the_run_and_passes_within_threshold(self):
+        report = self._call({"parse_csv": {"p50_ms": 100.0}},
+                            {"parse_csv": {"p50_ms": 110.0}})
+        self.assertEqual(report["results"]["parse_csv"]["p50_ms"], 110.0)
+        self.assertIn("commit", report["meta"])
+
+    def test_explain_records_plans_and_prints_the_changed_ones(self):
+        timing = {"parse_csv": {"p50_ms": 100.0}}
+        report = self._call(timing, timing, explain=True,
+                            base_plans={"box_row": "SCAN explore_shipmentitem"},
+                            plans={"box_row": "SEARCH explore_shipmentitem USING INDEX i "
+                                              "(instance=? AND part_id=?)"})
+        self.assertIn("box_row", report["plans"])
+        self.assertIn("plan box_row changed: ['full scan'] → ok", self.stderr.getvalue())
+
+    def test_regression_fails_the_command(self):
+        with self.assertRaisesMessage(CommandError, "parse_csv"):
+            self._call({"parse_csv": {"p50_ms": 100.0}}, {"parse_csv": {"p50_ms": 150.0}},
+                       threshold=0.2)
+
+    def test_unknown_scenario_is_refused(self):
+        with self.assertRaisesMessage(CommandError, "unknown scenario"):
+            call_command("bench", "nope")
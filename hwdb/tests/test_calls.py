@@ -0,0 +1,112 @@
+"""Tests for HWDB call instrumentation (``hwdb.calls`` + ``HwdbCallsMiddleware``):
+the real client against the fake server, so timing hooks see real responses.
+
+    python manage.py test hwdb
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from hwdb import calls
+from hwdb.api_client import FnalDbApiClient
+from hwdb.fake import FakeHwdb, Faults, Fleet
+from hwdb.middleware import HwdbCallsMiddleware
+
+PTID = "D05700200001"
+PID = f"{PTID}-00001"
+
+
+class CallsTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.app = FakeHwdb(Fleet([(PTID, 3)]), Faults(seed=1))
+        cls.server = cls.app.make_server()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        host, port = cls.server.server_address[:2]
+        cls.url = f"http://{host}:{port}/api/v1"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.app.faults = Faults(seed=1)
+        calls.clear_slow_calls()
+        self.api = FnalDbApiClient(self.url, "tok")
+
+    def test_endpoint_templates(self):
+        self.assertEqual(calls.template(f"components/{PID}/tests/863"),
+                         "components/{part_id}/tests/{id}")
+        self.assertEqual(calls.template(f"/component-types/{PTID}/components"),
+                         "component-types/{part_type_id}/components")
+        self.assertEqual(calls.template("users/whoami"), "users/whoami")
+
+    def test_calls_in_a_context_are_collected_with_their_shape(self):
+        with calls.collecting("explore:part") as collector:
+            self.api.get_component(PID)
+            self.api.get_tests(PID)
+        self.assertEqual([(c.method, c.endpoint) for c in collector.calls],
+                         [("GET", "components/{part_id}"), ("GET", "components/{part_id}/tests")])
+        c = collector.calls[0]
+        self.assertEqual((c.status, c.view, c.retries, c.instance), (200, "explore:part", 0, ""))
+        self.assertGreater(c.bytes, 0)
+        self.assertGreaterEqual(c.ms, 0)
+        self.assertIsNone(calls.current())
+
+    def test_a_repeat_after_failure_counts_as_a_retry(self):
+        self.app.faults.set("rate_503", "component=1")
+        with calls.collecting() as collector:
+            with self.assertRaises(requests.HTTPError):
+                self.api.get_component(PID)
+            self.app.faults = Faults()
+            self.api.get_component(PID)
+        self.assertEqual([(c.status, c.retries) for c in collector.calls], [(503, 0), (200, 1)])
+
+    def test_slow_calls_land_in_the_rolling_log(self):
+        with override_settings(HWDB_SLOW_CALL_MS=0), self.assertLogs("hwdb.calls", "WARNING"):
+            self.api.get_component(PID)
+        self.assertEqual([c.endpoint for c in calls.slow_calls()], ["components/{part_id}"])
+        with override_settings(HWDB_SLOW_CALL_MS=60_000):
+            self.api.get_component(PID)
+        self.assertEqual(len(calls.slow_calls()), 1)
+
+    def test_pools_inherit_the_collector(self):
+        with calls.collecting() as collector:
+            with ThreadPoolExecutor(max_workers=2, initializer=calls.inherit()) as pool:
+                list(pool.map(lambda n: FnalDbApiClient(self.url, "t").get_component(
+                    f"{PTID}-{n:05d}"), [1, 2, 3]))
+        self.assertEqual(len(collector.calls), 3)
+
+    def _through_middleware(self):
+        def view(request):
+            mw.process_view(request, view, (), {})
+            self.api.get_component(PID)
+            self.api.get_component(f"{PTID}-00002")
+            return HttpResponse("<html><body><p>page</p></body></html>")
+        mw = HwdbCallsMiddleware(view)
+        return mw(RequestFactory().get("/hw/"))
+
+    @override_settings(HWDB_CALL_FOOTER=False)
+    def test_middleware_sets_server_timing(self):
+        resp = self._through_middleware()
+        total, first = resp["Server-Timing"].split(", ")
+        self.assertRegex(total, r'^hwdb;dur=[\d.]+;desc="2 HWDB calls"$')
+        self.assertRegex(first, r'^hwdb0;dur=[\d.]+;desc="GET components/\{part_id\} ×2"$')
+        self.assertNotIn(b"hwdb-calls", resp.content)
+
+    @override_settings(HWDB_CALL_FOOTER=True)
+    def test_footer_lists_the_pages_calls(self):
+        html = self._through_middleware().content.decode()
+        self.assertIn('id="hwdb-calls"', html)
+        self.assertIn("2 HWDB calls", html)
+        self.assertIn("GET components/{part_id}", html)
+        self.assertLess(html.index("hwdb-calls"), html.index("</body>"))
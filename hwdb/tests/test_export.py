@@ -0,0 +1,109 @@
+"""Tests for the streamed table export (``hwdb.export``, ``/hwdb/export/``,
+``manage.py export``).
+
+    python manage.py test hwdb
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models.query import QuerySet
+from django.test import TestCase
+
+from cets.testutils import make_cets_user
+from core.models import FEMB, FembTest
+from explore.models import HwdbTestEvent
+from hwdb import export
+
+PTID = "D05700200001"
+
+
+def _at(day):
+    return datetime(2026, 3, day, 12, tzinfo=timezone.utc)
+
+
+class ExportTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        HwdbTestEvent.objects.bulk_create(
+            HwdbTestEvent.build("prod", PTID, [(f"{PTID}-{i:05d}", "Visual", _at(i))
+                                               for i in range(1, 6)])
+            + HwdbTestEvent.build("prod", "D05700300001",
+                                  [("D05700300001-00001", "Visual", _at(1))])
+            + HwdbTestEvent.build("dev", PTID, [(f"{PTID}-00009", "Visual", _at(1))]))
+        femb = FEMB.objects.create(serial_number="00042")
+        FembTest.objects.create(femb=femb, timestamp=_at(2), test_type="QC", test_env="LN",
+                                report_filename="r.md", status="pass")
+        cls.user = make_cets_user(username="analyst")
+
+    def _csv(self, *args, **kw):
+        return list(csv.reader(io.StringIO(
+            b"".join(export.stream(*args, **kw)).decode())))
+
+    def test_csv_with_filters(self):
+        rows = self._csv("test_events", part_type=PTID, since="2026-03-02",
+                         until="2026-03-04")
+        self.assertEqual(rows[0], ["instance", "part_type_id", "part_id",
+                                   "test_type_name", "created"])
+        self.assertEqual([r[2] for r in rows[1:]],
+                         [f"{PTID}-0000{i}" for i in (2, 3, 4)])
+        self.assertEqual(rows[1][4], "2026-03-02T12:00:00+00:00")
+        self.assertEqual(len(self._csv("test_events", instance="dev")), 2)
+
+    def test_ndjson_follows_relations(self):
+        [line] = b"".join(export.stream("femb_tests", "ndjson")).decode().splitlines()
+        row = json.loads(line)
+        self.assertEqual(row["femb_serial_number"], "00042")
+        self.assertEqual(row["test_env"], "LN")
+
+    def test_rows_come_through_a_chunked_cursor(self):
+        with mock.patch.object(QuerySet, "iterator", autospec=True,
+                               side_effect=QuerySet.iterator) as it:
+            b"".join(export.stream("test_events"))
+        self.assertEqual(it.call_args.kwargs, {"chunk_size": export.CHUNK_ROWS})
+
+    def test_output_is_handed_on_in_blocks(self):
+        with mock.patch.object(export, "BLOCK_BYTES", 100):
+            blocks = list(export.stream("test_events", "ndjson"))
+        self.assertGreater(len(blocks), 2)
+        self.assertEqual(len(b"".join(blocks).splitlines()), 6)
+
+    def test_bad_filters_fail_before_streaming(self):
+        for kw in [{"table": "nope"}, {"table": "femb_tests", "part_type": PTID},
+                   {"table": "test_events", "since": "March"},
+                   {"table": "test_events", "until": "2026-02-30"},
+                   {"table": "test_events", "instance": "qa"},
+                   {"table": "test_events", "fmt": "xml"}]:
+            with self.subTest(**kw), self.assertRaises(export.ExportError):
+                export.stream(**kw)
+
+    def test_view_streams_gzip(self):
+        self.client.force_login(self.user)
+        resp = self.client.get("/hwdb/export/test_events/",
+                               {"format": "ndjson", "gzip": "1", "part_type": PTID})
+        self.assertTrue(resp.streaming)
+        self.assertEqual(resp["Content-Type"], "application/gzip")
+        self.assertIn('filename="test_events.ndjson.gz"', resp["Content-Disposition"])
+        lines = gzip.decompress(b"".join(resp.streaming_content)).splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(self.client.get("/hwdb/export/nope/").status_code, 400)
+
+    def test_command_writes_a_file(self):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        call_command("export", "femb_tests", "--out", path)
+        with open(path) as f:
+            self.assertEqual(len(f.read().splitlines()), 2)
+        with self.assertRaises(CommandError):
+            call_command("export", "femb_tests", "--part-type", PTID)
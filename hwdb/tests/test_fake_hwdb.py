@@ -0,0 +1,92 @@
+"""Tests for the fake HWDB server (``hwdb.fake``): the real client against it
+over HTTP — pagination, writes, fault injection and keep-alive reuse.
+
+    python manage.py test hwdb
+"""
+
+from __future__ import annotations
+
+import threading
+
+import requests
+from django.test import SimpleTestCase
+
+from hwdb.api_client import FnalDbApiClient
+from hwdb.fake import FakeHwdb, Faults, Fleet, parse_types
+
+PTID = "D05700200001"
+
+
+class FakeHwdbTest(SimpleTestCase):
+    def setUp(self):
+        self.faults = Faults(timeout_s=0.2, seed=1)
+        self.app = FakeHwdb(Fleet([(PTID, 7)], n_boxes=2, box_slots=4), self.faults)
+        self.server = self.app.make_server()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address[:2]
+        self.api = FnalDbApiClient(f"http://{host}:{port}/api/v1", "any-bearer")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_listing_pages_and_detail_reads(self):
+        endpoint = f"component-types/{PTID}/components"
+        first = self.api._make_request("GET", endpoint, params={"page": 1, "size": 5})
+        self.assertEqual(first["pagination"]["total"], 7)
+        self.assertEqual(first["pagination"]["pages"], 2)
+        second = self.api._make_request("GET", endpoint, params={"page": 2, "size": 5})
+        self.assertEqual([r["part_id"] for r in second["data"]],
+                         [f"{PTID}-00006", f"{PTID}-00007"])
+        item = self.api.get_component(f"{PTID}-00001")["data"]
+        self.assertEqual(item["component_type"]["part_type_id"], PTID)
+        self.assertEqual(len(self.api.get_tests(f"{PTID}-00001")["data"]), 3)
+        tt = self.api.get_test_types(PTID)["data"][0]
+        self.assertTrue(all(t["test_type"]["id"] == tt["id"] for t in
+                            self.api.get_tests(f"{PTID}-00001", test_type_id=tt["id"])["data"]))
+
+    def test_writes_land_in_the_fleet(self):
+        box = f"{Fleet.BOX_TYPE}-00001"
+        held = self.api.get_subcomponents(box)["data"]
+        self.assertEqual([m["functional_position"] for m in held], ["Slot1", "Slot2"])
+        # The other box's item is "already in use", like HWDB says.
+        other = self.api.get_subcomponents(f"{Fleet.BOX_TYPE}-00002")["data"][0]["part_id"]
+        body = self.api.patch_subcomponents(box, {"component": {"part_id": box},
+                                                  "subcomponents": {"Slot3": other}})
+        self.assertEqual(body["status"], "ERROR")
+        self.assertIn("already in use", body["data"])
+        body = self.api.patch_subcomponents(box, {"component": {"part_id": box},
+                                                  "subcomponents": {"Slot3": f"{PTID}-00007"}})
+        self.assertEqual(body["status"], "OK")
+        self.assertEqual(self.api.get_container(f"{PTID}-00007")["data"][0]
+                         ["container"]["part_id"], box)
+        created = self.api.create_component(PTID, {"serial_number": "NEW-1"})
+        self.assertEqual(self.api.find_component_by_serial(PTID, "NEW-1")["part_id"],
+                         created["part_id"])
+
+    def test_injected_errors_and_timeouts(self):
+        self.faults.set("rate_503", "tests=1")
+        with self.assertRaises(requests.HTTPError) as e:
+            self.api.get_tests(f"{PTID}-00001")
+        self.assertEqual(e.exception.response.status_code, 503)
+        self.api.get_component(f"{PTID}-00001")         # other endpoints unaffected
+        self.faults.set("rate_timeout", "component=1")
+        with self.assertRaises(requests.ConnectionError):
+            self.api.get_component(f"{PTID}-00001")
+        self.assertEqual(self.app.stats["faults"], {"503": 1, "timeout": 1})
+
+    def test_one_client_reuses_its_connection(self):
+        for _ in range(5):
+            self.api.get_component(f"{PTID}-00001")
+        self.assertEqual(self.app.stats["connections"], 1)
+        self.assertEqual(self.app.stats["requests"]["component"], 5)
+
+    def test_fault_specs(self):
+        faults = Faults()
+        faults.set("latency_ms", "40,list=250")
+        self.assertEqual(faults.for_endpoint("list").latency_ms, 250)
+        self.assertEqual(faults.for_endpoint("tests").latency_ms, 40)
+        with self.assertRaises(ValueError):
+            faults.set("latency_ms", "nope=1")
+        self.assertEqual(parse_types("D05700200001:5,D05700300001"),
+                         [("D05700200001", 5), ("D05700300001", 100)])
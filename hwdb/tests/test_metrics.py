@@ -0,0 +1,160 @@
+"""Tests for the Prometheus metrics (``hwdb.metrics``, ``/metrics``): the
+exposition format, merging across worker files, and the instrumented paths
+(HWDB calls via the fake server, sync engines, view middleware).
+
+    python manage.py test hwdb
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+import requests
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from hwdb import metrics
+from hwdb.api_client import FnalDbApiClient
+from hwdb.fake import FakeHwdb, Faults, Fleet
+
+PTID = "D05700200001"
+
+
+def _dead_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+class _MetricsDir:
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        self.tmp = tmp
+        cm = override_settings(METRICS_DIR=tmp)
+        cm.enable()
+        self.addCleanup(cm.disable)
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+
+class ExpositionTest(_MetricsDir, SimpleTestCase):
+    def test_counters_gauges_and_cumulative_histograms(self):
+        metrics.inc("cache_requests_total", cache="tree", result="hit")
+        metrics.inc("cache_requests_total", 2, cache="tree", result="hit")
+        metrics.gauge_add("hwdb_in_flight_requests", 1, instance="prod")
+        for v in (0.03, 0.2, 40):
+            metrics.observe("hwdb_request_duration_seconds", v,
+                            instance="prod", endpoint='a"b', method="GET")
+        text = metrics.render()
+        self.assertIn("# TYPE cache_requests_total counter", text)
+        self.assertIn('cache_requests_total{cache="tree",result="hit"} 3', text)
+        self.assertIn('hwdb_in_flight_requests{instance="prod"} 1', text)
+        labels = 'instance="prod",endpoint="a\\"b",method="GET"'
+        self.assertIn(f'hwdb_request_duration_seconds_bucket{{{labels},le="0.05"}} 1', text)
+        self.assertIn(f'hwdb_request_duration_seconds_bucket{{{labels},le="0.25"}} 2', text)
+        self.assertIn(f'hwdb_request_duration_seconds_bucket{{{labels},le="30"}} 2', text)
+        self.assertIn(f'hwdb_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3', text)
+        self.assertIn(f"hwdb_request_duration_seconds_count{{{labels}}} 3", text)
+        self.assertIn(f"hwdb_request_duration_seconds_sum{{{labels}}} 40.23", text)
+
+    def test_unknown_labels_are_a_programming_error(self):
+        with self.assertRaises(ValueError):
+            metrics.inc("cache_requests_total", cache="tree")
+
+    def test_workers_merge_through_their_files(self):
+        metrics.inc("upload_chips_total", 5, outcome="ok")
+        metrics.gauge_add("hwdb_in_flight_requests", 2, instance="prod")
+        metrics.gauge_set("sync_last_items_per_second", 10, engine="sync_family")
+        # An exited worker: its counters still count, its in-flight gauge doesn't,
+        # and its older "latest" gauge loses to ours.
+        pid = _dead_pid()
+        with open(f"{self.tmp}/{pid}.json", "w") as f:
+            json.dump({"pid": pid, "values": {
+                "upload_chips_total": [[["ok"], 3], [["failed"], 1]],
+                "hwdb_in_flight_requests": [[["prod"], [7, 1.0]]],
+                "sync_last_items_per_second": [[["sync_family"], [99, 1.0]]],
+            }}, f)
+        merged = metrics.collect()
+        self.assertEqual(merged["upload_chips_total"], {("ok",): 8, ("failed",): 1})
+        self.assertEqual(merged["hwdb_in_flight_requests"][("prod",)][0], 2)
+        self.assertEqual(merged["sync_last_items_per_second"][("sync_family",)][0], 10)
+
+
+class SyncJobTest(_MetricsDir, SimpleTestCase):
+    def test_outcomes_durations_and_items(self):
+        @metrics.sync_job("sync_family")
+        def engine(fail=False):
+            yield "start\n"
+            metrics.sync_items(40)
+            if fail:
+                raise RuntimeError("boom")
+            yield "done\n"
+
+        self.assertEqual(list(engine()), ["start\n", "done\n"])
+        with self.assertRaises(RuntimeError):
+            list(engine(fail=True))
+        gen = engine()
+        next(gen)
+        gen.close()
+        merged = metrics.collect()
+        runs = merged["sync_duration_seconds"]
+        self.assertEqual({k[1] for k in runs}, {"ok", "error", "aborted"})
+        self.assertEqual(merged["sync_items_total"][("sync_family",)], 80)
+        self.assertIn(("sync_family",), merged["sync_last_items_per_second"])
+        metrics.sync_items(5)   # outside a run: ignored
+        self.assertEqual(metrics.collect()["sync_items_total"][("sync_family",)], 80)
+
+
+class HwdbTrafficTest(_MetricsDir, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.app = FakeHwdb(Fleet([(PTID, 2)]), Faults(seed=1))
+        server = self.app.make_server()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        host, port = server.server_address[:2]
+        self.api = FnalDbApiClient(f"http://{host}:{port}/api/v1", "tok")
+
+    def test_responses_by_status_class_and_latency(self):
+        self.api.get_component(f"{PTID}-00001")
+        self.app.faults.set("rate_429", "component=1")
+        with self.assertRaises(requests.HTTPError):
+            self.api.get_component(f"{PTID}-00002")
+        merged = metrics.collect()
+        responses = merged["hwdb_responses_total"]
+        self.assertEqual(responses[("", "components/{part_id}", "2xx")], 1)
+        self.assertEqual(responses[("", "components/{part_id}", "429")], 1)
+        hist = merged["hwdb_request_duration_seconds"][("", "components/{part_id}", "GET")]
+        self.assertEqual(sum(hist[:-1]), 2)
+        self.assertEqual(merged["hwdb_in_flight_requests"][("",)][0], 0)
+
+
+class EndpointTest(_MetricsDir, TestCase):
+    def test_token_or_staff_only(self):
+        metrics.inc("cache_requests_total", cache="tree", result="miss")
+        with override_settings(METRICS_TOKEN="s3cret"):
+            self.assertEqual(self.client.get("/metrics").status_code, 401)
+            resp = self.client.get("/metrics", headers={"Authorization": "Bearer s3cret"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp["Content-Type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn('cache_requests_total{cache="tree",result="miss"} 1', resp.content.decode())
+        with override_settings(METRICS_TOKEN=""):
+            self.assertEqual(self.client.get("/metrics").status_code, 403)
+            self.client.force_login(get_user_model().objects.create_user(
+                "ops", "o@o.io", "pw", is_staff=True, is_superuser=True))
+            self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+    def test_requests_are_measured_per_view(self):
+        with override_settings(METRICS_TOKEN="t"):
+            self.client.get("/metrics", headers={"Authorization": "Bearer t"})
+        merged = metrics.collect()
+        self.assertIn(("metrics",), merged["view_db_queries"])
+        self.assertIn(("metrics",), merged["view_duration_seconds"])
@@ -0,0 +1,97 @@
+"""Tests for query profiling (``hwdb.profiler``, ``QueryProfileMiddleware``)
+and the test-suite budget helper (``hwdb.testing``).
+
+    python manage.py test hwdb
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from hwdb import profiler
+from hwdb.testing import QueryBudgetMixin
+
+User = get_user_model()
+
+
+class ShapeTest(TestCase):
+    def test_literals_and_in_lists_fold(self):
+        self.assertEqual(
+            profiler.shape('SELECT "a"."x1" FROM "a" WHERE "a"."id" IN (%s, %s, %s) '
+                           "AND \"a\".\"name\" = 'bob' LIMIT 21"),
+            'SELECT "a"."x1" FROM "a" WHERE "a"."id" IN (…) AND "a"."name" = ? LIMIT ?')
+        self.assertEqual(profiler.shape("SELECT 1 WHERE x IN (%s)"),
+                         profiler.shape("SELECT 2 WHERE x IN (%s, %s)"))
+
+    def test_a_query_per_row_is_a_repeat(self):
+        User.objects.bulk_create([User(username=f"u{i}") for i in range(4)])
+        with profiler.profiling() as p:
+            for pk in User.objects.values_list("pk", flat=True):
+                User.objects.filter(pk=pk).first()
+        self.assertEqual(p.count, 5)
+        [(sql, n, _ms)] = p.repeats()
+        self.assertEqual(n, 4)
+        self.assertIn("WHERE", sql)
+
+
+class MiddlewareTest(TestCase):
+    def setUp(self):
+        profiler.reset()
+        self.addCleanup(profiler.reset)
+        self.staff = User.objects.create_user("ops", "o@o.io", "pw", is_staff=True,
+                                              is_superuser=True)
+
+    def test_off_unless_asked(self):
+        self.client.force_login(self.staff)
+        self.assertNotIn("X-Query-Count", self.client.get("/metrics"))
+        resp = self.client.get("/metrics", headers={"X-Query-Profile": "1"})
+        self.assertEqual(resp["X-Query-Repeats"], "0")
+        self.assertRegex(resp["Server-Timing"], r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertEqual([r["view"] for r in profiler.report()], ["metrics"])
+
+    def test_header_is_staff_only_outside_debug(self):
+        self.client.force_login(User.objects.create_user("u", "u@u.io", "pw"))
+        self.assertNotIn("X-Query-Count", self.client.get(
+            "/metrics", headers={"X-Query-Profile": "1"}))
+        with override_settings(DEBUG=True):
+            self.assertIn("X-Query-Count", self.client.get(
+                "/metrics", headers={"X-Query-Profile": "1"}))
+
+    def test_report_ranks_views_and_is_written_when_due(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        quiet, noisy = profiler.Profile("quiet"), profiler.Profile("noisy")
+        quiet.add("SELECT 1", 1.0)
+        for pk in range(5):
+            noisy.add(f"SELECT * FROM t WHERE id = {pk}", 1.0)
+        with override_settings(QUERY_PROFILE_DIR=tmp, QUERY_PROFILE_REPORT_SECONDS=3600):
+            profiler.tally(quiet)
+            self.assertEqual(list(Path(tmp).iterdir()), [])
+            with override_settings(QUERY_PROFILE_REPORT_SECONDS=0):
+                profiler.tally(noisy)
+            path = next(Path(tmp).glob("*.txt"))
+        self.assertEqual([r["view"] for r in profiler.report()], ["noisy", "quiet"])
+        text = path.read_text()
+        self.assertLess(text.index("noisy"), text.index("quiet"))
+        self.assertIn("5× SELECT * FROM t WHERE id = ?", text)
+
+
+class BudgetTest(QueryBudgetMixin, TestCase):
+    def test_within_budget_passes(self):
+        with self.assertQueryBudget(1):
+            User.objects.count()
+
+    def test_over_budget_or_repeating_fails(self):
+        with self.assertRaisesMessage(AssertionError, "2 queries, budget 1"):
+            with self.assertQueryBudget(1):
+                User.objects.count()
+                User.objects.exists()
+        with self.assertRaisesMessage(AssertionError, "3× SELECT"):
+            with self.assertQueryBudget(10):
+                for pk in (1, 2, 3):
+                    User.objects.filter(pk=pk).first()
@@ -33,6 +33,7 @@ from typing import Callable, Iterable, Iterator, Optional
 from django.conf import settings
 from django.utils import timezone
 
+from .. import metrics
 from . import csv_parser
 
 logger = logging.getLogger(__name__)
@@ -756,18 +757,26 @@ def iter_upload_chips_parallel(
             force_csv_attach=force_csv_attach,
         )
 
-    with ThreadPoolExecutor(max_workers=workers, initializer=_init) as pool:
-        futures = {pool.submit(_work, c): c for c in chips}
-        for fut in as_completed(futures):
-            chip = futures[fut]
-            try:
-                result = fut.result()
-            except Exception as e:
-                logger.exception("upload_chip crashed for %s", chip.serial_number)
-                result = ChipResult(
-                    serial_number=chip.serial_number,
-                    part_id=None,
-                    created=False,
-                    error=f"crashed: {e}",
-                )
-            yield chip, result
+    counts = {"ok": 0, "failed": 0}
+    try:
+        with ThreadPoolExecutor(max_workers=workers, initializer=_init) as pool:
+            futures = {pool.submit(_work, c): c for c in chips}
+            for fut in as_completed(futures):
+                chip = futures[fut]
+                try:
+                    result = fut.result()
+                except Exception as e:
+                    logger.exception("upload_chip crashed for %s", chip.serial_number)
+                    result = ChipResult(
+                        serial_number=chip.serial_number,
+                        part_id=None,
+                        created=False,
+                        error=f"crashed: {e}",
+                    )
+                outcome = "ok" if result.ok else "failed"
+                counts[outcome] += 1
+                metrics.inc("upload_chips_total", outcome=outcome)
+                yield chip, result
+    finally:
+        for outcome, n in counts.items():
+            metrics.observe("upload_run_chips", n, outcome=outcome)
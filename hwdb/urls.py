@@ -22,6 +22,7 @@ urlpatterns = [
     # Permanent-redirect old bookmarks (the ?node= query string is preserved).
     path("explore/", RedirectView.as_view(pattern_name="explore:home",
                                            permanent=True, query_string=True)),
+    path("export/<str:table>/", views.export_view, name="export"),
     path("link/", views.fnal_link_view, name="link"),
     path("link/poll/", views.fnal_link_poll_view, name="link_poll"),
     path("components/<str:component_type_id>/", views.component_list_view, name="component_list"),
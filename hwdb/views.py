@@ -1,3 +1,4 @@
+import hmac
 import logging
 from datetime import datetime, timedelta
 from functools import wraps
@@ -6,8 +7,10 @@ from urllib.parse import urlencode
 
 from decouple import config as env_config
 from django.conf import settings
+from django.contrib.auth.decorators import login_not_required
 from django.db.models import Count, Max, Q
-from django.http import JsonResponse, StreamingHttpResponse
+from django.http import (HttpResponse, HttpResponseBadRequest, HttpResponseForbidden,
+                         JsonResponse, StreamingHttpResponse)
 from django.shortcuts import redirect, render
 from django.urls import reverse
 from django.utils import timezone
@@ -16,6 +19,7 @@ from django.views.decorators.http import require_POST
 
 from core.models import LArASIC, FEMB, FembTest
 
+from . import export, metrics
 from .api_client import FnalDbApiClient
 from .fnal import flow
 from .fnal import session as fnal_session
@@ -1031,3 +1035,41 @@ def part_type_list_view(request, bearer, part1, part2, subsystem_id):
     except Exception:
         logger.exception("HWDB API call failed")
         return render(request, "hwdb/error.html", {"error_message": GENERIC_ERROR})
+
+
+@login_not_required
+def metrics_view(request):
+    """Prometheus scrape target (``hwdb.metrics``). A scraper authenticates
+    with ``Authorization: Bearer $METRICS_TOKEN``; with no token configured,
+    only staff sessions may read it."""
+    token = settings.METRICS_TOKEN
+    if token:
+        sent = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(sent.encode(), f"Bearer {token}".encode()):
+            return HttpResponse("metrics token required\n", status=401,
+                                content_type="text/plain")
+    elif not (request.user.is_authenticated and request.user.is_staff):
+        return HttpResponseForbidden("staff only\n", content_type="text/plain")
+    return HttpResponse(metrics.render(),
+                        content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def export_view(request, table):
+    """Stream one table (``hwdb.export``) as CSV or NDJSON: ``?format=``
+    csv|ndjson, ``gzip=1``, and the filters ``instance``, ``part_type``,
+    ``since``/``until`` (dates or datetimes)."""
+    fmt = request.GET.get("format", "csv")
+    gz = request.GET.get("gzip") in ("1", "true", "yes")
+    try:
+        body = export.stream(
+            table, fmt, gzip=gz,
+            instance=request.GET.get("instance", "prod"),
+            part_type=request.GET.get("part_type", ""),
+            since=request.GET.get("since", ""), until=request.GET.get("until", ""))
+    except export.ExportError as e:
+        return HttpResponseBadRequest(f"{e}\n", content_type="text/plain")
+    response = StreamingHttpResponse(
+        body, content_type="application/gzip" if gz else export.FORMATS[fmt])
+    response["Content-Disposition"] = (
+        f'attachment; filename="{export.filename(table, fmt, gz)}"')
+    return response